@@ -98,10 +98,38 @@ class AppConfig:
     # Notification Settings
     NOTIFICATION_POLL_INTERVAL = 80  # milliseconds
     TOAST_DISPLAY_TIME = 3000  # milliseconds
+    # Per-process send buffer in front of the notification queue (oldest dropped on overflow)
+    NOTIFICATION_BUFFER_SIZE = 64
+    NOTIFICATION_SEND_POLICY = "merge"  # "merge" (fold same-group payloads) | "drop_oldest"
+    TOAST_GROUP_EXTEND_MS = 1500  # Extra lifetime when a same-group toast is coalesced
+    # Per-group cap on *new* toast windows: group -> (max windows, per window ms).
+    # Keys are exact groups ("campo1:score") or "*:<kind>" for that kind in every
+    # field; "*" alone would cap all groups. Payloads over the limit are folded
+    # into the visible toast of that group or dropped (logged). Only the noisy
+    # live-update groups are capped; confirmations and errors always show.
+    TOAST_GROUP_RATE_LIMITS = {
+        "*:score": (3, 10000),
+        "*:timer": (3, 10000),
+    }
+    MONITOR_REFRESH_MS = 30000  # Re-enumerate monitors (hot-plug, taskbar moves)
+    TOAST_ANIMATION_INTERVAL = 16  # milliseconds; one shared frame clock for all toasts
+    
+    # Cross-process State Bus Settings
+    STATE_BUS_ENABLED = True  # Push gameinfo deltas between field processes
+    STATE_BUS_HOST = "127.0.0.1"  # Loopback only; port is picked by the OS
+
+    # Team-data broker: one process owns the Mongo client/catalog for every field
+    TEAM_BROKER_ENABLED = True
+    TEAM_BROKER_HOST = "127.0.0.1"  # Loopback only; port is picked by the OS
+    TEAM_BROKER_WORKERS = 4  # Broker threads serving field calls
+    TEAM_BROKER_TIMEOUT_S = 15  # Per call (bulk import/export wait indefinitely)
+    TEAM_BROKER_START_TIMEOUT_S = 10  # Launcher waits this long for the broker address
     
     # Security Settings
     ADMIN_PIN = os.getenv("PIN", "")
     LICENSE_CHECK_INTERVAL = 15000  # milliseconds (15 seconds)
+    LICENSE_STATUS_REFRESH_S = 300  # Background database revalidation of the cached license status
+    MACHINE_HASH_CACHE_FILENAME = "machine_hash.bin"  # Per-boot node-lock hash (LOCAL_APP_DIRNAME/license)
     
     # Boundary and Spacing Settings
     SCREEN_BOUNDARY_MARGIN = 50
@@ -146,10 +174,27 @@ class AppConfig:
     MEIPASS_ATTRIBUTE = "_MEIPASS"
     ENV_DIR_ENVVAR = "GOAL_ENV_DIR"
     
+    # Local Team Catalog Settings (offline-first reads, incremental Mongo sync)
+    TEAM_CATALOG_DIRNAME = "data"
+    TEAM_CATALOG_FILENAME = "teams_catalog.sqlite3"
+    TEAM_SYNC_INTERVAL_S = 60  # Background pull of Mongo changes
+    TEAM_TOMBSTONE_RETENTION_DAYS = 30  # Older deletes are purged; stale clients full-resync
+    TEAM_IMPORT_BATCH_SIZE = 500  # Upserts per bulk_write round trip
+    TEAM_ASYNC_WORKERS = 4  # Threads serving AsyncTeamManager calls
+    TEAM_ASYNC_MAX_PENDING = 32  # Queued calls beyond this fail fast (TeamTaskRejected)
+    TEAM_ASYNC_TIMEOUT_S = 10  # Covers serverSelectionTimeoutMS plus the query itself
+    # Write-behind outbox: saves/deletes are queued locally and replayed into Mongo
+    TEAM_OUTBOX_FILENAME = "team_outbox.sqlite3"
+    TEAM_OUTBOX_BATCH_SIZE = 100  # Mutations per bulk_write round trip
+    TEAM_OUTBOX_RETRY_BASE_S = 2  # First retry delay while Mongo is unreachable (doubles per failure)
+    TEAM_OUTBOX_RETRY_MAX_S = 300  # Backoff cap
+    TEAM_OUTBOX_STATUS_POLL_MS = 3000  # Team Manager pending-count refresh
+    
     # Backup Settings
-    AUTO_BACKUP_ENABLED = True
-    BACKUP_RETENTION_DAYS = 30
+    AUTO_BACKUP_ENABLED = True  # Compressed teams snapshots on every change (teams.json is always kept)
+    BACKUP_RETENTION_DAYS = 30  # Older snapshots are pruned (the newest one is always kept)
     BACKUP_FILE_PREFIX = "teams_backup_"
+    BACKUP_DIRNAME = "backups"  # Next to teams.json
     
     # Debug Settings
     DEBUG_MODE = False  # Will be set in __init__ or class method
@@ -158,6 +203,7 @@ class AppConfig:
     # UI Refresh Settings
     REFRESH_INTERVAL = 1.0  # seconds
     SEARCH_DEBOUNCE_MS = 300
+    AUTOCOMPLETE_MAX_RESULTS = 200  # Suggestions per keystroke (index search limit)
     
     # Pagination Settings
     ITEMS_PER_PAGE = 25
@@ -10,6 +10,8 @@ from .env_loader import SecureEnvLoader
 from .filenames import get_env
 from .helpers import save_teams_to_json, load_teams_from_json, prompt_for_pin
 from .mongodb import MongoTeamManager, _get_mongo_client
+from .team_async import AsyncTeamManager, TeamTaskRejected, async_team_manager, deliver
+from .team_broker import RemoteTeamManager, TeamBrokerError, get_team_manager
 from .gameinfo import GameInfoStore, DEFAULT_FIELD_STATE
 from .server_launcher import ServerLauncher, get_server_launcher, start_server_after_license, stop_server_on_exit
 
@@ -22,6 +24,13 @@ __all__ = [
     'load_teams_from_json',
     'prompt_for_pin',
     'MongoTeamManager',
+    'AsyncTeamManager',
+    'TeamTaskRejected',
+    'async_team_manager',
+    'deliver',
+    'RemoteTeamManager',
+    'TeamBrokerError',
+    'get_team_manager',
     'GameInfoStore',
     'DEFAULT_FIELD_STATE',
     '_get_mongo_client',
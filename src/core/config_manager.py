@@ -11,7 +11,6 @@ class ConfigManager:
     def __init__(self, config_file: str = "performance_config.json"):
         self.config_file = Path(config_file)
         self.config = self._load_default_config()
-        self._load_config()
         self._log = get_logger(__name__)
         # Precompute allow/forbid sets
         self._allowed_top_keys = set(self.config.keys())
@@ -27,6 +26,8 @@ class ConfigManager:
             "SERVER_WATCHDOG_ENABLED": "server_watchdog_enabled",
             "SERVER_HEALTH_CHECK_ENABLED": "server_health_check_enabled",
         }
+        # File overrides go through the same allow/forbid rules, so load last
+        self._load_config()
     
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration values"""
@@ -48,6 +49,7 @@ class ConfigManager:
                 "base_ttl": 300,           # Base cache TTL
                 "max_ttl": 1800,           # Maximum cache TTL
                 "min_ttl": 60,             # Minimum cache TTL
+                "stale_ttl": 3600,         # How long past TTL a snapshot may be served while refreshing
                 "batch_update_delay": 0.5, # Delay for batching updates
                 "background_sync": True,    # Enable background JSON sync
                 "preload_json": True,      # Preload JSON during startup
@@ -82,14 +84,19 @@ class ConfigManager:
         }
     
     def _load_config(self) -> None:
-        """Load configuration from file"""
+        """Load configuration from file.
+
+        The file may give a nested section (e.g. ``teams_cache``) in part; its
+        keys are merged over that section's defaults instead of replacing it.
+        """
         if self.config_file.exists():
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     file_config = json.load(f)
                     # Sanitize incoming config
                     safe = self._sanitize_updates(file_config)
-                    self.config.update(safe)
+                    for k, v in safe.items():
+                        self._apply(k, v)
             except Exception as e:
                 # Log but continue with defaults
                 get_logger(__name__).warning("config_load_failed", exc_info=True)
@@ -126,17 +133,20 @@ class ConfigManager:
         safe = self._sanitize_updates(updates)
         if not safe:
             return
-        # Merge respecting nested teams_cache
+        # Merge respecting nested sections
         for k, v in safe.items():
-            if k == "teams_cache" and isinstance(v, dict):
-                base = self.config.get("teams_cache", {})
-                base.update(v)
-                self.config["teams_cache"] = base
-            else:
-                self.config[k] = v
+            self._apply(k, v)
         self._log.info("config_updated", extra={"keys": list(safe.keys())})
 
     # ---- helpers ----
+    def _apply(self, key: str, value: Any) -> None:
+        """Set a sanitized value; dict sections merge over the current section."""
+        current = self.config.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            self.config[key] = {**current, **value}
+        else:
+            self.config[key] = value
+
     def _sanitize_updates(self, updates: Dict[str, Any]) -> Dict[str, Any]:
         safe: Dict[str, Any] = {}
         for orig_key, value in updates.items():
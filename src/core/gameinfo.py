@@ -3,12 +3,14 @@ import re
 import json
 import time
 import threading
-from typing import Any, Dict, Iterator
+import weakref
+from typing import Any, Dict, Iterator, Tuple
 from contextlib import contextmanager
 
 from ..config import AppConfig
 from .logger import get_logger
 from .file_cache import read_json_cached, write_json_async, write_json_sync, batch_write_json, invalidate_file_cache
+from .state_bus import StateDelta, get_state_bus, next_version, publish_state_delta
 
 log = get_logger(__name__)
 
@@ -92,6 +94,33 @@ def _format_time(total_seconds: int) -> str:
     return f"{m:02}:{s:02}"
 
 
+# ───────────────── Cross-process state bus wiring ─────────────────
+# Every live store in this process receives deltas published elsewhere
+_live_stores: "weakref.WeakSet[GameInfoStore]" = weakref.WeakSet()
+_bus_subscribed = False
+_bus_subscribe_lock = threading.Lock()
+
+
+def _dispatch_delta(delta: StateDelta, origin: "GameInfoStore | None" = None) -> None:
+    for store in list(_live_stores):
+        if store is not origin:
+            store._apply_delta(delta)
+
+
+def _ensure_bus_subscription() -> None:
+    """Subscribe the store registry once the process is connected to the bus."""
+    global _bus_subscribed
+    if _bus_subscribed:
+        return
+    bus = get_state_bus()
+    if bus is None:
+        return
+    with _bus_subscribe_lock:
+        if not _bus_subscribed:
+            bus.subscribe(_dispatch_delta)
+            _bus_subscribed = True
+
+
 def _normalize_field_key(field: int | str) -> str:
     if isinstance(field, int):
         return f"field_{field}"
@@ -114,7 +143,13 @@ class GameInfoStore:
         self._data: Dict[str, Any] = {}
         self._loaded = False
         self.debug = debug
+        # Last applied version per (field, key) so stale deltas never win
+        self._versions: Dict[Tuple[str, str], int] = {}
+        # _data/_versions are patched from the bus reader thread while the Tk thread uses them
+        self._lock = threading.RLock()
         self._ensure_file()
+        _live_stores.add(self)
+        _ensure_bus_subscription()
 
     def _log(self, *parts: Any) -> None:
         if self.debug:
@@ -130,21 +165,23 @@ class GameInfoStore:
     def _load_from_disk(self) -> Dict[str, Any]:
         # Use cached file reading
         data = read_json_cached(self.path, {})
-        self._data = data
-        self._loaded = True
-
-        blk = self._data.get(self.field_key, {})
-        if not isinstance(blk, dict):
-            blk = {}
-        changed = False
-        for k, v in DEFAULT_FIELD_STATE.items():
-            if k not in blk:
-                blk[k] = v
-                changed = True
-        self._data[self.field_key] = blk
+        with self._lock:
+            self._data = data
+            self._loaded = True
+
+            blk = self._data.get(self.field_key, {})
+            if not isinstance(blk, dict):
+                blk = {}
+            changed = False
+            for k, v in DEFAULT_FIELD_STATE.items():
+                if k not in blk:
+                    blk[k] = v
+                    changed = True
+            self._data[self.field_key] = blk
+            if changed:
+                # Use sync write for immediate persistence
+                write_json_sync(self.path, self._data)
         if changed:
-            # Use sync write for immediate persistence
-            write_json_sync(self.path, self._data)
             log.info("gameinfo_seed_defaults", extra={"path": self.path, "field": self.field_key})
 
         log.debug("gameinfo_loaded", extra={"path": self.path, "field": self.field_key, "keys": list(blk.keys())})
@@ -162,20 +199,23 @@ class GameInfoStore:
     # ----- public API -----
     def read_all_field(self) -> Dict[str, Any]:
         data = self._load_from_disk()
-        blk = dict(data[self.field_key])
+        with self._lock:
+            blk = dict(data[self.field_key])
         log.debug("gameinfo_read_all_field", extra={"field": self.field_key})
         return blk
 
     def read_field_key(self, key: str, default: Any = None) -> Any:
         data = self._load_from_disk()
-        val = data[self.field_key].get(key, DEFAULT_FIELD_STATE.get(key, default))
+        with self._lock:
+            val = data[self.field_key].get(key, DEFAULT_FIELD_STATE.get(key, default))
         log.debug("gameinfo_read_field_key", extra={"field": self.field_key, "key": key})
         return val
 
     def get(self, key: str, default: Any = None) -> Any:
         self._ensure_loaded()
-        blk = self._data.get(self.field_key, {})
-        val = blk.get(key, DEFAULT_FIELD_STATE.get(key, default))
+        with self._lock:
+            blk = self._data.get(self.field_key, {})
+            val = blk.get(key, DEFAULT_FIELD_STATE.get(key, default))
         log.debug("gameinfo_get_cached", extra={"field": self.field_key, "key": key})
         return val
 
@@ -184,12 +224,14 @@ class GameInfoStore:
             self._log("set ignored (unknown key):", key)
             return False
         self._ensure_loaded()
-        blk = self._data[self.field_key]
-        if blk.get(key) == value:
-            log.debug("gameinfo_set_noop", extra={"field": self.field_key, "key": key})
-            return False
-        blk[key] = value
+        with self._lock:
+            blk = self._data[self.field_key]
+            if blk.get(key) == value:
+                log.debug("gameinfo_set_noop", extra={"field": self.field_key, "key": key})
+                return False
+            blk[key] = value
         log.info("gameinfo_set", extra={"field": self.field_key, "key": key})
+        self._publish(key, value)
         if persist:
             # Use batch write directly (single queue layer)
             try:
@@ -200,16 +242,19 @@ class GameInfoStore:
 
     def update(self, patch: Dict[str, Any], persist: bool = True) -> bool:
         self._ensure_loaded()
-        blk = self._data[self.field_key]
         safe_patch: Dict[str, Any] = {}
-        for k, v in patch.items():
-            if k in ALLOWED_KEYS and blk.get(k) != v:
-                blk[k] = v
-                safe_patch[k] = v
+        with self._lock:
+            blk = self._data[self.field_key]
+            for k, v in patch.items():
+                if k in ALLOWED_KEYS and blk.get(k) != v:
+                    blk[k] = v
+                    safe_patch[k] = v
         if not safe_patch:
             self._log("update no-op")
             return False
         log.info("gameinfo_update", extra={"field": self.field_key, "keys": list(safe_patch.keys())})
+        for k, v in safe_patch.items():
+            self._publish(k, v)
         if persist:
             try:
                 batch_write_json(self.path, {self.field_key: safe_patch})
@@ -217,6 +262,34 @@ class GameInfoStore:
                 log.error("gameinfo_batch_write_error", extra={"path": self.path, "field": self.field_key}, exc_info=True)
         return True
     
+    # ----- state bus -----
+    def _publish(self, key: str, value: Any) -> None:
+        """Push a local change to sibling stores and other processes."""
+        delta = StateDelta(self.field_key, key, value, next_version())
+        with self._lock:
+            self._versions[(delta.field, key)] = delta.version
+        _dispatch_delta(delta, origin=self)
+        _ensure_bus_subscription()
+        publish_state_delta(delta.field, key, value, delta.version)
+
+    def _apply_delta(self, delta: StateDelta) -> None:
+        """Patch the in-memory view with a change made elsewhere (no disk I/O)."""
+        if delta.key not in ALLOWED_KEYS:
+            return
+        vkey = (delta.field, delta.key)
+        with self._lock:
+            if delta.version <= self._versions.get(vkey, 0):
+                return
+            self._versions[vkey] = delta.version
+            if not self._loaded:
+                return  # first load will read the file anyway
+            blk = self._data.get(delta.field)
+            if not isinstance(blk, dict):
+                blk = {}
+                self._data[delta.field] = blk
+            blk[delta.key] = delta.value
+        log.debug("gameinfo_delta_applied", extra={"field": delta.field, "key": delta.key})
+
     def _read_disk_raw(self) -> Dict[str, Any]:
         # Use cached file reading
         return read_json_cached(self.path, {})
@@ -272,8 +345,9 @@ class GameInfoStore:
             log.debug("gameinfo_write_sync", extra={"path": self.path})
 
             # Update cache to reflect on-disk snapshot
-            self._data = data
-            self._loaded = True
+            with self._lock:
+                self._data = data
+                self._loaded = True
             return True
     
 if __name__ == "__main__":
@@ -2,15 +2,23 @@ from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
 from src.core.env_loader import ensure_env_loaded
 from src.core import get_env
-from src.core import save_teams_to_json, load_teams_from_json
+from src.core import load_teams_from_json
 from src.notification import show_message_notification
 # Performance monitoring removed - keeping core optimizations
 import threading
 import time
-from typing import Optional, Dict, Set
+from typing import Any, Callable, Optional, Dict, List, Set, Tuple
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 from src.config.settings import AppConfig
+from src.core.config_manager import get_config
 from src.core.logger import get_logger
+from src.core.team_async import AsyncTeamManager
+from src.core.team_bulk import ImportReport, bulk_upsert_teams, iter_collection_teams, read_team_file
+from src.core.team_bulk import export_teams as _export_teams
+from src.core.team_search import KeyFn, TeamSearchIndex
+from src.core.team_backup import get_team_backup
+from src.core.team_catalog import TeamCatalog, TeamCatalogSync, get_team_catalog, start_team_sync
+from src.core.team_outbox import OP_DELETE, OP_UPSERT, OutboxFlusher, TeamOutbox, get_team_outbox, start_outbox_flusher
 
 # Global connection pool
 _mongo_client = None
@@ -18,37 +26,154 @@ _mongo_client_lock = threading.Lock()
 
 # ─── SmartTeamCache ─────────────────────────────────────────────────────────
 class SmartTeamCache:
-    """Enhanced cache with selective invalidation and adaptive TTL"""
+    """
+    Teams snapshot with adaptive TTL and stale-while-revalidate reads.
+
+    `get_or_load(loader)` never blocks once a snapshot exists: a fresh snapshot
+    is a hit; an expired one (within `stale_ttl`) is served as-is while a single
+    background thread reloads it and swaps the new dict in atomically. Only an
+    empty (or very old) cache loads on the calling thread, and concurrent
+    callers share that one load. `search` never loads inline: a stale or missing
+    snapshot only starts a background refresh. TTLs come from the `teams_cache`
+    config section.
+    """
     
-    def __init__(self, base_ttl: int = 300):
+    def __init__(self, base_ttl: Optional[int] = None, *, min_ttl: Optional[int] = None,
+                 max_ttl: Optional[int] = None, stale_ttl: Optional[int] = None):
+        cfg = get_config("teams_cache", {}) or {}
         self._cache: Dict[str, str] = {}
+        self.key_fn: Optional[KeyFn] = None  # Stored normalized keys (TeamCatalog.key_of)
+        self._index = TeamSearchIndex()  # Autocomplete index over self._cache
         self._cache_timestamp: float = 0
-        self._base_ttl = base_ttl
+        self._base_ttl = int(base_ttl if base_ttl is not None else cfg.get("base_ttl", 300))
+        self._min_ttl = int(min_ttl if min_ttl is not None else cfg.get("min_ttl", 60))
+        self._max_ttl = int(max_ttl if max_ttl is not None else cfg.get("max_ttl", 1800))
+        self._stale_ttl = int(stale_ttl if stale_ttl is not None else cfg.get("stale_ttl", 3600))
         self._dirty_flags: Set[str] = set()  # Track which teams changed
         self._usage_count = 0
         self._last_access = time.time()
         self._lock = threading.Lock()
+        # Single-flight refresh; the generation detects writes racing a reload
+        self._refresh_done = threading.Event()
+        self._refresh_done.set()
+        self._generation = 0
+        self._expired = False  # Forced stale (remote change) regardless of age
+        self._metrics: Dict[str, int] = {
+            "hits": 0, "stale_hits": 0, "misses": 0,
+            "refreshes": 0, "refresh_failures": 0, "last_refresh_ms": 0,
+        }
     
     def get_ttl(self) -> int:
         """Adapt TTL based on usage frequency"""
         with self._lock:
-            current_time = time.time()
-            time_since_access = current_time - self._last_access
-            
-            if self._usage_count > 10 and time_since_access < 60:
-                # High usage, extend cache
-                return min(self._base_ttl * 2, 1800)  # Up to 30 minutes
-            elif self._usage_count < 3:
-                # Low usage, shorten cache
-                return max(self._base_ttl // 2, 60)   # Minimum 1 minute
-            
-            return self._base_ttl
+            return self._ttl_locked()
+
+    def _ttl_locked(self) -> int:
+        time_since_access = time.time() - self._last_access
+        if self._usage_count > 10 and time_since_access < 60:
+            # High usage, extend cache
+            return min(self._base_ttl * 2, self._max_ttl)
+        elif self._usage_count < 3:
+            # Low usage, shorten cache
+            return max(self._base_ttl // 2, self._min_ttl)
+        return self._base_ttl
     
     def is_valid(self) -> bool:
         """Check if cache is still valid"""
         current_time = time.time()
-        return (bool(self._cache) and 
+        return (bool(self._cache) and not self._expired and
                 (current_time - self._cache_timestamp) < self.get_ttl())
+
+    def get_or_load(self, loader: Callable[[], Dict[str, str]]) -> Dict[str, str]:
+        """Return the snapshot, refreshing it through `loader` as needed (see class doc)."""
+        self._revalidate(loader)
+        with self._lock:
+            return self._cache.copy()
+
+    def has_data(self) -> bool:
+        """True once a snapshot has been loaded (fresh or stale)."""
+        with self._lock:
+            return bool(self._cache)
+
+    def search(self, query: str, limit: Optional[int] = None,
+               loader: Optional[Callable[[], Dict[str, str]]] = None) -> List[Tuple[str, str]]:
+        """(name, abbreviation) pairs matching `query` from the prebuilt index (no dict copy).
+
+        Never blocks on `loader`: a stale or missing snapshot only schedules a
+        background refresh, and the current index is searched as-is.
+        """
+        if loader is not None:
+            self._revalidate(loader, inline=False)
+        with self._lock:
+            return self._index.search(query, limit)
+
+    def _revalidate(self, loader: Callable[[], Dict[str, str]], inline: bool = True) -> None:
+        """Hit/stale: return at once (stale starts a background refresh); miss: load inline
+        (or in the background when `inline` is False)."""
+        with self._lock:
+            age = time.time() - self._cache_timestamp
+            has_data = bool(self._cache)
+            ttl = self._ttl_locked()
+            self._record_access()
+            if has_data and age < ttl and not self._expired:
+                self._metrics["hits"] += 1
+                return
+            if has_data and age < ttl + self._stale_ttl:
+                self._metrics["stale_hits"] += 1
+                self._start_refresh_locked(loader, background=True)
+                return
+            self._metrics["misses"] += 1
+            leader = self._start_refresh_locked(loader, background=not inline)
+            if not inline:
+                return
+        if leader:
+            self._refresh(loader)
+        else:
+            self._refresh_done.wait()
+
+    def refresh_async(self, loader: Callable[[], Dict[str, str]]) -> None:
+        """Reload in the background (no-op if a refresh is already running)."""
+        with self._lock:
+            self._start_refresh_locked(loader, background=True)
+
+    def _start_refresh_locked(self, loader: Callable[[], Dict[str, str]], background: bool) -> bool:
+        """Claim the refresh slot; returns True if the caller must run it inline."""
+        if not self._refresh_done.is_set():
+            return False
+        self._refresh_done.clear()
+        if background:
+            threading.Thread(target=self._refresh, args=(loader,),
+                             name="teams-cache-refresh", daemon=True).start()
+            return False
+        return True
+
+    def _refresh(self, loader: Callable[[], Dict[str, str]]) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            generation = self._generation
+        try:
+            teams = loader()
+            fresh = {str(k).upper(): str(v).upper() for k, v in (teams or {}).items()}
+            index = TeamSearchIndex(fresh, self.key_fn)  # Built off-lock; swapped with the dict
+            with self._lock:
+                # Atomic swap; readers hold either the old or the new dict
+                self._cache = fresh
+                self._index = index
+                # A write landed mid-reload: keep the data but revalidate next read
+                self._cache_timestamp = time.time()
+                self._expired = generation != self._generation
+                self._dirty_flags.clear()
+                self._metrics["refreshes"] += 1
+                self._metrics["last_refresh_ms"] = int((time.perf_counter() - started) * 1000)
+        except Exception:
+            with self._lock:
+                self._metrics["refresh_failures"] += 1
+            try:
+                _log.warning("teams_cache_refresh_failed", exc_info=True)
+            except Exception:
+                pass
+        finally:
+            self._refresh_done.set()
     
     def get_team(self, team_name: str) -> Optional[str]:
         """Get single team with selective cache check"""
@@ -69,7 +194,12 @@ class SmartTeamCache:
         """Update single team in cache"""
         team_key = team_name.strip().upper()
         with self._lock:
-            self._cache[team_key] = abbreviation.strip().upper()
+            # Copy-on-write so snapshots handed out earlier never change
+            updated = dict(self._cache)
+            updated[team_key] = abbreviation.strip().upper()
+            self._cache = updated
+            self._index.upsert(team_key, updated[team_key])
+            self._generation += 1
             # Mark this team as fresh
             self._dirty_flags.discard(team_key)
 
@@ -79,29 +209,61 @@ class SmartTeamCache:
         team_key = team_name.strip().upper()
         with self._lock:
             self._dirty_flags.add(team_key)
+            self._index.remove(team_key)  # Don't suggest it until it is reloaded
+            self._generation += 1
+
+    def remove_team(self, team_name: str) -> None:
+        """Drop a deleted team from the snapshot (copy-on-write)."""
+        team_key = team_name.strip().upper()
+        with self._lock:
+            if team_key in self._cache:
+                updated = dict(self._cache)
+                del updated[team_key]
+                self._cache = updated
+            self._index.remove(team_key)
+            self._dirty_flags.discard(team_key)
+            self._generation += 1
 
+    def mark_stale(self) -> None:
+        """Expire the snapshot but keep serving it until a refresh swaps it out."""
+        with self._lock:
+            self._expired = True
+            self._generation += 1
     
     def invalidate_all(self) -> None:
         """Invalidate entire cache"""
         with self._lock:
-            self._cache.clear()
+            self._cache = {}
+            self._index = TeamSearchIndex(key_fn=self.key_fn)
             self._cache_timestamp = 0
             self._dirty_flags.clear()
+            self._generation += 1
     
     def set_teams(self, teams: Dict[str, str]) -> None:
         """Set all teams and mark cache as fresh"""
+        fresh = {str(k).upper(): str(v).upper() for k, v in teams.items()}
+        index = TeamSearchIndex(fresh, self.key_fn)
         with self._lock:
-            self._cache = {str(k).upper(): str(v).upper() for k, v in teams.items()}
+            self._cache = fresh
+            self._index = index
             self._cache_timestamp = time.time()
+            self._expired = False
             self._dirty_flags.clear()
+            self._generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/stale/miss/refresh counters plus current size."""
+        with self._lock:
+            return {**self._metrics, "size": len(self._cache),
+                    "refreshing": int(not self._refresh_done.is_set())}
     
     def _record_access(self) -> None:
         """Record cache access for TTL optimization"""
         self._usage_count += 1
         self._last_access = time.time()
 
-# Global smart cache instance
-_teams_cache = SmartTeamCache(base_ttl=int(getattr(AppConfig, "UI_UPDATE_DEBOUNCE", 50)) * 6)
+# Global smart cache instance (TTLs from the `teams_cache` config section)
+_teams_cache = SmartTeamCache()
 _teams_cache_timestamp = 0
 _log = get_logger(__name__)
 
@@ -149,8 +311,28 @@ def _get_mongo_client() -> MongoClient:
         # mypy: _mongo_client is MongoClient now
         return _mongo_client  # type: ignore[return-value]
 
+def _on_catalog_changed(_count: int) -> None:
+    """Remote changes landed in the local catalog: keep serving, revalidate on next read."""
+    _teams_cache.mark_stale()
+
 # ─── MongoTeamManager ───────────────────────────────────────────────────────
 class MongoTeamManager:
+    """
+    Team storage backed by Mongo, read through the local TeamCatalog.
+
+    Reads (load_teams, get_abbreviation, get_all_names) never touch the network
+    once the catalog has synced. Writes are recorded in the outbox, applied
+    locally at once and replayed into Mongo by the outbox flusher (so they
+    survive Mongo being unreachable). Deletes are tombstones (`deleted: true`)
+    so other machines' incremental syncs can see them.
+    """
+
+    catalog: TeamCatalog
+    sync: TeamCatalogSync
+    outbox: TeamOutbox
+    flusher: OutboxFlusher
+    _async: Optional[AsyncTeamManager] = None
+
     def __init__(self):
         self.client = _get_mongo_client()
         
@@ -159,99 +341,131 @@ class MongoTeamManager:
 
         coll_name = get_env("MONGO_COLLECTION")
         self.collection = self.db[coll_name]
-        try:
-            self.collection.create_index("name", unique=True)
-        except Exception:
+
+        # Local catalog: seeded from teams.json on first run, then kept in sync
+        # by a background thread (which also creates the Mongo indexes)
+        self.catalog = get_team_catalog()
+        if self.catalog.is_empty():
             try:
-                _log.warning("mongo_index_create_failed", exc_info=True)
+                seed = load_teams_from_json()
+                if seed:
+                    self.catalog.replace_all(seed)
             except Exception:
                 pass
+        # Search indexes reuse the catalog's stored keys instead of re-normalizing
+        _teams_cache.key_fn = self.catalog.key_of
+        # Unflushed local edits stay on top of whatever the sync pulls
+        self.outbox = get_team_outbox()
+        self.sync = start_team_sync(lambda: self.collection, pending_fn=self.outbox.pending_changes)
+        self.sync.add_listener(_on_catalog_changed)
+        self.flusher = start_outbox_flusher(lambda: self.collection)
         
         # Background sync thread for JSON updates
         self._json_sync_pending = False
         self._json_sync_lock = threading.Lock()
 
-    def save_team(self, name: str, abbreviation: str) -> None:
+    def async_api(self) -> AsyncTeamManager:
+        """Future-returning facade for UI callers (shared bounded worker pool)."""
+        if self._async is None:
+            self._async = AsyncTeamManager(self)
+        return self._async
+
+    def save_team(self, name: str, abbreviation: str) -> List[str]:
+        """Upsert a team; returns near-duplicate existing names (accent/punctuation/typo-level)."""
         name_clean = name.strip().upper()
         abbr_clean = abbreviation.strip().upper()
 
-        start_time = time.time()
-        try:
-            result = self.collection.update_one(
-                {"name": name_clean},
-                {"$set": {"abbreviation": abbr_clean}},
-                upsert=True
-            )
-            
-            # Record database write performance
-
-            
-            # Update cache incrementally instead of clearing all
-            global _teams_cache
-            _teams_cache.update_team(name_clean, abbr_clean)
-            
-            # Schedule background JSON update
-            self._schedule_json_update()
-            
+        similar = self.catalog.find_similar(name_clean)
+        if similar:
             try:
-                if result.upserted_id:
-                    _log.info("team_inserted", extra={"name": name_clean})
-                else:
-                    _log.info("team_updated", extra={"name": name_clean})
+                _log.warning("team_near_duplicate", extra={"name": name_clean, "similar": similar[:5]})
             except Exception:
                 pass
-                
-        except Exception as e:
-            raise e
 
-    def load_teams(self) -> dict[str, str]:
+        # Durable first, then visible locally; the flusher writes it to Mongo
+        base = self.catalog.get(name_clean)
+        self.outbox.record(OP_UPSERT, name_clean, abbr_clean, base)
+        self.catalog.upsert(name_clean, abbr_clean)
         global _teams_cache
+        _teams_cache.update_team(name_clean, abbr_clean)
+        self.flusher.request_flush()
         
-        # Check smart cache first
-        if _teams_cache.is_valid():
-            try:
-                _log.debug("teams_loaded_cache")
-            except Exception:
-                pass
-            return _teams_cache.get_all()
+        # Schedule background JSON update
+        self._schedule_json_update()
         
-        # Load from database with projection for better performance
-        start_time = time.time()
         try:
-            teams = {
-                doc["name"]: doc["abbreviation"]
-                for doc in self.collection.find(projection={"name": 1, "abbreviation": 1, "_id": 0})
-            }
-            
-            # Record database query performance
-            query_time = time.time() - start_time
-            try:
-                _log.debug("teams_query_ms", extra={"ms": int(query_time * 1000)})
-            except Exception:
-                pass
-            # Update smart cache
-            _teams_cache.set_teams(teams)
-            
-            try:
-                _log.info("teams_loaded_db")
-            except Exception:
-                pass
-            return teams
-            
-        except ConnectionFailure as e:
+            _log.info("team_inserted" if base is None else "team_updated", extra={"name": name_clean})
+        except Exception:
+            pass
+        return similar
+
+    def import_teams(self, path: str, progress=None) -> ImportReport:
+        """Bulk upsert teams from a CSV/JSON file; one cache/backup refresh at the end."""
+        report = bulk_upsert_teams(self.collection, read_team_file(path), progress=progress)
+        if report.applied:
+            self.catalog.apply_changes(report.applied)
+            _teams_cache.mark_stale()
+            self._schedule_json_update()
+        return report
+
+    def export_teams(self, path: str, progress=None) -> int:
+        """Stream every live team from Mongo to a CSV/JSON file."""
+        return _export_teams(iter_collection_teams(self.collection), path,
+                             progress=progress, total=len(self.catalog))
+
+    def load_teams(self) -> dict[str, str]:
+        """Teams snapshot; stale data is served while a background refresh runs."""
+        return _teams_cache.get_or_load(self._load_from_catalog)
+
+    def _load_from_catalog(self) -> dict[str, str]:
+        # Serve from the local catalog; only the very first run (never synced,
+        # no teams.json) has to wait for Mongo
+        if self.catalog.is_empty() and not self.catalog.has_synced():
             try:
-                _log.error("mongo_connection_failed", exc_info=True)
+                self.sync.sync_once()
             except Exception:
-                pass
-            # Return cached data if available, even if expired
-            cached_teams = _teams_cache.get_all()
-            if cached_teams:
                 try:
-                    _log.warning("teams_loaded_stale_cache")
+                    _log.error("mongo_connection_failed", exc_info=True)
                 except Exception:
                     pass
-                return cached_teams
-            return {}
+        teams = self.catalog.all()
+        try:
+            _log.debug("teams_loaded_catalog", extra={"count": len(teams)})
+        except Exception:
+            pass
+        return teams
+
+    def search_teams(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+        """Autocomplete lookup: (name, abbreviation) pairs, prefix matches first.
+
+        Loads a cold cache first (blocking; off the Tk thread only).
+        """
+        if not _teams_cache.has_data():
+            self.load_teams()
+        return _teams_cache.search(query, limit, loader=self._load_from_catalog)
+
+    def suggest_teams(self, query: str, limit: Optional[int] = None) -> Optional[List[Tuple[str, str]]]:
+        """Autocomplete pairs for the Tk thread; never loads inline.
+
+        None while no teams are loaded: a background refresh is started and the
+        caller falls back to its own list.
+        """
+        if not _teams_cache.has_data():
+            _teams_cache.refresh_async(self._load_from_catalog)
+            return None
+        return _teams_cache.search(query, limit, loader=self._load_from_catalog)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Team cache hit/stale/refresh metrics."""
+        return _teams_cache.stats()
+
+    def outbox_status(self) -> Dict[str, Any]:
+        """Mutations waiting for Mongo, plus retry/backoff state."""
+        return self.flusher.status()
+
+    def take_conflicts(self) -> List[Dict[str, Any]]:
+        """Conflicts found while flushing that the UI has not shown yet."""
+        return self.outbox.take_conflicts()
 
     def get_abbreviation(self, name: str) -> str:
         name_clean = name.strip().upper()
@@ -261,10 +475,17 @@ class MongoTeamManager:
         if cached_abbr:
             return cached_abbr
         
+        # Local catalog is authoritative once it has synced
+        local_abbr = self.catalog.get(name_clean)
+        if local_abbr is not None or self.catalog.has_synced():
+            if local_abbr:
+                _teams_cache.update_team(name_clean, local_abbr)
+            return local_abbr or ""
+        
         # Fallback to database query
         try:
             doc = self.collection.find_one(
-                {"name": name_clean}, 
+                {"name": name_clean, "deleted": {"$ne": True}},
                 projection={"abbreviation": 1, "_id": 0}
             )
             if isinstance(doc, dict):
@@ -281,49 +502,78 @@ class MongoTeamManager:
         if cached_teams:
             return list(cached_teams.keys())
         
-        # Fallback to database
-        try:
-            return [str(doc.get("name", "")) for doc in self.collection.find(
-                projection={"name": 1, "_id": 0}
-            ) if isinstance(doc, dict) and doc.get("name")]
-        except ConnectionFailure:
-            return []
+        return self.catalog.names()
 
     def backup_to_json(self) -> None:
-        """Optimized JSON backup with change detection"""
-        teams = self.load_teams()
-        
-        # Load existing JSON to compare
+        """Write teams.json and a rotated snapshot if the team set changed since the last backup."""
+        backup = get_team_backup()
+        content_hash = self.catalog.content_hash()
+        if backup.is_current(content_hash):
+            try:
+                _log.debug("teams_json_up_to_date")
+            except Exception:
+                pass
+            return  # No changes, skip write
         try:
-            existing_teams = load_teams_from_json()
-            if existing_teams == teams:
-                try:
-                    _log.debug("teams_json_up_to_date")
-                except Exception:
-                    pass
-                return  # No changes, skip write
-        except:
-            pass  # JSON doesn't exist or is invalid
-        
-        # Only write if there are actual changes
+            backup.save(self.catalog.all(), content_hash)
+        except Exception:
+            try:
+                _log.error("teams_backup_save_failed", exc_info=True)
+            except Exception:
+                pass
+
+    def schedule_backup(self) -> None:
+        """Back up in the background (debounced); safe to call from the UI thread."""
+        self._schedule_json_update()
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """Restorable snapshots, newest first."""
+        out: List[Dict[str, Any]] = []
+        for path in get_team_backup().snapshots():
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            out.append({"name": path.name, "path": str(path), "size": size})
+        return out
+
+    def restore_backup(self, snapshot: str) -> int:
+        """Make the team set equal to `snapshot` (queued through the outbox); returns teams changed."""
+        teams = get_team_backup().load(snapshot)
+        current = self.catalog.all()
+        changes: List[Tuple[str, Optional[str]]] = [(n, a) for n, a in teams.items() if current.get(n) != a]
+        changes += [(n, None) for n in current if n not in teams]
+        if not changes:
+            return 0
+        self.outbox.record_many([
+            (OP_DELETE if abbr is None else OP_UPSERT, name, abbr, current.get(name)) for name, abbr in changes
+        ])
+        self.catalog.apply_changes(changes)
+        _teams_cache.mark_stale()
+        self.flusher.request_flush()
+        self._schedule_json_update()
         try:
-            _log.info("teams_json_changed_updating")
+            _log.info("teams_backup_restored", extra={"snapshot": str(snapshot), "changed": len(changes)})
         except Exception:
             pass
-        save_teams_to_json(teams)
+        return len(changes)
 
     def delete_team(self, name: str) -> bool:
-        """Delete team from database and invalidate cache"""
-        result = self.collection.delete_one({"name": name.strip().upper()})
+        """Delete team (queued tombstone for Mongo, removed locally) and invalidate cache"""
+        name_clean = name.strip().upper()
+        base = self.catalog.get(name_clean)
+        self.outbox.record(OP_DELETE, name_clean, None, base)
+        self.catalog.remove(name_clean)
+        self.flusher.request_flush()
         
-        # Invalidate specific team in cache
+        # Drop the team from the cached snapshot
         global _teams_cache
-        _teams_cache.invalidate_team(name.strip().upper())
+        _teams_cache.remove_team(name_clean)
         
         # Schedule background JSON update
         self._schedule_json_update()
         
-        return bool(getattr(result, "deleted_count", 0) > 0)
+        return base is not None
 
     def _schedule_json_update(self):
         """Schedule JSON update in background thread to avoid blocking UI"""
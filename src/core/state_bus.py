@@ -0,0 +1,310 @@
+"""
+Cross-process state bus for field processes.
+
+What this is:
+- A tiny pub/sub hub that runs next to the notification server and relays
+  compact state deltas ``(field, key, value, version)`` between processes over
+  authenticated local ``multiprocessing.connection`` sockets.
+
+Why it exists:
+- Field processes used to learn about each other's changes only by re-reading
+  ``gameinfo.json``. With the bus, a ``GameInfoStore.set`` in one process is
+  pushed to every other process, which patches its in-memory view immediately.
+
+Main features:
+- Hub: accept thread + one reader and one sender thread per client, fan-out to
+  all other clients
+- Client: non-blocking ``publish`` (dedicated sender thread) and a reader thread
+  that dispatches deltas to local subscribers
+- Last-writer-wins versions (ns timestamps, strictly increasing per process)
+- End-to-end latency statistics (publisher ``set`` -> subscriber view)
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Client, Listener
+from queue import Empty, Queue
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from ..config import AppConfig
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+Address = Tuple[str, int]
+
+
+class StateDelta(NamedTuple):
+    """Single key change for one field section of gameinfo."""
+    field: str
+    key: str
+    value: Any
+    version: int
+
+
+_version_lock = threading.Lock()
+_last_version = 0
+
+
+def next_version() -> int:
+    """Return a strictly increasing ns timestamp usable as a delta version."""
+    global _last_version
+    with _version_lock:
+        _last_version = max(_last_version + 1, time.time_ns())
+        return _last_version
+
+
+# ─────────────────────────── Hub ───────────────────────────
+class StateBusHub:
+    """Relay deltas received from one client to every other connected client."""
+
+    def __init__(self, host: str = "127.0.0.1", authkey: Optional[bytes] = None):
+        self.authkey = authkey or os.urandom(16)
+        self._listener = Listener((host, 0), authkey=self.authkey)
+        host_, port = self._listener.address
+        self.address: Address = (str(host_), int(port))
+        # Connection (or PipeConnection on Windows) -> its outgoing queue; one sender thread
+        # per client owns its writes, so relays never interleave and a stalled client only delays itself
+        self._clients: Dict[Any, "Queue[Any]"] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._accept_thread: Optional[threading.Thread] = None
+        self.relayed = 0
+
+    def start(self) -> "StateBusHub":
+        if self._accept_thread is None:
+            self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+            self._accept_thread.start()
+            log.info("state_bus_hub_started", extra={"port": self.address[1]})
+        return self
+
+    def _accept_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                if self._closed.is_set():
+                    break
+                log.warning("state_bus_accept_failed", exc_info=True)
+                continue
+            out: "Queue[Any]" = Queue()
+            with self._lock:
+                self._clients[conn] = out
+            threading.Thread(target=self._send_loop, args=(conn, out), daemon=True).start()
+            threading.Thread(target=self._client_loop, args=(conn,), daemon=True).start()
+
+    def _client_loop(self, conn: Any) -> None:
+        try:
+            while not self._closed.is_set():
+                msg = conn.recv()
+                self._broadcast(msg, origin=conn)
+        except (EOFError, OSError):
+            pass
+        except Exception:
+            log.warning("state_bus_client_error", exc_info=True)
+        finally:
+            self._drop(conn)
+
+    def _send_loop(self, conn: Any, out: "Queue[Any]") -> None:
+        while True:
+            msg = out.get()
+            if msg is None:
+                break
+            try:
+                conn.send(msg)
+                self.relayed += 1
+            except Exception:
+                self._drop(conn)
+                break
+
+    def _broadcast(self, msg: Any, origin: Any) -> None:
+        with self._lock:
+            targets = [q for c, q in self._clients.items() if c is not origin]
+        for q in targets:
+            q.put(msg)
+
+    def _drop(self, conn: Any) -> None:
+        with self._lock:
+            out = self._clients.pop(conn, None)
+        if out is not None:
+            out.put(None)  # Stop its sender thread
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def client_count(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def close(self) -> None:
+        self._closed.set()
+        try:
+            self._listener.close()
+        except Exception:
+            pass
+        with self._lock:
+            clients = list(self._clients)
+        for c in clients:
+            self._drop(c)
+
+
+# ─────────────────────────── Client ───────────────────────────
+DeltaCallback = Callable[[StateDelta], None]
+
+
+class StateBusClient:
+    """Per-process connection to the hub.
+
+    ``publish`` only enqueues; a sender thread owns all socket writes so the
+    Tk thread never blocks on a stalled peer. Incoming deltas are delivered to
+    subscribers on the reader thread (subscribers must not touch Tk widgets
+    directly).
+    """
+
+    LATENCY_SAMPLES = 512
+
+    def __init__(self, address: Address, authkey: bytes):
+        self._conn = Client(address, authkey=authkey)
+        self._send_q: "Queue[Optional[StateDelta]]" = Queue()
+        self._subscribers: List[DeltaCallback] = []
+        self._sub_lock = threading.Lock()
+        self._latencies_ms: Deque[float] = deque(maxlen=self.LATENCY_SAMPLES)
+        self._closed = threading.Event()
+        self.sent = 0
+        self.received = 0
+        self._sender = threading.Thread(target=self._send_loop, daemon=True)
+        self._reader = threading.Thread(target=self._recv_loop, daemon=True)
+        self._sender.start()
+        self._reader.start()
+
+    # ----- publish / subscribe -----
+    def publish(self, field: str, key: str, value: Any, version: Optional[int] = None) -> StateDelta:
+        delta = StateDelta(field, key, value, version if version is not None else next_version())
+        if not self._closed.is_set():
+            self._send_q.put(delta)
+        return delta
+
+    def subscribe(self, callback: DeltaCallback) -> None:
+        with self._sub_lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: DeltaCallback) -> None:
+        with self._sub_lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    # ----- worker threads -----
+    def _send_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                delta = self._send_q.get(timeout=0.5)
+            except Empty:
+                continue
+            if delta is None:
+                break
+            try:
+                self._conn.send(tuple(delta))
+                self.sent += 1
+            except Exception:
+                log.warning("state_bus_send_failed", exc_info=True)
+                self._closed.set()
+                break
+
+    def _recv_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                raw = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            except Exception:
+                log.warning("state_bus_recv_failed", exc_info=True)
+                break
+            try:
+                delta = StateDelta(*raw)
+            except Exception:
+                continue
+            self.received += 1
+            self._latencies_ms.append(max(0.0, (time.time_ns() - delta.version) / 1_000_000))
+            with self._sub_lock:
+                subs = list(self._subscribers)
+            for cb in subs:
+                try:
+                    cb(delta)
+                except Exception:
+                    log.warning("state_bus_subscriber_error", exc_info=True)
+        self._closed.set()
+
+    # ----- metrics / lifecycle -----
+    def latency_stats(self) -> Dict[str, float]:
+        """Publisher ``set`` -> local view latency over the last samples (ms)."""
+        samples = sorted(self._latencies_ms)
+        if not samples:
+            return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        n = len(samples)
+        return {
+            "count": n,
+            "avg_ms": round(sum(samples) / n, 3),
+            "p50_ms": round(samples[n // 2], 3),
+            "p95_ms": round(samples[min(n - 1, int(n * 0.95))], 3),
+            "max_ms": round(samples[-1], 3),
+        }
+
+    def is_connected(self) -> bool:
+        return not self._closed.is_set()
+
+    def close(self) -> None:
+        if self.received:
+            log.info("state_bus_latency", extra=self.latency_stats())
+        self._closed.set()
+        self._send_q.put(None)
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+
+# ─────────────────────────── Process-level helpers ───────────────────────────
+# Initialized per process via init_state_bus()
+_client: Optional[StateBusClient] = None
+
+
+def start_state_bus_hub() -> Optional[StateBusHub]:
+    """Start the hub in the launcher process. Returns None when disabled/failing."""
+    if not getattr(AppConfig, "STATE_BUS_ENABLED", True):
+        return None
+    try:
+        return StateBusHub(host=getattr(AppConfig, "STATE_BUS_HOST", "127.0.0.1")).start()
+    except Exception:
+        log.warning("state_bus_hub_start_failed", exc_info=True)
+        return None
+
+
+def init_state_bus(address: Optional[Address], authkey: Optional[bytes]) -> Optional[StateBusClient]:
+    """Connect this process to the hub. Call once in each field process."""
+    global _client
+    if address is None or authkey is None:
+        return None
+    try:
+        _client = StateBusClient((str(address[0]), int(address[1])), authkey)
+        atexit.register(_client.close)
+        log.info("state_bus_connected", extra={"pid": os.getpid()})
+    except Exception:
+        log.warning("state_bus_connect_failed", exc_info=True)
+        _client = None
+    return _client
+
+
+def get_state_bus() -> Optional[StateBusClient]:
+    return _client
+
+
+def publish_state_delta(field: str, key: str, value: Any, version: Optional[int] = None) -> None:
+    """Best-effort publish; a no-op when this process is not connected."""
+    client = _client
+    if client is not None and client.is_connected():
+        client.publish(field, key, value, version)
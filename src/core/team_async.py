@@ -0,0 +1,256 @@
+"""
+Asynchronous facade over MongoTeamManager.
+
+What this is:
+- `AsyncTeamManager(manager)`: the same operations as MongoTeamManager
+  (`load_teams`, `get_abbreviation`, `save_team`, `delete_team`, bulk
+  import/export) returning `concurrent.futures.Future`s
+- One shared, bounded worker pool (`TEAM_ASYNC_WORKERS` threads, at most
+  `TEAM_ASYNC_MAX_PENDING` queued calls) for every facade in the process
+- Per-call timeouts (`TEAM_ASYNC_TIMEOUT_S` by default) and cancellation
+- `deliver()`: run a callback on the Tk thread (via `widget.after`) once a
+  future settles
+
+Why it exists:
+- The sync methods do network I/O and were called from Tk callbacks; with a
+  slow Atlas the window froze for up to `serverSelectionTimeoutMS`. The sync
+  API stays for scripts; UI code goes through this facade instead.
+
+Semantics:
+- `future.cancel()` succeeds while the call is still queued; a running call
+  cannot be interrupted (pymongo has no cancellation) and finishes in the
+  background.
+- On timeout the future fails with `TimeoutError` right away; if the worker
+  later completes, its result is discarded.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import CancelledError, Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from ..config import AppConfig
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Sentinel: "use the configured default timeout" (None means no timeout)
+_DEFAULT: Any = object()
+
+
+class TeamTaskRejected(RuntimeError):
+    """Raised (via the future) when the pool already has too many pending calls."""
+
+
+class _Watchdog:
+    """Single thread failing futures whose deadline passed before they settled."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, "Future[Any]"]] = []
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, future: "Future[Any]", timeout_s: float) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + timeout_s, next(self._seq), future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="team-async-watchdog", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                deadline, _, future = self._heap[0]
+                wait = deadline - time.monotonic()
+                if wait > 0 and not future.done():
+                    self._cond.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+            if not future.done():
+                _settle(future, exc=TimeoutError("team operation timed out"))
+
+
+class _Pool:
+    """Shared bounded executor; created lazily on first submit."""
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.watchdog = _Watchdog()
+        self.submitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def submit(self, fn: Callable[[], T], timeout_s: Optional[float]) -> "Future[T]":
+        future: "Future[T]" = Future()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                future.set_exception(TeamTaskRejected(f"{self._pending} team operations already pending"))
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="team-async")
+            self._pending += 1
+            self.submitted += 1
+            executor = self._executor
+        executor.submit(self._run, future, fn)
+        if timeout_s is not None and timeout_s > 0:
+            self.watchdog.watch(future, timeout_s)
+        return future
+
+    def _run(self, future: "Future[T]", fn: Callable[[], T]) -> None:
+        try:
+            try:
+                if not future.set_running_or_notify_cancel():
+                    return  # Cancelled while queued
+            except (RuntimeError, InvalidStateError):
+                with self._lock:
+                    self.timed_out += 1
+                return  # Timed out while queued
+            try:
+                result = fn()
+            except BaseException as e:
+                if not _settle(future, exc=e):
+                    self._late(fn)
+                return
+            if not _settle(future, result=result):
+                self._late(fn)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _late(self, fn: Callable[[], Any]) -> None:
+        with self._lock:
+            self.timed_out += 1
+        log.warning("team_async_late_result", extra={"fn": getattr(fn, "__name__", repr(fn))})
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers, "pending": self._pending, "submitted": self.submitted,
+                "rejected": self.rejected, "timed_out": self.timed_out,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _settle(future: "Future[Any]", result: Any = None, exc: Optional[BaseException] = None) -> bool:
+    """Complete `future` unless something (timeout, cancel) already did."""
+    try:
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        return True
+    except InvalidStateError:
+        return False
+
+
+_pool: Optional[_Pool] = None
+_pool_lock = threading.Lock()
+
+
+def get_team_pool() -> _Pool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _Pool(int(AppConfig.TEAM_ASYNC_WORKERS), int(AppConfig.TEAM_ASYNC_MAX_PENDING))
+        return _pool
+
+
+def deliver(
+    future: "Future[T]",
+    widget: Any,
+    on_result: Callable[[T], None],
+    on_error: Optional[Callable[[BaseException], None]] = None,
+) -> None:
+    """Call `on_result`/`on_error` on the Tk thread once `future` settles.
+
+    Cancelled futures and destroyed widgets are ignored silently.
+    """
+
+    def _on_tk() -> None:
+        try:
+            if not widget.winfo_exists():
+                return
+        except Exception:
+            return
+        try:
+            value = future.result(timeout=0)
+        except CancelledError:
+            return
+        except BaseException as e:
+            if on_error is not None:
+                on_error(e)
+            else:
+                log.warning("team_async_failed", exc_info=(type(e), e, e.__traceback__))
+            return
+        on_result(value)
+
+    def _done(_f: "Future[T]") -> None:
+        try:
+            widget.after(0, _on_tk)
+        except Exception:
+            pass  # Widget (or Tk) already gone
+
+    future.add_done_callback(_done)
+
+
+class AsyncTeamManager:
+    """Future-returning wrapper around a MongoTeamManager (or anything shaped like one)."""
+
+    def __init__(self, manager: Any, *, timeout_s: Any = _DEFAULT) -> None:
+        self.manager = manager
+        self.timeout_s: Optional[float] = (
+            float(AppConfig.TEAM_ASYNC_TIMEOUT_S) if timeout_s is _DEFAULT else timeout_s
+        )
+
+    def submit(self, fn: Callable[[], T], *, timeout_s: Any = _DEFAULT) -> "Future[T]":
+        """Run `fn()` on the team pool; `timeout_s=None` disables the timeout."""
+        return get_team_pool().submit(fn, self.timeout_s if timeout_s is _DEFAULT else timeout_s)
+
+    def load_teams(self) -> "Future[dict]":
+        return self.submit(self.manager.load_teams)
+
+    def get_abbreviation(self, name: str) -> "Future[str]":
+        return self.submit(lambda: self.manager.get_abbreviation(name))
+
+    def save_team(self, name: str, abbreviation: str) -> "Future[List[str]]":
+        return self.submit(lambda: self.manager.save_team(name, abbreviation))
+
+    def delete_team(self, name: str) -> "Future[bool]":
+        return self.submit(lambda: self.manager.delete_team(name))
+
+    def import_teams(self, path: str, progress: Optional[Callable[[int, int], None]] = None) -> "Future[Any]":
+        # Bulk work is bounded by the batch count, not by a network timeout
+        return self.submit(lambda: self.manager.import_teams(path, progress), timeout_s=None)
+
+    def export_teams(self, path: str, progress: Optional[Callable[[int, int], None]] = None) -> "Future[int]":
+        return self.submit(lambda: self.manager.export_teams(path, progress), timeout_s=None)
+
+    def restore_backup(self, snapshot: str) -> "Future[int]":
+        return self.submit(lambda: self.manager.restore_backup(snapshot), timeout_s=None)
+
+
+def async_team_manager(manager: Any) -> AsyncTeamManager:
+    """The manager's shared facade if it has one (MongoTeamManager), else a new wrapper."""
+    api = getattr(manager, "async_api", None)
+    facade = api() if callable(api) else None
+    if isinstance(facade, AsyncTeamManager):
+        return facade
+    return AsyncTeamManager(manager)
@@ -0,0 +1,241 @@
+"""
+Incremental, rotated team backups.
+
+What this is:
+- ``teams.json`` (the live copy used to seed a fresh catalog) plus
+  gzip-compressed ``teams_backup_<UTC timestamp>.json.gz`` snapshots in a
+  ``backups`` folder next to it, pruned after ``BACKUP_RETENTION_DAYS``.
+- A stable, order-independent content hash of the team set: the sum of one
+  BLAKE2b digest per (name, abbreviation). ``TeamCatalog`` updates it on every
+  write, so it is always known without touching the data.
+
+Why it exists:
+- ``backup_to_json`` used to re-read and parse teams.json and compare whole
+  dicts after every save, then overwrite the only copy. An unchanged team set
+  is now skipped by comparing two strings, and every change leaves a snapshot
+  that can be restored after a bad import or a mass delete.
+
+Main features:
+- Atomic writes (temp file + ``os.replace``) for teams.json and snapshots
+- Last saved hash persisted in ``backup_state.json`` (survives restarts)
+- The newest snapshot is never pruned, however old it is
+"""
+
+import calendar
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..config import AppConfig
+from .file_cache import invalidate_file_cache
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+_DIGEST_MOD = 1 << 64
+_STATE_FILENAME = "backup_state.json"
+_SNAPSHOT_SUFFIX = ".json.gz"
+_STAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
+# ----- content hash -----
+def team_digest(name: str, abbreviation: str) -> int:
+    """64-bit digest of one team; the set hash is the sum of these (mod 2**64)."""
+    raw = f"{name}\x00{abbreviation}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "big")
+
+
+def combine_digests(digests: Iterable[int]) -> int:
+    return sum(digests) % _DIGEST_MOD
+
+
+def format_content_hash(count: int, digest: int) -> str:
+    return f"{count}-{digest % _DIGEST_MOD:016x}"
+
+
+def teams_content_hash(teams: Dict[str, str]) -> str:
+    """Full O(n) hash of a snapshot; matches ``TeamCatalog.content_hash()`` for the same teams."""
+    return format_content_hash(len(teams), combine_digests(team_digest(n, a) for n, a in teams.items()))
+
+
+# ----- paths -----
+def default_live_path() -> Path:
+    from .filenames import BASE_FOLDER_PATH
+    return Path(BASE_FOLDER_PATH) / AppConfig.TEAMS_BACKUP_FILENAME
+
+
+def default_backup_dir() -> Path:
+    return default_live_path().parent / AppConfig.BACKUP_DIRNAME
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(payload)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+class TeamBackup:
+    """Writes teams.json and a compressed snapshot whenever the team set's hash changes."""
+
+    def __init__(
+        self,
+        folder: Optional[Path] = None,
+        *,
+        live_path: Optional[Path] = None,
+        prefix: Optional[str] = None,
+        retention_days: Optional[float] = None,
+        snapshots_enabled: Optional[bool] = None,
+    ):
+        self.live_path = Path(live_path) if live_path is not None else default_live_path()
+        self.folder = Path(folder) if folder is not None else self.live_path.parent / AppConfig.BACKUP_DIRNAME
+        self.prefix = prefix if prefix is not None else AppConfig.BACKUP_FILE_PREFIX
+        days = retention_days if retention_days is not None else AppConfig.BACKUP_RETENTION_DAYS
+        self.retention_s = float(days) * 86400.0
+        self.snapshots_enabled = AppConfig.AUTO_BACKUP_ENABLED if snapshots_enabled is None else snapshots_enabled
+        self._pattern = re.compile(re.escape(self.prefix) + r"(\d{8}-\d{6})(?:_[0-9a-f]+)?" + re.escape(_SNAPSHOT_SUFFIX) + "$")
+        self._lock = threading.Lock()
+        self._last_hash: Optional[str] = self._read_state().get("hash")
+
+    # ----- state -----
+    def _state_path(self) -> Path:
+        return self.folder / _STATE_FILENAME
+
+    def _read_state(self) -> Dict[str, Any]:
+        try:
+            with open(self._state_path(), "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def last_hash(self) -> Optional[str]:
+        return self._last_hash
+
+    def is_current(self, content_hash: str) -> bool:
+        """True when the last saved backup already has this content (O(1))."""
+        return content_hash == self._last_hash
+
+    # ----- save -----
+    def save(self, teams: Dict[str, str], content_hash: Optional[str] = None) -> Optional[Path]:
+        """Write teams.json (and a snapshot, if enabled) unless nothing changed; returns the snapshot path."""
+        digest = content_hash if content_hash is not None else teams_content_hash(teams)
+        with self._lock:
+            if digest == self._last_hash:
+                log.debug("teams_backup_unchanged", extra={"hash": digest})
+                return None
+            self.folder.mkdir(parents=True, exist_ok=True)
+            data = dict(sorted(teams.items()))
+            _write_atomic(self.live_path, json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+            invalidate_file_cache(str(self.live_path))
+
+            now = time.time()
+            snapshot: Optional[Path] = None
+            pruned = 0
+            if self.snapshots_enabled:
+                name = f"{self.prefix}{time.strftime(_STAMP_FORMAT, time.gmtime(now))}"
+                snapshot = self.folder / f"{name}{_SNAPSHOT_SUFFIX}"
+                if snapshot.exists():  # Two changes within the same second
+                    snapshot = self.folder / f"{name}_{digest[-8:]}{_SNAPSHOT_SUFFIX}"
+                payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                _write_atomic(snapshot, gzip.compress(payload, mtime=0))
+                pruned = self._prune_locked(now)
+
+            state = {"hash": digest, "snapshot": snapshot.name if snapshot else None, "saved_at": now, "count": len(data)}
+            _write_atomic(self._state_path(), json.dumps(state).encode("utf-8"))
+            self._last_hash = digest
+        log.info("teams_backup_saved", extra={
+            "path": str(snapshot or self.live_path), "count": len(data), "pruned": pruned,
+        })
+        return snapshot
+
+    # ----- snapshots -----
+    def _stamp(self, path: Path) -> Optional[float]:
+        match = self._pattern.match(path.name)
+        if not match:
+            return None
+        try:
+            return float(calendar.timegm(time.strptime(match.group(1), _STAMP_FORMAT)))
+        except ValueError:
+            return None
+
+    def _dated_snapshots(self) -> List[Tuple[float, Path]]:
+        """(timestamp, path) newest first; same-second snapshots are ordered by mtime."""
+        dated: List[Tuple[float, float, Path]] = []
+        try:
+            entries = list(self.folder.iterdir())
+        except OSError:
+            return []
+        for path in entries:
+            stamp = self._stamp(path)
+            if stamp is None:
+                continue
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            dated.append((stamp, mtime, path))
+        dated.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [(stamp, path) for stamp, _, path in dated]
+
+    def snapshots(self) -> List[Path]:
+        """Snapshot files, newest first."""
+        return [path for _, path in self._dated_snapshots()]
+
+    def prune(self, now: Optional[float] = None) -> int:
+        with self._lock:
+            return self._prune_locked(time.time() if now is None else now)
+
+    def _prune_locked(self, now: float) -> int:
+        cutoff = now - self.retention_s
+        removed = 0
+        for stamp, path in self._dated_snapshots()[1:]:  # Always keep the newest
+            if stamp >= cutoff:
+                continue
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                log.debug("teams_backup_prune_failed", extra={"path": str(path)}, exc_info=True)
+        return removed
+
+    def resolve(self, snapshot: Union[str, Path]) -> Path:
+        """Accept a snapshot path or a bare file name from ``snapshots()``."""
+        path = Path(snapshot)
+        if not path.is_absolute() and not path.exists():
+            path = self.folder / path
+        return path
+
+    def load(self, snapshot: Union[str, Path]) -> Dict[str, str]:
+        """Teams stored in a snapshot (gzip or plain JSON, e.g. an old teams.json)."""
+        path = self.resolve(snapshot)
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        if raw[:2] == b"\x1f\x8b":
+            raw = gzip.decompress(raw)
+        data = json.loads(raw.decode("utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError(f"{path.name}: expected a JSON object of name -> abbreviation")
+        return {str(n).strip().upper(): str(a).strip().upper() for n, a in data.items() if str(n).strip()}
+
+
+# ─────────────────────────── Process-level helpers ───────────────────────────
+_backup: Optional[TeamBackup] = None
+_init_lock = threading.Lock()
+
+
+def get_team_backup() -> TeamBackup:
+    """The process's TeamBackup for the default teams.json location."""
+    global _backup
+    with _init_lock:
+        if _backup is None:
+            _backup = TeamBackup()
+        return _backup
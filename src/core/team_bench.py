@@ -0,0 +1,279 @@
+"""
+Offline benchmark for the team data path, per repository backend.
+
+Runs the same workload against each ``TeamRepository`` with the app's
+``SmartTeamCache`` in front, the way ``MongoTeamManager`` reads:
+
+- bulk: ``save_many`` of every team, then single ``save_team`` calls
+- cache: reads mixed with local writes and periodic remote changes
+  (``mark_stale``); reports hit/stale/miss rates and backend loads
+- search: autocomplete keystrokes against the cache's index
+- bulk_path (memory and mongo): the app's own ``team_bulk`` import/export and
+  ``OutboxFlusher`` replay against a collection (``InMemoryTeamCollection`` for
+  the memory backend)
+
+The ``memory`` backend takes ``--latency-ms``/``--jitter-ms``/``--failure-rate``
+to mimic Atlas round trips and flaky networks; failed bulk steps are retried
+(``--retries``) and counted, like a user pressing Import again. ``mongo``
+writes to a scratch collection (``--mongo-collection``, dropped afterwards),
+never the real one.
+
+    python -m src.core.team_bench --backend memory json --teams 10000 --latency-ms 40
+"""
+
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .mongodb import SmartTeamCache
+from .team_bulk import bulk_upsert_teams, export_teams, iter_collection_teams
+from .team_outbox import OP_UPSERT, OutboxFlusher, TeamOutbox
+from .team_repository import InMemoryTeamCollection, InMemoryTeamRepository, TeamRepository, create_team_repository
+from .team_search import random_teams
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "avg_ms": round(sum(ordered) / n, 4),
+        "p50_ms": round(ordered[n // 2], 4),
+        "p95_ms": round(ordered[min(n - 1, int(n * 0.95))], 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+def _timed(fn: Callable[[], Any], samples: List[float]) -> bool:
+    """Run `fn`, append its latency; False if it raised a ConnectionError."""
+    t = time.perf_counter()
+    try:
+        fn()
+        return True
+    except ConnectionError:
+        return False
+    finally:
+        samples.append((time.perf_counter() - t) * 1000)
+
+
+def _retried(fn: Callable[[], Any], retries: int) -> Tuple[bool, int, float]:
+    """Run `fn` until it succeeds (up to `retries` extra attempts): (ok, failed attempts, ms)."""
+    failed = 0
+    t = time.perf_counter()
+    for _ in range(retries + 1):
+        try:
+            fn()
+            return True, failed, (time.perf_counter() - t) * 1000
+        except ConnectionError:
+            failed += 1
+    return False, failed, (time.perf_counter() - t) * 1000
+
+
+def run_workload(
+    repo: TeamRepository,
+    teams: Dict[str, str],
+    *,
+    writes: int = 200,
+    reads: int = 5_000,
+    remote_change_every: int = 500,
+    queries: int = 200,
+    limit: int = 200,
+    seed: int = 11,
+    retries: int = 5,
+) -> Dict[str, Any]:
+    """Bulk load `teams` into `repo`, then measure writes, cached reads and search."""
+    rng = random.Random(seed)
+    names = list(teams)
+    out: Dict[str, Any] = {"teams": len(teams)}
+
+    # ----- bulk + single writes -----
+    loaded, bulk_failed, bulk_ms = _retried(lambda: repo.save_many(teams), retries)
+    out["bulk"] = {
+        "ms": round(bulk_ms, 1),
+        "teams_per_s": round(len(teams) / max(bulk_ms / 1000, 1e-9)) if loaded else 0,
+        "failed_attempts": bulk_failed,
+        "loaded": loaded,
+    }
+    write_ms: List[float] = []
+    failed_writes = 0
+    for _ in range(writes):
+        name = rng.choice(names)
+        if not _timed(lambda: repo.save_team(name, teams[name]), write_ms):
+            failed_writes += 1
+    out["save_team"] = {**_percentiles(write_ms), "failed": failed_writes}
+
+    # ----- cache in front of the backend -----
+    loads = 0
+
+    def loader() -> Dict[str, str]:
+        nonlocal loads
+        loads += 1
+        return repo.load_teams()
+
+    cache = SmartTeamCache(base_ttl=300, min_ttl=0, max_ttl=300, stale_ttl=3600)
+    read_ms: List[float] = []
+    for i in range(reads):
+        if remote_change_every and i and i % remote_change_every == 0:
+            cache.mark_stale()  # Another machine changed something
+        if i % 50 == 0:
+            name = rng.choice(names)
+            try:
+                repo.save_team(name, teams[name])
+                cache.update_team(name, teams[name])
+            except ConnectionError:
+                pass
+        _timed(lambda: cache.get_or_load(loader), read_ms)
+    stats = cache.stats()
+    served = stats["hits"] + stats["stale_hits"] + stats["misses"]
+    out["cache"] = {
+        **_percentiles(read_ms),
+        "hit_rate": round(stats["hits"] / max(served, 1), 4),
+        "stale_rate": round(stats["stale_hits"] / max(served, 1), 4),
+        "miss_rate": round(stats["misses"] / max(served, 1), 4),
+        "backend_loads": loads,
+        "refresh_failures": stats["refresh_failures"],
+    }
+
+    # ----- autocomplete -----
+    search_ms: List[float] = []
+    for _ in range(queries):
+        target = rng.choice(names)
+        typed = target[:rng.randint(3, 10)]
+        for i in range(1, len(typed) + 1):
+            prefix = typed[:i]
+            _timed(lambda: cache.search(prefix, limit), search_ms)
+    out["search"] = {**_percentiles(search_ms), "keystrokes": len(search_ms)}
+    return out
+
+
+def run_bulk_path(
+    collection: Any,
+    teams: Dict[str, str],
+    *,
+    edits: int = 500,
+    batch_size: Optional[int] = None,
+    retries: int = 5,
+    seed: int = 13,
+) -> Dict[str, Any]:
+    """The app's bulk import, streaming export and outbox replay against `collection`."""
+    rng = random.Random(seed)
+    rows = [(i, name, abbr) for i, (name, abbr) in enumerate(teams.items(), start=1)]
+    out: Dict[str, Any] = {}
+
+    ok, failed, ms = _retried(lambda: bulk_upsert_teams(collection, rows, batch_size=batch_size), retries)
+    out["import"] = {
+        "ms": round(ms, 1), "teams_per_s": round(len(rows) / max(ms / 1000, 1e-9)) if ok else 0,
+        "failed_attempts": failed, "completed": ok,
+    }
+
+    scratch = Path(tempfile.mkdtemp(prefix="team_bench_export_"))
+    try:
+        exported: List[int] = []
+        ok, failed, ms = _retried(
+            lambda: exported.append(export_teams(iter_collection_teams(collection), str(scratch / "teams.csv"))),
+            retries,
+        )
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    out["export"] = {"ms": round(ms, 1), "teams": exported[-1] if exported else 0,
+                     "failed_attempts": failed, "completed": ok}
+
+    # Write-behind: operator edits recorded locally, replayed in bulk_write batches
+    outbox = TeamOutbox(Path(":memory:"))
+    names = list(teams)
+    outbox.record_many([(OP_UPSERT, name, f"E{i}", teams[name])
+                        for i, name in enumerate(rng.sample(names, min(edits, len(names))))])
+    flusher = OutboxFlusher(outbox, lambda: collection)
+    ok, failed, ms = _retried(flusher.flush_once, retries)
+    out["outbox_flush"] = {"ms": round(ms, 1), "flushed": flusher.flushed, "failed_attempts": failed,
+                           "pending": outbox.pending_count()}
+    outbox.close()
+    return out
+
+
+def run_benchmark(
+    backend: str = "memory",
+    count: int = 10_000,
+    *,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    failure_rate: float = 0.0,
+    mongo_collection: str = "teams_bench",
+    edits: int = 500,
+    **workload: Any,
+) -> Dict[str, Any]:
+    teams = random_teams(count)
+    scratch: Optional[Path] = None
+    collection: Any = None
+    bulk_collection: Any = None
+    if backend == "memory":
+        options: Dict[str, Any] = dict(
+            latency_s=latency_ms / 1000, jitter_s=jitter_ms / 1000, failure_rate=failure_rate
+        )
+        repo = create_team_repository("memory", seed=7, **options)
+        bulk_collection = InMemoryTeamCollection(InMemoryTeamRepository(seed=8, **options))
+    elif backend == "json":
+        scratch = Path(tempfile.mkdtemp(prefix="team_bench_"))
+        repo = create_team_repository("json", path=scratch / "teams.json")
+    elif backend == "mongo":
+        from .filenames import get_env
+        from .mongodb import _get_mongo_client
+
+        if mongo_collection == get_env("MONGO_COLLECTION"):
+            raise ValueError("refusing to benchmark (and drop) the live teams collection")
+        collection = _get_mongo_client()[get_env("MONGO_DB")][mongo_collection]
+        repo = create_team_repository("mongo", collection=collection)
+        bulk_collection = collection
+    else:
+        raise ValueError(f"unknown backend: {backend!r}")
+    try:
+        result = run_workload(repo, teams, **workload)
+        if bulk_collection is not None:
+            result["bulk_path"] = run_bulk_path(
+                bulk_collection, teams, edits=edits, retries=workload.get("retries", 5)
+            )
+    finally:
+        if scratch is not None:
+            shutil.rmtree(scratch, ignore_errors=True)
+        if collection is not None:
+            collection.drop()
+    return {"backend": backend, **result}
+
+
+def main() -> None:
+    import argparse
+    import json
+
+    ap = argparse.ArgumentParser(description="Team repository / cache / search benchmark")
+    ap.add_argument("--backend", nargs="+", choices=["memory", "json", "mongo"], default=["memory", "json"])
+    ap.add_argument("--teams", type=int, default=10_000)
+    ap.add_argument("--writes", type=int, default=200, help="single save_team calls")
+    ap.add_argument("--reads", type=int, default=5_000, help="cached reads")
+    ap.add_argument("--remote-change-every", type=int, default=500, help="reads between simulated remote changes")
+    ap.add_argument("--queries", type=int, default=200, help="typed names for the search benchmark")
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="memory backend: per-call latency")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="memory backend: extra random latency")
+    ap.add_argument("--failure-rate", type=float, default=0.0, help="memory backend: fraction of calls that fail")
+    ap.add_argument("--retries", type=int, default=5, help="extra attempts for failed bulk steps")
+    ap.add_argument("--edits", type=int, default=500, help="outbox edits replayed in the bulk path")
+    ap.add_argument("--mongo-collection", default="teams_bench", help="scratch collection (dropped afterwards)")
+    args = ap.parse_args()
+    results = [
+        run_benchmark(
+            backend, args.teams,
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, failure_rate=args.failure_rate,
+            mongo_collection=args.mongo_collection, edits=args.edits, retries=args.retries,
+            writes=args.writes, reads=args.reads, remote_change_every=args.remote_change_every,
+            queries=args.queries,
+        )
+        for backend in args.backend
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,542 @@
+"""
+Team-data broker process.
+
+What this is:
+- `TeamBroker`: runs in its own process next to the notification server and
+  owns the only `MongoTeamManager` (one pooled MongoClient, one TeamCatalog,
+  one SmartTeamCache). Field processes call it over an authenticated loopback
+  ``multiprocessing.connection`` socket; calls run on a small worker pool.
+- `RemoteTeamManager`: the MongoTeamManager surface (load_teams, search_teams,
+  save_team, ...) as calls to the broker. The broker pushes a "changed" event
+  after every write or remote sync, which clears the client's small
+  abbreviation memo and rebuilds its autocomplete index (``suggest_teams``
+  answers keystrokes from that field-local index, never with a round trip).
+- `get_team_manager()`: the process-wide team manager. Broker client when
+  `init_team_broker()` got an address, otherwise (broker disabled, failed to
+  start, or lost mid-run) a local MongoTeamManager.
+
+Why it exists:
+- Every field process built its own MongoClient (TLS handshake, index checks)
+  and held its own catalog and full teams cache, so Mongo connections and
+  memory grew linearly with the number of fields.
+
+Wire format (pickled tuples):
+- client -> broker: ``("call", req_id, method, args)``
+- broker -> client: ``("ok", req_id, result)``, ``("err", req_id, type, message)``,
+  ``("progress", req_id, done, total)``, ``("changed", version)``
+"""
+
+import itertools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Client, Listener
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..config import AppConfig
+from .logger import get_logger
+from .team_async import AsyncTeamManager
+from .team_search import TeamSearchIndex
+
+log = get_logger(__name__)
+
+Address = Tuple[str, int]
+ProgressFn = Callable[[int, int], None]
+
+# Methods a client may call; writes are followed by a "changed" broadcast
+_READ_METHODS = frozenset({
+    "load_teams", "search_teams", "get_abbreviation", "get_all_names",
+    "cache_stats", "backup_to_json", "schedule_backup", "list_backups", "export_teams",
+    "outbox_status", "take_conflicts",
+})
+_WRITE_METHODS = frozenset({"save_team", "delete_team", "import_teams", "restore_backup"})
+_PROGRESS_METHODS = frozenset({"import_teams", "export_teams"})
+
+_ABBR_MEMO_MAX = 1024
+
+_DEFAULT: Any = object()
+
+
+class TeamBrokerUnavailable(ConnectionError):
+    """The broker connection is closed (broker exited or never reachable)."""
+
+
+class TeamBrokerError(RuntimeError):
+    """A call failed inside the broker; `remote_type` is the original exception class name."""
+
+    def __init__(self, remote_type: str, message: str) -> None:
+        super().__init__(message)
+        self.remote_type = remote_type
+
+
+# ─────────────────────────── Broker ───────────────────────────
+class TeamBroker:
+    """Serve one team manager to many field processes."""
+
+    def __init__(
+        self,
+        manager_factory: Callable[[], Any],
+        host: str = "127.0.0.1",
+        authkey: Optional[bytes] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        self.authkey = authkey or os.urandom(16)
+        self._factory = manager_factory
+        self._manager: Optional[Any] = None
+        self._manager_lock = threading.Lock()
+        self._listener = Listener((host, 0), authkey=self.authkey)
+        host_, port = self._listener.address
+        self.address: Address = (str(host_), int(port))
+        self._clients: Dict[Any, threading.Lock] = {}  # connection -> send lock
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._pool = ThreadPoolExecutor(
+            max_workers=int(workers or AppConfig.TEAM_BROKER_WORKERS), thread_name_prefix="team-broker"
+        )
+        self._accept_thread: Optional[threading.Thread] = None
+        self.version = 0
+        self.calls = 0
+
+    def start(self) -> "TeamBroker":
+        if self._accept_thread is None:
+            self._accept_thread = threading.Thread(target=self._accept_loop, name="team-broker-accept", daemon=True)
+            self._accept_thread.start()
+            log.info("team_broker_started", extra={"port": self.address[1]})
+        return self
+
+    def manager(self) -> Any:
+        """The shared team manager, built on first use (Mongo client, catalog, sync)."""
+        with self._manager_lock:
+            if self._manager is None:
+                manager = self._factory()
+                sync = getattr(manager, "sync", None)
+                if sync is not None:
+                    # Remote edits pulled by the catalog sync reach the fields too
+                    sync.add_listener(lambda _count: self._publish_changed())
+                self._manager = manager
+            return self._manager
+
+    # ----- connections -----
+    def _accept_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                if self._closed.is_set():
+                    break
+                log.warning("team_broker_accept_failed", exc_info=True)
+                continue
+            with self._lock:
+                self._clients[conn] = threading.Lock()
+            if self._closed.is_set():
+                self._drop(conn)  # Raced close()
+                break
+            if self._manager is None:
+                # Connect to Mongo while the field finishes starting up
+                self._pool.submit(self._warm_up)
+            threading.Thread(target=self._client_loop, args=(conn,), name="team-broker-client", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        try:
+            self.manager()
+        except Exception:
+            log.warning("team_broker_manager_init_failed", exc_info=True)
+
+    def _client_loop(self, conn: Any) -> None:
+        try:
+            while not self._closed.is_set():
+                msg = conn.recv()
+                try:
+                    kind, req_id, method, args = msg
+                except (TypeError, ValueError):
+                    continue
+                if kind == "call":
+                    self._pool.submit(self._handle, conn, req_id, str(method), tuple(args))
+        except (EOFError, OSError):
+            pass
+        except Exception:
+            log.warning("team_broker_client_error", exc_info=True)
+        finally:
+            self._drop(conn)
+
+    def _handle(self, conn: Any, req_id: int, method: str, args: Tuple[Any, ...]) -> None:
+        self.calls += 1
+        try:
+            if method not in _READ_METHODS and method not in _WRITE_METHODS:
+                raise AttributeError(f"Unknown team broker method: {method}")
+            call_args = list(args)
+            if method in _PROGRESS_METHODS:
+                call_args.append(lambda done, total: self._send(conn, ("progress", req_id, done, total)))
+            result = getattr(self.manager(), method)(*call_args)
+        except Exception as e:
+            self._send(conn, ("err", req_id, type(e).__name__, str(e)))
+            return
+        self._send(conn, ("ok", req_id, result))
+        if method in _WRITE_METHODS:
+            self._publish_changed()
+
+    def _send(self, conn: Any, msg: Any) -> None:
+        with self._lock:
+            send_lock = self._clients.get(conn)
+        if send_lock is None:
+            return
+        try:
+            with send_lock:
+                conn.send(msg)
+        except Exception:
+            self._drop(conn)
+
+    def _publish_changed(self) -> None:
+        with self._lock:
+            self.version += 1
+            version = self.version
+            targets = list(self._clients)
+        for conn in targets:
+            self._send(conn, ("changed", version))
+
+    def _drop(self, conn: Any) -> None:
+        with self._lock:
+            self._clients.pop(conn, None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    # ----- metrics / lifecycle -----
+    def client_count(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def wait(self) -> None:
+        self._closed.wait()
+
+    def close(self) -> None:
+        self._closed.set()
+        try:
+            self._listener.close()
+        except Exception:
+            pass
+        with self._lock:
+            clients, self._clients = list(self._clients), {}
+        for conn in clients:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._pool.shutdown(wait=False)
+
+
+# ─────────────────────────── Client ───────────────────────────
+class RemoteTeamManager:
+    """MongoTeamManager-shaped proxy to the broker (falls back to a local manager if it is lost)."""
+
+    _async: Optional[AsyncTeamManager] = None
+
+    def __init__(
+        self,
+        address: Address,
+        authkey: bytes,
+        *,
+        timeout_s: Optional[float] = None,
+        fallback: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self._conn = Client(address, authkey=authkey)
+        self.timeout_s = float(timeout_s if timeout_s is not None else AppConfig.TEAM_BROKER_TIMEOUT_S)
+        self._fallback_factory = fallback or _local_team_manager
+        self._fallback: Optional[Any] = None
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._pending: Dict[int, "Future[Any]"] = {}
+        self._progress: Dict[int, ProgressFn] = {}
+        self._abbr_memo: Dict[str, str] = {}
+        # Autocomplete index (built off the Tk thread; rebuilt when the broker pushes "changed")
+        self._index: Optional[TeamSearchIndex] = None
+        self._index_version = -1
+        self._index_loading = False
+        self._index_lock = threading.Lock()  # TeamSearchIndex.search keeps narrowing state
+        self._closed = threading.Event()
+        self.version = 0  # Last "changed" version seen from the broker
+        self._reader = threading.Thread(target=self._recv_loop, name="team-broker-reader", daemon=True)
+        self._reader.start()
+
+    # ----- transport -----
+    def _call(self, method: str, *args: Any, timeout_s: Any = _DEFAULT, progress: Optional[ProgressFn] = None) -> Any:
+        """Run `method` in the broker; `timeout_s=None` waits indefinitely (bulk work)."""
+        if self._closed.is_set():
+            return self._call_local(method, args, progress)
+        timeout = self.timeout_s if timeout_s is _DEFAULT else timeout_s
+        req_id = next(self._ids)
+        future: "Future[Any]" = Future()
+        with self._lock:
+            self._pending[req_id] = future
+            if progress is not None:
+                self._progress[req_id] = progress
+        try:
+            with self._send_lock:
+                self._conn.send(("call", req_id, method, args))
+            return future.result(timeout)
+        except FutureTimeout:
+            raise TimeoutError(f"Team broker did not answer {method} within {timeout}s") from None
+        except (OSError, EOFError, TeamBrokerUnavailable):
+            self._closed.set()
+            return self._call_local(method, args, progress)
+        finally:
+            with self._lock:
+                self._pending.pop(req_id, None)
+                self._progress.pop(req_id, None)
+
+    def _call_local(self, method: str, args: Tuple[Any, ...], progress: Optional[ProgressFn]) -> Any:
+        with self._lock:
+            if self._fallback is None:
+                log.warning("team_broker_lost_using_local_manager", extra={"method": method})
+                self._fallback = self._fallback_factory()
+            manager = self._fallback
+        call_args = list(args)
+        if method in _PROGRESS_METHODS:
+            call_args.append(progress)
+        return getattr(manager, method)(*call_args)
+
+    def _recv_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                msg = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            except Exception:
+                log.warning("team_broker_recv_failed", exc_info=True)
+                break
+            try:
+                self._dispatch(msg)
+            except Exception:
+                log.warning("team_broker_message_invalid", exc_info=True)
+        self._closed.set()
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for future in pending:
+            if not future.done():
+                future.set_exception(TeamBrokerUnavailable("Team broker connection closed"))
+
+    def _dispatch(self, msg: Tuple[Any, ...]) -> None:
+        kind = msg[0]
+        if kind == "changed":
+            with self._lock:
+                self.version = int(msg[1])
+                self._abbr_memo.clear()
+                rebuild = self._index is not None
+            if rebuild:
+                self._refresh_index()
+            return
+        if kind == "progress":
+            with self._lock:
+                callback = self._progress.get(msg[1])
+            if callback is not None:
+                callback(int(msg[2]), int(msg[3]))
+            return
+        with self._lock:
+            future = self._pending.get(msg[1])
+        if future is None or future.done():
+            return  # Caller timed out
+        if kind == "ok":
+            future.set_result(msg[2])
+        elif kind == "err":
+            future.set_exception(TeamBrokerError(str(msg[2]), str(msg[3])))
+
+    # ----- MongoTeamManager surface -----
+    def async_api(self) -> AsyncTeamManager:
+        """Future-returning facade for UI callers (shared bounded worker pool)."""
+        if self._async is None:
+            self._async = AsyncTeamManager(self)
+        return self._async
+
+    def load_teams(self) -> Dict[str, str]:
+        teams: Dict[str, str] = self._call("load_teams")
+        return teams
+
+    def search_teams(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+        pairs: List[Tuple[str, str]] = self._call("search_teams", query, limit)
+        return pairs
+
+    def suggest_teams(self, query: str, limit: Optional[int] = None) -> Optional[List[Tuple[str, str]]]:
+        """Autocomplete pairs from the field-local index (no round trip); None until it has loaded."""
+        with self._lock:
+            index = self._index
+            current = self._index_version == self.version
+        if index is None or not current:
+            self._refresh_index()
+        if index is None:
+            return None
+        with self._index_lock:
+            return index.search(query, limit)
+
+    def _refresh_index(self) -> None:
+        with self._lock:
+            if self._index_loading:
+                return
+            self._index_loading = True
+        threading.Thread(target=self._load_index, name="team-broker-index", daemon=True).start()
+
+    def _load_index(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    version = self.version
+                index = TeamSearchIndex(self.load_teams())
+                with self._lock:
+                    self._index, self._index_version = index, version
+                    if self.version == version:
+                        break  # Otherwise changed again while loading: rebuild once more
+        except Exception:
+            log.warning("team_broker_index_load_failed", exc_info=True)
+        finally:
+            with self._lock:
+                self._index_loading = False
+
+    def get_abbreviation(self, name: str) -> str:
+        key = name.strip().upper()
+        with self._lock:
+            memo = self._abbr_memo.get(key)
+            version = self.version
+        if memo is not None:
+            return memo
+        abbr: str = self._call("get_abbreviation", key)
+        with self._lock:
+            if self.version == version:  # Not invalidated while the call was in flight
+                if len(self._abbr_memo) >= _ABBR_MEMO_MAX:
+                    self._abbr_memo.clear()
+                self._abbr_memo[key] = abbr
+        return abbr
+
+    def get_all_names(self) -> List[str]:
+        names: List[str] = self._call("get_all_names")
+        return names
+
+    def save_team(self, name: str, abbreviation: str) -> List[str]:
+        similar: List[str] = self._call("save_team", name, abbreviation)
+        return similar
+
+    def delete_team(self, name: str) -> bool:
+        return bool(self._call("delete_team", name))
+
+    def import_teams(self, path: str, progress: Optional[ProgressFn] = None) -> Any:
+        return self._call("import_teams", path, timeout_s=None, progress=progress)
+
+    def export_teams(self, path: str, progress: Optional[ProgressFn] = None) -> int:
+        return int(self._call("export_teams", path, timeout_s=None, progress=progress))
+
+    def backup_to_json(self) -> None:
+        self._call("backup_to_json")
+
+    def schedule_backup(self) -> None:
+        self._call("schedule_backup")
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        backups: List[Dict[str, Any]] = self._call("list_backups")
+        return backups
+
+    def restore_backup(self, snapshot: str) -> int:
+        return int(self._call("restore_backup", snapshot, timeout_s=None))
+
+    def cache_stats(self) -> Dict[str, int]:
+        stats: Dict[str, int] = self._call("cache_stats")
+        return stats
+
+    def outbox_status(self) -> Dict[str, Any]:
+        status: Dict[str, Any] = self._call("outbox_status")
+        return status
+
+    def take_conflicts(self) -> List[Dict[str, Any]]:
+        conflicts: List[Dict[str, Any]] = self._call("take_conflicts")
+        return conflicts
+
+    # ----- lifecycle -----
+    def is_connected(self) -> bool:
+        return not self._closed.is_set()
+
+    def close(self) -> None:
+        self._closed.set()
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+
+# ─────────────────────────── Process-level helpers ───────────────────────────
+class TeamBrokerHandle(NamedTuple):
+    process: Any
+    address: Address
+    authkey: bytes
+
+
+def _local_team_manager() -> Any:
+    # Without the broker every field opens the shared catalog/outbox files itself: the catalog
+    # keeps its sync watermark per process, and outbox replays are idempotent upserts/tombstones
+    # completed by (id, revision), so concurrent flushers cannot lose or double-apply an edit
+    from .mongodb import MongoTeamManager
+
+    return MongoTeamManager()
+
+
+def team_broker_main(conn: Any, authkey: bytes) -> None:
+    """Broker process target: report the listening address on `conn`, then serve."""
+    broker = TeamBroker(_local_team_manager, host=AppConfig.TEAM_BROKER_HOST, authkey=authkey).start()
+    conn.send(broker.address)
+    conn.close()
+    broker.wait()
+
+
+def start_team_broker() -> Optional[TeamBrokerHandle]:
+    """Spawn the broker process (launcher only). Returns None when disabled/failing."""
+    if not AppConfig.TEAM_BROKER_ENABLED:
+        return None
+    authkey = os.urandom(16)
+    parent_conn, child_conn = Pipe(duplex=False)
+    proc = Process(target=team_broker_main, args=(child_conn, authkey), name="team-broker", daemon=True)
+    try:
+        proc.start()
+        child_conn.close()
+        if not parent_conn.poll(AppConfig.TEAM_BROKER_START_TIMEOUT_S):
+            raise TimeoutError("team broker did not report its address")
+        host, port = parent_conn.recv()
+        return TeamBrokerHandle(proc, (str(host), int(port)), authkey)
+    except Exception:
+        log.warning("team_broker_start_failed", exc_info=True)
+        if proc.is_alive():
+            proc.terminate()
+        return None
+    finally:
+        parent_conn.close()
+
+
+# Set per field process by init_team_broker(); the manager itself is created on first use
+_broker_address: Optional[Address] = None
+_broker_authkey: Optional[bytes] = None
+_team_manager: Optional[Any] = None
+_team_manager_lock = threading.Lock()
+
+
+def init_team_broker(address: Optional[Address], authkey: Optional[bytes]) -> None:
+    """Remember where the broker listens. Call once in each field process."""
+    global _broker_address, _broker_authkey
+    if address is None or authkey is None:
+        return
+    _broker_address = (str(address[0]), int(address[1]))
+    _broker_authkey = authkey
+
+
+def get_team_manager() -> Any:
+    """Process-wide team manager: the broker client if reachable, else a local MongoTeamManager."""
+    global _team_manager
+    with _team_manager_lock:
+        if _team_manager is None:
+            if _broker_address is not None and _broker_authkey is not None:
+                try:
+                    _team_manager = RemoteTeamManager(_broker_address, _broker_authkey)
+                    log.info("team_broker_connected", extra={"pid": os.getpid()})
+                except Exception:
+                    log.warning("team_broker_connect_failed", exc_info=True)
+            if _team_manager is None:
+                _team_manager = _local_team_manager()
+        return _team_manager
@@ -0,0 +1,239 @@
+"""
+Bulk team import/export.
+
+What this is:
+- Readers for CSV (``name,abbreviation`` with optional header) and JSON
+  (``teams.json``-style ``{name: abbr}`` or a list of ``{"name", "abbreviation"}``)
+- Validation against the ``AppConfig`` team name/abbreviation limits
+- Batched ``bulk_write`` upserts with progress callbacks
+- Streaming export (cursor -> file) to CSV or JSON
+
+Why it exists:
+- ``MongoTeamManager.save_team`` is one round trip (and one backup schedule)
+  per team; loading a 2,000-team league took 2,000 round trips. A bulk import
+  is ceil(N / batch) round trips and a single cache/backup refresh.
+"""
+
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..config import AppConfig
+from .logger import get_logger
+from .team_names import normalize_team_key
+
+log = get_logger(__name__)
+
+# (source row/line number, name, abbreviation)
+RawTeam = Tuple[int, str, str]
+ProgressCallback = Callable[[int, int], None]
+
+_NAME_HEADERS = {"name", "nome", "team", "equipa"}
+_ABBR_HEADERS = {"abbreviation", "abbr", "abrev", "sigla"}
+
+
+@dataclass
+class ImportReport:
+    total: int = 0
+    valid: int = 0
+    upserted: int = 0
+    modified: int = 0
+    duplicates: int = 0
+    batches: int = 0
+    invalid: List[Tuple[int, str]] = field(default_factory=list)  # (row, reason)
+    elapsed_ms: int = 0
+    # Normalized (name, abbreviation) pairs that were written
+    applied: List[Tuple[str, str]] = field(default_factory=list)
+
+    def summary(self) -> str:
+        text = f"{self.valid} teams imported ({self.upserted} new, {self.modified} updated)"
+        if self.invalid:
+            text += f", {len(self.invalid)} rejected"
+        return text
+
+
+# ─────────────────────────── Parsing / validation ───────────────────────────
+def read_team_file(path: str) -> Iterator[RawTeam]:
+    """Yield (row, name, abbreviation) from a .csv or .json file."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            yield from parse_team_json(json.load(f))
+    else:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            yield from parse_team_csv(f)
+
+
+def parse_team_csv(stream: Iterable[str]) -> Iterator[RawTeam]:
+    lines = iter(stream)
+    try:
+        first = next(lines)
+    except StopIteration:
+        return
+    try:
+        dialect: Any = csv.Sniffer().sniff(first, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+
+    def _rows() -> Iterator[str]:
+        yield first
+        yield from lines
+
+    name_col, abbr_col = 0, 1
+    for row_no, row in enumerate(csv.reader(_rows(), dialect), start=1):
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        lowered = [cell.strip().lower() for cell in row]
+        if row_no == 1 and (_NAME_HEADERS & set(lowered)):
+            name_col = next(i for i, c in enumerate(lowered) if c in _NAME_HEADERS)
+            abbr_col = next((i for i, c in enumerate(lowered) if c in _ABBR_HEADERS), 1)
+            continue
+        name = row[name_col] if name_col < len(row) else ""
+        abbr = row[abbr_col] if abbr_col < len(row) else ""
+        yield (row_no, name, abbr)
+
+
+def parse_team_json(data: Any) -> Iterator[RawTeam]:
+    if isinstance(data, dict):
+        for i, (name, abbr) in enumerate(data.items(), start=1):
+            yield (i, str(name), str(abbr))
+    elif isinstance(data, list):
+        for i, item in enumerate(data, start=1):
+            if isinstance(item, dict):
+                yield (i, str(item.get("name", "")), str(item.get("abbreviation", item.get("abbr", ""))))
+            elif isinstance(item, (list, tuple)) and len(item) >= 2:
+                yield (i, str(item[0]), str(item[1]))
+            else:
+                yield (i, "", "")
+    else:
+        raise ValueError("Unsupported JSON layout for team import")
+
+
+def validate_team(name: str, abbreviation: str) -> Optional[str]:
+    """Return a reason string if the pair is not importable, else None."""
+    if len(name) < AppConfig.MIN_TEAM_NAME_LENGTH:
+        return "name too short"
+    if len(name) > AppConfig.MAX_TEAM_NAME_LENGTH:
+        return f"name longer than {AppConfig.MAX_TEAM_NAME_LENGTH}"
+    if not abbreviation:
+        return "missing abbreviation"
+    if len(abbreviation) > AppConfig.MAX_TEAM_ABBREVIATION_LENGTH:
+        return f"abbreviation longer than {AppConfig.MAX_TEAM_ABBREVIATION_LENGTH}"
+    return None
+
+
+def prepare_import(rows: Iterable[RawTeam], report: ImportReport) -> Dict[str, str]:
+    """Normalize + validate; later rows win over earlier duplicates."""
+    teams: Dict[str, str] = {}
+    for row_no, raw_name, raw_abbr in rows:
+        report.total += 1
+        name, abbr = raw_name.strip().upper(), raw_abbr.strip().upper()
+        reason = validate_team(name, abbr)
+        if reason is not None:
+            report.invalid.append((row_no, reason))
+            continue
+        if name in teams:
+            report.duplicates += 1
+        teams[name] = abbr
+    report.valid = len(teams)
+    return teams
+
+
+# ─────────────────────────── Import / export ───────────────────────────
+def bulk_upsert_teams(
+    collection: Any,
+    rows: Iterable[RawTeam],
+    *,
+    batch_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> ImportReport:
+    """Validate `rows` and upsert them with unordered ``bulk_write`` batches."""
+    from pymongo import UpdateOne
+
+    started = time.perf_counter()
+    report = ImportReport()
+    teams = prepare_import(rows, report)
+    size = max(1, int(batch_size or AppConfig.TEAM_IMPORT_BATCH_SIZE))
+    items = list(teams.items())
+    done = 0
+    if progress is not None:
+        progress(0, len(items))
+    for start in range(0, len(items), size):
+        batch = items[start:start + size]
+        ops = [
+            UpdateOne(
+                {"name": name},
+                {
+                    "$set": {"abbreviation": abbr, "name_key": normalize_team_key(name), "deleted": False},
+                    "$currentDate": {"updated_at": True},
+                },
+                upsert=True,
+            )
+            for name, abbr in batch
+        ]
+        result = collection.bulk_write(ops, ordered=False)
+        report.batches += 1
+        report.upserted += int(getattr(result, "upserted_count", 0) or 0)
+        report.modified += int(getattr(result, "modified_count", 0) or 0)
+        report.applied.extend(batch)
+        done += len(batch)
+        if progress is not None:
+            progress(done, len(items))
+    report.elapsed_ms = int((time.perf_counter() - started) * 1000)
+    log.info("teams_bulk_imported", extra={
+        "total": report.total, "valid": report.valid, "invalid": len(report.invalid),
+        "batches": report.batches, "ms": report.elapsed_ms,
+    })
+    return report
+
+
+def export_teams(
+    teams: Iterable[Tuple[str, str]],
+    path: str,
+    *,
+    progress: Optional[ProgressCallback] = None,
+    total: int = 0,
+) -> int:
+    """Stream (name, abbreviation) pairs to CSV or JSON (by extension), atomically."""
+    as_json = Path(path).suffix.lower() == ".json"
+    tmp = f"{path}.tmp"
+    count = 0
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f) if not as_json else None
+        if writer is not None:
+            writer.writerow(["name", "abbreviation"])
+        else:
+            f.write("{")
+        for name, abbr in teams:
+            if writer is not None:
+                writer.writerow([name, abbr])
+            else:
+                f.write("," if count else "")
+                f.write(f"\n  {json.dumps(name, ensure_ascii=False)}: {json.dumps(abbr, ensure_ascii=False)}")
+            count += 1
+            if progress is not None and count % 500 == 0:
+                progress(count, total)
+        if writer is None:
+            f.write("\n}\n")
+    os.replace(tmp, path)
+    if progress is not None:
+        progress(count, total or count)
+    log.info("teams_exported", extra={"count": count, "path": path})
+    return count
+
+
+def iter_collection_teams(collection: Any, batch_size: int = 500) -> Iterator[Tuple[str, str]]:
+    """Live teams straight from a Mongo cursor (never materializes the collection)."""
+    cursor = collection.find(
+        {"deleted": {"$ne": True}},
+        projection={"_id": 0, "name": 1, "abbreviation": 1},
+        batch_size=batch_size,
+    ).sort("name", 1)
+    for doc in cursor:
+        if isinstance(doc, dict) and doc.get("name"):
+            yield (str(doc["name"]), str(doc.get("abbreviation", "")))
+
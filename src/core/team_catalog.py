@@ -0,0 +1,466 @@
+"""
+Offline-first local team catalog.
+
+What this is:
+- A small SQLite database under the per-user app dir holding every team
+  (name -> abbreviation), mirrored in memory for instant reads.
+- A background sync that pulls only what changed in Mongo since the last
+  ``updated_at`` watermark. Deleted teams are tombstones in Mongo
+  (``deleted: true`` + ``updated_at``) so removals propagate too.
+
+Why it exists:
+- ``MongoTeamManager.load_teams`` used to fetch the whole collection whenever
+  the in-memory cache expired, often on the Tk thread. Reads now come from the
+  catalog, so startup and autocomplete never wait on the network, and a sync
+  costs O(changes) instead of O(collection).
+
+Main features:
+- WAL-mode SQLite, one connection guarded by a lock (safe from any thread)
+- Watermark with an inclusive ``$gte`` query: same-timestamp writes are never
+  missed, re-applying a change is idempotent
+- Watermark and last sync time are kept per process, seeded from the file on
+  open: several processes may share one catalog file, and one process's sync
+  must not skip changes another process's in-memory mirror has not seen
+- Full resync when the last sync is older than the tombstone retention window
+- Single sync thread; ``request_sync()`` wakes it early (coalesced)
+- Unflushed local edits (``team_outbox``) are laid over the pulled data
+- Running content hash of the team set (``team_backup``) for cheap change checks
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..config import AppConfig
+from .logger import get_logger
+from .path_finder import get_path_finder
+from .team_backup import combine_digests, format_content_hash, team_digest
+from .team_names import find_near_duplicates, normalize_team_key
+
+log = get_logger(__name__)
+
+# (name, abbreviation or None for a tombstone)
+TeamChange = Tuple[str, Optional[str]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    name TEXT PRIMARY KEY,
+    abbreviation TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    name_key TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def default_catalog_path() -> Path:
+    pf = get_path_finder()
+    return pf.user_local_appdir(AppConfig.LOCAL_APP_DIRNAME, AppConfig.TEAM_CATALOG_DIRNAME) / AppConfig.TEAM_CATALOG_FILENAME
+
+
+def _norm(value: Any) -> str:
+    return str(value).strip().upper()
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """Mongo ``updated_at`` (naive UTC datetime, aware datetime or number) -> epoch seconds."""
+    if isinstance(value, datetime):
+        dt: datetime = value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+class TeamCatalog:
+    """Persistent name -> abbreviation store with an in-memory mirror."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else default_catalog_path()
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.DatabaseError:
+            pass
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._teams: Dict[str, str] = {}
+        self._keys: Dict[str, str] = {}  # name -> normalized key (computed once, stored)
+        # Rows and sync metadata from one read transaction, so the watermark matches the mirror
+        self._conn.execute("BEGIN")
+        try:
+            for n, a, k in self._conn.execute("SELECT name, abbreviation, name_key FROM teams"):
+                self._teams[str(n)] = str(a)
+                self._keys[str(n)] = str(k)
+            self._watermark = self._get_float("watermark")
+            self._last_sync_at = self._get_float("last_sync_at")
+        finally:
+            self._conn.execute("COMMIT")
+        self._digest = combine_digests(team_digest(n, a) for n, a in self._teams.items())
+
+    def _migrate(self) -> None:
+        """Add/backfill the `name_key` column for catalogs created before it existed."""
+        cols = {row[1] for row in self._conn.execute("PRAGMA table_info(teams)")}
+        with self._conn:
+            if "name_key" not in cols:
+                self._conn.execute("ALTER TABLE teams ADD COLUMN name_key TEXT")
+            missing = self._conn.execute("SELECT name FROM teams WHERE name_key IS NULL").fetchall()
+            if missing:
+                self._conn.executemany(
+                    "UPDATE teams SET name_key = ? WHERE name = ?",
+                    [(normalize_team_key(n), n) for (n,) in missing],
+                )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS teams_name_key ON teams(name_key)")
+
+    # ----- reads (memory only) -----
+    def all(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._teams)
+
+    def get(self, name: str) -> Optional[str]:
+        with self._lock:
+            return self._teams.get(_norm(name))
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._teams)
+
+    def key_of(self, name: str) -> Optional[str]:
+        """Stored normalized key for `name` (None if the team is unknown)."""
+        with self._lock:
+            return self._keys.get(_norm(name))
+
+    def keys(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._keys)
+
+    def find_by_key(self, text: str) -> List[str]:
+        """Teams whose key equals the key of `text` (accent/punctuation-insensitive)."""
+        key = normalize_team_key(text)
+        with self._lock:
+            return [n for n, k in self._keys.items() if k == key]
+
+    def find_similar(self, name: str) -> List[str]:
+        """Near-duplicates of `name` among the other teams (see team_names)."""
+        with self._lock:
+            candidates = list(self._keys.items())
+        return find_near_duplicates(_norm(name), candidates)
+
+    def content_hash(self) -> str:
+        """Stable hash of the whole team set, kept up to date on every write (O(1))."""
+        with self._lock:
+            return format_content_hash(len(self._teams), self._digest)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._teams)
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    # ----- writes -----
+    def upsert(self, name: str, abbreviation: str, updated_at: Optional[float] = None) -> None:
+        self.apply_changes([(name, abbreviation)], updated_at)
+
+    def remove(self, name: str) -> None:
+        self.apply_changes([(name, None)])
+
+    def apply_changes(self, changes: Iterable[TeamChange], updated_at: Optional[float] = None) -> int:
+        """Apply upserts/tombstones in one transaction. Returns the number applied."""
+        ts = updated_at if updated_at is not None else time.time()
+        upserts: List[Tuple[str, str, float, str]] = []
+        deletes: List[Tuple[str]] = []
+        for name, abbr in changes:
+            key = _norm(name)
+            if not key:
+                continue
+            if abbr is None:
+                deletes.append((key,))
+            else:
+                upserts.append((key, _norm(abbr), ts, normalize_team_key(key)))
+        if not upserts and not deletes:
+            return 0
+        with self._lock:
+            with self._conn:
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT INTO teams(name, abbreviation, updated_at, name_key) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(name) DO UPDATE SET abbreviation=excluded.abbreviation, "
+                        "updated_at=excluded.updated_at, name_key=excluded.name_key",
+                        upserts,
+                    )
+                if deletes:
+                    self._conn.executemany("DELETE FROM teams WHERE name = ?", deletes)
+            digest = self._digest
+            for key, abbr, _, name_key in upserts:
+                old = self._teams.get(key)
+                if old is not None:
+                    digest -= team_digest(key, old)
+                digest += team_digest(key, abbr)
+                self._teams[key] = abbr
+                self._keys[key] = name_key
+            for (key,) in deletes:
+                old = self._teams.pop(key, None)
+                if old is not None:
+                    digest -= team_digest(key, old)
+                self._keys.pop(key, None)
+            self._digest = combine_digests([digest])
+        return len(upserts) + len(deletes)
+
+    def replace_all(self, teams: Dict[str, str]) -> None:
+        """Swap the whole catalog (full resync)."""
+        now = time.time()
+        rows = [(_norm(n), _norm(a), now, normalize_team_key(n)) for n, a in teams.items() if _norm(n)]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM teams")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO teams(name, abbreviation, updated_at, name_key) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            self._teams = {n: a for n, a, _, _ in rows}
+            self._keys = {n: k for n, _, _, k in rows}
+            self._digest = combine_digests(team_digest(n, a) for n, a in self._teams.items())
+
+    # ----- sync metadata -----
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return str(row[0]) if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO meta(key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                    (key, value),
+                )
+
+    def _get_float(self, key: str) -> Optional[float]:
+        raw = self.get_meta(key)
+        try:
+            return float(raw) if raw is not None else None
+        except ValueError:
+            return None
+
+    def watermark(self) -> Optional[float]:
+        """Newest Mongo ``updated_at`` (epoch seconds) applied to this process's mirror."""
+        with self._lock:
+            return self._watermark
+
+    def last_sync_at(self) -> Optional[float]:
+        with self._lock:
+            return self._last_sync_at
+
+    def mark_synced(self, watermark: float, synced_at: float) -> None:
+        """Record a sync for this process; the file keeps the newest values (seed for the next open)."""
+        with self._lock:
+            self._watermark = watermark
+            self._last_sync_at = synced_at
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO meta(key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value=excluded.value "
+                    "WHERE CAST(meta.value AS REAL) < CAST(excluded.value AS REAL)",
+                    [("watermark", repr(watermark)), ("last_sync_at", repr(synced_at))],
+                )
+
+    def has_synced(self) -> bool:
+        return self.last_sync_at() is not None
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+class TeamCatalogSync:
+    """Pull Mongo changes into a TeamCatalog (on demand or on a slow timer)."""
+
+    def __init__(
+        self,
+        catalog: TeamCatalog,
+        collection_fn: Callable[[], Any],
+        *,
+        interval_s: Optional[float] = None,
+        retention_days: Optional[int] = None,
+        pending_fn: Optional[Callable[[], Dict[str, Optional[str]]]] = None,
+    ):
+        self.catalog = catalog
+        self._collection_fn = collection_fn
+        # Local edits not in Mongo yet (name -> abbreviation, None = delete); they win over pulled data
+        self.pending_fn = pending_fn
+        self.interval_s = float(interval_s if interval_s is not None else AppConfig.TEAM_SYNC_INTERVAL_S)
+        days = retention_days if retention_days is not None else AppConfig.TEAM_TOMBSTONE_RETENTION_DAYS
+        self.retention_s = float(days) * 86400.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._sync_lock = threading.Lock()
+        self._listeners: List[Callable[[int], None]] = []
+        self._index_ready = False
+        self.syncs = 0
+        self.changes_applied = 0
+
+    def add_listener(self, callback: Callable[[int], None]) -> None:
+        """Called (on the sync thread) with the change count after each sync that changed something."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def _ensure_indexes(self, coll: Any) -> None:
+        if self._index_ready:
+            return
+        # Separately: a failed unique `name` index (duplicates) must not skip `updated_at`,
+        # which the incremental query depends on
+        for field, options in (("name", {"unique": True}), ("updated_at", {}), ("name_key", {})):
+            try:
+                coll.create_index(field, **options)
+            except Exception:
+                log.warning("mongo_index_create_failed", extra={"field": field}, exc_info=True)
+        self._index_ready = True
+
+    def sync_once(self) -> int:
+        """Apply changes since the watermark (or everything, on a full resync)."""
+        with self._sync_lock:
+            coll = self._collection_fn()
+            self._ensure_indexes(coll)
+            started = time.time()
+            pending = self.pending_fn() if self.pending_fn is not None else {}
+            last = self.catalog.last_sync_at()
+            full = last is None or (started - last) > self.retention_s
+            watermark = self.catalog.watermark()
+            query: Dict[str, Any] = {}
+            if not full and watermark is not None:
+                query = {"updated_at": {"$gte": datetime.fromtimestamp(watermark, tz=timezone.utc)}}
+            projection = {"_id": 0, "name": 1, "abbreviation": 1, "updated_at": 1, "deleted": 1}
+
+            changes: List[TeamChange] = []
+            live: Dict[str, str] = {}
+            newest = watermark or 0.0
+            for doc in coll.find(query, projection=projection):
+                if not isinstance(doc, dict) or not doc.get("name"):
+                    continue
+                ts = to_epoch(doc.get("updated_at"))
+                if ts is not None and ts > newest:
+                    newest = ts
+                if doc.get("deleted"):
+                    changes.append((str(doc["name"]), None))
+                else:
+                    abbr = str(doc.get("abbreviation", ""))
+                    changes.append((str(doc["name"]), abbr))
+                    live[_norm(doc["name"])] = _norm(abbr)
+
+            if full:
+                for pending_name, pending_abbr in pending.items():
+                    if pending_abbr is None:
+                        live.pop(pending_name, None)
+                    else:
+                        live[pending_name] = pending_abbr
+                before = self.catalog.all()
+                self.catalog.replace_all(live)
+                applied = sum(1 for k in set(before) | set(live) if before.get(k) != live.get(k))
+                self._purge_tombstones(coll, started)
+            else:
+                current = self.catalog.all()
+                # Re-delivered boundary docs ($gte) are no-ops: only count real changes
+                real = [
+                    (n, a) for n, a in changes
+                    if _norm(n) not in pending and current.get(_norm(n)) != (None if a is None else _norm(a))
+                ]
+                applied = self.catalog.apply_changes(real)
+
+            self.catalog.mark_synced(newest, started)
+            self.syncs += 1
+            self.changes_applied += applied
+            log.info("team_catalog_synced", extra={
+                "full": full, "scanned": len(changes), "applied": applied,
+                "ms": int((time.time() - started) * 1000),
+            })
+        if applied:
+            for cb in list(self._listeners):
+                try:
+                    cb(applied)
+                except Exception:
+                    log.warning("team_catalog_listener_failed", exc_info=True)
+        return applied
+
+    def _purge_tombstones(self, coll: Any, now: float) -> None:
+        """Tombstones older than the retention window are only needed by clients that will full-resync anyway."""
+        cutoff = datetime.fromtimestamp(now - self.retention_s, tz=timezone.utc)
+        try:
+            coll.delete_many({"deleted": True, "updated_at": {"$lt": cutoff}})
+        except Exception:
+            log.debug("team_tombstone_purge_failed", exc_info=True)
+
+    # ----- background thread -----
+    def start(self) -> "TeamCatalogSync":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="team-catalog-sync", daemon=True)
+            self._thread.start()
+        return self
+
+    def request_sync(self) -> None:
+        """Ask the sync thread to run soon; repeated requests coalesce."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync_once()
+            except Exception:
+                log.warning("team_catalog_sync_failed", exc_info=True)
+            self._wake.wait(self.interval_s)
+            self._wake.clear()
+
+
+# ─────────────────────────── Process-level helpers ───────────────────────────
+_catalog: Optional[TeamCatalog] = None
+_sync: Optional[TeamCatalogSync] = None
+_init_lock = threading.Lock()
+
+
+def get_team_catalog() -> TeamCatalog:
+    """Open (once per process) the catalog; falls back to memory if the file can't be used."""
+    global _catalog
+    with _init_lock:
+        if _catalog is None:
+            try:
+                _catalog = TeamCatalog()
+            except Exception:
+                log.warning("team_catalog_open_failed", exc_info=True)
+                _catalog = TeamCatalog(Path(":memory:"))
+        return _catalog
+
+
+def start_team_sync(
+    collection_fn: Callable[[], Any],
+    pending_fn: Optional[Callable[[], Dict[str, Optional[str]]]] = None,
+) -> TeamCatalogSync:
+    """Start (once per process) the background sync for the shared catalog."""
+    global _sync
+    catalog = get_team_catalog()
+    with _init_lock:
+        if _sync is None:
+            _sync = TeamCatalogSync(catalog, collection_fn, pending_fn=pending_fn).start()
+        return _sync
+
+
+def get_team_sync() -> Optional[TeamCatalogSync]:
+    return _sync
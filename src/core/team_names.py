@@ -0,0 +1,77 @@
+"""
+Team name normalization.
+
+What this is:
+- `normalize_team_key()`: the matching key for a team name or a search query.
+  NFKD + diacritics stripped, case-folded, dots/apostrophes dropped, other
+  punctuation and whitespace runs collapsed to one space ("Sporting Clube de Bragança" and
+  "sporting-clube de  braganca" share the key "sporting clube de braganca")
+- `is_near_duplicate()`: same key, same key without spaces, or (for longer
+  names) one edit apart
+
+Why it exists:
+- Names were compared after `.strip().upper()` only, so accented and
+  unaccented spellings never matched in search and created duplicate teams.
+  Keys are computed once per team (catalog load / write) and stored next to
+  the name, locally and in Mongo (`name_key`).
+"""
+
+import unicodedata
+from typing import Iterable, List, Tuple
+
+# Dropped outright so initials join up ("F.C." -> "fc"); other punctuation splits words
+_JOINING_PUNCTUATION = frozenset(".'’`´")
+
+# Keys shorter than this only count as duplicates on an exact (compact) match
+NEAR_DUPLICATE_MIN_LENGTH = 6
+
+
+def normalize_team_key(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    chars = []
+    for c in decomposed:
+        if unicodedata.combining(c) or c in _JOINING_PUNCTUATION:
+            continue
+        chars.append(c if c.isalnum() else " ")
+    return " ".join("".join(chars).casefold().split())
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """True if a single insert/delete/substitute turns `a` into `b` (a != b)."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = j = 0
+    edited = False
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            i += 1
+            j += 1
+            continue
+        if edited:
+            return False
+        edited = True
+        if len(a) == len(b):
+            i += 1
+        j += 1
+    return True
+
+
+def is_near_duplicate(key: str, other_key: str) -> bool:
+    if key == other_key:
+        return True
+    compact, other = key.replace(" ", ""), other_key.replace(" ", "")
+    if compact == other:
+        return True
+    if min(len(compact), len(other)) < NEAR_DUPLICATE_MIN_LENGTH:
+        return False
+    return _one_edit_apart(compact, other)
+
+
+def find_near_duplicates(name: str, candidates: Iterable[Tuple[str, str]]) -> List[str]:
+    """Names from (name, key) `candidates` that look like `name` (excluding `name` itself)."""
+    key = normalize_team_key(name)
+    if not key:
+        return []
+    return [other for other, other_key in candidates if other != name and is_near_duplicate(key, other_key)]
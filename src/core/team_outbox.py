@@ -0,0 +1,376 @@
+"""
+Write-behind outbox for team mutations.
+
+What this is:
+- A small SQLite file next to the team catalog holding every save/delete that
+  has not reached Mongo yet (one row per team: a newer edit of the same team
+  replaces the pending one but keeps the value it was based on).
+- A flusher thread that replays pending rows in ordered ``bulk_write``
+  batches of idempotent upserts/tombstones, with exponential backoff (plus
+  jitter) while Mongo is unreachable.
+- Conflict reporting: if the remote value moved away from the value the
+  operator edited (another machine changed it meanwhile), the local edit
+  still wins but the conflict is recorded for the UI (`take_conflicts`).
+
+Why it exists:
+- ``save_team``/``delete_team`` wrote to Mongo inline, so with Atlas down the
+  edit was lost and the UI waited for the server selection timeout. Now a
+  mutation is durable and visible locally as soon as it is recorded.
+"""
+
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..config import AppConfig
+from .logger import get_logger
+from .path_finder import get_path_finder
+from .team_names import normalize_team_key
+
+log = get_logger(__name__)
+
+OP_UPSERT = "upsert"
+OP_DELETE = "delete"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    op TEXT NOT NULL,
+    abbreviation TEXT,
+    base_abbreviation TEXT,
+    created_at REAL NOT NULL,
+    revision INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE TABLE IF NOT EXISTS conflicts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    op TEXT NOT NULL,
+    local TEXT,
+    remote TEXT,
+    base TEXT,
+    detected_at REAL NOT NULL,
+    reported INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# name -> pending abbreviation (None = pending delete)
+PendingChanges = Dict[str, Optional[str]]
+
+
+class OutboxEntry(NamedTuple):
+    id: int
+    name: str
+    op: str
+    abbreviation: Optional[str]
+    base: Optional[str]  # Local value the edit started from (None = team absent)
+    revision: int  # Bumped by a re-edit, so a flush never drops a newer edit
+
+
+def default_outbox_path() -> Path:
+    pf = get_path_finder()
+    return pf.user_local_appdir(AppConfig.LOCAL_APP_DIRNAME, AppConfig.TEAM_CATALOG_DIRNAME) / AppConfig.TEAM_OUTBOX_FILENAME
+
+
+def _norm(value: Any) -> str:
+    return str(value).strip().upper()
+
+
+class TeamOutbox:
+    """Durable queue of team mutations waiting for Mongo."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else default_outbox_path()
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # FULL: a recorded edit must survive a crash or power cut
+            self._conn.execute("PRAGMA synchronous=FULL")
+        except sqlite3.DatabaseError:
+            pass
+        self._conn.executescript(_SCHEMA)
+
+    # ----- recording -----
+    def record(self, op: str, name: str, abbreviation: Optional[str], base: Optional[str]) -> None:
+        """Queue `op` for `name`; `base` is the local value the edit started from (None = absent)."""
+        self.record_many([(op, name, abbreviation, base)])
+
+    def record_many(self, edits: List[Tuple[str, str, Optional[str], Optional[str]]]) -> None:
+        """Queue several (op, name, abbreviation, base) edits in one transaction."""
+        now = time.time()
+        rows = [
+            (_norm(name), op, _norm(abbr) if op == OP_UPSERT and abbr is not None else None, base, now)
+            for op, name, abbr, base in edits
+        ]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                # An older pending edit of the same team keeps its base and position
+                self._conn.executemany(
+                    "INSERT INTO outbox(name, op, abbreviation, base_abbreviation, created_at) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET op=excluded.op, abbreviation=excluded.abbreviation, "
+                    "created_at=excluded.created_at, revision=revision + 1, attempts=0, last_error=NULL",
+                    rows,
+                )
+
+    # ----- reads -----
+    def pending_count(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()
+        return int(row[0]) if row else 0
+
+    def pending_changes(self) -> PendingChanges:
+        """Pending end state per team (what the catalog must show until flushed)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT name, op, abbreviation FROM outbox").fetchall()
+        return {str(n): (str(a) if op == OP_UPSERT else None) for n, op, a in rows}
+
+    def batch(self, limit: int) -> List[OutboxEntry]:
+        """Oldest pending entries."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, name, op, abbreviation, base_abbreviation, revision FROM outbox ORDER BY id LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        return [OutboxEntry(int(i), str(n), str(op), a, b, int(r)) for i, n, op, a, b, r in rows]
+
+    def last_error(self) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_error FROM outbox WHERE last_error IS NOT NULL ORDER BY id LIMIT 1"
+            ).fetchone()
+        return str(row[0]) if row else None
+
+    # ----- flush bookkeeping -----
+    def complete(self, entries: List[OutboxEntry]) -> None:
+        """Drop flushed entries unless re-edited meanwhile (that newer edit stays queued)."""
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM outbox WHERE id = ? AND revision = ?",
+                    [(e.id, e.revision) for e in entries],
+                )
+                # A re-edited entry now builds on what was just written, not on the old base
+                self._conn.executemany(
+                    "UPDATE outbox SET base_abbreviation = ? WHERE id = ? AND revision != ?",
+                    [(e.abbreviation, e.id, e.revision) for e in entries],
+                )
+
+    def fail(self, ids: List[int], error: str) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE outbox SET attempts = attempts + 1, last_error = ? WHERE id = ?",
+                    [(error[:500], i) for i in ids],
+                )
+
+    # ----- conflicts -----
+    def add_conflict(self, name: str, op: str, local: Optional[str], remote: Optional[str], base: Optional[str]) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO conflicts(name, op, local, remote, base, detected_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (name, op, local, remote, base, time.time()),
+                )
+
+    def take_conflicts(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Unreported conflicts (oldest first); they are marked reported."""
+        with self._lock:
+            with self._conn:
+                rows = self._conn.execute(
+                    "SELECT id, name, op, local, remote, base, detected_at FROM conflicts "
+                    "WHERE reported = 0 ORDER BY id LIMIT ?",
+                    (int(limit),),
+                ).fetchall()
+                self._conn.executemany("UPDATE conflicts SET reported = 1 WHERE id = ?", [(r[0],) for r in rows])
+        return [
+            {"name": n, "op": op, "local": local, "remote": remote, "base": base, "detected_at": at}
+            for _id, n, op, local, remote, base, at in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+class OutboxFlusher:
+    """Replay a TeamOutbox into Mongo on a background thread."""
+
+    def __init__(
+        self,
+        outbox: TeamOutbox,
+        collection_fn: Callable[[], Any],
+        *,
+        batch_size: Optional[int] = None,
+        base_delay_s: Optional[float] = None,
+        max_delay_s: Optional[float] = None,
+    ):
+        self.outbox = outbox
+        self._collection_fn = collection_fn
+        self.batch_size = max(1, int(batch_size or AppConfig.TEAM_OUTBOX_BATCH_SIZE))
+        self.base_delay_s = float(base_delay_s if base_delay_s is not None else AppConfig.TEAM_OUTBOX_RETRY_BASE_S)
+        self.max_delay_s = float(max_delay_s if max_delay_s is not None else AppConfig.TEAM_OUTBOX_RETRY_MAX_S)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.failures = 0  # Consecutive failed flushes (drives the backoff)
+        self.next_retry_at = 0.0
+        self.flushed = 0
+        self.conflicts = 0
+
+    def retry_delay(self) -> float:
+        """Exponential backoff with jitter for the current failure streak."""
+        if not self.failures:
+            return 0.0
+        delay = min(self.max_delay_s, self.base_delay_s * 2.0 ** (self.failures - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def flush_once(self) -> int:
+        """Push pending rows batch by batch; returns how many were written. Raises on Mongo errors."""
+        from pymongo import UpdateOne
+
+        written = 0
+        with self._flush_lock:
+            while True:
+                entries = self.outbox.batch(self.batch_size)
+                if not entries:
+                    break
+                conflicts: List[OutboxEntry] = []
+                try:
+                    coll = self._collection_fn()
+                    remote = self._remote_state(coll, [e.name for e in entries])
+                    ops = []
+                    for e in entries:
+                        # Someone else changed the team since it was edited here: local edit wins, report it
+                        if remote.get(e.name) not in (e.base, e.abbreviation):
+                            conflicts.append(e)
+                        if e.op == OP_UPSERT:
+                            update: Dict[str, Any] = {
+                                "$set": {
+                                    "abbreviation": e.abbreviation,
+                                    "name_key": normalize_team_key(e.name),
+                                    "deleted": False,
+                                },
+                                "$currentDate": {"updated_at": True},
+                            }
+                            ops.append(UpdateOne({"name": e.name}, update, upsert=True))
+                        else:
+                            ops.append(UpdateOne(
+                                {"name": e.name, "deleted": {"$ne": True}},
+                                {"$set": {"deleted": True}, "$currentDate": {"updated_at": True}},
+                            ))
+                    coll.bulk_write(ops, ordered=True)
+                except Exception as exc:
+                    self.outbox.fail([e.id for e in entries], f"{type(exc).__name__}: {exc}")
+                    raise
+                for e in conflicts:
+                    self._report_conflict(e, remote.get(e.name))
+                self.outbox.complete(entries)
+                written += len(entries)
+                self.flushed += len(entries)
+        if written:
+            log.info("team_outbox_flushed", extra={"count": written, "pending": self.outbox.pending_count()})
+        return written
+
+    def _remote_state(self, coll: Any, names: List[str]) -> Dict[str, Optional[str]]:
+        """Current live abbreviation per name in Mongo (missing/deleted -> absent)."""
+        state: Dict[str, Optional[str]] = {}
+        cursor = coll.find(
+            {"name": {"$in": names}},
+            projection={"_id": 0, "name": 1, "abbreviation": 1, "deleted": 1},
+        )
+        for doc in cursor:
+            if isinstance(doc, dict) and doc.get("name") and not doc.get("deleted"):
+                state[_norm(doc["name"])] = _norm(doc.get("abbreviation", ""))
+        return state
+
+    def _report_conflict(self, entry: OutboxEntry, remote: Optional[str]) -> None:
+        self.conflicts += 1
+        self.outbox.add_conflict(entry.name, entry.op, entry.abbreviation, remote, entry.base)
+        log.warning("team_outbox_conflict", extra={
+            "team": entry.name, "op": entry.op, "local": entry.abbreviation, "remote": remote, "base": entry.base,
+        })
+
+    # ----- background thread -----
+    def start(self) -> "OutboxFlusher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="team-outbox-flush", daemon=True)
+            self._thread.start()
+        return self
+
+    def request_flush(self) -> None:
+        """Ask the flusher to run now (ignored while backing off); requests coalesce."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pending": self.outbox.pending_count(),
+            "retry_in_s": round(max(0.0, self.next_retry_at - time.time()), 1) if self.failures else 0.0,
+            "failures": self.failures,
+            "last_error": self.outbox.last_error() if self.failures else None,
+            "flushed": self.flushed,
+            "conflicts": self.conflicts,
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if time.time() >= self.next_retry_at:
+                try:
+                    self.flush_once()
+                    self.failures = 0
+                except Exception:
+                    self.failures += 1
+                    self.next_retry_at = time.time() + self.retry_delay()
+                    log.warning("team_outbox_flush_failed", exc_info=True, extra={
+                        "failures": self.failures, "pending": self.outbox.pending_count(),
+                    })
+            wait = max(0.0, self.next_retry_at - time.time()) if self.failures else AppConfig.TEAM_SYNC_INTERVAL_S
+            self._wake.wait(wait)
+            self._wake.clear()
+
+
+# ─────────────────────────── Process-level helpers ───────────────────────────
+_outbox: Optional[TeamOutbox] = None
+_flusher: Optional[OutboxFlusher] = None
+_init_lock = threading.Lock()
+
+
+def get_team_outbox() -> TeamOutbox:
+    """Open (once per process) the outbox; falls back to memory if the file can't be used."""
+    global _outbox
+    with _init_lock:
+        if _outbox is None:
+            try:
+                _outbox = TeamOutbox()
+            except Exception:
+                log.warning("team_outbox_open_failed", exc_info=True)
+                _outbox = TeamOutbox(Path(":memory:"))
+        return _outbox
+
+
+def start_outbox_flusher(collection_fn: Callable[[], Any]) -> OutboxFlusher:
+    """Start (once per process) the flusher for the shared outbox."""
+    global _flusher
+    outbox = get_team_outbox()
+    with _init_lock:
+        if _flusher is None:
+            _flusher = OutboxFlusher(outbox, collection_fn).start()
+        return _flusher
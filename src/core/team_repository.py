@@ -0,0 +1,353 @@
+"""
+Team repository backends.
+
+What this is:
+- ``TeamRepository``: the storage contract behind the team manager
+  (``save_team``, ``save_many``, ``load_teams``, ``get_abbreviation``,
+  ``delete_team``, ``get_all_names``).
+- Three implementations: ``MongoTeamRepository`` (a collection, same document
+  shape and tombstones as the app), ``JsonTeamRepository`` (a teams.json-style
+  file) and ``InMemoryTeamRepository`` (a dict with injectable latency and
+  failures).
+- ``InMemoryTeamCollection``: the slice of a pymongo collection the app's bulk
+  import/export (``team_bulk``) and outbox flusher use, over an in-memory
+  repository, so those code paths run offline with the same latency/failures.
+
+Why it exists:
+- Caching, autocomplete and bulk paths could only be exercised against a live
+  Atlas cluster. With the in-memory backend they can be load-tested offline,
+  including slow or flaky "network" behaviour (see ``team_bench``).
+
+Main features:
+- Names/abbreviations normalized like ``MongoTeamManager`` (strip + upper)
+- ``save_team`` returns near-duplicate names, like the manager
+- Injected failures raise ``InjectedFailure`` (a ``ConnectionError``), so they
+  take the same error paths as a lost Mongo connection
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Protocol, Set, Tuple
+
+from ..config import AppConfig
+from .team_names import find_near_duplicates, normalize_team_key
+
+
+class TeamRepository(Protocol):
+    """Storage contract for teams (name -> abbreviation)."""
+
+    def save_team(self, name: str, abbreviation: str) -> List[str]: ...
+
+    def save_many(self, teams: Mapping[str, str]) -> int: ...
+
+    def load_teams(self) -> Dict[str, str]: ...
+
+    def get_abbreviation(self, name: str) -> str: ...
+
+    def delete_team(self, name: str) -> bool: ...
+
+    def get_all_names(self) -> List[str]: ...
+
+
+class InjectedFailure(ConnectionError):
+    """Raised by InMemoryTeamRepository when a failure is injected."""
+
+
+def _norm(value: Any) -> str:
+    return str(value).strip().upper()
+
+
+def _normalized(teams: Mapping[str, str]) -> Dict[str, str]:
+    return {_norm(n): _norm(a) for n, a in teams.items() if _norm(n)}
+
+
+class _DictTeamStore:
+    """Shared dict-backed logic for the JSON and in-memory repositories."""
+
+    def __init__(self, teams: Optional[Mapping[str, str]] = None) -> None:
+        self._lock = threading.RLock()
+        self._teams: Dict[str, str] = _normalized(teams or {})
+        self._keys: Dict[str, str] = {n: normalize_team_key(n) for n in self._teams}
+
+    def _persist(self) -> None:
+        """Called (under the lock) after every change."""
+
+    def save_team(self, name: str, abbreviation: str) -> List[str]:
+        key, abbr = _norm(name), _norm(abbreviation)
+        with self._lock:
+            similar = find_near_duplicates(key, self._keys.items())
+            self._teams[key] = abbr
+            self._keys[key] = normalize_team_key(key)
+            self._persist()
+        return similar
+
+    def save_many(self, teams: Mapping[str, str]) -> int:
+        fresh = _normalized(teams)
+        with self._lock:
+            self._teams.update(fresh)
+            self._keys.update((n, normalize_team_key(n)) for n in fresh)
+            self._persist()
+        return len(fresh)
+
+    def load_teams(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._teams)
+
+    def get_abbreviation(self, name: str) -> str:
+        with self._lock:
+            return self._teams.get(_norm(name), "")
+
+    def delete_team(self, name: str) -> bool:
+        key = _norm(name)
+        with self._lock:
+            if self._teams.pop(key, None) is None:
+                return False
+            self._keys.pop(key, None)
+            self._persist()
+        return True
+
+    def get_all_names(self) -> List[str]:
+        with self._lock:
+            return list(self._teams)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._teams)
+
+
+class JsonTeamRepository(_DictTeamStore):
+    """Teams in a JSON object file, rewritten atomically on every change."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        teams: Dict[str, str] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if isinstance(data, dict):
+                teams = {str(n): str(a) for n, a in data.items()}
+        except FileNotFoundError:
+            pass
+        super().__init__(teams)
+        self.writes = 0
+
+    def _persist(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self._teams, fh, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+        self.writes += 1
+
+
+class InMemoryTeamRepository(_DictTeamStore):
+    """
+    Dict-backed repository for tests and benchmarks.
+
+    Every call first waits `latency_s` (+ up to `jitter_s`) to stand in for a
+    network round trip, then fails with probability `failure_rate`, or always
+    when its method name is in `fail_on`. `calls` counts calls per method.
+    """
+
+    def __init__(
+        self,
+        teams: Optional[Mapping[str, str]] = None,
+        *,
+        latency_s: float = 0.0,
+        jitter_s: float = 0.0,
+        failure_rate: float = 0.0,
+        fail_on: Iterable[str] = (),
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__(teams)
+        self.latency_s = float(latency_s)
+        self.jitter_s = float(jitter_s)
+        self.failure_rate = float(failure_rate)
+        self.fail_on: Set[str] = set(fail_on)
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+        self.failures = 0
+
+    def _io(self, method: str) -> None:
+        with self._rng_lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            delay = self.latency_s + (self._rng.random() * self.jitter_s if self.jitter_s else 0.0)
+            failed = method in self.fail_on or (self.failure_rate > 0 and self._rng.random() < self.failure_rate)
+            if failed:
+                self.failures += 1
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            raise InjectedFailure(f"injected failure in {method}")
+
+    def save_team(self, name: str, abbreviation: str) -> List[str]:
+        self._io("save_team")
+        return super().save_team(name, abbreviation)
+
+    def save_many(self, teams: Mapping[str, str]) -> int:
+        self._io("save_many")
+        return super().save_many(teams)
+
+    def load_teams(self) -> Dict[str, str]:
+        self._io("load_teams")
+        return super().load_teams()
+
+    def get_abbreviation(self, name: str) -> str:
+        self._io("get_abbreviation")
+        return super().get_abbreviation(name)
+
+    def delete_team(self, name: str) -> bool:
+        self._io("delete_team")
+        return super().delete_team(name)
+
+    def get_all_names(self) -> List[str]:
+        self._io("get_all_names")
+        return super().get_all_names()
+
+
+class BulkResult(NamedTuple):
+    """The counters ``team_bulk`` reads from a pymongo ``BulkWriteResult``."""
+    upserted_count: int
+    modified_count: int
+
+
+class _Cursor:
+    """find() result; supports the ``sort`` call ``iter_collection_teams`` chains."""
+
+    def __init__(self, docs: Iterable[Dict[str, Any]]) -> None:
+        self._docs = list(docs)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._docs)
+
+    def sort(self, key: str, direction: int = 1) -> "_Cursor":
+        return _Cursor(sorted(self._docs, key=lambda doc: doc[key], reverse=direction < 0))
+
+
+class InMemoryTeamCollection:
+    """
+    Collection facade over an InMemoryTeamRepository for ``team_bulk`` and ``OutboxFlusher``.
+
+    Supports ``bulk_write`` of ``UpdateOne`` ops in the app's document shape
+    (``$set`` abbreviation / ``deleted``) and ``find`` by ``deleted`` or
+    ``name $in``. Every call is one round trip of the repository (latency and
+    injected failures under the method names ``bulk_write``/``find``).
+    """
+
+    def __init__(self, repo: InMemoryTeamRepository) -> None:
+        self.repo = repo
+
+    def bulk_write(self, ops: Iterable[Any], ordered: bool = True) -> "BulkResult":
+        self.repo._io("bulk_write")
+        upserted = modified = 0
+        with self.repo._lock:
+            for op in ops:
+                doc = op._doc  # pymongo keeps UpdateOne's filter/update private
+                fields = doc.get("$set", {})
+                name = _norm(op._filter["name"])
+                current = self.repo._teams.get(name)
+                if fields.get("deleted"):
+                    if current is not None:
+                        _DictTeamStore.delete_team(self.repo, name)
+                        modified += 1
+                    continue
+                if current is None and not op._upsert:
+                    continue
+                abbr = _norm(fields.get("abbreviation", ""))
+                _DictTeamStore.save_many(self.repo, {name: abbr})
+                if current is None:
+                    upserted += 1
+                elif current != abbr:
+                    modified += 1
+        return BulkResult(upserted, modified)
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Any = None, **_options: Any) -> _Cursor:
+        self.repo._io("find")
+        names = ((query or {}).get("name") or {}).get("$in")
+        wanted = None if names is None else {_norm(n) for n in names}
+        teams = _DictTeamStore.load_teams(self.repo)
+        return _Cursor(
+            {"name": n, "abbreviation": a, "deleted": False}
+            for n, a in teams.items() if wanted is None or n in wanted
+        )
+
+
+class MongoTeamRepository:
+    """Direct collection access (no catalog, cache or outbox), same documents as the app."""
+
+    def __init__(self, collection: Any) -> None:
+        self.collection = collection
+
+    @staticmethod
+    def _update(abbreviation: Optional[str], name: str) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {"deleted": True} if abbreviation is None else {
+            "abbreviation": abbreviation, "name_key": normalize_team_key(name), "deleted": False,
+        }
+        return {"$set": fields, "$currentDate": {"updated_at": True}}
+
+    def save_team(self, name: str, abbreviation: str) -> List[str]:
+        key, abbr = _norm(name), _norm(abbreviation)
+        # Indexed name_key lookup: accent/punctuation twins only (no typo-level scan)
+        similar = [
+            str(doc["name"]) for doc in self.collection.find(
+                {"name_key": normalize_team_key(key), "name": {"$ne": key}, "deleted": {"$ne": True}},
+                projection={"_id": 0, "name": 1},
+            )
+        ]
+        self.collection.update_one({"name": key}, self._update(abbr, key), upsert=True)
+        return similar
+
+    def save_many(self, teams: Mapping[str, str]) -> int:
+        from pymongo import UpdateOne
+
+        items = list(_normalized(teams).items())
+        size = max(1, int(AppConfig.TEAM_IMPORT_BATCH_SIZE))
+        for start in range(0, len(items), size):
+            ops = [UpdateOne({"name": n}, self._update(a, n), upsert=True) for n, a in items[start:start + size]]
+            self.collection.bulk_write(ops, ordered=False)
+        return len(items)
+
+    def load_teams(self) -> Dict[str, str]:
+        return {name: abbr for name, abbr in self._live()}
+
+    def _live(self) -> Iterable[Tuple[str, str]]:
+        for doc in self.collection.find({"deleted": {"$ne": True}}, projection={"_id": 0, "name": 1, "abbreviation": 1}):
+            if isinstance(doc, dict) and doc.get("name"):
+                yield str(doc["name"]), str(doc.get("abbreviation", ""))
+
+    def get_abbreviation(self, name: str) -> str:
+        doc = self.collection.find_one(
+            {"name": _norm(name), "deleted": {"$ne": True}}, projection={"_id": 0, "abbreviation": 1}
+        )
+        return str(doc.get("abbreviation", "")) if isinstance(doc, dict) else ""
+
+    def delete_team(self, name: str) -> bool:
+        key = _norm(name)
+        result = self.collection.update_one({"name": key, "deleted": {"$ne": True}}, self._update(None, key))
+        return bool(getattr(result, "modified_count", 0))
+
+    def get_all_names(self) -> List[str]:
+        return [name for name, _ in self._live()]
+
+
+def create_team_repository(backend: str, **options: Any) -> TeamRepository:
+    """``memory`` (InMemoryTeamRepository options), ``json`` (``path``) or ``mongo`` (``collection``)."""
+    if backend == "memory":
+        return InMemoryTeamRepository(**options)
+    if backend == "json":
+        path = options.get("path")
+        return JsonTeamRepository(Path(path) if path else Path(AppConfig.TEAMS_BACKUP_FILENAME))
+    if backend == "mongo":
+        collection = options.get("collection")
+        if collection is None:
+            from .filenames import get_env
+            from .mongodb import _get_mongo_client
+
+            collection = _get_mongo_client()[get_env("MONGO_DB")][get_env("MONGO_COLLECTION")]
+        return MongoTeamRepository(collection)
+    raise ValueError(f"unknown team repository backend: {backend!r}")
@@ -0,0 +1,390 @@
+"""
+In-memory search index over team names (autocomplete).
+
+What this is:
+- `TeamSearchIndex`: normalized keys, a sorted key array for prefix lookups
+  (bisect) and n-gram postings (1..3 characters) for substring lookups
+- Incremental `upsert`/`remove`; removed ids are tombstoned and the postings
+  compacted once they pile up
+- Query narrowing: when a query contains the previous one, the previous
+  (verified) result set is filtered instead of starting from the postings
+
+Why it exists:
+- `Autocomplete` used to copy the whole team dict and casefold every label on
+  every debounced keystroke: O(N) per key press. With the index a keystroke is
+  a postings lookup plus verification of a small candidate list.
+
+Result order: prefix matches (alphabetical) first, then the remaining
+substring matches in index order (alphabetical right after a `build`).
+
+`FuzzyTeamSearch` is the ranked, letter-bag variant used by the team manager
+window (any-order letters, best match first).
+
+    python -m src.core.team_search --teams 100000
+"""
+
+import bisect
+import random
+import string
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .team_names import normalize_team_key
+
+GRAM_SIZES = (1, 2, 3)
+# Rebuild postings once tombstones exceed this share of ids
+COMPACT_RATIO = 0.25
+
+
+# Precomputed key lookup (e.g. TeamCatalog.key_of); None -> normalize on the spot
+KeyFn = Callable[[str], Optional[str]]
+
+
+def normalize_key(text: str) -> str:
+    """Search key for a label or query (accent/case/punctuation-insensitive)."""
+    return normalize_team_key(text)
+
+
+def _key_for(label: str, key_fn: Optional[KeyFn]) -> str:
+    key = key_fn(label) if key_fn is not None else None
+    return key if key is not None else normalize_team_key(label)
+
+
+def _grams(key: str) -> Iterable[str]:
+    """Distinct 1..3-character substrings of `key`."""
+    return {key[i:i + n] for n in GRAM_SIZES for i in range(len(key) - n + 1)}
+
+
+class TeamSearchIndex:
+    """Prefix + substring index mapping labels (team names) to values (abbreviations)."""
+
+    def __init__(self, teams: Optional[Mapping[str, str]] = None, key_fn: Optional[KeyFn] = None) -> None:
+        self.key_fn = key_fn
+        self._labels: List[Optional[str]] = []  # id -> label (None = removed)
+        self._keys: List[str] = []               # id -> normalized key
+        self._values: Dict[str, str] = {}        # label -> value
+        self._ids: Dict[str, int] = {}           # label -> id
+        self._sorted_keys: List[str] = []
+        self._sorted_ids: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._removed = 0
+        self.version = 0
+        # Narrowing state: last normalized query -> verified ids
+        self._last_key = ""
+        self._last_ids: Sequence[int] = ()
+        self._last_version = -1
+        if teams:
+            self.build(teams)
+
+    # ---------------- Maintenance ----------------
+    def build(self, teams: Mapping[str, str]) -> None:
+        """Replace the whole index (labels are added in key order)."""
+        self._labels, self._keys, self._values, self._ids = [], [], {}, {}
+        self._postings = {}
+        self._removed = 0
+        pairs = sorted(((_key_for(str(k), self.key_fn), str(k)) for k in teams), key=lambda p: p[0])
+        for key, label in pairs:
+            self._add(label, key)
+            self._values[label] = str(teams[label])
+        self._sorted_keys = [k for k, _ in pairs]
+        self._sorted_ids = list(range(len(pairs)))
+        self.version += 1
+
+    def upsert(self, label: str, value: str) -> None:
+        self._values[label] = value
+        if label in self._ids:
+            return  # Only the value changed; the key is derived from the label
+        key = _key_for(label, self.key_fn)
+        tid = self._add(label, key)
+        pos = bisect.bisect_right(self._sorted_keys, key)
+        self._sorted_keys.insert(pos, key)
+        self._sorted_ids.insert(pos, tid)
+        self.version += 1
+
+    def remove(self, label: str) -> None:
+        tid = self._ids.pop(label, None)
+        if tid is None:
+            return
+        self._values.pop(label, None)
+        key = self._keys[tid]
+        lo = bisect.bisect_left(self._sorted_keys, key)
+        hi = bisect.bisect_right(self._sorted_keys, key, lo)
+        for pos in range(lo, hi):
+            if self._sorted_ids[pos] == tid:
+                del self._sorted_keys[pos]
+                del self._sorted_ids[pos]
+                break
+        self._labels[tid] = None
+        self._removed += 1
+        self.version += 1
+        if self._removed > COMPACT_RATIO * max(1, len(self._labels)):
+            self.build(dict(self._values))
+
+    def _add(self, label: str, key: str) -> int:
+        tid = len(self._labels)
+        self._labels.append(label)
+        self._keys.append(key)
+        self._ids[label] = tid
+        postings = self._postings
+        for g in _grams(key):
+            bucket = postings.get(g)
+            if bucket is None:
+                postings[g] = [tid]
+            else:
+                bucket.append(tid)
+        return tid
+
+    # ---------------- Queries ----------------
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._ids
+
+    def get(self, label: str) -> Optional[str]:
+        return self._values.get(label)
+
+    def items(self) -> List[Tuple[str, str]]:
+        return list(self._values.items())
+
+    def _substring_ids(self, key: str) -> Sequence[int]:
+        """All ids whose key contains `key` (may include removed ids)."""
+        if len(key) <= GRAM_SIZES[-1]:
+            # The gram's own postings are exact
+            return self._postings.get(key, ())
+        n = GRAM_SIZES[-1]
+        candidates: Sequence[int] = ()
+        best = -1
+        for i in range(len(key) - n + 1):
+            bucket = self._postings.get(key[i:i + n])
+            if not bucket:
+                return ()
+            if best < 0 or len(bucket) < best:
+                candidates, best = bucket, len(bucket)
+        if (self._last_version == self.version and self._last_key
+                and self._last_key in key and len(self._last_ids) < best):
+            candidates = self._last_ids  # Narrow the previous result
+        keys = self._keys
+        return [i for i in candidates if key in keys[i]]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, str]]:
+        """(label, value) pairs whose label contains `query`; prefix matches first."""
+        key = normalize_key(query)
+        if not key:
+            return []
+        ids = self._substring_ids(key)
+        self._last_key, self._last_ids, self._last_version = key, ids, self.version
+
+        cap = limit if limit is not None and limit > 0 else len(self._ids)
+        out: List[Tuple[str, str]] = []
+        taken = set()
+        labels, values = self._labels, self._values
+        # Prefix matches straight from the sorted array
+        pos = bisect.bisect_left(self._sorted_keys, key)
+        sorted_keys, sorted_ids = self._sorted_keys, self._sorted_ids
+        while pos < len(sorted_keys) and len(out) < cap and sorted_keys[pos].startswith(key):
+            tid = sorted_ids[pos]
+            label = labels[tid]
+            if label is not None:
+                out.append((label, values[label]))
+                taken.add(tid)
+            pos += 1
+        for tid in ids:
+            if len(out) >= cap:
+                break
+            label = labels[tid]
+            if label is not None and tid not in taken:
+                out.append((label, values[label]))
+        return out
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "labels": len(self._ids),
+            "removed": self._removed,
+            "grams": len(self._postings),
+            "postings": sum(len(b) for b in self._postings.values()),
+        }
+
+
+# ---------------- Fuzzy ranking (team manager) ----------------
+def _compact(text: str) -> str:
+    return normalize_team_key(text).replace(" ", "")
+
+
+def _bag_mask(chars: str) -> int:
+    mask = 0
+    for c in chars:
+        mask |= 1 << (ord(c) & 63)
+    return mask
+
+
+def _bag(chars: str) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for c in chars:
+        counts[c] = counts.get(c, 0) + 1
+    return counts
+
+
+class _FuzzyEntry:
+    __slots__ = ("name", "abbreviation", "compact", "abbr", "word_starts", "bag", "mask")
+
+    def __init__(self, name: str, abbreviation: str, key: str) -> None:
+        self.name = name
+        self.abbreviation = abbreviation
+        words = key.split()
+        self.compact = "".join(words)
+        self.abbr = _compact(abbreviation)
+        starts, pos = set(), 0
+        for w in words:
+            if w:
+                starts.add(pos)
+                pos += len(w)
+        self.word_starts = frozenset(starts)
+        # Character-bag signature over name + abbreviation (the old letter match)
+        everything = self.compact + self.abbr
+        self.bag = _bag(everything)
+        self.mask = _bag_mask(everything)
+
+
+class FuzzyTeamSearch:
+    """Ranked letter-bag search for the team manager list.
+
+    A team matches when every query letter (alphanumerics only, with
+    multiplicity) occurs in its name + abbreviation, as before. Matches are
+    ranked best-first: exact name/abbreviation, name prefix, abbreviation
+    prefix, contiguous substring, in-order subsequence (word starts and runs
+    score higher), then out-of-order letter matches. Ties sort by name.
+    """
+
+    def __init__(self, teams: Optional[Mapping[str, str]] = None, key_fn: Optional[KeyFn] = None) -> None:
+        self.key_fn = key_fn
+        self._entries: Dict[str, _FuzzyEntry] = {}
+        self._last_query = ""
+        self._last_names: List[str] = []
+        if teams:
+            self.build(teams)
+
+    def build(self, teams: Mapping[str, str]) -> None:
+        key_fn = self.key_fn
+        self._entries = {
+            str(n): _FuzzyEntry(str(n), str(a), _key_for(str(n), key_fn)) for n, a in teams.items()
+        }
+        self._last_query, self._last_names = "", []
+
+    def upsert(self, name: str, abbreviation: str) -> None:
+        self._entries[name] = _FuzzyEntry(name, abbreviation, _key_for(name, self.key_fn))
+        self._last_query, self._last_names = "", []
+
+    def remove(self, name: str) -> None:
+        if self._entries.pop(name, None) is not None:
+            self._last_query, self._last_names = "", []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, query: str) -> List[str]:
+        """Matching team names, best first (all names, sorted, for an empty query)."""
+        q = _compact(query)
+        if not q:
+            return sorted(self._entries)
+        # A longer query needs a superset of letters: narrow the previous matches
+        if self._last_query and q.startswith(self._last_query):
+            pool: Iterable[_FuzzyEntry] = (self._entries[n] for n in self._last_names)
+        else:
+            pool = self._entries.values()
+        qmask = _bag_mask(q)
+        qbag = _bag(q).items()
+        scored: List[Tuple[float, str]] = []
+        for e in pool:
+            if qmask & ~e.mask:
+                continue
+            bag = e.bag
+            if all(bag.get(c, 0) >= n for c, n in qbag):
+                scored.append((-self._score(q, e), e.name))
+        scored.sort()
+        names = [n for _, n in scored]
+        self._last_query, self._last_names = q, names
+        return names
+
+    @staticmethod
+    def _score(q: str, e: _FuzzyEntry) -> float:
+        name, abbr = e.compact, e.abbr
+        if q == name or q == abbr:
+            return 1000.0
+        if name.startswith(q):
+            return 900.0 - len(name) / 100.0
+        if abbr.startswith(q):
+            return 850.0 - len(abbr) / 100.0
+        idx = name.find(q)
+        if idx >= 0:
+            return 800.0 - idx - (0.5 if idx not in e.word_starts else 0.0)
+        # In-order subsequence: reward word starts and consecutive runs
+        score, pos, prev = 0.0, 0, -2
+        starts = e.word_starts
+        for c in q:
+            pos = name.find(c, pos)
+            if pos < 0:
+                return 100.0  # Letters present, but out of order
+            score += 1.0 + (3.0 if pos in starts else 0.0) + (2.0 if pos == prev + 1 else 0.0)
+            prev = pos
+            pos += 1
+        return 500.0 + score - (prev + 1 - len(q)) * 0.1
+
+
+# ---------------- Benchmark ----------------
+def random_teams(count: int, seed: int = 7) -> Dict[str, str]:
+    """`count` synthetic teams (1-3 random words -> first three letters), reproducible per seed."""
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 9)))
+             for _ in range(max(200, count // 20))]
+    teams: Dict[str, str] = {}
+    while len(teams) < count:
+        name = " ".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        teams[name] = name[:3]
+    return teams
+
+
+def run_benchmark(count: int = 100_000, queries: int = 200, limit: int = 200) -> Dict[str, float]:
+    """Type random team names one key at a time; report per-keystroke latency."""
+    teams = random_teams(count)
+    t0 = time.perf_counter()
+    index = TeamSearchIndex(teams)
+    build_ms = (time.perf_counter() - t0) * 1000
+    rng = random.Random(11)
+    names = list(teams)
+    samples: List[float] = []
+    for _ in range(queries):
+        target = rng.choice(names)
+        start = rng.randrange(len(target))
+        typed = target[start:start + rng.randint(4, 12)]
+        for i in range(1, len(typed) + 1):
+            t = time.perf_counter()
+            index.search(typed[:i], limit)
+            samples.append((time.perf_counter() - t) * 1000)
+    samples.sort()
+    n = len(samples)
+    return {
+        "teams": count,
+        "build_ms": round(build_ms, 1),
+        "keystrokes": n,
+        "avg_ms": round(sum(samples) / n, 4),
+        "p50_ms": round(samples[n // 2], 4),
+        "p95_ms": round(samples[min(n - 1, int(n * 0.95))], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def main() -> None:
+    import argparse
+    import json
+
+    ap = argparse.ArgumentParser(description="Team search index keystroke benchmark")
+    ap.add_argument("--teams", type=int, default=100_000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--limit", type=int, default=200, help="max suggestions per keystroke")
+    args = ap.parse_args()
+    print(json.dumps(run_benchmark(args.teams, args.queries, args.limit), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,8 @@ from src.ui.footer_label import create_footer
 from src.utils.window_utils import create_main_window, apply_drag_and_drop
 from src.notification import init_notification_queue, server_main
 from src.core.path_finder import get_path_finder
+from src.core.state_bus import init_state_bus, start_state_bus_hub
+from src.core.team_broker import init_team_broker, start_team_broker
 from src.core.logger import get_logger, mark_telemetry
 
 # Global variable to track instance positions for cascade effect
@@ -59,12 +61,13 @@ class ScoreApp:
         self.instance_number = instance_number
         
         # Initialize attributes that will be set later
-        from typing import Optional
+        from typing import Optional, Union
         from src.core.gameinfo import GameInfoStore
         from src.core.mongodb import MongoTeamManager
+        from src.core.team_broker import RemoteTeamManager
         
         self.json: Optional[GameInfoStore] = None
-        self.mongo: Optional[MongoTeamManager] = None
+        self.mongo: Optional[Union[MongoTeamManager, RemoteTeamManager]] = None
         self.decrement_buttons_enabled = False
         
         # Check license BEFORE initializing any components
@@ -293,7 +296,7 @@ class ScoreApp:
         """Defer the backup operation to avoid blocking UI"""
         if self.mongo:
             try:
-                self.mongo.backup_to_json()
+                self.mongo.schedule_backup()
             except Exception:
                 pass
 
@@ -581,7 +584,7 @@ class ScoreApp:
         """Initialize components in parallel for faster startup"""
         import threading
         from src.core import get_config
-        from src.core.mongodb import MongoTeamManager
+        from src.core.team_broker import get_team_manager
         from src.core.gameinfo import GameInfoStore
         
         # Update loading message to show license validation success
@@ -592,7 +595,8 @@ class ScoreApp:
         
         # Start database connection in background
         def init_database():
-            self.mongo = MongoTeamManager()
+            # Broker client when the team broker is up, else a local Mongo manager
+            self.mongo = get_team_manager()
             # Defer initial backup to avoid blocking startup
             try:
                 self.root.after(1500, self._deferred_backup)
@@ -861,11 +865,14 @@ def ask_instance_count_ui() -> int:
 
 
 
-def child_entry(instance_number, notification_queue):
+def child_entry(instance_number, notification_queue, state_bus_address=None, state_bus_authkey=None,
+                team_broker_address=None, team_broker_authkey=None):
     """
-    Initialize notification queue in this child process, then start the ScoreApp instance.
+    Initialize notification queue, state bus and team broker address in this child process, then start the ScoreApp instance.
     """
     init_notification_queue(notification_queue)
+    init_state_bus(state_bus_address, state_bus_authkey)
+    init_team_broker(team_broker_address, team_broker_authkey)
     start_instance(instance_number)
 
 
@@ -890,12 +897,22 @@ def main():
     p_notify = Process(target=server_main, args=(q,), daemon=True)
     p_notify.start()
 
+    # Start the cross-process state bus hub alongside it (lives in this process)
+    state_bus = start_state_bus_hub()
+    bus_address = state_bus.address if state_bus else None
+    bus_authkey = state_bus.authkey if state_bus else None
+
+    # One team-data broker owns the Mongo client/catalog for every field (daemon ok)
+    team_broker = start_team_broker()
+    broker_address = team_broker.address if team_broker else None
+    broker_authkey = team_broker.authkey if team_broker else None
+
     # Fast batch process creation
     procs = []
     batch_size = 5  # Increased batch size for faster startup
     
     for i in range(1, count + 1):
-        p = Process(target=child_entry, args=(i, q))
+        p = Process(target=child_entry, args=(i, q, bus_address, bus_authkey, broker_address, broker_authkey))
         p.start()
         procs.append(p)
         
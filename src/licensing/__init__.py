@@ -6,6 +6,7 @@ license management, validation, modal dialogs, and application blocking.
 """
 
 from .license_manager import LicenseManager
+from .license_status import LicenseStatusService, get_license_service
 from .license_validator import LicenseValidator
 from .license_modal import LicenseModal, LicenseActivationDialog
 from .license_blocker import LicenseBlocker
@@ -20,6 +21,8 @@ from .license_integration import (
 
 __all__ = [
     'LicenseManager',
+    'LicenseStatusService',
+    'get_license_service',
     'LicenseValidator',
     'LicenseModal',
     'LicenseActivationDialog',
@@ -5,7 +5,8 @@ Prevents application usage when licenses are invalid and shows blocking messages
 
 import customtkinter as ctk
 from typing import Callable, Optional
-from .license_manager import LicenseManager, LicenseStatus
+from .license_manager import LicenseStatus
+from .license_status import get_license_service
 from src.core.logger import get_logger
 
 log = get_logger(__name__)
@@ -22,128 +23,39 @@ class LicenseBlocker:
             on_license_valid: Optional callback to execute when license becomes valid
         """
         self.parent = parent
-        self.license_manager = LicenseManager()
+        self.license_service = get_license_service()
+        self.license_manager = self.license_service.manager
         self.blocking_frame = None
         self.is_blocked = False
         self.on_license_valid = on_license_valid
         self._listener_active = True
+        self._status_listener = None
         
         # Start listening for license activation notifications from other instances
         self._start_license_notification_listener()
         
     def _start_license_notification_listener(self):
-        """Start listening for license activation notifications from other instances."""
-        def check_for_license_updates():
-            try:
-                # Check if listener should continue
-                if not self._listener_active:
-                    return
-                
-                # Check if license status has changed (e.g., another instance activated it)
-                if self.is_blocked:
-                    # First check the signal file from other instances
-                    if self._check_license_activation_signal():
-                        log.info("license_activation_signal_detected")
-                        # Small delay to ensure the license file is fully written
-                        self.parent.after(500, self._check_and_continue_if_valid)
-                        return
-                    
-                    # Also check direct license status
-                    status, is_valid = self.license_manager.get_license_status()
-                    if is_valid:
-                        log.info("license_became_valid_direct_check")
-                        self._remove_blocking()
-                        if self.on_license_valid:
-                            self.on_license_valid()
-                        return
-                
-                # Continue listening if still active
-                if self._listener_active:
-                    self.parent.after(1000, check_for_license_updates)  # Check every second
-            except Exception as e:
-                log.error("license_notification_listener_error", extra={"error": str(e)})
-                # Continue listening even if there's an error
-                if self._listener_active:
-                    self.parent.after(1000, check_for_license_updates)
-        
-        # Start the listener
-        self.parent.after(1000, check_for_license_updates)
+        """Unblock as soon as the license becomes valid (e.g. activated in another field process)."""
+        # Status changes are pushed by the license service (state bus + background revalidation)
+        self._status_listener = self.license_service.subscribe(self.parent, self._on_license_status_changed)
+    
+    def _on_license_status_changed(self, snap):
+        """Called on the Tk thread when the cached license status changes."""
+        if not self._listener_active or not self.is_blocked or not snap.is_valid:
+            return
+        log.info("license_became_valid_notification", extra={"status": snap.status})
+        self._remove_blocking()
+        if self.on_license_valid:
+            self.on_license_valid()
     
     def stop_notification_listener(self):
         """Stop the notification listener."""
         self._listener_active = False
+        if self._status_listener is not None:
+            self.license_service.remove_listener(self._status_listener)
+            self._status_listener = None
         log.info("license_notification_listener_stopped")
     
-    def _check_license_activation_signal(self) -> bool:
-        """Check if another instance has activated a license."""
-        try:
-            import os
-            import tempfile
-            
-            temp_dir = tempfile.gettempdir()
-            signal_file = os.path.join(temp_dir, "license_activated_signal")
-            
-            if os.path.exists(signal_file):
-                # Check if the signal file is recent (within last 10 seconds)
-                import time
-                current_time = time.time()
-                
-                try:
-                    with open(signal_file, 'r') as f:
-                        signal_time = float(f.read().strip())
-                    
-                    # If signal is recent, consider it valid
-                    if current_time - signal_time < 10:
-                        return True
-                    else:
-                        # Remove old signal file
-                        os.remove(signal_file)
-                except (ValueError, IOError):
-                    # Remove corrupted signal file
-                    try:
-                        os.remove(signal_file)
-                    except:
-                        pass
-                        
-            return False
-            
-        except Exception as e:
-            log.error("license_check_activation_signal_error", extra={"error": str(e)})
-            return False
-    
-    def _check_and_continue_if_valid(self):
-        """Check license status and continue if valid."""
-        try:
-            # Clean up the signal file first
-            self._cleanup_license_activation_signal()
-            
-            status, is_valid = self.license_manager.get_license_status()
-            if is_valid:
-                log.info("license_confirmed_valid_after_signal")
-                self._remove_blocking()
-                if self.on_license_valid:
-                    self.on_license_valid()
-            else:
-                log.info("license_still_invalid_after_signal")
-        except Exception as e:
-            log.error("license_check_status_after_signal_error", extra={"error": str(e)})
-    
-    def _cleanup_license_activation_signal(self):
-        """Clean up the license activation signal file."""
-        try:
-            import os
-            import tempfile
-            
-            temp_dir = tempfile.gettempdir()
-            signal_file = os.path.join(temp_dir, "license_activated_signal")
-            
-            if os.path.exists(signal_file):
-                os.remove(signal_file)
-                log.debug("license_activation_signal_file_cleaned")
-                
-        except Exception as e:
-            log.error("license_cleanup_activation_signal_error", extra={"error": str(e)})
-    
     def check_and_block(self) -> bool:
         """
         Check license status and block if invalid.
@@ -153,16 +65,14 @@ class LicenseBlocker:
         """
         try:
             log.info("license_check_started")
-            status, is_valid = self.license_manager.get_license_status()
-            log.info("license_check_status", extra={"status": status, "is_valid": is_valid})
+            snap = self.license_service.snapshot()
+            status, is_valid = snap.status, snap.is_valid
+            log.info("license_check_status", extra={"status": status, "is_valid": is_valid, "online": snap.online})
             
-            # Get detailed license info for debugging
-            license_details = self.license_manager.get_license_details()
-            if license_details:
-                redacted = {k: ("***" if k in {"code", "signature"} else v) for k, v in license_details.items() if k != "_debug"}
+            # Decoded license info for debugging
+            if snap.data:
+                redacted = {k: ("***" if k in {"code", "signature"} else v) for k, v in snap.data.items()}
                 log.debug("license_details", extra={"details": redacted})
-                if "_debug" in license_details:
-                    log.debug("license_details_debug", extra={"debug": license_details["_debug"]})
             else:
                 log.info("license_details_unavailable")
             
@@ -326,6 +236,7 @@ class LicenseBlocker:
                 
                 # Save the license
                 if self.license_manager.save_license(license_data):
+                    self.license_service.reload()
                     # Remove blocking and continue
                     self._remove_blocking()
                     log.info("license_activated_success")
@@ -349,22 +260,9 @@ class LicenseBlocker:
     def _broadcast_license_activation(self):
         """Broadcast license activation to other instances."""
         try:
-            # Create a temporary file or use a shared mechanism to signal other instances
-            # This is a simple approach using a file-based signal
-            import os
-            import tempfile
-            
-            # Create a temporary file in a known location that other instances can check
-            temp_dir = tempfile.gettempdir()
-            signal_file = os.path.join(temp_dir, "license_activated_signal")
-            
-            # Write a timestamp to indicate when the license was activated
-            import time
-            with open(signal_file, 'w') as f:
-                f.write(str(time.time()))
-            
-            log.info("license_activation_broadcasted", extra={"signal_file": signal_file})
-            
+            # Pushed over the state bus; blocked field processes re-read license.enc immediately
+            self.license_service.announce_activation()
+            log.info("license_activation_broadcasted")
         except Exception as e:
             log.error("license_activation_broadcast_error", extra={"error": str(e)})
     
@@ -405,8 +303,8 @@ class LicenseBlocker:
                 if not self.parent.winfo_exists():
                     return  # Stop the periodic check if parent was destroyed
                     
-                # Always check license status, regardless of current blocking state
-                status, is_valid = self.license_manager.get_license_status()
+                # Cached status (revalidated against the database in the background)
+                status, is_valid = self.license_service.get_license_status()
                 
                 if not self.is_blocked:
                     # App is not blocked, check if it should be blocked
@@ -6,7 +6,7 @@ Shows detailed license information in a clean, simple UI.
 import customtkinter as ctk
 from datetime import datetime, timezone
 from typing import Optional, Dict
-from .license_manager import LicenseManager
+from .license_status import get_license_service
 from ..utils import apply_drag_and_drop
 from ..config.settings import AppConfig
 from src.ui.footer_label import create_footer
@@ -20,7 +20,7 @@ class LicenseDetailsWindow:
     
     def __init__(self, parent):
         self.parent = parent
-        self.license_manager = LicenseManager()
+        self.license_manager = get_license_service().manager
         self.window = None
         
     def show(self):
@@ -280,17 +280,9 @@ class LicenseDetailsWindow:
     def _load_license_data(self):
         """Load and display license data."""
         try:
-            # Get license status and data
-            status, is_valid = self.license_manager.get_license_status()
-            
-            # Get license data if available
-            license_data = None
-            if self.license_manager.license_file.exists():
-                try:
-                    encrypted_data = self.license_manager.license_file.read_bytes()
-                    license_data = self.license_manager._decrypt_license_data(encrypted_data)
-                except Exception as e:
-                    log.error("license_details_decrypt_failed", extra={"error": str(e)})
+            # Cached status and decoded data (no file or database access)
+            snap = get_license_service().snapshot()
+            status, is_valid, license_data = snap.status, snap.is_valid, snap.data
             
             # Update status
             status_text = self.license_manager.get_status_display_text(status, license_data)
@@ -4,8 +4,8 @@ Simple integration functions to add licensing to any application window.
 """
 
 from typing import Optional
-from .license_manager import LicenseManager
 from .license_blocker import LicenseBlocker
+from .license_status import get_license_service
 from src.core.logger import get_logger
 
 log = get_logger(__name__)
@@ -50,8 +50,7 @@ def check_license_status() -> tuple[str, bool]:
         Tuple of (status, is_valid)
     """
     try:
-        manager = LicenseManager()
-        return manager.get_license_status()
+        return get_license_service().get_license_status()
     except Exception as e:
         log.error("license_check_status_failed", extra={"error": str(e)})
         return "not_found", False
@@ -64,8 +63,8 @@ def get_license_display_info() -> tuple[str, str]:
         Tuple of (display_text, status_color)
     """
     try:
-        manager = LicenseManager()
-        status, _ = manager.get_license_status()
+        manager = get_license_service().manager
+        status, _ = get_license_service().get_license_status()
         display_text = manager.get_status_display_text(status)
         status_color = manager.get_status_color(status)
         return display_text, status_color
@@ -6,8 +6,6 @@ Handles license validation, encryption, and status management with machine bindi
 import os
 import json
 import hashlib
-import uuid
-import platform
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Tuple, Optional, Literal
@@ -16,6 +14,7 @@ from ..config import AppConfig
 from ..utils.online_time_provider import get_current_utc_time, get_time_source_info
 from src.core.logger import get_logger
 from .native_verifier import verify_signature as native_verify_signature
+from .machine_hash import get_machine_hash
 
 log = get_logger(__name__)
 
@@ -52,41 +51,8 @@ class LicenseManager:
         return fernet_key
         
     def _compute_machine_hash(self) -> str:
-        """Compute a stable machine hash for node-locking."""
-        try:
-            # Get system information
-            system_info = [
-                platform.node(),  # Computer name
-                platform.machine(),  # Architecture
-                str(uuid.getnode()),  # MAC address
-            ]
-            
-            # Get additional hardware info if available
-            try:
-                cpu_info = platform.processor()
-                if cpu_info:
-                    system_info.append(cpu_info)
-            except:
-                pass
-                
-            try:
-                # Get disk info if available (import psutil lazily)
-                import psutil
-                disk_info = psutil.disk_partitions()
-                if disk_info:
-                    system_info.append(disk_info[0].device)
-            except:
-                pass
-            
-            # Create stable hash
-            combined = "|".join(filter(None, system_info)).encode()
-            return hashlib.sha256(combined).hexdigest()[:16]
-            
-        except Exception as e:
-            log.warning("license_machine_hash_compute_failed", extra={"error": str(e)})
-            # Fallback to basic system info
-            fallback = f"{platform.node()}-{platform.machine()}"
-            return hashlib.sha256(fallback.encode()).hexdigest()[:16]
+        """Machine hash for node-locking (computed once per boot, see machine_hash)."""
+        return get_machine_hash()
     
     def _encrypt_license_data(self, data: dict) -> bytes:
         """Encrypt license data using AES-GCM equivalent (Fernet)."""
@@ -203,52 +169,56 @@ class LicenseManager:
             return "not_found", False
     
     def get_license_status(self) -> Tuple[LicenseStatus, bool]:
-        """Get current license status. Returns (status, is_valid)."""
+        """Get current license status. Returns (status, is_valid).
+
+        Decrypts the file and checks the database every time; UI code should
+        read the cached status from `license_status.get_license_service()`.
+        """
+        status, is_valid, _ = self.evaluate_license(online=True)
+        return status, is_valid
+
+    def read_license(self) -> Optional[dict]:
+        """Decrypted license.enc contents, or None if missing/unreadable."""
+        if not self.license_file.exists():
+            return None
+        return self._decrypt_license_data(self.license_file.read_bytes())
+
+    def evaluate_license(self, online: bool = True) -> Tuple[LicenseStatus, bool, Optional[dict]]:
+        """(status, is_valid, license data). `online` refreshes the data from the database first."""
         try:
             # Ensure license directory exists
             self.license_dir.mkdir(exist_ok=True)
             
-            # Check if license file exists
-            if not self.license_file.exists():
-                return "not_found", False
-            
-            # Read and decrypt license file
-            encrypted_data = self.license_file.read_bytes()
-            license_data = self._decrypt_license_data(encrypted_data)
-            
+            license_data = self.read_license()
             if not license_data:
-                return "not_found", False
+                return "not_found", False, None
             
             # Verify signature
             signature = license_data.get("signature", "")
             if not self._verify_license_signature(license_data, signature):
-                return "blocked", False
+                return "blocked", False, license_data
             
-            # Always refresh from database first to get latest status
-            self._refresh_license_from_database(license_data)
+            # Database status wins over the local copy (saved back when it changed)
+            if online:
+                license_data = self._refresh_license_from_database(license_data)
             
-            # Re-read the updated license data
-            if self.license_file.exists():
-                encrypted_data = self.license_file.read_bytes()
-                updated_license_data = self._decrypt_license_data(encrypted_data)
-                if updated_license_data:
-                    # Validate the updated license data
-                    return self._validate_license_data(updated_license_data)
-            
-            # Fallback to original validation if refresh failed
-            return self._validate_license_data(license_data)
+            status, is_valid = self._validate_license_data(license_data)
+            return status, is_valid, license_data
             
         except Exception as e:
             log.error("license_get_status_error", extra={"error": str(e)})
-            return "not_found", False
+            return "not_found", False, None
     
-    def _refresh_license_from_database(self, current_license_data: dict) -> bool:
-        """Refresh license data from database and update local file if changed."""
+    def _refresh_license_from_database(self, current_license_data: dict) -> dict:
+        """Refresh license data from database and update local file if changed.
+
+        Returns the data to validate: the updated copy if it was saved, else the current one.
+        """
         try:
             # Get license code from current data
             license_code = current_license_data.get("code")
             if not license_code:
-                return False
+                return current_license_data
             
             # Import here to avoid circular imports
             from .license_validator import LicenseValidator
@@ -286,20 +256,20 @@ class LicenseManager:
                     # Save updated license to local file
                     if self.save_license(updated_license_data):
                         log.info("license_save_success", extra={"status": db_status})
-                        return True
+                        return updated_license_data
                     else:
                         log.error("license_save_failed")
-                        return False
+                        return current_license_data
                 else:
                     log.debug("license_status_unchanged", extra={"status": db_status})
-                    return True
+                    return current_license_data
             else:
                 log.warning("license_not_found_in_database", extra={"status": db_status})
-                return False
+                return current_license_data
                 
         except Exception as e:
             log.error("license_refresh_error", extra={"error": str(e)})
-            return False
+            return current_license_data
     
     def save_license(self, license_data: dict) -> bool:
         """Save encrypted license data to file."""
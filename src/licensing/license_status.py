@@ -0,0 +1,234 @@
+"""
+Cached license status for the UI.
+
+What this is:
+- One ``LicenseStatusService`` per process holding the last decoded license
+  and its (status, is_valid) in memory.
+- A background thread that revalidates against the database every
+  ``LICENSE_STATUS_REFRESH_S`` (or sooner on ``request_refresh()``), one
+  revalidation at a time, and tells listeners when the status changes.
+
+Why it exists:
+- ``LicenseManager.get_license_status`` decrypts license.enc, verifies the
+  signature and queries Mongo on every call, and it was called from the
+  blocker's 1 s listener, its periodic check and every window footer, all on
+  the Tk thread. Those callers now read a snapshot (no I/O).
+
+Main features:
+- First read decodes the local file only (no network); the database check
+  follows in the background
+- Single-flight: concurrent refresh requests share the running revalidation
+- ``subscribe(widget, callback)`` delivers changes on the Tk thread and stops
+  once the widget is destroyed
+- ``announce_activation()`` tells the other field processes over the state bus
+  that license.enc changed; each re-reads it right away (no polling)
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from ..config import AppConfig
+from src.core.logger import get_logger
+from src.core.state_bus import StateBusClient, StateDelta, get_state_bus, publish_state_delta
+from .license_manager import LicenseManager, LicenseStatus
+
+log = get_logger(__name__)
+
+
+class LicenseSnapshot(NamedTuple):
+    status: LicenseStatus
+    is_valid: bool
+    data: Optional[dict]  # Decoded license.enc (None when missing/unreadable)
+    checked_at: float  # time.time() of the evaluation
+    online: bool  # True once the database confirmed it
+
+
+Listener = Callable[[LicenseSnapshot], None]
+
+# State bus delta announcing that another process saved a new license.enc
+BUS_FIELD = "license"
+BUS_ACTIVATED_KEY = "activated"
+
+
+class LicenseStatusService:
+    """In-memory license status with background, single-flight revalidation."""
+
+    def __init__(
+        self,
+        manager: Optional[LicenseManager] = None,
+        refresh_interval_s: Optional[float] = None,
+    ):
+        self.manager = manager if manager is not None else LicenseManager()
+        interval = refresh_interval_s if refresh_interval_s is not None else AppConfig.LICENSE_STATUS_REFRESH_S
+        self.refresh_interval_s = float(interval)
+        self._lock = threading.Lock()
+        self._snapshot: Optional[LicenseSnapshot] = None
+        self._listeners: List[Listener] = []
+        # Single-flight: set while no revalidation is running
+        self._idle = threading.Event()
+        self._idle.set()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._bus: Optional[StateBusClient] = None
+        self.revalidations = 0
+
+    # ----- reads (O(1) once loaded) -----
+    def snapshot(self) -> LicenseSnapshot:
+        snap = self._snapshot
+        if snap is None:
+            # First read in this process: local file only, the database check runs in the background
+            snap = self.reload()
+        return snap
+
+    def get_license_status(self) -> Tuple[LicenseStatus, bool]:
+        """Same shape as `LicenseManager.get_license_status`, without the I/O."""
+        snap = self.snapshot()
+        return snap.status, snap.is_valid
+
+    def get_license_data(self) -> Optional[dict]:
+        return self.snapshot().data
+
+    # ----- updates -----
+    def reload(self) -> LicenseSnapshot:
+        """Re-read license.enc now (no network), e.g. right after saving it; then revalidate online."""
+        status, is_valid, data = self.manager.evaluate_license(online=False)
+        snap = self._publish(LicenseSnapshot(status, is_valid, data, time.time(), False))
+        self.request_refresh()
+        return snap
+
+    def refresh(self, wait: bool = True, timeout_s: Optional[float] = None) -> LicenseSnapshot:
+        """Revalidate against the database; joins a revalidation already in flight."""
+        with self._lock:
+            leader = self._idle.is_set()
+            if leader:
+                self._idle.clear()
+        if leader:
+            try:
+                status, is_valid, data = self.manager.evaluate_license(online=True)
+                self.revalidations += 1
+                self._publish(LicenseSnapshot(status, is_valid, data, time.time(), True))
+            except Exception:
+                log.warning("license_status_refresh_failed", exc_info=True)
+            finally:
+                self._idle.set()
+        elif wait:
+            self._idle.wait(timeout_s)
+        return self.snapshot()
+
+    def request_refresh(self) -> None:
+        """Ask the background thread to revalidate soon; repeated requests coalesce."""
+        self.start()
+        self._wake.set()
+
+    def _publish(self, snap: LicenseSnapshot) -> LicenseSnapshot:
+        with self._lock:
+            previous = self._snapshot
+            self._snapshot = snap
+            listeners = list(self._listeners)
+        if previous is not None and (previous.status, previous.is_valid) == (snap.status, snap.is_valid):
+            return snap
+        log.info("license_status_changed", extra={
+            "from": previous.status if previous else None, "to": snap.status, "online": snap.online,
+        })
+        for cb in listeners:
+            try:
+                cb(snap)
+            except Exception:
+                log.warning("license_status_listener_failed", exc_info=True)
+        return snap
+
+    # ----- listeners -----
+    def add_listener(self, callback: Listener) -> None:
+        """Called (on the thread that found it) with the new snapshot when the status changes."""
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def remove_listener(self, callback: Listener) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def subscribe(self, widget: Any, callback: Listener) -> Listener:
+        """`callback` runs on the Tk thread of `widget`; unsubscribes when the widget is gone."""
+
+        def _on_change(snap: LicenseSnapshot) -> None:
+            def _on_tk() -> None:
+                try:
+                    if not widget.winfo_exists():
+                        self.remove_listener(_on_change)
+                        return
+                except Exception:
+                    self.remove_listener(_on_change)
+                    return
+                callback(snap)
+
+            try:
+                widget.after(0, _on_tk)
+            except Exception:
+                self.remove_listener(_on_change)  # Widget (or Tk) already gone
+
+        self.add_listener(_on_change)
+        return _on_change
+
+    # ----- cross-process activation -----
+    def attach_bus(self, bus: Optional[StateBusClient] = None) -> bool:
+        """Re-read license.enc whenever another process announces an activation."""
+        bus = bus if bus is not None else get_state_bus()
+        if bus is None:
+            return False
+        with self._lock:
+            if self._bus is bus:
+                return True
+            self._bus = bus
+        bus.subscribe(self._on_bus_delta)
+        return True
+
+    def _on_bus_delta(self, delta: StateDelta) -> None:
+        # Runs on the bus reader thread; reload is a local decrypt, listeners marshal to Tk themselves
+        if delta.field != BUS_FIELD or delta.key != BUS_ACTIVATED_KEY:
+            return
+        log.info("license_activation_received", extra={"from_pid": delta.value})
+        self.reload()
+
+    def announce_activation(self) -> None:
+        """Tell the other processes license.enc was just saved (no-op without a bus)."""
+        publish_state_delta(BUS_FIELD, BUS_ACTIVATED_KEY, os.getpid())
+
+    # ----- background thread -----
+    def start(self) -> "LicenseStatusService":
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="license-status", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.refresh_interval_s)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.refresh(wait=False)
+
+
+# ─────────────────────────── Process-level helpers ───────────────────────────
+_service: Optional[LicenseStatusService] = None
+_init_lock = threading.Lock()
+
+
+def get_license_service() -> LicenseStatusService:
+    """The process's license status service (background revalidation starts on first use)."""
+    global _service
+    with _init_lock:
+        if _service is None:
+            _service = LicenseStatusService().start()
+            _service.attach_bus()
+        return _service
@@ -0,0 +1,248 @@
+"""
+Machine hash for node-locking, with the slow hardware probes cached per boot.
+
+What this is:
+- ``compute_machine_hash()``: the node-lock hash (computer name, architecture,
+  MAC, CPU and first disk), unchanged from ``LicenseManager``.
+- ``get_machine_hash()``: returns it from a per-process memo, else combines the
+  live identity (computer name, architecture, MAC) with the CPU/disk strings
+  from a small per-boot file, else probes those and stores them.
+
+Why it exists:
+- ``platform.processor()`` and ``psutil.disk_partitions()`` can take hundreds of
+  milliseconds on Windows and spawn subprocesses, and ``LicenseManager`` is
+  constructed several times in every process. Hardware only changes across
+  reboots, so probing them once per boot is enough.
+
+Cache file:
+- JSON ``{"boot", "host", "slow"}`` with an HMAC-SHA256 tag, wrapped with
+  DPAPI (current user) on Windows
+- The tag key ships with the app, so the tag only catches corruption and casual
+  edits; it is not proof of origin. That is why the file never holds the hash
+  itself: the parts that tie a license to a machine (computer name, MAC) are
+  read live on every lookup, and a forged file can only supply CPU/disk strings
+- Valid only for the same hostname and boot time (±``_BOOT_TOLERANCE_S``);
+  anything else (other boot, bad tag, unreadable file) means probe again
+
+Cold vs warm timings:
+    python -m src.licensing.machine_hash
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import platform
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..config import AppConfig
+from src.core.logger import get_logger
+from src.core.path_finder import get_path_finder
+
+log = get_logger(__name__)
+
+_BOOT_TOLERANCE_S = 5.0  # Boot time is derived from uptime and may drift by a second or two
+_TAG_KEY = hashlib.sha256(b"Stream_Futebol_Dashboard:machine_hash").digest()  # Integrity only, not a secret
+_TAG_SIZE = 32
+
+
+def live_identity() -> List[str]:
+    """Computer name, architecture and MAC; cheap, so never cached."""
+    return [
+        platform.node(),  # Computer name
+        platform.machine(),  # Architecture
+        str(uuid.getnode()),  # MAC address
+    ]
+
+
+def probe_hardware() -> List[str]:
+    """CPU and first disk device (slow; cached per boot by get_machine_hash)."""
+    parts: List[str] = []
+    try:
+        cpu_info = platform.processor()
+        if cpu_info:
+            parts.append(cpu_info)
+    except Exception:
+        pass
+
+    try:
+        # Get disk info if available (import psutil lazily)
+        import psutil
+        disk_info = psutil.disk_partitions()
+        if disk_info:
+            parts.append(disk_info[0].device)
+    except Exception:
+        pass
+    return parts
+
+
+def _combine(parts: List[str]) -> str:
+    combined = "|".join(filter(None, parts)).encode()
+    return hashlib.sha256(combined).hexdigest()[:16]
+
+
+def _fallback_hash() -> str:
+    fallback = f"{platform.node()}-{platform.machine()}"
+    return hashlib.sha256(fallback.encode()).hexdigest()[:16]
+
+
+def compute_machine_hash(hardware: Optional[List[str]] = None) -> str:
+    """Compute a stable machine hash for node-locking.
+
+    ``hardware`` is the output of ``probe_hardware()``; probed when omitted.
+    """
+    try:
+        if hardware is None:
+            hardware = probe_hardware()
+        return _combine(live_identity() + list(hardware))
+    except Exception as e:
+        log.warning("license_machine_hash_compute_failed", extra={"error": str(e)})
+        # Fallback to basic system info
+        return _fallback_hash()
+
+
+def current_boot_key() -> Tuple[float, str]:
+    """(boot time as epoch seconds, hostname); both cheap to read."""
+    try:
+        import psutil
+        boot = float(psutil.boot_time())
+    except Exception:
+        boot = time.time() - time.monotonic()
+    return boot, platform.node()
+
+
+def default_cache_path() -> Path:
+    pf = get_path_finder()
+    return pf.user_local_appdir(AppConfig.LOCAL_APP_DIRNAME, "license") / AppConfig.MACHINE_HASH_CACHE_FILENAME
+
+
+def _protect(data: bytes) -> bytes:
+    if os.name != "nt":
+        return data  # No DPAPI: the HMAC tag still catches corruption
+    from src.core.dpapi import dpapi_protect
+    return dpapi_protect(data)
+
+
+def _unprotect(data: bytes) -> bytes:
+    if os.name != "nt":
+        return data
+    from src.core.dpapi import dpapi_unprotect
+    return dpapi_unprotect(data)
+
+
+class MachineHashCache:
+    """Per-boot file holding the slow hardware probe results (not the hash)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else default_cache_path()
+
+    def load(self, boot: float, host: str) -> Optional[List[str]]:
+        """Cached hardware parts if the file is intact and was written during this boot on this host."""
+        try:
+            raw = _unprotect(self.path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception:
+            log.debug("machine_hash_cache_unreadable", exc_info=True)
+            return None
+        tag, body = raw[:_TAG_SIZE], raw[_TAG_SIZE:]
+        if not hmac.compare_digest(tag, hmac.new(_TAG_KEY, body, hashlib.sha256).digest()):
+            log.warning("machine_hash_cache_corrupt", extra={"path": str(self.path)})
+            return None
+        try:
+            data = json.loads(body.decode("utf-8"))
+            cached_boot, cached_host = float(data["boot"]), str(data["host"])
+            slow = [str(part) for part in data["slow"]]
+        except (ValueError, KeyError, TypeError):
+            return None
+        if cached_host != host or abs(cached_boot - boot) > _BOOT_TOLERANCE_S:
+            return None
+        return slow
+
+    def store(self, boot: float, host: str, slow: List[str]) -> None:
+        body = json.dumps({"boot": boot, "host": host, "slow": list(slow)}).encode("utf-8")
+        payload = _protect(hmac.new(_TAG_KEY, body, hashlib.sha256).digest() + body)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, self.path)
+
+
+# ─────────────────────────── Process-level helpers ───────────────────────────
+_memo: Optional[str] = None
+_memo_lock = threading.Lock()
+last_lookup: Dict[str, object] = {}  # {"source": "memo"|"file"|"computed", "ms": float}
+
+
+def get_machine_hash(cache: Optional[MachineHashCache] = None, *, use_memo: bool = True) -> str:
+    """Machine hash from the process memo, or live identity plus cached (or fresh) hardware probes."""
+    global _memo
+    started = time.perf_counter()
+    with _memo_lock:
+        if use_memo and _memo is not None:
+            last_lookup.update(source="memo", ms=(time.perf_counter() - started) * 1000)
+            return _memo
+        cache = cache if cache is not None else MachineHashCache()
+        boot, host = current_boot_key()
+        hardware = cache.load(boot, host)
+        source = "file"
+        if hardware is None:
+            hardware = probe_hardware()
+            source = "computed"
+            try:
+                cache.store(boot, host, hardware)
+            except Exception:
+                log.warning("machine_hash_cache_store_failed", exc_info=True)
+        # Computer name, architecture and MAC are always read live
+        value = compute_machine_hash(hardware)
+        if use_memo:
+            _memo = value
+        ms = (time.perf_counter() - started) * 1000
+        last_lookup.update(source=source, ms=ms)
+    log.info("machine_hash_loaded", extra={"source": source, "ms": round(ms, 2)})
+    return value
+
+
+def run_benchmark(rounds: int = 5) -> Dict[str, float]:
+    """Cold (full computation) vs warm (per-boot hardware file) vs memo lookups, in ms."""
+    cold: List[float] = []
+    warm: List[float] = []
+    memo: List[float] = []
+    cache = MachineHashCache()
+    for _ in range(rounds):
+        t = time.perf_counter()
+        compute_machine_hash()
+        cold.append((time.perf_counter() - t) * 1000)
+    get_machine_hash(cache, use_memo=False)  # Make sure the file exists
+    for _ in range(rounds):
+        t = time.perf_counter()
+        get_machine_hash(cache, use_memo=False)
+        warm.append((time.perf_counter() - t) * 1000)
+    get_machine_hash(cache)
+    for _ in range(rounds):
+        t = time.perf_counter()
+        get_machine_hash(cache)
+        memo.append((time.perf_counter() - t) * 1000)
+    return {
+        "rounds": rounds,
+        "cold_ms": round(min(cold), 3),
+        "warm_file_ms": round(min(warm), 3),
+        "memo_ms": round(min(memo), 4),
+    }
+
+
+def main() -> None:
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Machine hash cold/warm lookup timings")
+    ap.add_argument("--rounds", type=int, default=5)
+    args = ap.parse_args()
+    print(json.dumps(run_benchmark(args.rounds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,15 @@ for displaying user messages and system alerts.
 """
 
 from .notification_server import server_main
-from .toast import init_notification_queue, show_message_notification, prompt_notification
+from .toast import (
+    init_notification_queue, show_message_notification, prompt_notification,
+    notification_sender_stats,
+)
 
 __all__ = [
     'server_main',
     'init_notification_queue',
     'show_message_notification',
     'prompt_notification',
+    'notification_sender_stats',
 ]
@@ -0,0 +1,190 @@
+# helpers/notification/animation.py
+"""
+One fixed-rate animation clock for every toast in the notification process.
+
+Each toast used to run its own `after()` chains for fade-in, fade-out and the
+progress bar, so ten visible toasts meant ten independent timers. Here a single
+`AnimationTicker` advances all running animations in one callback, stops
+rescheduling itself when nothing is animating, and keeps frame-time statistics.
+
+Animations are plain callables `fn(now) -> bool` (True = keep running) keyed
+by (owner, channel); `Tween` covers the common "ease from 0 to 1 over N ms"
+case and can be told to skip straight to its end state (off-screen or clamped
+toasts). Tk-free: the ticker only needs an `after(ms, fn)` scheduler.
+"""
+from __future__ import annotations
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from src.core.logger import get_logger
+
+log = get_logger(__name__)
+
+Step = Callable[[float], bool]
+Scheduler = Callable[[int, Callable[[], None]], Any]
+
+
+# ---------------------------- Easing ----------------------------
+def linear(t: float) -> float:
+    return t
+
+def ease_out_cubic(t: float) -> float:
+    """Fast start, gentle end (fade-in opacity/movement)."""
+    return 1.0 - (1.0 - t) ** 3
+
+def ease_in_cubic(t: float) -> float:
+    """Gentle start, fast end (fade-out opacity)."""
+    return t ** 3
+
+
+class Tween:
+    """Drive `on_frame(eased_t)` from 0 to 1 over `duration_ms`, then `on_done()`."""
+
+    def __init__(
+        self,
+        duration_ms: int,
+        on_frame: Callable[[float], None],
+        on_done: Optional[Callable[[], None]] = None,
+        *,
+        easing: Callable[[float], float] = ease_out_cubic,
+        skip: Optional[Callable[[], bool]] = None,
+    ):
+        self.duration_s = max(0.0, duration_ms / 1000.0)
+        self.on_frame = on_frame
+        self.on_done = on_done
+        self.easing = easing
+        self.skip = skip
+        self._start: Optional[float] = None
+        self.skipped = False
+
+    def __call__(self, now: float) -> bool:
+        if self._start is None:
+            self._start = now
+        if self.skip is not None and self.skip():
+            # Nobody can see the in-between frames: jump to the end state
+            self.skipped = True
+            t = 1.0
+        elif self.duration_s <= 0:
+            t = 1.0
+        else:
+            t = min(1.0, (now - self._start) / self.duration_s)
+        self.on_frame(self.easing(t))
+        if t < 1.0:
+            return True
+        if self.on_done is not None:
+            self.on_done()
+        return False
+
+
+class AnimationTicker:
+    """Advance every running animation from a single fixed-rate callback."""
+
+    FRAME_SAMPLES = 512
+
+    def __init__(self, schedule: Scheduler, interval_ms: int = 16, *, clock: Callable[[], float] = time.perf_counter):
+        self._schedule = schedule
+        self.interval_ms = max(1, int(interval_ms))
+        self._clock = clock
+        self._anims: Dict[Tuple[int, str], Step] = {}
+        self._running = False
+        self._last_tick: Optional[float] = None
+        # Frame statistics
+        self._frame_ms: Deque[float] = deque(maxlen=self.FRAME_SAMPLES)
+        self._gap_ms: Deque[float] = deque(maxlen=self.FRAME_SAMPLES)
+        self.frames = 0
+        self.steps = 0
+        self.skipped = 0
+        self.peak_active = 0
+
+    def __len__(self) -> int:
+        return len(self._anims)
+
+    # ----- registration -----
+    def start(self, owner: Any, channel: str, step: Step) -> None:
+        """Run `step` now and then on every frame until it returns False.
+
+        Replaces any animation already running on the same (owner, channel).
+        Animations that finish on their first frame never join the ticker.
+        """
+        key = (id(owner), channel)
+        self._anims.pop(key, None)
+        if not self._run_step(step, self._clock()):
+            return
+        self._anims[key] = step
+        self.peak_active = max(self.peak_active, len(self._anims))
+        self._ensure_running()
+
+    def cancel(self, owner: Any, channel: Optional[str] = None) -> None:
+        oid = id(owner)
+        if channel is not None:
+            self._anims.pop((oid, channel), None)
+            return
+        for key in [k for k in self._anims if k[0] == oid]:
+            del self._anims[key]
+
+    def is_running(self, owner: Any, channel: str) -> bool:
+        return (id(owner), channel) in self._anims
+
+    # ----- clock -----
+    def _ensure_running(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._last_tick = None
+        self._schedule(self.interval_ms, self._tick)
+
+    def _run_step(self, step: Step, now: float) -> bool:
+        self.steps += 1
+        try:
+            keep = bool(step(now))
+        except Exception:
+            log.warning("toast_animation_failed", exc_info=True)
+            return False
+        if not keep and getattr(step, "skipped", False):
+            self.skipped += 1
+        return keep
+
+    def _tick(self) -> None:
+        t0 = self._clock()
+        if self._last_tick is not None:
+            self._gap_ms.append((t0 - self._last_tick) * 1000.0)
+        self._last_tick = t0
+        for key, step in list(self._anims.items()):
+            # A callback earlier in this frame may have cancelled/replaced it
+            if self._anims.get(key) is not step:
+                continue
+            if not self._run_step(step, t0):
+                if self._anims.get(key) is step:
+                    del self._anims[key]
+        self.frames += 1
+        elapsed_ms = (self._clock() - t0) * 1000.0
+        self._frame_ms.append(elapsed_ms)
+        if not self._anims:
+            self._running = False
+            log.debug("toast_animation_stats", extra=self.stats())
+            return
+        # Fixed rate: the work done this frame comes out of the next delay
+        self._schedule(max(1, int(self.interval_ms - elapsed_ms)), self._tick)
+
+    # ----- metrics -----
+    def stats(self) -> Dict[str, float]:
+        """Per-frame callback cost and frame-to-frame spacing (ms)."""
+        frame = sorted(self._frame_ms)
+        gaps = sorted(self._gap_ms)
+
+        def pct(samples, q: float) -> float:
+            return round(samples[min(len(samples) - 1, int(len(samples) * q))], 3) if samples else 0.0
+
+        return {
+            "frames": self.frames,
+            "steps": self.steps,
+            "skipped": self.skipped,
+            "active": len(self._anims),
+            "peak_active": self.peak_active,
+            "frame_avg_ms": round(sum(frame) / len(frame), 3) if frame else 0.0,
+            "frame_p95_ms": pct(frame, 0.95),
+            "frame_max_ms": round(frame[-1], 3) if frame else 0.0,
+            "interval_avg_ms": round(sum(gaps) / len(gaps), 3) if gaps else 0.0,
+            "interval_p95_ms": pct(gaps, 0.95),
+        }
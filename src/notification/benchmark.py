@@ -0,0 +1,90 @@
+# helpers/notification/benchmark.py
+"""
+Notification throughput benchmark (no display required).
+
+Starts a headless sink process and M producer processes that each send their
+share of N toasts through the regular client path (`init_notification_queue`
++ `notify`). Prints end-to-end latency percentiles (producer call -> sink
+decision) and writes the sink's full JSON report.
+
+    python -m src.notification.benchmark --toasts 5000 --producers 4 --out toast_bench.json
+"""
+from __future__ import annotations
+import argparse
+import json
+import time
+from multiprocessing import Process, Queue
+from typing import Any, Dict, Optional
+
+
+def _producer(q: Any, index: int, count: int, duration_ms: int, groups: int, buffer_size: int) -> None:
+    from . import toast
+
+    # buffer_size 0: room for the whole burst, so the run measures the pipeline, not drops
+    toast.init_notification_queue(q, buffer_size=buffer_size or count)
+    for i in range(count):
+        group = f"bench{index}:{i % groups}" if groups else None
+        toast.notify(f"Producer {index}", f"Toast {i}", duration=duration_ms, group=group)
+    # Let the feeder thread hand everything over before the process exits
+    if toast._sender is not None:
+        toast._sender.close(timeout=30.0)
+        stats = toast._sender.stats()
+        if stats["dropped"] or stats["merged"]:
+            print(f"producer {index}: {stats}")
+
+
+def run_benchmark(
+    toasts: int = 1000,
+    producers: int = 4,
+    duration_ms: int = 200,
+    groups: int = 0,
+    out: Optional[str] = "toast_benchmark.json",
+    buffer_size: int = 0,
+) -> Dict[str, Any]:
+    from .headless import headless_server_main
+
+    report_path = out or "toast_benchmark.json"
+    q: Any = Queue()
+    sink = Process(target=headless_server_main, args=(q, report_path), daemon=True)
+    sink.start()
+
+    per = [toasts // producers + (1 if i < toasts % producers else 0) for i in range(producers)]
+    t0 = time.perf_counter()
+    procs = [
+        Process(target=_producer, args=(q, i, n, duration_ms, groups, buffer_size))
+        for i, n in enumerate(per)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    q.put(None)
+    sink.join()
+    elapsed = time.perf_counter() - t0
+
+    with open(report_path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    summary = report["summary"]
+    summary["wall_s"] = round(elapsed, 3)
+    summary["throughput_per_s"] = round(summary["payloads"] / elapsed, 1) if elapsed else 0.0
+    return summary
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Headless toast pipeline benchmark")
+    ap.add_argument("--toasts", type=int, default=1000, help="total toasts (N)")
+    ap.add_argument("--producers", type=int, default=4, help="producer processes (M)")
+    ap.add_argument("--duration-ms", type=int, default=200, help="toast lifetime")
+    ap.add_argument("--groups", type=int, default=0, help="distinct groups per producer (0 = ungrouped)")
+    ap.add_argument("--out", default="toast_benchmark.json", help="JSON report path")
+    ap.add_argument("--buffer", type=int, default=0,
+                    help="per-producer send buffer (0 = whole burst, no drops)")
+    args = ap.parse_args()
+    summary = run_benchmark(
+        args.toasts, args.producers, args.duration_ms, args.groups, args.out, args.buffer
+    )
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
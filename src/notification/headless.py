@@ -0,0 +1,338 @@
+# helpers/notification/headless.py
+"""
+Headless notification sink: the real toast policy without a display.
+
+What this is:
+- `HeadlessToastSink` is a `ToastServer` whose windows, Tk root and monitors
+  are in-memory stand-ins. Grouping, rate limits, stacking and the per-monitor
+  backlog run unchanged; only pixels are skipped.
+- `run_headless()` consumes the same queue protocol as `server_main`
+  (ToastPayload or legacy tuples, `None` to stop) and writes a JSON report.
+
+Why it exists:
+- Build agents have no display, so notification throughput and placement could
+  not be measured or regression-tested there (see benchmark.py).
+
+Report contents: one event per payload (decision, placement, receive time,
+end-to-end latency from `ToastPayload.created_at`) plus a summary with latency
+percentiles and server counters.
+"""
+from __future__ import annotations
+import heapq
+import itertools
+import json
+import math
+import os
+import time
+from queue import Empty
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .monitors import Monitor, MonitorTopology
+from .notification_server import ToastServer, _coerce_payload
+from .toast import TOAST_FADE_OUT_MS, ToastPayload
+from .toast_layout import TARGET_MAX_VISIBLE, WorkArea
+from src.core.logger import get_logger
+
+log = get_logger(__name__)
+
+HEADLESS_SCREEN: WorkArea = (0, 0, 1920, 1080)
+# Rough stand-in for Tk text metrics: fixed chrome + one line per N characters
+HEADLESS_BASE_HEIGHT = 52
+HEADLESS_LINE_HEIGHT = 16
+HEADLESS_CHARS_PER_LINE = 38
+
+
+def estimate_toast_height(title: str, message: str) -> int:
+    lines = sum(
+        max(1, math.ceil(len(part) / HEADLESS_CHARS_PER_LINE))
+        for part in ((title or "").strip(), (message or "").strip()) if part
+    )
+    return HEADLESS_BASE_HEIGHT + HEADLESS_LINE_HEIGHT * lines
+
+
+class HeadlessRoot:
+    """Just enough of a Tk root: a timer heap pumped by `run_due()`."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._seq = itertools.count()
+        self._cancelled: set = set()
+
+    def after(self, ms: int, fn: Callable[[], None]) -> int:
+        job = next(self._seq)
+        heapq.heappush(self._timers, (self._clock() + ms / 1000.0, job, fn))
+        return job
+
+    def after_cancel(self, job: int) -> None:
+        self._cancelled.add(job)
+
+    def next_due_in(self) -> Optional[float]:
+        if not self._timers:
+            return None
+        return max(0.0, self._timers[0][0] - self._clock())
+
+    def run_due(self) -> int:
+        ran = 0
+        now = self._clock()
+        while self._timers and self._timers[0][0] <= now:
+            _, job, fn = heapq.heappop(self._timers)
+            if job in self._cancelled:
+                self._cancelled.discard(job)
+                continue
+            fn()
+            ran += 1
+        return ran
+
+    def winfo_exists(self) -> bool:
+        return True
+
+    def winfo_screenwidth(self) -> int:
+        return HEADLESS_SCREEN[2]
+
+    def winfo_screenheight(self) -> int:
+        return HEADLESS_SCREEN[3]
+
+    def winfo_pointerxy(self) -> Tuple[int, int]:
+        return (0, 0)
+
+
+class HeadlessToast:
+    """Window-less PooledToast: same lifecycle and callbacks, timed by HeadlessRoot."""
+
+    def __init__(self, root: HeadlessRoot):
+        self.root = root
+        self.on_dismissed: Optional[Callable[["HeadlessToast"], None]] = None
+        self.offscreen = False
+        self.clamped = False
+        self.geometry: Tuple[int, int, int, int] = (0, 0, 0, 0)
+        self._active = False
+        self._closing = False
+        self._job: Optional[int] = None
+        self.duration = 5000
+        self.count = 1
+        self.title = ""
+        self.message = ""
+
+    def configure_toast(self, title, message, icon, bg_color, duration, **_kw) -> None:
+        self._cancel()
+        self._active = self._closing = False
+        self.title, self.message = title, message
+        self.duration = duration
+        self.count = 1
+        self.clamped = False
+
+    def coalesce(self, title, message, icon, bg_color, extend_ms) -> bool:
+        old_h = self.measure_height()
+        self.title, self.message = title, message
+        self.count += 1
+        if self._active and not self._closing:
+            self._schedule_dismiss(self.duration + extend_ms)
+        return self.measure_height() != old_h
+
+    def measure_height(self) -> int:
+        return estimate_toast_height(self.title, self.message)
+
+    def place(self, width: int, height: int, x: int, y: int) -> None:
+        self.geometry = (x, y, width, height)
+
+    def exists(self) -> bool:
+        return True
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @property
+    def closing(self) -> bool:
+        return self._closing
+
+    def fade_in(self) -> None:
+        self._active = True
+        self._schedule_dismiss(self.duration)
+
+    def fade_out(self) -> None:
+        if not self._active or self._closing:
+            return
+        self._closing = True
+        self._cancel()
+        self._job = self.root.after(TOAST_FADE_OUT_MS, self._finish)
+
+    def destroy(self) -> None:
+        self._cancel()
+
+    def _schedule_dismiss(self, duration_ms: int) -> None:
+        self._cancel()
+        self._job = self.root.after(max(0, duration_ms - TOAST_FADE_OUT_MS), self.fade_out)
+
+    def _cancel(self) -> None:
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def _finish(self) -> None:
+        self._job = None
+        self._active = self._closing = False
+        cb, self.on_dismissed = self.on_dismissed, None
+        if cb is not None:
+            cb(self)
+
+
+class HeadlessToastPool:
+    """ToastWindowPool counterpart handing out HeadlessToast objects."""
+
+    def __init__(self, root: HeadlessRoot, max_idle: int = TARGET_MAX_VISIBLE + 2):
+        self.root = root
+        self.max_idle = max_idle
+        self._idle: List[HeadlessToast] = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self) -> HeadlessToast:
+        if self._idle:
+            self.reused += 1
+            return self._idle.pop()
+        self.created += 1
+        return HeadlessToast(self.root)
+
+    def release(self, toast: HeadlessToast) -> None:
+        toast.on_dismissed = None
+        if len(self._idle) < self.max_idle:
+            self._idle.append(toast)
+
+    def prewarm(self, count: int) -> None:
+        while len(self._idle) < min(count, self.max_idle):
+            self.created += 1
+            self._idle.append(HeadlessToast(self.root))
+
+    def stats(self) -> Dict[str, int]:
+        return {"windows_built": self.created, "windows_reused": self.reused, "idle": len(self._idle)}
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    s = sorted(samples)
+    n = len(s)
+
+    def at(q: float) -> float:
+        return round(s[min(n - 1, int(n * q))], 3)
+
+    return {
+        "count": n, "avg_ms": round(sum(s) / n, 3),
+        "p50_ms": at(0.50), "p95_ms": at(0.95), "p99_ms": at(0.99), "max_ms": round(s[-1], 3),
+    }
+
+
+class HeadlessToastSink(ToastServer):
+    """ToastServer on stand-ins that records every decision for the JSON report."""
+
+    def __init__(self, monitors: Optional[List[Monitor]] = None, root: Optional[HeadlessRoot] = None):
+        root = root or HeadlessRoot()
+        screens = monitors or [Monitor(HEADLESS_SCREEN, HEADLESS_SCREEN)]
+        super().__init__(
+            root, None,
+            pool=HeadlessToastPool(root),
+            monitors=MonitorTopology(root, enumerate_fn=lambda: list(screens)),
+        )
+        self.events: List[Dict[str, Any]] = []
+        self.latencies_ms: List[float] = []
+        self._started = time.perf_counter()
+        self._current: Optional[Dict[str, Any]] = None
+
+    def _known_height(self, payload: ToastPayload) -> Optional[int]:
+        return estimate_toast_height(payload.title, payload.message)
+
+    def handle_payload(self, payload: ToastPayload) -> None:
+        now = time.time()
+        event: Dict[str, Any] = {
+            "seq": len(self.events),
+            "title": payload.title,
+            "group": payload.group,
+            "recv_s": round(time.perf_counter() - self._started, 6),
+            "decision": "queued",
+        }
+        if payload.created_at is not None:
+            latency = max(0.0, (now - payload.created_at) * 1000.0)
+            event["latency_ms"] = round(latency, 3)
+            self.latencies_ms.append(latency)
+        coalesced, limited = self.coalesced, self.rate_limited
+        self._current = event
+        try:
+            super().handle_payload(payload)
+        finally:
+            self._current = None
+        if self.coalesced != coalesced:
+            event["decision"] = "coalesced"
+        elif self.rate_limited != limited:
+            event["decision"] = "rate_limited"
+        self.events.append(event)
+
+    def _build_and_maybe_show(self, payload: ToastPayload, workarea: WorkArea) -> bool:
+        shown = super()._build_and_maybe_show(payload, workarea)
+        if not shown:
+            return False
+        win = self.layouts[workarea].slots[-1].win
+        placement = {"workarea": list(workarea), "geometry": list(win.geometry)}
+        if self._current is not None:
+            self._current.update(decision="shown", **placement)
+        else:
+            # Flushed from the backlog after a dismissal
+            self.events.append({
+                "seq": len(self.events), "title": payload.title, "group": payload.group,
+                "recv_s": round(time.perf_counter() - self._started, 6),
+                "decision": "shown_from_backlog", **placement,
+            })
+        return True
+
+    def report(self) -> Dict[str, Any]:
+        decisions: Dict[str, int] = {}
+        for e in self.events:
+            decisions[e["decision"]] = decisions.get(e["decision"], 0) + 1
+        return {
+            "summary": {
+                "payloads": sum(1 for e in self.events if e["decision"] != "shown_from_backlog"),
+                "elapsed_s": round(time.perf_counter() - self._started, 3),
+                "decisions": decisions,
+                "pending": len(self.pending),
+                "latency": _percentiles(self.latencies_ms),
+                "pool": self.pool.stats(),
+            },
+            "events": self.events,
+        }
+
+    def write_report(self, path: str) -> None:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+
+
+def run_headless(q: Any, sink: HeadlessToastSink, report_path: Optional[str] = None) -> Dict[str, Any]:
+    """Consume `q` until the `None` sentinel, pumping the sink's timers in between."""
+    root = sink.root
+    while True:
+        wait = root.next_due_in()
+        try:
+            raw = q.get(timeout=wait) if wait is not None else q.get()
+        except Empty:
+            root.run_due()
+            continue
+        except (EOFError, OSError):
+            break
+        if raw is None:
+            break
+        try:
+            sink.handle_payload(_coerce_payload(raw))
+        except Exception:
+            log.warning("toast_handle_failed", exc_info=True)
+        root.run_due()
+    sink.close()
+    if report_path:
+        sink.write_report(report_path)
+    return sink.report()
+
+
+def headless_server_main(notification_queue: Any, report_path: Optional[str] = None) -> None:
+    """Process entry point: drop-in for server_main on machines without a display."""
+    run_headless(notification_queue, HeadlessToastSink(), report_path)
@@ -0,0 +1,177 @@
+# helpers/notification/monitors.py
+"""
+Cached monitor topology for toast placement.
+
+The notification server used to ask Win32 for the monitor under the cursor on
+every toast, and on non-Windows hosts fell back to building a throwaway
+``CTk()`` root just to read the screen size. This module enumerates monitors
+once, refreshes on a slow timer (or when a point lands outside every known
+monitor, e.g. after hot-plugging), and answers point -> work area lookups from
+memory. The fallback reads the screen size from the server's existing root and
+never creates a Tk root of its own.
+"""
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from src.core.logger import get_logger
+
+log = get_logger(__name__)
+
+Rect = Tuple[int, int, int, int]  # left, top, right, bottom
+
+# Used only when neither Win32 nor a Tk root can tell us anything
+DEFAULT_WORK_AREA: Rect = (0, 0, 1920, 1080)
+
+
+@dataclass(frozen=True)
+class Monitor:
+    bounds: Rect     # full monitor rectangle
+    work_area: Rect  # minus taskbar/docked bars
+
+    def contains(self, x: int, y: int) -> bool:
+        left, top, right, bottom = self.bounds
+        return left <= x < right and top <= y < bottom
+
+    def distance_sq(self, x: int, y: int) -> int:
+        left, top, right, bottom = self.bounds
+        dx = (left - x) if x < left else (x - (right - 1)) if x >= right else 0
+        dy = (top - y) if y < top else (y - (bottom - 1)) if y >= bottom else 0
+        return dx * dx + dy * dy
+
+
+def enumerate_win32_monitors() -> List[Monitor]:
+    """All monitors via EnumDisplayMonitors/GetMonitorInfoW (raises off Windows)."""
+    import ctypes
+    from ctypes import wintypes
+
+    class RECT(ctypes.Structure):
+        _fields_ = [("left", ctypes.c_long), ("top", ctypes.c_long),
+                    ("right", ctypes.c_long), ("bottom", ctypes.c_long)]
+
+    class MONITORINFO(ctypes.Structure):
+        _fields_ = [("cbSize", ctypes.c_ulong),
+                    ("rcMonitor", RECT),
+                    ("rcWork", RECT),
+                    ("dwFlags", ctypes.c_ulong)]
+
+    user32 = ctypes.windll.user32
+    MonitorEnumProc = ctypes.WINFUNCTYPE(
+        ctypes.c_int, wintypes.HMONITOR, wintypes.HDC, ctypes.POINTER(RECT), wintypes.LPARAM
+    )
+    found: List[Monitor] = []
+
+    def _on_monitor(hmon, _hdc, _rect, _data):
+        mi = MONITORINFO()
+        mi.cbSize = ctypes.sizeof(MONITORINFO)
+        if user32.GetMonitorInfoW(hmon, ctypes.byref(mi)):
+            m, w = mi.rcMonitor, mi.rcWork
+            found.append(Monitor((m.left, m.top, m.right, m.bottom), (w.left, w.top, w.right, w.bottom)))
+        return 1  # continue enumeration
+
+    if not user32.EnumDisplayMonitors(None, None, MonitorEnumProc(_on_monitor), 0):
+        raise OSError("EnumDisplayMonitors failed")
+    return found
+
+
+def get_cursor_pos(root: Optional[Any] = None) -> Tuple[int, int]:
+    try:
+        import ctypes
+        from ctypes import wintypes
+        pt = wintypes.POINT()
+        if ctypes.windll.user32.GetCursorPos(ctypes.byref(pt)):
+            return (pt.x, pt.y)
+    except Exception:
+        pass
+    try:
+        if root is not None:
+            x, y = root.winfo_pointerxy()
+            return (int(x), int(y))
+    except Exception:
+        pass
+    return (0, 0)
+
+
+class MonitorTopology:
+    """Monitor list cached in memory; refreshed on a slow timer or on a miss."""
+
+    def __init__(
+        self,
+        root: Optional[Any] = None,
+        *,
+        enumerate_fn: Optional[Callable[[], List[Monitor]]] = None,
+        miss_refresh_s: float = 1.0,
+    ):
+        self.root = root
+        self._enumerate = enumerate_fn or enumerate_win32_monitors
+        self._miss_refresh_s = miss_refresh_s
+        self.monitors: List[Monitor] = []
+        self._loaded_at = 0.0
+        self.refreshes = 0
+
+    def refresh(self) -> None:
+        try:
+            monitors = self._enumerate()
+        except Exception:
+            monitors = []
+        if not monitors:
+            monitors = [self._fallback_monitor()]
+        if monitors != self.monitors:
+            log.info("monitor_topology_changed", extra={"count": len(monitors)})
+        self.monitors = monitors
+        self._loaded_at = time.monotonic()
+        self.refreshes += 1
+
+    def _fallback_monitor(self) -> Monitor:
+        """Single screen from the existing root (never builds a new Tk root)."""
+        rect = DEFAULT_WORK_AREA
+        try:
+            if self.root is not None and self.root.winfo_exists():
+                rect = (0, 0, int(self.root.winfo_screenwidth()), int(self.root.winfo_screenheight()))
+        except Exception:
+            pass
+        return Monitor(rect, rect)
+
+    def work_area_at(self, x: int, y: int) -> Rect:
+        if not self.monitors:
+            self.refresh()
+        hit = self._lookup(x, y)
+        if hit is None and time.monotonic() - self._loaded_at >= self._miss_refresh_s:
+            # Point outside every known monitor: topology probably changed
+            self.refresh()
+            hit = self._lookup(x, y)
+        if hit is None:
+            # MONITOR_DEFAULTTONEAREST semantics
+            hit = min(self.monitors, key=lambda m: m.distance_sq(x, y))
+        return hit.work_area
+
+    def is_visible(self, x: int, y: int, width: int, height: int) -> bool:
+        """True if the rectangle overlaps any known monitor."""
+        if not self.monitors:
+            return True  # unknown topology: assume visible
+        for m in self.monitors:
+            left, top, right, bottom = m.bounds
+            if x < right and x + width > left and y < bottom and y + height > top:
+                return True
+        return False
+
+    def _lookup(self, x: int, y: int) -> Optional[Monitor]:
+        for m in self.monitors:
+            if m.contains(x, y):
+                return m
+        return None
+
+    def schedule_refresh(self, interval_ms: int) -> None:
+        """Keep the cache fresh with a slow Tk timer (display changes, DPI, taskbar)."""
+        if self.root is None or interval_ms <= 0:
+            return
+
+        def tick():
+            self.refresh()
+            try:
+                self.root.after(interval_ms, tick)
+            except Exception:
+                pass
+
+        self.root.after(interval_ms, tick)
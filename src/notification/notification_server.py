@@ -1,234 +1,332 @@
 # helpers/notification/notification_server.py
 from __future__ import annotations
+import threading
+import time
 from collections import deque, defaultdict
-from dataclasses import dataclass
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 from multiprocessing import Queue
-from .toast import TOAST_WIDTH, ToastPayload, _build_toast_window
-
-# -------- Windows multi-monitor helpers (with safe fallbacks) --------
-def _get_cursor_pos() -> Tuple[int, int]:
-    try:
-        import ctypes
-        from ctypes import wintypes
-        pt = wintypes.POINT()
-        ctypes.windll.user32.GetCursorPos(ctypes.byref(pt))
-        return (pt.x, pt.y)
-    except Exception:
-        return (0, 0)
+from .animation import AnimationTicker
+from .monitors import MonitorTopology, get_cursor_pos
+from .toast_layout import (
+    TARGET_MAX_VISIBLE, PendingBacklog, Placement, ToastStackLayout, WorkArea,
+)
+from .toast import (
+    TOAST_WIDTH, PooledToast, ToastPayload, ToastWindowPool,
+    cached_toast_height, toast_text_key,
+)
+from src.config.settings import AppConfig
+from src.core.logger import get_logger
+
+log = get_logger(__name__)
+
+# -------- Multi-monitor helpers (cached topology, safe fallbacks) --------
+def _get_cursor_pos(root: Optional[ctk.CTk] = None) -> Tuple[int, int]:
+    return get_cursor_pos(root)
 
 def _get_work_area_from_point(
     x: int,
     y: int,
-    ct_root: Optional[ctk.CTk] = None
+    ct_root: Optional[ctk.CTk] = None,
+    topology: Optional[MonitorTopology] = None,
 ) -> Tuple[int, int, int, int]:
-    try:
-        import ctypes
-        from ctypes import wintypes
-
-        class RECT(ctypes.Structure):
-            _fields_ = [("left", ctypes.c_long), ("top", ctypes.c_long),
-                        ("right", ctypes.c_long), ("bottom", ctypes.c_long)]
-
-        class MONITORINFO(ctypes.Structure):
-            _fields_ = [("cbSize", ctypes.c_ulong),
-                        ("rcMonitor", RECT),
-                        ("rcWork", RECT),
-                        ("dwFlags", ctypes.c_ulong)]
-
-        MonitorFromPoint = ctypes.windll.user32.MonitorFromPoint
-        GetMonitorInfoW = ctypes.windll.user32.GetMonitorInfoW
-        MonitorFromPoint.restype = wintypes.HMONITOR
-        MONITOR_DEFAULTTONEAREST = 2
-
-        hmon = MonitorFromPoint(wintypes.POINT(x, y), MONITOR_DEFAULTTONEAREST)
-        mi = MONITORINFO()
-        mi.cbSize = ctypes.sizeof(MONITORINFO)
-        GetMonitorInfoW(hmon, ctypes.byref(mi))
-        r = mi.rcWork
-        return (r.left, r.top, r.right, r.bottom)
-
-    except Exception:
-        root = ct_root if (ct_root and ct_root.winfo_exists()) else None
-        if root is None:
-            tmp = ctk.CTk()
-            try:
-                tmp.withdraw()
-                w, h = tmp.winfo_screenwidth(), tmp.winfo_screenheight()
-            finally:
-                try: tmp.destroy()
-                except: pass
-        else:
-            w, h = root.winfo_screenwidth(), root.winfo_screenheight()
-        return (0, 0, w, h)
+    """Work area of the monitor at (x, y); one-off lookups build a throwaway cache."""
+    topo = topology if topology is not None else MonitorTopology(ct_root)
+    return topo.work_area_at(x, y)
 
 
 # ------------------ Server state & layout policy ---------------------
 TOAST_SIZE = (TOAST_WIDTH, 100)  # height is ignored; real height is measured
-MARGIN = 16
-GAP = 6
-TARGET_MAX_VISIBLE = 10
 
-@dataclass
-class ActiveToast:
-    win: ctk.CTkToplevel
-    height: int = TOAST_SIZE[1]  # updated to real height after creation
+class GroupRateLimiter:
+    """Sliding-window cap on how many new toast windows a group may open."""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.limits = dict(limits if limits is not None else AppConfig.TOAST_GROUP_RATE_LIMITS)
+        self._hits: Dict[str, Deque[float]] = defaultdict(deque)
+
+    def _limit_for(self, group: str) -> Optional[Tuple[int, int]]:
+        """Exact group, then "*:<kind>" ("campo2:score" -> "*:score"), then "*"."""
+        limit = self.limits.get(group)
+        if limit is None and ":" in group:
+            limit = self.limits.get("*:" + group.split(":", 1)[1])
+        return limit or self.limits.get("*")
+
+    def allow(self, group: str, now: Optional[float] = None) -> bool:
+        limit = self._limit_for(group)
+        if not limit:
+            return True
+        max_count, window_ms = limit
+        now = time.monotonic() if now is None else now
+        hits = self._hits[group]
+        while hits and now - hits[0] >= window_ms / 1000.0:
+            hits.popleft()
+        if len(hits) >= max_count:
+            return False
+        hits.append(now)
+        return True
+
 
 class ToastServer:
-    def __init__(self, root: ctk.CTk, q: Queue):
+    """
+    Tk sink: stacks toasts per monitor. `pool` and `monitors` can be swapped
+    for window-less stand-ins (see headless.py) to run the same policy offscreen.
+    """
+
+    def __init__(
+        self,
+        root: ctk.CTk,
+        q: Queue,
+        *,
+        pool: Optional[Any] = None,
+        monitors: Optional[MonitorTopology] = None,
+    ):
         self.root = root
         self.q = q
-        self.stacks: Dict[Tuple[int, int, int, int], List[ActiveToast]] = defaultdict(list)
-        self.pending: Deque[Tuple[ToastPayload, Tuple[int, int, int, int]]] = deque()
+        # One incremental stack per monitor work area + per-work-area FIFO backlog
+        self.layouts: Dict[WorkArea, ToastStackLayout[PooledToast]] = {}
+        self.pending = PendingBacklog()
+        # One frame clock drives every toast's fade/progress animation
+        self.ticker = AnimationTicker(root.after, AppConfig.TOAST_ANIMATION_INTERVAL)
+        # Pre-built windows recycled across toasts (a little headroom over the visible cap)
+        self.pool = pool if pool is not None else ToastWindowPool(
+            max_idle=TARGET_MAX_VISIBLE + 2, ticker=self.ticker
+        )
+        # Visible toast per group (for in-place coalescing) + new-window rate limits
+        self.group_toasts: Dict[str, Tuple[PooledToast, WorkArea]] = {}
+        self.rate_limiter = GroupRateLimiter()
+        self.coalesced = 0
+        self.rate_limited = 0
+        # Monitors enumerated once; refreshed by a slow timer or on a lookup miss
+        self.monitors = monitors if monitors is not None else MonitorTopology(root)
 
     # ---------- capacity / geometry helpers ----------
-    def _per_toast_cap(self, workarea: Tuple[int,int,int,int]) -> int:
-        left, top, right, bottom = workarea
-        available = (bottom - top) - (2 * MARGIN)  # vertical pixels we can use
-        # ten toasts => 9 gaps between them
-        cap = (available - GAP * (TARGET_MAX_VISIBLE - 1)) // TARGET_MAX_VISIBLE
-        return max(28, int(cap))  # keep a sensible minimum
-
-    def _can_fit_more(self, workarea: Tuple[int,int,int,int], next_height: int) -> bool:
-        cap = self._per_toast_cap(workarea)
-        next_h = min(next_height, cap)
-        left, top, right, bottom = workarea
-        stack = self.stacks[workarea]
-        used = sum(min(t.height, cap) for t in stack) + (GAP * len(stack) if stack else 0)
-        y_top_next = bottom - MARGIN - next_h - used
-        return y_top_next >= (top + MARGIN)
-
-    def _place_toast(self, workarea: Tuple[int,int,int,int], toast: ctk.CTkToplevel, next_height: int):
-        cap = self._per_toast_cap(workarea)
-        next_h = min(next_height, cap)
-
-        left, top, right, bottom = workarea
-        width = TOAST_SIZE[0]
-        stack = self.stacks[workarea]
-        used = sum(min(t.height, cap) for t in stack) + (GAP * len(stack) if stack else 0)
-        y = bottom - MARGIN - next_h - used
-        x = right - MARGIN - width
-        toast.geometry(f"{width}x{next_h}+{x}+{y}")
-        setattr(toast, "_target_xy", (x, y))
-
-    def _reflow(self, workarea: Tuple[int,int,int,int]):
-        cap = self._per_toast_cap(workarea)
-        left, top, right, bottom = workarea
-        width = TOAST_SIZE[0]
-        x = right - MARGIN - width
-        y = bottom - MARGIN
-        new_stack: List[ActiveToast] = []
-        for t in list(self.stacks[workarea]):
-            if not t.win.winfo_exists():
-                continue
-            h = min(max(1, t.height), cap)
-            y -= h
-            t.win.geometry(f"{width}x{h}+{x}+{y}")
-            # 👇 keep the target position up to date
-            setattr(t.win, "_target_xy", (x, y))
-            new_stack.append(ActiveToast(t.win, h))
-            y -= GAP
-        self.stacks[workarea] = new_stack
-
-
-    def _attach_close_handlers(self, workarea, win: ctk.CTkToplevel):
-        def on_destroy(_evt=None):
-            stack = self.stacks[workarea]
-            self.stacks[workarea] = [t for t in stack if (t.win.winfo_exists() and t.win != win)]
-            self._reflow(workarea)
+    def _layout(self, workarea: WorkArea) -> ToastStackLayout[PooledToast]:
+        layout = self.layouts.get(workarea)
+        if layout is None:
+            layout = ToastStackLayout(workarea, TOAST_SIZE[0])
+            self.layouts[workarea] = layout
+        return layout
+
+    def _apply(self, placements: List[Placement]) -> None:
+        for win, x, y, w, h in placements:
+            if win.exists():
+                win.place(w, h, x, y)
+                win.offscreen = not self.monitors.is_visible(x, y, w, h)
+
+    def _attach_close_handlers(self, workarea: WorkArea, win: PooledToast):
+        def on_dismissed(_toast: PooledToast):
+            for group, (gwin, _wa) in list(self.group_toasts.items()):
+                if gwin is win:
+                    del self.group_toasts[group]
+            # Only the toasts above the removed one move
+            self._apply(self._layout(workarea).remove(win))
+            self.pool.release(win)
             self._try_flush_backlog(workarea)
-        win.bind("<Destroy>", on_destroy)
+        win.on_dismissed = on_dismissed
 
-
-    def _show_now(self, payload: ToastPayload, workarea):
-        # Create with target size first, place, then measure real height and reflow
-        win = self._build_and_maybe_show(payload, workarea)
-
-
-    def _try_flush_backlog(self, workarea):
+    def _try_flush_backlog(self, workarea: WorkArea):
         while True:
-            idx = next((i for i,(p,wa) in enumerate(self.pending) if wa == workarea), None)
-            if idx is None:
+            entry = self.pending.peek(workarea)
+            if entry is None:
                 break
-            payload, _ = self.pending[idx]
-            if not self._build_and_maybe_show(payload, workarea):
+            if not self._build_and_maybe_show(entry.payload, workarea):
                 break
-            del self.pending[idx]
+            self.pending.popleft(workarea)
 
     # -------------------- main dispatch --------------------
     def handle_payload(self, payload: ToastPayload):
-        ax, ay = payload.anchor if payload.anchor is not None else _get_cursor_pos()
-        workarea = _get_work_area_from_point(ax, ay, ct_root=self.root)
-        if not self._build_and_maybe_show(payload, workarea):
-            self.pending.append((payload, workarea))
-
+        if payload.group:
+            if self._coalesce_into_group(payload):
+                return
+            if not self.rate_limiter.allow(payload.group):
+                self.rate_limited += 1
+                log.info("toast_group_rate_limited", extra={
+                    "group": payload.group, "title": payload.title, "dropped": self.rate_limited,
+                })
+                return
+        ax, ay = payload.anchor if payload.anchor is not None else _get_cursor_pos(self.root)
+        workarea = self.monitors.work_area_at(ax, ay)
+        # Keep FIFO order: never jump ahead of toasts already waiting here
+        if self.pending.peek(workarea) is not None or not self._build_and_maybe_show(payload, workarea):
+            self.pending.append(payload, workarea, payload.group)
+
+    def _coalesce_into_group(self, payload: ToastPayload) -> bool:
+        """Update the visible (or queued) toast of the same group in place."""
+        group = payload.group
+        if not group:
+            return False
+        entry = self.group_toasts.get(group)
+        if entry is not None:
+            win, workarea = entry
+            if win.active and not win.closing and win.exists():
+                if win.coalesce(payload.title, payload.message, payload.icon,
+                                payload.bg_color, AppConfig.TOAST_GROUP_EXTEND_MS):
+                    layout = self._layout(workarea)
+                    real_h = win.measure_height()
+                    win.clamped = real_h > layout.cap
+                    self._apply(layout.resize(win, real_h))
+                self.coalesced += 1
+                return True
+        # Not visible yet: replace the queued payload of the same group
+        queued = self.pending.for_group(group)
+        if queued is not None:
+            queued.payload = payload
+            self.coalesced += 1
+            return True
+        return False
+
+    def _known_height(self, payload: ToastPayload) -> Optional[int]:
+        key = toast_text_key(payload.title, payload.message, payload.duration > 400)
+        return cached_toast_height(key)
+
+    def close(self) -> None:
+        log.info("toast_server_stats", extra={
+            "coalesced": self.coalesced, "rate_limited": self.rate_limited,
+            "pending": len(self.pending), **self.pool.stats(),
+        })
+
+    def _build_and_maybe_show(self, payload: ToastPayload, workarea: WorkArea) -> bool:
+        t0 = time.perf_counter()
+        layout = self._layout(workarea)
+
+        # Known text metrics: decide fit before touching any window
+        known_h = self._known_height(payload)
+        if known_h is not None and not layout.can_fit(known_h):
+            return False
 
-            
-    def _build_and_maybe_show(self, payload: ToastPayload, workarea) -> bool:
-        win = _build_toast_window(
+        win = self.pool.acquire()
+        win.configure_toast(
             payload.title, payload.message, payload.icon, payload.bg_color, payload.duration
         )
-        # measure
-        real_h = getattr(win, "_measured_height", None)
-        if not isinstance(real_h, int) or real_h <= 0:
-            win.update_idletasks()
-            real_h = max(1, win.winfo_height())
-
-        cap = self._per_toast_cap(workarea)
-        real_h = min(real_h, cap)  # clamp so 10 can always fit
-
-        if not self._can_fit_more(workarea, real_h):
-            try: win.destroy()
-            except: pass
+        real_h = win.measure_height()  # layout clamps so 10 can always fit
+
+        if not layout.can_fit(real_h):
+            self.pool.release(win)
             return False
 
-        self._place_toast(workarea, win, real_h)
-        self.stacks[workarea].append(ActiveToast(win, height=real_h))
+        win.clamped = real_h > layout.cap
+        self._apply([layout.push(win, real_h)])
         self._attach_close_handlers(workarea, win)
-        self._reflow(workarea)
-        self._reflow(workarea)
-        win.update_idletasks()   # 👈 flush geometry so builder sees the recorded target
-        win._fade_in()           # type: ignore[attr-defined]
+        if payload.group:
+            self.group_toasts[payload.group] = (win, workarea)
+        win.fade_in()
+        log.debug("toast_first_paint_ms", extra={
+            "ms": round((time.perf_counter() - t0) * 1000, 2), **self.pool.stats(),
+        })
         return True
 
 
+def _coerce_payload(payload) -> ToastPayload:
+    """Accept legacy (title, message, opts) tuples as well as ToastPayload."""
+    if isinstance(payload, ToastPayload):
+        return payload
+    title, message, opts = payload
+    return ToastPayload(
+        title=title, message=message,
+        duration=opts.get("duration", 5000),
+        icon=opts.get("icon", "ℹ️"),
+        bg_color=opts.get("bg_color"),
+        anchor=opts.get("anchor"),
+        group=opts.get("group"),
+    )
+
+
+# ------------------ Queue reader -> Tk thread hand-off ---------------------
+WAKE_EVENT = "<<ToastMailbox>>"
+
+class NotificationMailbox:
+    """
+    Thread-safe hand-off between the blocking queue reader and the Tk thread.
+
+    The reader appends to a deque and fires a single virtual event; further
+    payloads that arrive before the Tk thread drains only append. The Tk
+    thread clears the wake flag *before* draining so nothing can be stranded.
+    """
+
+    def __init__(self, root: ctk.CTk):
+        self.root = root
+        self._items: Deque[Optional[ToastPayload]] = deque()
+        self._wake_pending = threading.Event()
+
+    def put(self, item: Optional[ToastPayload]) -> None:
+        self._items.append(item)
+        if self._wake_pending.is_set():
+            return
+        self._wake_pending.set()
+        try:
+            # Marshalled onto the Tk thread by tkinter (threaded Tcl)
+            self.root.event_generate(WAKE_EVENT, when="tail")
+        except Exception:
+            self._wake_pending.clear()
+            log.warning("toast_mailbox_wake_failed", exc_info=True)
+
+    def drain(self) -> List[Optional[ToastPayload]]:
+        self._wake_pending.clear()
+        out: List[Optional[ToastPayload]] = []
+        while True:
+            try:
+                out.append(self._items.popleft())
+            except IndexError:
+                return out
+
+
+def _reader_loop(q: Queue, mailbox: NotificationMailbox) -> None:
+    """Block on the cross-process queue; no wake-ups while idle."""
+    while True:
+        try:
+            payload = q.get()
+        except (EOFError, OSError):
+            mailbox.put(None)
+            return
+        except Exception:
+            log.warning("toast_queue_read_failed", exc_info=True)
+            continue
+        if payload is None:
+            mailbox.put(None)
+            return
+        try:
+            mailbox.put(_coerce_payload(payload))
+        except Exception:
+            log.warning("toast_payload_invalid", exc_info=True)
+
+
 def server_main(notification_queue: Queue):
     ctk.set_appearance_mode("dark")
     root = ctk.CTk()
     root.withdraw()
 
     server = ToastServer(root, notification_queue)
+    mailbox = NotificationMailbox(root)
 
-    def poll():
-        try:
-            for _ in range(10):
-                if notification_queue.empty():
-                    break
-                payload = notification_queue.get_nowait()
-                if payload is None:
-                    root.quit(); return
-                if not isinstance(payload, ToastPayload):
-                    title, message, opts = payload
-                    payload = ToastPayload(
-                        title=title, message=message,
-                        duration=opts.get("duration", 5000),
-                        icon=opts.get("icon", "ℹ️"),
-                        bg_color=opts.get("bg_color"),
-                        anchor=opts.get("anchor"),
-                        group=opts.get("group"),
-                    )
+    def on_wake(_evt=None):
+        for payload in mailbox.drain():
+            if payload is None:
+                server.close()
+                root.quit(); return
+            try:
                 server.handle_payload(payload)
-        except Exception:
-            pass
-        finally:
-            root.after(50, poll)  # Faster polling (was 80ms, now 50ms)
-
-    poll()
+            except Exception:
+                log.warning("toast_handle_failed", exc_info=True)
+
+    root.bind(WAKE_EVENT, on_wake)
+
+    def start_reader():
+        # Started from inside mainloop so cross-thread Tk calls are serviced
+        threading.Thread(
+            target=_reader_loop, args=(notification_queue, mailbox),
+            name="toast-queue-reader", daemon=True,
+        ).start()
+
+    root.after_idle(start_reader)
+    root.after_idle(server.monitors.refresh)
+    server.monitors.schedule_refresh(AppConfig.MONITOR_REFRESH_MS)
+    # Build a few toast windows up front so the first burst only reconfigures
+    root.after_idle(lambda: server.pool.prewarm(3))
     root.mainloop()
 
 if __name__ == "__main__":
     from multiprocessing import Queue as Q
     q = Q()
-    server_main(q)
\ No newline at end of file
+    server_main(q)
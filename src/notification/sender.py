@@ -0,0 +1,215 @@
+# helpers/notification/sender.py
+"""
+Client-side notification sender (one per process).
+
+`show_message_notification` used to call `multiprocessing.Queue.put` on the Tk
+thread. That takes the queue's lock and grows an unbounded buffer whenever the
+notification process is stalled. Here the Tk thread only appends to a bounded
+deque; a daemon feeder thread drains it, folds same-group payloads (the server
+would coalesce them anyway), and forwards to the cross-process queue while the
+server keeps up.
+
+Overflow policy: the oldest buffered payload is dropped. With policy "merge"
+(the default) an older payload of the same group is superseded by the newer
+one instead of both being sent; when the buffer is full, same-group payloads
+are folded first and only then is the oldest dropped, so a flood of one group
+cannot push out unrelated toasts. `stats()` exposes
+submitted/sent/dropped/merged.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import deque
+from queue import SimpleQueue
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.core.logger import get_logger
+
+log = get_logger(__name__)
+
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_MERGE = "merge"
+
+
+class NotificationSender:
+    """Bounded, non-blocking front for the cross-process notification queue."""
+
+    def __init__(
+        self,
+        q: Any,
+        capacity: int = 64,
+        policy: str = POLICY_MERGE,
+        *,
+        max_in_flight: Optional[int] = None,
+        backoff_s: float = 0.05,
+    ):
+        if policy not in (POLICY_DROP_OLDEST, POLICY_MERGE):
+            raise ValueError(f"Unknown notification policy: {policy}")
+        self.q = q
+        self.capacity = max(1, int(capacity))
+        self.policy = policy
+        # Stop forwarding while the server has this many unread payloads
+        self.max_in_flight = max_in_flight if max_in_flight is not None else self.capacity
+        self.backoff_s = backoff_s
+        self._buf: Deque[Any] = deque(maxlen=self.capacity)
+        # Held only for appends, the overflow fold and batch takes (never across I/O)
+        self._buf_lock = threading.Lock()
+        self._wake: "SimpleQueue[bool]" = SimpleQueue()
+        self._idle = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.submitted = 0
+        self.sent = 0
+        # Split per thread so neither side does a read-modify-write on the other's counter
+        self._overflowed = 0  # Tk thread: buffer full on submit
+        self._folded = 0      # Tk thread: same-group payloads merged to make room
+        self._lost = 0        # feeder: put failed / closed while stalled
+        self._batch_merged = 0  # feeder: same-group payloads merged in a batch
+
+    # ----- Tk thread side -----
+    def submit(self, payload: Any) -> None:
+        """Hand a payload to the feeder. Never waits on the server (short buffer lock + optional wake)."""
+        if self._closed:
+            return
+        if self._thread is None:
+            self._start()
+        with self._buf_lock:
+            if len(self._buf) >= self.capacity:
+                self._make_room(payload)
+            if len(self._buf) >= self.capacity:
+                self._overflowed += 1  # deque(maxlen) discards the oldest on append
+            self._buf.append(payload)
+        self.submitted += 1
+        if self._idle:
+            self._idle = False
+            self._wake.put(True)
+
+    def _make_room(self, payload: Any) -> None:
+        """Full buffer under "merge": fold same-group payloads before anything is dropped."""
+        if self.policy != POLICY_MERGE:
+            return
+        group = getattr(payload, "group", None)
+        buffered = list(self._buf)
+        if group:
+            # `payload` supersedes every buffered payload of its group
+            kept = [p for p in buffered if getattr(p, "group", None) != group]
+        else:
+            kept = buffered
+        kept, _ = _fold_groups(kept)
+        folded = len(buffered) - len(kept)
+        if folded:
+            self._buf.clear()
+            self._buf.extend(kept)
+            self._folded += folded
+
+    # ----- feeder thread -----
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._feed_loop, name="toast-sender", daemon=True
+                )
+                self._thread.start()
+
+    def _feed_loop(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+            for i, payload in enumerate(batch):
+                if not self._wait_for_room():
+                    # Closed while the server was stalled: count the rest as dropped
+                    self._lost += len(batch) - i
+                    return
+                try:
+                    self.q.put(payload)
+                    self.sent += 1
+                except Exception:
+                    self._lost += 1
+                    log.warning("toast_send_failed", exc_info=True)
+
+    def _take_batch(self) -> Optional[List[Any]]:
+        """Block until payloads are buffered; returns None once closed and drained."""
+        while True:
+            with self._buf_lock:
+                batch: List[Any] = list(self._buf)
+                self._buf.clear()
+            if batch:
+                return self._merge(batch) if self.policy == POLICY_MERGE else batch
+            if self._closed:
+                return None
+            # Publish "idle" before the final emptiness check so no wake is missed
+            self._idle = True
+            if self._buf or self._closed:
+                self._idle = False
+                continue
+            self._wake.get()
+
+    def _merge(self, batch: List[Any]) -> List[Any]:
+        out, merged = _fold_groups(batch)
+        self._batch_merged += merged
+        return out
+
+    def _wait_for_room(self) -> bool:
+        """Back off while the server is behind; new payloads keep merging locally."""
+        while True:
+            try:
+                pending = self.q.qsize()
+            except (NotImplementedError, AttributeError, OSError):
+                return True  # qsize unsupported (macOS): forward without pacing
+            if pending < self.max_in_flight:
+                return True
+            if self._closed:
+                return False
+            time.sleep(self.backoff_s)
+
+    # ----- lifecycle / metrics -----
+    @property
+    def dropped(self) -> int:
+        return self._overflowed + self._lost
+
+    @property
+    def merged(self) -> int:
+        return self._folded + self._batch_merged
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait (bounded) until everything buffered has been forwarded."""
+        end = time.monotonic() + timeout
+        while time.monotonic() < end:
+            if not self._buf and self.sent + self.dropped + self.merged >= self.submitted:
+                return True
+            time.sleep(0.005)
+        return False
+
+    def close(self, timeout: float = 1.0) -> None:
+        self.flush(timeout)
+        self._closed = True
+        self._wake.put(True)
+        if self.dropped or self.merged:
+            log.info("toast_sender_stats", extra=self.stats())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "merged": self.merged,
+            "buffered": len(self._buf),
+        }
+
+
+def _fold_groups(batch: List[Any]) -> Tuple[List[Any], int]:
+    """Keep only the newest payload per group, at that payload's position."""
+    last: Dict[str, int] = {}
+    for i, payload in enumerate(batch):
+        group = getattr(payload, "group", None)
+        if group:
+            last[group] = i
+    out = []
+    for i, payload in enumerate(batch):
+        group = getattr(payload, "group", None)
+        if group and last[group] != i:
+            continue
+        out.append(payload)
+    return out, len(batch) - len(out)
@@ -1,21 +1,23 @@
 # helpers/notification/toast.py
 from __future__ import annotations
+from collections import OrderedDict
 from dataclasses import dataclass
 import time
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import customtkinter as ctk
 import tkinter as tk
-from typing import Any, Dict, Optional, Union
-import time
 import threading
 from queue import Queue
 
 # Import settings
 from src.config.settings import AppConfig
+from .sender import NotificationSender
+from .animation import AnimationTicker, Tween, ease_in_cubic, ease_out_cubic, linear
 
 
 # Initialized per process via init_notification_queue()
 notification_queue = None
+_sender: Optional[NotificationSender] = None
 
 @dataclass
 class ToastPayload:
@@ -26,13 +28,26 @@ class ToastPayload:
     bg_color: Optional[str] = None
     # Anchor screen selection: (x, y) in global desktop coords
     anchor: Optional[Tuple[int, int]] = None
-    # Optional grouping key (drop/replace future)
+    # Optional grouping key: same-group toasts update the visible one in place
     group: Optional[str] = None
+    # Wall-clock send time (time.time()), for end-to-end latency measurements
+    created_at: Optional[float] = None
 
-def init_notification_queue(q: Any):
+def init_notification_queue(q: Any, *, buffer_size: Optional[int] = None):
     """Assign the shared notification queue. Call once in each process."""
-    global notification_queue
+    global notification_queue, _sender
+    if _sender is not None:
+        _sender.close(timeout=0)
     notification_queue = q
+    _sender = NotificationSender(
+        q, buffer_size or AppConfig.NOTIFICATION_BUFFER_SIZE, AppConfig.NOTIFICATION_SEND_POLICY
+    )
+    import atexit
+    atexit.register(_sender.close)
+
+def notification_sender_stats() -> Dict[str, int]:
+    """Submitted/sent/dropped/merged counters for this process's sender."""
+    return _sender.stats() if _sender is not None else {}
 
 def prompt_notification(
     title: str,
@@ -127,8 +142,11 @@ def show_message_notification(
     """
     Enqueue a toast request. If 'anchor' is None we’ll use current cursor
     position in the server process (i.e., the user's *current* screen).
+
+    Never blocks: the payload goes into this process's bounded send buffer and
+    a background thread forwards it to the notification server.
     """
-    if notification_queue is None:
+    if notification_queue is None or _sender is None:
         raise RuntimeError("Notification queue not initialized")
 
     payload = ToastPayload(
@@ -139,294 +157,535 @@ def show_message_notification(
         bg_color=bg_color,
         anchor=anchor,
         group=group,
+        created_at=time.time(),
     )
-    notification_queue.put(payload)
+    _sender.submit(payload)
 
 # Keep width shared with the server
 TOAST_WIDTH = AppConfig.DIALOG_WIDTH  # Use dialog width from settings instead of hardcoded 320
 
 
-def _build_toast_window(
-    title: str,
-    message: str,
-    icon: str,
-    bg_color: Optional[str],
-    duration: int,
-    *,
-    anim: str = "lift",        # "lift" | "slide" | "fade"
-    show_progress: bool = True,
-) -> ctk.CTkToplevel:
+# ---------- Toast visual constants (shared by every pooled window) ----------
+TOAST_RADIUS = 12
+TOAST_INNER_PAD = 10
+TOAST_WRAP = TOAST_WIDTH - 86  # text wrap width, leaves room for icon
+# Scale fonts for a more compact text appearance
+TOAST_TITLE_FONT = (AppConfig.FONT_FAMILY, max(6, int(AppConfig.FONT_SIZE_DIALOG_TITLE * 1.3)), "bold")
+TOAST_MSG_FONT = (AppConfig.FONT_FAMILY, max(6, int(AppConfig.FONT_SIZE_DIALOG_BODY * 0.8)))
+TOAST_ICON_FONT = (AppConfig.FONT_FAMILY_EMOJI, 16)  # Use emoji font family from settings
+TOAST_FADE_IN_MS = AppConfig.FADE_STEP_INTERVAL * AppConfig.FADE_STEPS
+TOAST_FADE_OUT_MS = AppConfig.FADE_STEP_INTERVAL * (AppConfig.FADE_STEPS // 2)
+TOAST_CHROMA = "#010101"
+
+# Measured heights keyed by text metrics (wrapped line counts), see toast_text_key()
+_HEIGHT_CACHE: "OrderedDict[Tuple[int, int, bool], int]" = OrderedDict()
+_HEIGHT_CACHE_MAX = 128
+_measure_fonts: Dict[str, Any] = {}
+
+
+def _wrapped_lines(text: str, font_key: str, font_spec: Tuple[Any, ...], wrap: int) -> int:
+    """Count the lines Tk will need for `text` at `wrap` pixels (word wrapping)."""
+    text = (text or "").strip()
+    if not text:
+        return 0
+    font = _measure_fonts.get(font_key)
+    if font is None:
+        from tkinter import font as tkfont
+        font = tkfont.Font(family=font_spec[0], size=font_spec[1],
+                           weight=font_spec[2] if len(font_spec) > 2 else "normal")
+        _measure_fonts[font_key] = font
+    space = font.measure(" ")
+    lines = 0
+    for para in text.split("\n"):
+        lines += 1
+        width = 0
+        for word in para.split():
+            w = font.measure(word)
+            if width and width + space + w > wrap:
+                lines += 1
+                width = w
+            else:
+                width = width + space + w if width else w
+    return lines
+
+
+def toast_text_key(title: str, message: str, show_progress: bool) -> Tuple[int, int, bool]:
+    """Height-cache key: toasts with the same wrapped line counts share a height."""
+    return (
+        _wrapped_lines(title, "title", TOAST_TITLE_FONT, TOAST_WRAP),
+        _wrapped_lines(message, "msg", TOAST_MSG_FONT, TOAST_WRAP),
+        bool(show_progress),
+    )
+
+
+def cached_toast_height(key: Tuple[int, int, bool]) -> Optional[int]:
+    h = _HEIGHT_CACHE.get(key)
+    if h is not None:
+        _HEIGHT_CACHE.move_to_end(key)
+    return h
+
+
+def _remember_toast_height(key: Tuple[int, int, bool], height: int) -> None:
+    _HEIGHT_CACHE[key] = height
+    _HEIGHT_CACHE.move_to_end(key)
+    while len(_HEIGHT_CACHE) > _HEIGHT_CACHE_MAX:
+        _HEIGHT_CACHE.popitem(last=False)
+
+
+class PooledToast:
     """
-    Build a compact toast window with:
+    A compact toast window that is built once and then reconfigured/recycled:
       - Rounded corners (with true transparent corners on Windows)
-      - Bottom-right placement (server sets _target_xy; we animate from there)
+      - Bottom-right placement (server calls place(); we animate from there)
       - Click-to-dismiss anywhere
       - Footer hint ("Click to dismiss") + a lifetime progress bar (optional)
       - Smooth fade-in/fade-out animation
       - Progress bar timing synced to actual visible time (no 1px sliver)
 
-    NOTE: The server is responsible for:
-      - Measuring/clamping height for stacking
-      - Setting `win._target_xy = (x, y)` and then calling `win._fade_in()`
+    Lifecycle: configure_toast() -> measure_height() -> place() -> fade_in()
+    -> (timeout or click) fade_out() -> withdrawn and handed to `on_dismissed`
+    so the owner can return it to the pool.
+
+    Fades and the progress bar are driven by a shared `AnimationTicker` (one
+    timer for all toasts); `offscreen`/`clamped` toasts skip straight to the
+    end state of every animation.
     """
-    import time  # local import keeps module side-effects minimal
-
-    # ---------- Visual constants ----------
-    RADIUS    = 12
-    SURFACE   = bg_color or AppConfig.COLORS["success"]  # Use success color from settings instead of hardcoded green
-    # Scale fonts down by half for a more compact text appearance
-    TITLE_FONT_SZ = max(6, int(AppConfig.FONT_SIZE_DIALOG_TITLE * 1.3))
-    BODY_FONT_SZ  = max(6, int(AppConfig.FONT_SIZE_DIALOG_BODY * 0.8))
-    TITLE_FONT= (AppConfig.FONT_FAMILY, TITLE_FONT_SZ, "bold")
-    MSG_FONT  = (AppConfig.FONT_FAMILY, BODY_FONT_SZ)
-    ICON_FONT = (AppConfig.FONT_FAMILY_EMOJI, 16)  # Use emoji font family from settings
-    WRAP      = TOAST_WIDTH - 86       # text wrap width, leaves room for icon
-    INNER_PAD = 10
-    FADE_IN_MS, FADE_OUT_MS = AppConfig.FADE_STEP_INTERVAL * AppConfig.FADE_STEPS, AppConfig.FADE_STEP_INTERVAL * (AppConfig.FADE_STEPS // 2)  # Use animation settings
-
-    # Track all `after()` callbacks so we can cancel them on manual dismiss
-    timers: list[Any] = []
-
-    # ---------- Top-level window ----------
-    from src.utils import create_toast_window, configure_window, WindowConfig
-    # Increase base height to accommodate potentially longer messages due to smaller font
-    toast = create_toast_window(TOAST_WIDTH, 150)
-    toast.attributes("-alpha", 0.0)  # start fully transparent for fade-in
-    toast.attributes("-toolwindow", True)  # prevent taskbar icon
-
-    # True transparent corners via chroma key where supported (Windows/Tk 8.6+)
-    CHROMA = "#010101"
-    try:
-        toast.configure(fg_color=CHROMA)
-        toast.attributes("-transparentcolor", CHROMA)
-    except Exception:
-        # Fallback: just color the toplevel to match the card; corners still look clean
-        toast.configure(fg_color=SURFACE)
-
-    # ---------- Card container (rounded) ----------
-    # We use GRID on the card so we can reserve bottom rows for footer + progress
-    card = ctk.CTkFrame(
-        toast, corner_radius=RADIUS, border_width=0, fg_color=SURFACE, cursor="hand2"
-    )
-    card.pack(fill="both", expand=True)
-
-    # Layout: row0 = content (expands/shrinks), row1 = footer label, row2 = progress bar
-    card.grid_columnconfigure(0, weight=1)
-    card.grid_rowconfigure(0, weight=1)  # content shrinks first if height is clamped
-    card.grid_rowconfigure(1, weight=0)
-    card.grid_rowconfigure(2, weight=0)
-
-    # ---------- CONTENT (row 0) ----------
-    content = ctk.CTkFrame(card, fg_color="transparent", cursor="hand2")
-    content.grid(row=0, column=0, sticky="nsew", padx=INNER_PAD, pady=(INNER_PAD, 4))
-
-    # Container uses pack; its children use GRID so we can center the icon vertically
-    row = ctk.CTkFrame(content, fg_color="transparent", cursor="hand2")
-    row.pack(fill="both", expand=True)
-
-    # Two columns: [icon] [text], one row that stretches vertically
-    row.grid_columnconfigure(0, weight=0)  # icon column
-    row.grid_columnconfigure(1, weight=1)  # text column
-    row.grid_rowconfigure(0, weight=1)     # row expands so icon can center vertically
-
-    # Emoji-based icon. Placed in the single row, centered by letting the row expand.
-    icon_lbl = ctk.CTkLabel(
-        row, text=icon, font=ICON_FONT, text_color="white",
-        fg_color="transparent", cursor="hand2"
-    )
-    # `sticky=""` keeps it centered inside the cell (no N/S/E/W pulling)
-    icon_lbl.grid(row=0, column=0, padx=(0, 8), sticky="")
 
-    # Text column: title + message
-    text_col = ctk.CTkFrame(row, fg_color="transparent", cursor="hand2")
-    text_col.grid(row=0, column=1, sticky="nsew")
+    def __init__(
+        self,
+        on_dismissed: Optional[Callable[["PooledToast"], None]] = None,
+        ticker: Optional[AnimationTicker] = None,
+    ):
+        from src.utils import create_toast_window
+
+        self.on_dismissed = on_dismissed
+        self.duration = 5000
+        self.anim = "lift"
+        self.text_key: Tuple[int, int, bool] = (0, 0, False)
+        self.target_xy: Tuple[int, int] = (0, 0)
+        self._active = False
+        self._closing = False
+        # Countdown state (set once fully faded in); lets coalesced updates extend it
+        self._deadline: Optional[float] = None
+        self._total_s = 0.0
+        self._dismiss_job: Optional[str] = None
+        self.count = 1  # coalesced notifications shown by this window
+        # Set by the server: no intermediate animation frames are drawn for these
+        self.offscreen = False
+        self.clamped = False
+        self._last_progress = -1.0
+        # Track all `after()` callbacks so we can cancel them on manual dismiss
+        self._timers: List[Any] = []
+
+        # ---------- Top-level window ----------
+        # Increase base height to accommodate potentially longer messages due to smaller font
+        self.win = create_toast_window(TOAST_WIDTH, 150)
+        self.win.withdraw()
+        self.win.attributes("-alpha", 0.0)  # start fully transparent for fade-in
+        self.win.attributes("-toolwindow", True)  # prevent taskbar icon
+        # Standalone toasts get a private ticker; the server shares one across the pool
+        self.ticker = ticker or AnimationTicker(self.win.after, AppConfig.TOAST_ANIMATION_INTERVAL)
+
+        # True transparent corners via chroma key where supported (Windows/Tk 8.6+)
+        self._chroma = True
+        try:
+            self.win.configure(fg_color=TOAST_CHROMA)
+            self.win.attributes("-transparentcolor", TOAST_CHROMA)
+        except Exception:
+            # Fallback: color the toplevel to match the card (done per configure)
+            self._chroma = False
+
+        # ---------- Card container (rounded) ----------
+        # We use GRID on the card so we can reserve bottom rows for footer + progress
+        self.card = ctk.CTkFrame(
+            self.win, corner_radius=TOAST_RADIUS, border_width=0,
+            fg_color=AppConfig.COLORS["success"], cursor="hand2"
+        )
+        self.card.pack(fill="both", expand=True)
+
+        # Layout: row0 = content (expands/shrinks), row1 = footer label, row2 = progress bar
+        self.card.grid_columnconfigure(0, weight=1)
+        self.card.grid_rowconfigure(0, weight=1)  # content shrinks first if height is clamped
+        self.card.grid_rowconfigure(1, weight=0)
+        self.card.grid_rowconfigure(2, weight=0)
+
+        # ---------- CONTENT (row 0) ----------
+        content = ctk.CTkFrame(self.card, fg_color="transparent", cursor="hand2")
+        content.grid(row=0, column=0, sticky="nsew", padx=TOAST_INNER_PAD, pady=(TOAST_INNER_PAD, 4))
+
+        # Container uses pack; its children use GRID so we can center the icon vertically
+        row = ctk.CTkFrame(content, fg_color="transparent", cursor="hand2")
+        row.pack(fill="both", expand=True)
+        row.grid_columnconfigure(0, weight=0)  # icon column
+        row.grid_columnconfigure(1, weight=1)  # text column
+        row.grid_columnconfigure(2, weight=0)  # counter badge column
+        row.grid_rowconfigure(0, weight=1)     # row expands so icon can center vertically
+
+        # Emoji-based icon; `sticky=""` keeps it centered inside the cell
+        self.icon_lbl = ctk.CTkLabel(
+            row, text="", font=TOAST_ICON_FONT, text_color="white",
+            fg_color="transparent", cursor="hand2"
+        )
+        self.icon_lbl.grid(row=0, column=0, padx=(0, 8), sticky="")
+
+        # Text column: title + message
+        text_col = ctk.CTkFrame(row, fg_color="transparent", cursor="hand2")
+        text_col.grid(row=0, column=1, sticky="nsew")
 
-    ctk.CTkLabel(
-        text_col, text=(title or "").strip(), font=TITLE_FONT,
-        text_color="white", fg_color="transparent",
-        wraplength=WRAP, justify="left"
-    ).pack(anchor="w")
+        self.title_lbl = ctk.CTkLabel(
+            text_col, text="", font=TOAST_TITLE_FONT,
+            text_color="white", fg_color="transparent",
+            wraplength=TOAST_WRAP, justify="left"
+        )
+        self.title_lbl.pack(anchor="w")
 
-    ctk.CTkLabel(
-        text_col, text=(message or "").strip(), font=MSG_FONT,
-        text_color="white", fg_color="transparent",
-        wraplength=WRAP, justify="left"
-    ).pack(anchor="w")
-
-    # ---------- FOOTER LABEL (row 1) ----------
-    footer_lbl = ctk.CTkLabel(
-        card, text="Click to dismiss", font=("Segoe UI", 9),
-        text_color="#eaeaea", fg_color="transparent", anchor="e"
-    )
-    # Pinned to bottom via grid; will always be visible even if content is clamped
-    footer_lbl.grid(row=1, column=0, sticky="ew", padx=INNER_PAD, pady=(0, 2))
+        self.msg_lbl = ctk.CTkLabel(
+            text_col, text="", font=TOAST_MSG_FONT,
+            text_color="white", fg_color="transparent",
+            wraplength=TOAST_WRAP, justify="left"
+        )
+        self.msg_lbl.pack(anchor="w")
 
-    # ---------- PROGRESS BAR (row 2) ----------
-    prog_bar = None
-    if show_progress and duration > 400:
-        # Slightly lighter progress over a darker track for visibility
-        prog_bar = ctk.CTkProgressBar(
-            card, height=3, corner_radius=2,
-            fg_color=AppConfig.COLORS["surface"], progress_color=AppConfig.COLORS["primary"]  # Use color settings instead of hardcoded colors
+        # Counter badge for coalesced group updates (hidden while count == 1)
+        self.badge_lbl = ctk.CTkLabel(
+            row, text="", font=(AppConfig.FONT_FAMILY, 10, "bold"),
+            text_color="white", fg_color=AppConfig.COLORS["surface"],
+            corner_radius=8, width=26, height=18, cursor="hand2"
         )
-        prog_bar.grid(row=2, column=0, sticky="ew", padx=INNER_PAD, pady=(0, INNER_PAD - 6))
-        prog_bar.set(1.0)
+        self.badge_lbl.grid(row=0, column=2, padx=(6, 0), sticky="ne")
+        self.badge_lbl.grid_remove()
 
-    # ---------- Helpers / interactions ----------
-    def _hide_progress_bar():
-        """Snap the progress bar to 0 and remove it from layout to avoid a 1-px sliver."""
-        if prog_bar is None:
-            return
-        try:
-            prog_bar.set(0.0)  # value to zero
-            # Blend the progress color into the track color to hide any theme repaint
-            prog_bar.configure(progress_color=prog_bar.cget("fg_color"))
-            toast.update_idletasks()
-            # Remove from layout immediately
-            mgr = prog_bar.winfo_manager()
-            if mgr == "grid":
-                prog_bar.grid_remove()
-            elif mgr == "pack":
-                prog_bar.pack_forget()
-            else:
-                prog_bar.place_forget()
-        except Exception:
-            pass
+        # ---------- FOOTER LABEL (row 1) ----------
+        footer_lbl = ctk.CTkLabel(
+            self.card, text="Click to dismiss", font=("Segoe UI", 9),
+            text_color="#eaeaea", fg_color="transparent", anchor="e"
+        )
+        # Pinned to bottom via grid; will always be visible even if content is clamped
+        footer_lbl.grid(row=1, column=0, sticky="ew", padx=TOAST_INNER_PAD, pady=(0, 2))
+
+        # ---------- PROGRESS BAR (row 2) ----------
+        # Slightly lighter progress over a darker track for visibility
+        self.prog_bar = ctk.CTkProgressBar(
+            self.card, height=3, corner_radius=2,
+            fg_color=AppConfig.COLORS["surface"], progress_color=AppConfig.COLORS["primary"]
+        )
+        self.prog_bar.grid(row=2, column=0, sticky="ew", padx=TOAST_INNER_PAD, pady=(0, TOAST_INNER_PAD - 6))
+        self._show_progress = True
 
-    def cancel_timers():
-        """Cancel all scheduled after() callbacks (e.g., on click-to-dismiss)."""
-        for t in timers[:]:
+        # Bind click anywhere (and Esc) to dismiss
+        for w in (self.win, self.card, content, row, text_col, footer_lbl,
+                  self.icon_lbl, self.title_lbl, self.msg_lbl, self.badge_lbl):
             try:
-                toast.after_cancel(t)
+                w.bind("<Button-1>", lambda _e=None: self.fade_out())
             except Exception:
                 pass
-        timers.clear()
-
-    def fade_out():
-        """Smooth fade-out + slight drop, then destroy the window."""
-        if not toast.winfo_exists():
+        self.win.bind("<Escape>", lambda _e=None: self.fade_out())
+
+    # ---------- Reconfiguration ----------
+    def configure_toast(
+        self,
+        title: str,
+        message: str,
+        icon: str,
+        bg_color: Optional[str],
+        duration: int,
+        *,
+        anim: str = "lift",        # "lift" | "slide" | "fade"
+        show_progress: bool = True,
+    ) -> None:
+        """Rebind this window to a new notification (no widgets are created)."""
+        self.cancel_timers()
+        self._active = False
+        self._closing = False
+        self._deadline = None
+        self._dismiss_job = None
+        self.duration = duration
+        self.count = 1
+        self.clamped = False
+        self.badge_lbl.grid_remove()
+        self.anim = anim
+        surface = bg_color or AppConfig.COLORS["success"]
+        if not self._chroma:
+            self.win.configure(fg_color=surface)
+        self.card.configure(fg_color=surface)
+        self.icon_lbl.configure(text=icon)
+        self.title_lbl.configure(text=(title or "").strip())
+        self.msg_lbl.configure(text=(message or "").strip())
+
+        want_progress = show_progress and duration > 400
+        if want_progress:
+            self.prog_bar.configure(progress_color=AppConfig.COLORS["primary"])
+            self._set_progress(1.0)
+            if not self._show_progress:
+                self.prog_bar.grid()
+        elif self._show_progress:
+            self.prog_bar.grid_remove()
+        self._show_progress = want_progress
+        self.text_key = toast_text_key(title, message, want_progress)
+        self.win.attributes("-alpha", 0.0)
+
+    @property
+    def closing(self) -> bool:
+        return self._closing
+
+    def coalesce(
+        self,
+        title: str,
+        message: str,
+        icon: str,
+        bg_color: Optional[str],
+        extend_ms: int,
+    ) -> bool:
+        """
+        Fold a same-group notification into this visible toast: refresh the
+        text, bump the counter badge and extend the lifetime. Returns True if
+        the text metrics changed (caller should re-measure and reflow).
+        """
+        self.count += 1
+        self.icon_lbl.configure(text=icon)
+        self.title_lbl.configure(text=(title or "").strip())
+        self.msg_lbl.configure(text=(message or "").strip())
+        if bg_color:
+            self.card.configure(fg_color=bg_color)
+            if not self._chroma:
+                self.win.configure(fg_color=bg_color)
+        self.badge_lbl.configure(text=f"×{self.count}")
+        self.badge_lbl.grid()
+        self.extend_lifetime(extend_ms)
+        old_key = self.text_key
+        self.text_key = toast_text_key(title, message, self.text_key[2])
+        return self.text_key != old_key
+
+    def extend_lifetime(self, extend_ms: int) -> None:
+        """Restart the visible countdown (full visible time + `extend_ms`)."""
+        if self._deadline is None:
+            # Still fading in: the countdown has not started yet
+            self.duration += max(0, extend_ms)
             return
-        cancel_timers()
-        _hide_progress_bar()  # ensure the bar is fully gone before exit
-
-        x, y = toast.winfo_x(), toast.winfo_y()
-        y_end = y + 8  # small downward motion
-        frames = max(1, FADE_OUT_MS // AppConfig.FADE_STEP_INTERVAL)  # Use animation step interval from settings
-
-        def tick(i=0):
-            if not toast.winfo_exists():
-                return
-            t = min(1.0, i / frames)
-            a = 1.0 - (t ** 3)  # ease-in cubic for opacity
-            toast.attributes("-alpha", max(0.0, a))
-            yi = int(y + (y_end - y) * t)
-            toast.geometry(f"+{toast.winfo_x()}+{yi}")
-            if t < 1.0:
-                timers.append(toast.after(AppConfig.FADE_STEP_INTERVAL, lambda: tick(i + 1)))  # Use animation step interval from settings
-            else:
-                try:
-                    toast.destroy()
-                except:
-                    pass
+        visible_s = max(0, self.duration - TOAST_FADE_IN_MS - TOAST_FADE_OUT_MS) / 1000.0
+        total_s = visible_s + max(0, extend_ms) / 1000.0
+        self._deadline = time.perf_counter() + total_s
+        self._total_s = total_s
+        if self._dismiss_job is not None:
+            # No progress bar: re-arm the single dismiss timer
+            try:
+                self.win.after_cancel(self._dismiss_job)
+            except Exception:
+                pass
+            self._dismiss_job = self.win.after(int(total_s * 1000), self.fade_out)
+            self._timers.append(self._dismiss_job)
+        elif self._show_progress:
+            self._set_progress(1.0)
+
+    def measure_height(self) -> int:
+        """Real height for stacking, served from the text-metrics cache when possible."""
+        cached = cached_toast_height(self.text_key)
+        if cached is not None:
+            return cached
+        self.win.update_idletasks()
+        height = max(1, int(self.win.winfo_reqheight()))
+        _remember_toast_height(self.text_key, height)
+        return height
+
+    def place(self, width: int, height: int, x: int, y: int) -> None:
+        self.win.geometry(f"{width}x{height}+{x}+{y}")
+        self.target_xy = (x, y)
+
+    def exists(self) -> bool:
+        try:
+            return bool(self.win.winfo_exists())
+        except Exception:
+            return False
 
-        tick()
+    @property
+    def active(self) -> bool:
+        return self._active
 
-    # Bind click anywhere (and Esc) to dismiss
-    for w in (toast, card, content, row, text_col, footer_lbl, icon_lbl):
+    def destroy(self) -> None:
+        self.cancel_timers()
         try:
-            w.bind("<Button-1>", lambda _e=None: fade_out())
+            self.win.destroy()
         except Exception:
             pass
-    toast.bind("<Escape>", lambda _e=None: fade_out())
 
-    # ---------- Animations ----------
-    def ease_out_cubic(t: float) -> float:
-        """Easing used for fade-in movement/opacity (fast start, gentle end)."""
-        return 1.0 - (1.0 - t) ** 3
+    # ---------- Helpers ----------
+    def _skip_animation(self) -> bool:
+        return self.offscreen or self.clamped
 
-    def start_progress_and_schedule_dismiss():
-        """
-        Start the lifetime bar AFTER fade-in, run for the exact visible time,
-        and trigger fade_out() when finished. Also hides the bar to avoid a 1-px tail.
-        """
-        visible_ms = max(0, duration - FADE_IN_MS - FADE_OUT_MS)
-        if prog_bar is None or visible_ms <= 0:
-            # No bar: just schedule the fade-out
-            timers.append(toast.after(visible_ms, fade_out))
+    def _set_progress(self, value: float) -> None:
+        """Only repaint the bar when it would move by at least one pixel."""
+        if abs(value - self._last_progress) * TOAST_WIDTH < 1.0 and value not in (0.0, 1.0):
             return
+        self._last_progress = value
+        try:
+            self.prog_bar.set(value)
+        except Exception:
+            pass
 
-        # Single controller loop: progress + deadline = same heartbeat
-        deadline = time.perf_counter() + (visible_ms / 1000.0)
-        total_s = visible_ms / 1000.0
+    def _hide_progress_bar(self) -> None:
+        """Snap the progress bar to 0 and remove it from layout to avoid a 1-px sliver."""
+        if not self._show_progress:
+            return
+        try:
+            self._set_progress(0.0)
+            # Blend the progress color into the track color to hide any theme repaint
+            self.prog_bar.configure(progress_color=self.prog_bar.cget("fg_color"))
+            self.prog_bar.grid_remove()
+            self._show_progress = False
+        except Exception:
+            pass
 
-        def step():
-            if not toast.winfo_exists():
-                return
-            remaining = deadline - time.perf_counter()
-            if remaining <= 0:
-                _hide_progress_bar()  # remove any residual sliver
-                fade_out()
-                return
-            # Update bar (clamped 0..1)
+    def cancel_timers(self) -> None:
+        """Cancel all scheduled after() callbacks and animations (e.g., on click-to-dismiss)."""
+        self.ticker.cancel(self)
+        for t in self._timers[:]:
             try:
-                if prog_bar is not None:
-                    prog_bar.set(max(0.0, min(1.0, remaining / total_s)))
+                self.win.after_cancel(t)
             except Exception:
                 pass
-            timers.append(toast.after(AppConfig.FADE_STEP_INTERVAL, step))  # Use animation step interval from settings
-
-        timers.append(toast.after(AppConfig.FADE_STEP_INTERVAL, step))  # Use animation step interval from settings
+        self._timers.clear()
 
-    def fade_in():
-        """Fade-in + optional small lift/slide from the server-placed target (bottom-right)."""
-        if not toast.winfo_exists():
+    # ---------- Animations ----------
+    def fade_in(self) -> None:
+        """Fade-in + optional small lift/slide towards the server-placed target."""
+        if not self.exists():
             return
-
-        # The server recorded the final geometry for us to animate towards
-        x_final, y_final = getattr(toast, "_target_xy", (toast.winfo_x(), toast.winfo_y()))
+        self._active = True
+        x_final, y_final = self.target_xy
 
         # Choose a starting offset for a subtle motion
-        if anim == "slide":
+        if self.anim == "slide":
             x0, y0 = x_final + 14, y_final
-        elif anim == "lift":
+        elif self.anim == "lift":
             x0, y0 = x_final, y_final + 12
         else:  # pure fade
             x0, y0 = x_final, y_final
+        moves = (x0, y0) != (x_final, y_final)
 
-        # Start from the offset position
-        if (x0, y0) != (x_final, y_final):
-            toast.geometry(f"+{x0}+{y0}")
+        self.win.attributes("-alpha", 0.0)
+        self.win.deiconify()
+        if moves and not self._skip_animation():
+            self.win.geometry(f"+{x0}+{y0}")
 
-        frames = max(1, FADE_IN_MS // AppConfig.FADE_STEP_INTERVAL)  # Use animation step interval from settings
+        def frame(a: float) -> None:
+            self.win.attributes("-alpha", a)
+            if moves:
+                self.win.geometry(f"+{int(x0 + (x_final - x0) * a)}+{int(y0 + (y_final - y0) * a)}")
 
-        def tick(i=0):
-            if not toast.winfo_exists():
-                return
-            t = min(1.0, i / frames)
-            a = ease_out_cubic(t)
-            toast.attributes("-alpha", a)
-            if (x0, y0) != (x_final, y_final):
-                xi = int(x0 + (x_final - x0) * a)
-                yi = int(y0 + (y_final - y0) * a)
-                toast.geometry(f"+{xi}+{yi}")
-            if t < 1.0:
-                timers.append(toast.after(AppConfig.FADE_STEP_INTERVAL, lambda: tick(i + 1)))  # Use animation step interval from settings
-            else:
-                toast.attributes("-alpha", 1.0)
-                # Only start the visible-time countdown after we're fully in
-                start_progress_and_schedule_dismiss()
+        def done() -> None:
+            self.win.attributes("-alpha", 1.0)
+            # Only start the visible-time countdown after we're fully in
+            self._start_progress_and_schedule_dismiss()
 
-        tick()
+        self.ticker.start(self, "fade", Tween(
+            TOAST_FADE_IN_MS, frame, done, easing=ease_out_cubic, skip=self._skip_animation,
+        ))
+
+    def _start_progress_and_schedule_dismiss(self) -> None:
+        """
+        Start the lifetime bar AFTER fade-in, run for the exact visible time,
+        and trigger fade_out() when finished. Also hides the bar to avoid a 1-px tail.
+        """
+        visible_ms = max(0, self.duration - TOAST_FADE_IN_MS - TOAST_FADE_OUT_MS)
+        # Single controller: progress + deadline = same heartbeat
+        self._deadline = time.perf_counter() + (visible_ms / 1000.0)
+        self._total_s = visible_ms / 1000.0
+        if not self._show_progress or visible_ms <= 0:
+            # No bar: just schedule the fade-out
+            self._dismiss_job = self.win.after(visible_ms, self.fade_out)
+            self._timers.append(self._dismiss_job)
+            return
 
-    # Expose hooks the server calls
-    # Attach helper callables via a side-car dict to avoid type attribute issues
-    setattr(toast, "_toast_hooks", {"fade_in": fade_in, "fade_out": fade_out})
+        def step(now: float) -> bool:
+            if not self.exists() or self._closing or self._deadline is None:
+                return False
+            remaining = self._deadline - now
+            if remaining <= 0:
+                self._hide_progress_bar()  # remove any residual sliver
+                self.fade_out()
+                return False
+            if not self._skip_animation():
+                self._set_progress(max(0.0, min(1.0, remaining / max(self._total_s, 1e-6))))
+            return True
+
+        self.ticker.start(self, "progress", step)
+
+    def fade_out(self) -> None:
+        """Smooth fade-out + slight drop, then withdraw and hand back to the owner."""
+        if not self.exists() or not self._active or self._closing:
+            return
+        self._closing = True
+        self.cancel_timers()
+        self._hide_progress_bar()  # ensure the bar is fully gone before exit
 
-    # Let the server read the real measured height for stacking/clamping
-    toast.update_idletasks()
-    try:
-        setattr(toast, "_measured_height", max(1, toast.winfo_height()))
-    except Exception:
-        pass
+        x, y = self.win.winfo_x(), self.win.winfo_y()
+        y_end = y + 8  # small downward motion
 
-    return toast
+        def frame(t: float) -> None:
+            if not self.exists():
+                return
+            self.win.attributes("-alpha", max(0.0, 1.0 - ease_in_cubic(t)))
+            self.win.geometry(f"+{x}+{int(y + (y_end - y) * t)}")
+
+        self.ticker.start(self, "fade", Tween(
+            TOAST_FADE_OUT_MS, frame, self._finish, easing=linear, skip=self._skip_animation,
+        ))
+
+    def _finish(self) -> None:
+        self.cancel_timers()
+        self._active = False
+        self._closing = False
+        self._deadline = None
+        self._dismiss_job = None
+        try:
+            self.win.withdraw()
+            self.win.attributes("-alpha", 0.0)
+        except Exception:
+            pass
+        cb = self.on_dismissed
+        self.on_dismissed = None
+        if cb is not None:
+            cb(self)
+
+
+class ToastWindowPool:
+    """Keeps dismissed toast windows around so bursts reuse them instead of rebuilding."""
+
+    def __init__(self, max_idle: int = 12, ticker: Optional[AnimationTicker] = None):
+        self.max_idle = max_idle
+        self.ticker = ticker
+        self._idle: List[PooledToast] = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self) -> PooledToast:
+        while self._idle:
+            toast = self._idle.pop()
+            if toast.exists():
+                self.reused += 1
+                return toast
+        self.created += 1
+        return PooledToast(ticker=self.ticker)
+
+    def release(self, toast: PooledToast) -> None:
+        toast.on_dismissed = None
+        if not toast.exists():
+            return
+        if len(self._idle) < self.max_idle:
+            try:
+                toast.win.withdraw()
+            except Exception:
+                pass
+            self._idle.append(toast)
+        else:
+            toast.destroy()
+
+    def prewarm(self, count: int) -> None:
+        """Build idle windows ahead of time (call when the Tk thread is idle)."""
+        while len(self._idle) < min(count, self.max_idle):
+            self.created += 1
+            self._idle.append(PooledToast(ticker=self.ticker))
+
+    def stats(self) -> Dict[str, int]:
+        # Not "created": that name is reserved on LogRecord (stats go into log extras)
+        return {"windows_built": self.created, "windows_reused": self.reused, "idle": len(self._idle)}
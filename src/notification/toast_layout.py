@@ -0,0 +1,158 @@
+# helpers/notification/toast_layout.py
+"""
+Tk-free stacking policy for toasts on one monitor work area.
+
+Toasts stack bottom-up from the work area's bottom-right corner. The layout
+keeps a running `used` height so fit checks and placement are O(1), and on
+removal/resize only the toasts *above* the changed slot are moved.
+
+The server maps each returned (item, x, y, w, h) onto a real window; tests and
+the headless sink drive it with plain objects.
+"""
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+WorkArea = Tuple[int, int, int, int]
+T = TypeVar("T")
+
+MARGIN = 16
+GAP = 6
+TARGET_MAX_VISIBLE = 10
+MIN_TOAST_HEIGHT = 28
+
+
+@dataclass
+class ActiveToast(Generic[T]):
+    win: T
+    height: int
+    y: int = 0
+
+
+Placement = Tuple[Any, int, int, int, int]  # (item, x, y, width, height)
+
+
+class ToastStackLayout(Generic[T]):
+    """Incremental bottom-up stack for a single work area."""
+
+    def __init__(self, workarea: WorkArea, width: int):
+        self.workarea = workarea
+        self.width = width
+        left, top, right, bottom = workarea
+        self.x = right - MARGIN - width
+        self.floor = bottom - MARGIN   # y of the bottom edge of the lowest toast
+        self.ceiling = top + MARGIN    # highest allowed top edge
+        available = (bottom - top) - (2 * MARGIN)  # vertical pixels we can use
+        # ten toasts => 9 gaps between them
+        cap = (available - GAP * (TARGET_MAX_VISIBLE - 1)) // TARGET_MAX_VISIBLE
+        self.cap = max(MIN_TOAST_HEIGHT, int(cap))  # keep a sensible minimum
+        self.slots: List[ActiveToast[T]] = []
+        self._index: Dict[int, int] = {}  # id(item) -> position in slots
+        self.used = 0  # sum of slot heights + one GAP per slot
+        # Number of slots touched by layout operations (for complexity checks)
+        self.work = 0
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __iter__(self) -> Iterator[ActiveToast[T]]:
+        return iter(self.slots)
+
+    def clamp(self, height: int) -> int:
+        return min(max(1, int(height)), self.cap)
+
+    def can_fit(self, height: int) -> bool:
+        return self.floor - self.used - self.clamp(height) >= self.ceiling
+
+    def push(self, item: T, height: int) -> Placement:
+        """Place `item` on top of the stack. Caller checks can_fit() first."""
+        h = self.clamp(height)
+        y = self.floor - self.used - h
+        self._index[id(item)] = len(self.slots)
+        self.slots.append(ActiveToast(item, h, y))
+        self.used += h + GAP
+        self.work += 1
+        return (item, self.x, y, self.width, h)
+
+    def contains(self, item: T) -> bool:
+        return id(item) in self._index
+
+    def remove(self, item: T) -> List[Placement]:
+        """Drop `item`; returns new placements for the toasts above it only."""
+        idx = self._index.pop(id(item), None)
+        if idx is None:
+            return []
+        slot = self.slots.pop(idx)
+        self.used -= slot.height + GAP
+        return self._shift_from(idx, slot.height + GAP)
+
+    def resize(self, item: T, height: int) -> List[Placement]:
+        """Change an item's height; returns placements for it and everything above."""
+        idx = self._index.get(id(item))
+        if idx is None:
+            return []
+        slot = self.slots[idx]
+        h = self.clamp(height)
+        delta = h - slot.height
+        if delta == 0:
+            return []
+        slot.height = h
+        slot.y -= delta
+        self.used += delta
+        self.work += 1
+        moved: List[Placement] = [(slot.win, self.x, slot.y, self.width, h)]
+        return moved + self._shift_from(idx + 1, -delta)
+
+    def _shift_from(self, start: int, dy: int) -> List[Placement]:
+        moved: List[Placement] = []
+        for i in range(start, len(self.slots)):
+            s = self.slots[i]
+            s.y += dy
+            self._index[id(s.win)] = i
+            moved.append((s.win, self.x, s.y, self.width, s.height))
+            self.work += 1
+        return moved
+
+
+@dataclass
+class PendingToast:
+    """Backlog entry; `payload` may be replaced in place by group coalescing."""
+    payload: Any
+    workarea: WorkArea
+    group: Optional[str] = None
+
+
+@dataclass
+class PendingBacklog:
+    """Per-work-area FIFO backlog with an O(1) group index."""
+    queues: Dict[WorkArea, Deque[PendingToast]] = field(default_factory=dict)
+    by_group: Dict[str, PendingToast] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return sum(len(q) for q in self.queues.values())
+
+    def append(self, payload: Any, workarea: WorkArea, group: Optional[str] = None) -> PendingToast:
+        entry = PendingToast(payload, workarea, group)
+        self.queues.setdefault(workarea, deque()).append(entry)
+        if group:
+            self.by_group[group] = entry
+        return entry
+
+    def for_group(self, group: str) -> Optional[PendingToast]:
+        return self.by_group.get(group)
+
+    def peek(self, workarea: WorkArea) -> Optional[PendingToast]:
+        q = self.queues.get(workarea)
+        return q[0] if q else None
+
+    def popleft(self, workarea: WorkArea) -> Optional[PendingToast]:
+        q = self.queues.get(workarea)
+        if not q:
+            return None
+        entry = q.popleft()
+        if not q:
+            del self.queues[workarea]
+        if entry.group and self.by_group.get(entry.group) is entry:
+            del self.by_group[entry.group]
+        return entry
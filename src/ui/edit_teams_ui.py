@@ -7,7 +7,12 @@ from src.config.settings import AppConfig
 from src.utils import top_centered_child_to_parent
 from src.ui.footer_label import create_footer
 from src.core.logger import get_logger
+from src.core.team_async import async_team_manager, deliver
+from src.core.team_backup import default_backup_dir
+from src.core.team_search import FuzzyTeamSearch
+from src.ui.team_list import VirtualTeamList
 import re
+from tkinter import filedialog, messagebox
 
 # Color constants from AppConfig - using AppConfig directly
 
@@ -20,11 +25,13 @@ class TeamManagerWindow(ctk.CTkToplevel):
         self.withdraw()
         
         self.mongo = mongo
+        self.teams_async = async_team_manager(mongo)  # Network I/O off the Tk thread
         self.all_teams = {}  # Store all teams for filtering
-        self.team_buttons = []  # Store team buttons for filtering
+        self.team_rows = []  # (name, abrev) for every team, load order
         self._icon_refs = []  # Store icon references
-        self.selected_index = -1  # Track currently selected team
-        self.visible_buttons = []  # Track visible buttons for navigation
+        self.visible_rows = []  # Rows matching the current filter, display order
+        # Reuse the catalog's stored normalized keys when the manager has one
+        self.search_engine = FuzzyTeamSearch(key_fn=getattr(getattr(mongo, "catalog", None), "key_of", None))
         self.search_query = ""  # Current search query
         self.empty_state_widget = None  # Track empty state widget
         self._is_loading = True  # Track loading state
@@ -95,6 +102,9 @@ class TeamManagerWindow(ctk.CTkToplevel):
         # Show ready indicator
         self.after(150, self._show_ready_indicator)  # Faster (was 300ms, now 150ms)
 
+        # Pending-sync count and conflict reports
+        self.after(500, self._poll_outbox)
+
     def _prompt_for_pin(self):
         return prompt_for_pin(self)
     
@@ -128,6 +138,152 @@ class TeamManagerWindow(ctk.CTkToplevel):
         )
         subtitle_label.pack(anchor="w", pady=(5, 0))
 
+        # Bulk actions (CSV/JSON)
+        actions = ctk.CTkFrame(header_frame, fg_color="transparent")
+        actions.pack(anchor="w", pady=(10, 0))
+        self.import_btn = ctk.CTkButton(
+            actions, text="Import…", width=90, height=28, corner_radius=8,
+            font=("Segoe UI", 12), command=self._import_teams
+        )
+        self.import_btn.pack(side="left", padx=(0, 6))
+        self.export_btn = ctk.CTkButton(
+            actions, text="Export…", width=90, height=28, corner_radius=8,
+            font=("Segoe UI", 12), fg_color=("gray70", "gray35"), command=self._export_teams
+        )
+        self.export_btn.pack(side="left")
+        self.restore_btn = ctk.CTkButton(
+            actions, text="Restore…", width=90, height=28, corner_radius=8,
+            font=("Segoe UI", 12), fg_color=("gray70", "gray35"), command=self._restore_backup
+        )
+        self.restore_btn.pack(side="left", padx=(6, 0))
+
+        # Saves/deletes still waiting for Mongo (write-behind outbox)
+        self.outbox_label = ctk.CTkLabel(
+            actions, text="", font=("Segoe UI", 11), text_color=("gray50", "gray60")
+        )
+        self.outbox_label.pack(side="left", padx=(12, 0))
+
+    # -------------------- Bulk import / export --------------------
+    _FILE_TYPES = [("CSV files", "*.csv"), ("JSON files", "*.json"), ("All files", "*.*")]
+
+    def _run_bulk(self, label, work, on_done):
+        """`work(progress)` returns a future; progress/result come back via after()."""
+        buttons = (self.import_btn, self.export_btn, self.restore_btn)
+        for btn in buttons:
+            btn.configure(state="disabled")
+
+        def progress(done, total):
+            text = f"{label} {done}/{total}…" if total else f"{label} {done}…"
+            self.after(0, lambda: self.search_info.configure(text=text))
+
+        def finish(result):
+            for btn in buttons:
+                btn.configure(state="normal")
+            on_done(result)
+
+        def failed(error):
+            for btn in buttons:
+                btn.configure(state="normal")
+            get_logger(__name__).error("team_bulk_failed", exc_info=(type(error), error, error.__traceback__))
+            show_message_notification(
+                "❌ Bulk operation failed", str(error), icon="❌", bg_color=AppConfig.COLOR_STOP
+            )
+
+        deliver(work(progress), self, finish, failed)
+
+    def _import_teams(self):
+        path = filedialog.askopenfilename(parent=self, title="Import teams", filetypes=self._FILE_TYPES)
+        if not path:
+            return
+
+        def done(report):
+            details = report.summary()
+            if report.invalid:
+                rows = ", ".join(str(r) for r, _ in report.invalid[:5])
+                details += f" (rows {rows}{'…' if len(report.invalid) > 5 else ''})"
+            show_message_notification(
+                "✅ Import complete", details, icon="✅",
+                bg_color=AppConfig.COLOR_WARNING if report.invalid else AppConfig.COLOR_SUCCESS
+            )
+            self._on_change()
+
+        self._run_bulk("Importing", lambda progress: self.teams_async.import_teams(path, progress), done)
+
+    def _export_teams(self):
+        path = filedialog.asksaveasfilename(
+            parent=self, title="Export teams", defaultextension=".csv", filetypes=self._FILE_TYPES
+        )
+        if not path:
+            return
+
+        def done(count):
+            self.search_info.configure(text=f"Showing all {len(self.visible_rows)} teams")
+            show_message_notification(
+                "✅ Export complete", f"{count} teams written to {path}", icon="✅",
+                bg_color=AppConfig.COLOR_SUCCESS
+            )
+
+        self._run_bulk("Exporting", lambda progress: self.teams_async.export_teams(path, progress), done)
+
+    def _restore_backup(self):
+        path = filedialog.askopenfilename(
+            parent=self, title="Restore teams backup", initialdir=str(default_backup_dir()),
+            filetypes=[("Team backups", f"{AppConfig.BACKUP_FILE_PREFIX}*.json.gz"), ("JSON files", "*.json")]
+        )
+        if not path:
+            return
+        if not messagebox.askyesno(
+            "Restore backup",
+            "Replace the current teams with this backup? Teams added since then will be removed.",
+            parent=self,
+        ):
+            return
+
+        def done(changed):
+            show_message_notification(
+                "✅ Restore complete", f"{changed} teams changed", icon="✅",
+                bg_color=AppConfig.COLOR_SUCCESS
+            )
+            self._on_change()
+
+        self._run_bulk("Restoring", lambda progress: self.teams_async.restore_backup(path), done)
+
+    # -------------------- Outbox status --------------------
+    def _poll_outbox(self):
+        """Refresh the pending-mutation count; report new sync conflicts once"""
+        try:
+            if not self.winfo_exists():
+                return
+        except Exception:
+            return
+
+        def work():
+            return self.mongo.outbox_status(), self.mongo.take_conflicts()
+
+        deliver(self.teams_async.submit(work), self, self._on_outbox_status, lambda e: None)
+        self.after(AppConfig.TEAM_OUTBOX_STATUS_POLL_MS, self._poll_outbox)
+
+    def _on_outbox_status(self, result):
+        status, conflicts = result
+        pending = int(status.get("pending", 0))
+        if not pending:
+            text = ""
+        elif status.get("failures"):
+            text = f"⏳ {pending} change(s) waiting to sync (offline, retry in {status.get('retry_in_s', 0):.0f}s)"
+        else:
+            text = f"⏳ {pending} change(s) waiting to sync"
+        self.outbox_label.configure(text=text)
+        if conflicts:
+            details = "; ".join(
+                f"{c['name']}: kept {c['local'] or 'deleted'} (was {c['remote'] or 'deleted'} remotely)"
+                for c in conflicts[:3]
+            )
+            if len(conflicts) > 3:
+                details += f" (+{len(conflicts) - 3} more)"
+            show_message_notification(
+                "⚠️ Sync conflict", details, icon="⚠️", bg_color=AppConfig.COLOR_WARNING
+            )
+
     def _build_search_bar(self):
         """Build the search bar with icon and advanced filtering"""
         search_container = ctk.CTkFrame(self, fg_color="transparent")
@@ -186,84 +342,39 @@ class TeamManagerWindow(ctk.CTkToplevel):
         self.search_info.pack(anchor="w", pady=(8, 0))
 
     def _filter_teams(self, event=None):
-        """Advanced search filter with letter-by-letter matching"""
+        """Ranked letter search (best match first) over all teams"""
         if self._is_loading:
             return  # Don't filter while loading
             
         query = self.search_entry.get().strip().lower()
         self.search_query = query
         
-        # Clear previous visible buttons
-        self.visible_buttons.clear()
-        
         if not query:
             # Show all teams if no search query
-            self.visible_buttons = self.team_buttons.copy()
-            self.search_info.configure(text=f"Showing all {len(self.visible_buttons)} teams")
+            self.visible_rows = list(self.team_rows)
+            self.search_info.configure(text=f"Showing all {len(self.visible_rows)} teams")
         else:
-            # Advanced search: check if all letters in query exist in team name/abbreviation
-            filtered_teams = []
-            
-            for name, abrev in self.all_teams.items():
-                name_lower = name.lower()
-                abrev_lower = abrev.lower()
-                full_text = f"{name_lower} {abrev_lower}"
-                
-                # Check if all letters in query exist in the team data
-                if self._letters_match(query, full_text):
-                    filtered_teams.append((name, abrev))
-            
-            # Update visible buttons based on filtered results
-            self.visible_buttons = []
-            for name, abrev in filtered_teams:
-                # Find the corresponding button
-                for btn in self.team_buttons:
-                    if btn.cget("text") == f"{name} — {abrev}":
-                        self.visible_buttons.append(btn)
-                        break
+            # Ranked letter search, best match first; rows are plain (name, abrev) pairs
+            teams = self.all_teams
+            self.visible_rows = [
+                (name, teams[name]) for name in self.search_engine.search(query) if name in teams
+            ]
             
             # Update search info
-            if self.visible_buttons:
+            if self.visible_rows:
                 self.search_info.configure(
-                    text=f"Found {len(self.visible_buttons)} team(s) matching '{query}'"
+                    text=f"Found {len(self.visible_rows)} team(s) matching '{query}'"
                 )
             else:
                 self.search_info.configure(
                     text=f"No teams found matching '{query}'"
                 )
         
-        # Update UI
+        # Update UI (selection resets to the first match)
         self._update_team_display()
-        
-        # Reset selection
-        self.selected_index = -1
-        if self.visible_buttons:
-            self.selected_index = 0
-            self._update_selection()
-
-    def _letters_match(self, query, text):
-        """Check if all letters in query exist in text (in order)"""
-        query_chars = list(query)
-        text_chars = list(text)
-        
-        # Remove spaces and special characters for matching
-        query_chars = [c for c in query_chars if c.isalnum()]
-        text_chars = [c for c in text_chars if c.isalnum()]
-        
-        if not query_chars:
-            return True
-            
-        # Check if all query characters exist in text (allowing for order flexibility)
-        for char in query_chars:
-            if char in text_chars:
-                # Remove the found character to avoid double counting
-                text_chars.remove(char)
-            else:
-                return False
-        return True
 
     def _update_team_display(self):
-        """Update the display of teams based on current filter"""
+        """Rebind the list's row pool to the current filter results"""
         if self._is_loading:
             return  # Don't update display while loading
             
@@ -272,16 +383,10 @@ class TeamManagerWindow(ctk.CTkToplevel):
             self.empty_state_widget.destroy()
             self.empty_state_widget = None
             
-        # Hide all buttons first
-        for btn in self.team_buttons:
-            btn.pack_forget()
-        
-        # Show only visible buttons
-        for btn in self.visible_buttons:
-            btn.pack(fill="x", pady=2, padx=5)
+        self.team_list.set_rows(self.visible_rows)
         
         # Show empty state if no results
-        if not self.visible_buttons:
+        if not self.visible_rows:
             self._show_empty_state()
 
     def _show_empty_state(self):
@@ -291,7 +396,7 @@ class TeamManagerWindow(ctk.CTkToplevel):
             self.empty_state_widget.destroy()
         
         empty_frame = ctk.CTkFrame(
-            self.scrollable_frame,
+            self.team_list.body,
             fg_color="transparent"
         )
         self.empty_state_widget = empty_frame
@@ -331,30 +436,35 @@ class TeamManagerWindow(ctk.CTkToplevel):
         subtitle_label.pack()
 
     def _build_team_list(self):
-        """Build the team list with improved styling"""
+        """Build the (virtualized) team list with improved styling"""
         # Create container for team list
         list_container = ctk.CTkFrame(self, fg_color="transparent")
         list_container.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        # Create scrollable frame with modern styling
-        self.scrollable_frame = ctk.CTkScrollableFrame(
-            list_container, 
+        # Only the rows on screen exist as widgets; filtering/scrolling rebinds them
+        self.team_list = VirtualTeamList(
+            list_container,
+            on_activate=self._open_edit_popup,
             corner_radius=15,
             fg_color=("gray95", "gray25"),
             border_width=1,
             border_color=("gray80", "gray30")
         )
-        self.scrollable_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        self.team_list.pack(fill="both", expand=True, padx=5, pady=5)
         
-        # Bind keyboard events to the scrollable frame
-        self.scrollable_frame.bind("<Key>", self._handle_keyboard)
-        self.scrollable_frame.bind("<Up>", self._handle_up)
-        self.scrollable_frame.bind("<Down>", self._handle_down)
-        self.scrollable_frame.bind("<Return>", self._handle_return)
-        self.scrollable_frame.bind("<Tab>", self._handle_tab)
+        # Keyboard navigation works on row indices, so bind at window level
+        # (handlers ignore keys while the search entry has focus)
+        self.bind("<Up>", lambda e: self._handle_nav(e, -1))
+        self.bind("<Down>", lambda e: self._handle_nav(e, 1))
+        self.bind("<Prior>", lambda e: self._handle_nav(e, -self.team_list.page_size(), wrap=False))
+        self.bind("<Next>", lambda e: self._handle_nav(e, self.team_list.page_size(), wrap=False))
+        self.bind("<Home>", lambda e: self._handle_nav(e, -len(self.visible_rows), wrap=False))
+        self.bind("<End>", lambda e: self._handle_nav(e, len(self.visible_rows), wrap=False))
+        self.bind("<Return>", self._handle_return)
+        self.bind("<Tab>", self._handle_tab)
         
-        # Make the scrollable frame focusable by binding focus events
-        self.scrollable_frame.bind("<Button-1>", lambda e: self.scrollable_frame.focus_set())
+        # Make the list focusable by clicking on it
+        self.team_list.bind("<Button-1>", lambda e: self.team_list.focus_set())
         
         # Teams will be loaded by _deferred_load_teams after UI is built
 
@@ -363,48 +473,16 @@ class TeamManagerWindow(ctk.CTkToplevel):
         # This method is kept for backward compatibility but now delegates to _deferred_load_teams
         self._deferred_load_teams()
 
-    def _handle_keyboard(self, event):
-        """Handle keyboard navigation"""
-        # Don't handle navigation if user is typing in search bar
-        if self.focus_get() == self.search_entry:
-            return
-            
-        if not self.visible_buttons:
-            return
-            
-        if event.keysym == "Up":
-            self._navigate_up()
-            return "break"
-        elif event.keysym == "Down":
-            self._navigate_down()
-            return "break"
-        elif event.keysym == "Return":
-            self._select_current()
-            return "break"
-        elif event.keysym == "Tab":
-            # Allow tab navigation between search and list
-            if self.focus_get() == self.search_entry:
-                self._focus_first_visible_button()
-            else:
-                self.search_entry.focus_set()
-
-    def _handle_up(self, event):
-        """Handle Up arrow key"""
-        if self.focus_get() != self.search_entry and self.visible_buttons:
-            self._navigate_up()
-            return "break"
-        return None
-
-    def _handle_down(self, event):
-        """Handle Down arrow key"""
-        if self.focus_get() != self.search_entry and self.visible_buttons:
-            self._navigate_down()
+    def _handle_nav(self, event, delta, wrap=True):
+        """Move the selection by `delta` rows (arrows wrap, page/home/end clamp)"""
+        if self.focus_get() != self.search_entry and self.visible_rows:
+            self.team_list.move_selection(delta, wrap=wrap)
             return "break"
         return None
 
     def _handle_return(self, event):
         """Handle Return key"""
-        if self.focus_get() != self.search_entry and self.visible_buttons:
+        if self.focus_get() != self.search_entry and self.visible_rows:
             self._select_current()
             return "break"
         return None
@@ -418,68 +496,17 @@ class TeamManagerWindow(ctk.CTkToplevel):
             self.search_entry.focus_set()
             return "break"
 
-    def _navigate_up(self):
-        """Navigate to previous team"""
-        if not self.visible_buttons:
-            return
-            
-        if self.selected_index <= 0:
-            # Wrap to last item
-            self.selected_index = len(self.visible_buttons) - 1
-        else:
-            self.selected_index -= 1
-            
-        self._update_selection()
-
-    def _navigate_down(self):
-        """Navigate to next team"""
-        if not self.visible_buttons:
-            return
-            
-        if self.selected_index >= len(self.visible_buttons) - 1:
-            # Wrap to first item
-            self.selected_index = 0
-        else:
-            self.selected_index += 1
-            
-        self._update_selection()
-
-    def _update_selection(self):
-        """Update visual selection of current team"""
-        if not self.visible_buttons or self.selected_index < 0:
-            return
-            
-        # Reset all button colors
-        for btn in self.visible_buttons:
-            btn.configure(
-                fg_color=("gray90", "gray30"),
-                border_color=("gray80", "gray40")
-            )
-        
-        # Highlight selected button
-        if 0 <= self.selected_index < len(self.visible_buttons):
-            selected_btn = self.visible_buttons[self.selected_index]
-            selected_btn.configure(
-                fg_color=("gray80", "gray40"),
-                border_color=("blue", "lightblue")
-            )
-
     def _select_current(self):
         """Select the currently highlighted team"""
-        if 0 <= self.selected_index < len(self.visible_buttons):
-            selected_btn = self.visible_buttons[self.selected_index]
-            # Extract team info from button text
-            text = selected_btn.cget("text")
-            if " — " in text:
-                name, abrev = text.split(" — ", 1)
-                self._open_edit_popup(name, abrev)
+        row = self.team_list.selected_row()
+        if row:
+            self._open_edit_popup(*row)
 
     def _focus_first_visible_button(self):
-        """Focus the first visible button for keyboard navigation"""
-        if self.visible_buttons:
-            self.scrollable_frame.focus_set()
-            self.selected_index = 0
-            self._update_selection()
+        """Focus the list and highlight its first row for keyboard navigation"""
+        self.team_list.focus_set()
+        if self.visible_rows:
+            self.team_list.select(0)
 
     def _open_edit_popup(self, name, abrev):
         """Open the edit popup for a team"""
@@ -493,15 +520,13 @@ class TeamManagerWindow(ctk.CTkToplevel):
 
     def _on_change(self):
         """Handle changes from edit popup"""
+        # Asynchronous: the current search is re-applied in _on_teams_loaded
         self._load_teams()
-        # Re-apply current search filter
-        if self.search_query:
-            self._filter_teams()
 
     def _show_loading_state(self):
         """Show a loading state while teams are being loaded"""
         loading_frame = ctk.CTkFrame(
-            self.scrollable_frame,
+            self.team_list.body,
             fg_color="transparent"
         )
         loading_frame.pack(expand=True, pady=50)
@@ -536,10 +561,18 @@ class TeamManagerWindow(ctk.CTkToplevel):
         self.loading_widget = loading_frame
 
     def _deferred_load_teams(self):
-        """Load teams after a brief delay to allow smooth UI rendering"""
+        """Load teams on the team pool; buttons are built back on the Tk thread"""
+        deliver(self.teams_async.load_teams(), self, self._on_teams_loaded, self._on_teams_load_failed)
+
+    def _on_teams_load_failed(self, e):
+        if hasattr(self, 'loading_widget') and self.loading_widget:
+            self.loading_widget.destroy()
+            self.loading_widget = None
+        self._show_error_state(f"Error loading teams: {str(e)}")
+
+    def _on_teams_loaded(self, teams):
         try:
-            # Load teams from database
-            self.all_teams = self.mongo.load_teams()
+            self.all_teams = teams
             
             # Remove loading state after a short delay
             self.after(25, lambda: self._remove_loading_state())  # Faster (was 50ms, now 25ms)
@@ -550,16 +583,15 @@ class TeamManagerWindow(ctk.CTkToplevel):
             # Update UI state
             self._is_loading = False
             
-            # Update search info
-            search_text = f"Showing all {len(self.visible_buttons)} teams"
-            self.search_info.configure(text=search_text)
+            # Re-apply the search still in the box (reload after an edit/import/restore)
+            if self.search_query:
+                self._filter_teams()
+            else:
+                self.search_info.configure(text=f"Showing all {len(self.visible_rows)} teams")
             
         except Exception as e:
             # Handle any loading errors gracefully
-            if hasattr(self, 'loading_widget') and self.loading_widget:
-                self.loading_widget.destroy()
-                self.loading_widget = None
-            self._show_error_state(f"Error loading teams: {str(e)}")
+            self._on_teams_load_failed(e)
 
     def _remove_loading_state(self):
         """Remove loading state with smooth transition"""
@@ -568,54 +600,27 @@ class TeamManagerWindow(ctk.CTkToplevel):
             self.loading_widget = None
 
     def _create_team_buttons(self):
-        """Create team buttons efficiently"""
-        # Clear existing buttons
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        self.team_buttons = []
-        self.visible_buttons = []
-        self.selected_index = -1
+        """Hand all teams to the virtual list (widget count does not depend on team count)"""
+        # Clear any state widgets (empty/error) from a previous load
+        for attr in ("empty_state_widget", "error_widget"):
+            widget = getattr(self, attr, None)
+            if widget:
+                widget.destroy()
+                setattr(self, attr, None)
+
+        self.search_engine.build(self.all_teams)
+        self.team_rows = list(self.all_teams.items())
+        self.visible_rows = list(self.team_rows)
+        self.team_list.set_rows(self.visible_rows)
         
         if not self.all_teams:
             # Show empty state
             self._show_empty_state()
-            return
-        
-        # Create all buttons first (without packing)
-        button_frames = []
-        for name, abrev in self.all_teams.items():
-            # Create team button with improved styling
-            btn = ctk.CTkButton(
-                self.scrollable_frame,
-                text=f"{name} — {abrev}",
-                anchor="w",
-                font=("Segoe UI", 13),
-                height=45,
-                corner_radius=10,
-                fg_color=("gray90", "gray30"),
-                hover_color=("gray85", "gray35"),
-                border_width=1,
-                border_color=("gray80", "gray40"),
-                command=lambda n=name, a=abrev: self._open_edit_popup(n, a)
-            )
-            self.team_buttons.append(btn)
-            self.visible_buttons.append(btn)
-            button_frames.append(btn)
-        
-        # Pack all buttons at once to prevent progressive rendering
-        for btn in button_frames:
-            btn.pack(fill="x", pady=2, padx=5)
-        
-        # Set initial selection
-        if self.visible_buttons:
-            self.selected_index = 0
-            self._update_selection()
 
     def _show_error_state(self, error_message):
         """Show error state when loading fails"""
         error_frame = ctk.CTkFrame(
-            self.scrollable_frame,
+            self.team_list.body,
             fg_color="transparent"
         )
         error_frame.pack(expand=True, pady=50)
@@ -664,6 +669,7 @@ class EditTeamPopup(ctk.CTkToplevel):
     def __init__(self, parent, mongo, original_name, original_abrev, on_done):
         super().__init__(parent)
         self.mongo = mongo
+        self.teams_async = async_team_manager(mongo)
         self.orig_name = original_name.strip().upper()
         self.orig_abrev = original_abrev.strip().upper()
         self.on_done = on_done
@@ -802,23 +808,42 @@ class EditTeamPopup(ctk.CTkToplevel):
             )
             return
 
-        # Save new team
-        self.mongo.save_team(new_name, new_abrev)
+        def work():
+            # Save new team, then delete the old one if renamed
+            similar = self.mongo.save_team(new_name, new_abrev) or []
+            if new_name != self.orig_name:
+                self.mongo.delete_team(self.orig_name)
+            return [n for n in similar if n != self.orig_name]
 
-        # Delete old team if renamed
-        if new_name != self.orig_name:
-            self.mongo.delete_team(self.orig_name)
+        def done(similar):
+            show_message_notification(
+                "✅ Team Updated",
+                f"Team '{new_name}' has been successfully updated.",
+                icon="✅",
+                bg_color=AppConfig.COLOR_SUCCESS
+            )
+            if similar:
+                show_message_notification(
+                    "⚠️ Possible Duplicate",
+                    f"'{new_name}' looks like: {', '.join(similar[:3])}",
+                    icon="⚠️",
+                    bg_color=AppConfig.COLOR_WARNING
+                )
+            self.destroy()
+            self.on_done()
 
+        self.configure(cursor="watch")
+        deliver(self.teams_async.submit(work), self, done, self._on_save_failed)
+
+    def _on_save_failed(self, e):
+        self.configure(cursor="")
         show_message_notification(
-            "✅ Team Updated",
-            f"Team '{new_name}' has been successfully updated.",
-            icon="✅",
-            bg_color=AppConfig.COLOR_SUCCESS
+            "❌ Save Failed",
+            f"Could not update the team: {e}",
+            icon="❌",
+            bg_color=AppConfig.COLOR_STOP
         )
 
-        self.destroy()
-        self.on_done()
-
     def _delete(self):
         """Delete team with confirmation"""
         # Create confirmation dialog using window utilities
@@ -918,13 +943,15 @@ class EditTeamPopup(ctk.CTkToplevel):
             return
 
         # Delete the team
-        self.mongo.delete_team(self.orig_name)
-        show_message_notification(
-            "❌ Team Deleted",
-            f"Team '{self.orig_name}' has been permanently removed.",
-            icon="❌",
-            bg_color=AppConfig.COLOR_STOP
-        )
-        
-        self.destroy()
-        self.on_done()
+        def done(_result):
+            show_message_notification(
+                "❌ Team Deleted",
+                f"Team '{self.orig_name}' has been permanently removed.",
+                icon="❌",
+                bg_color=AppConfig.COLOR_STOP
+            )
+            self.destroy()
+            self.on_done()
+
+        self.configure(cursor="watch")
+        deliver(self.teams_async.delete_team(self.orig_name), self, done, self._on_save_failed)
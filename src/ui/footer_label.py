@@ -485,11 +485,12 @@ def create_footer(parent, **kwargs):
         license_status_label.pack(side="left", expand=True, fill="x")  # Position on the left
         
         # License manager initialization
-        from src.licensing import LicenseManager
         from src.licensing import LicenseActivationDialog
         from src.licensing import show_license_details
+        from src.licensing.license_status import get_license_service
         
-        license_manager = LicenseManager()
+        license_service = get_license_service()
+        license_manager = license_service.manager
         
         # Create activate button early so it can be referenced
         activate_button = None
@@ -501,6 +502,7 @@ def create_footer(parent, **kwargs):
                     
                     def on_license_activated(license_data):
                         if license_manager.save_license(license_data):
+                            license_service.reload()
                             update_license_status()
                             try:
                                 from src.core.logger import get_logger
@@ -548,7 +550,7 @@ def create_footer(parent, **kwargs):
                 if not license_status_label.winfo_exists():
                     return  # Stop if widget was destroyed
                     
-                status, is_valid = license_manager.get_license_status()
+                status, is_valid = license_service.get_license_status()
                 
                 # Get display text and color
                 display_text = license_manager.get_status_display_text(status)
@@ -606,8 +608,9 @@ def create_footer(parent, **kwargs):
                     # Widget was destroyed, just return
                     return
         
-        # Initial license status check
+        # Initial license status check; later changes come from the background revalidation
         update_license_status()
+        license_service.subscribe(license_status_label, lambda _snap: update_license_status())
 
         # ----- Server metrics indicator (optional) -----
         try:
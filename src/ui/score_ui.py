@@ -213,7 +213,8 @@ class ScoreUI:
                 f"🔒Campo {self.instance}",
                 f"Lock : {not self.decrement_enabled}",
                 icon='🔒' if not self.decrement_enabled else '🔓',
-                bg_color=AppConfig.COLOR_SUCCESS if self.decrement_enabled else AppConfig.COLOR_ERROR
+                bg_color=AppConfig.COLOR_SUCCESS if self.decrement_enabled else AppConfig.COLOR_ERROR,
+                group=f"campo{self.instance}:lock",
             )
         
         # Delay notification to prevent interference with UI updates
@@ -241,7 +242,8 @@ class ScoreUI:
                 self._update_labels()
                 show_message_notification(
                     f"✅ Campo {self.instance}",
-                    f"Casa←{a} | Fora←{h}", icon='🔄', bg_color=AppConfig.COLOR_SUCCESS
+                    f"Casa←{a} | Fora←{h}", icon='🔄', bg_color=AppConfig.COLOR_SUCCESS,
+                    group=f"campo{self.instance}:score",
                 )
         except Exception as e:
             try:
@@ -0,0 +1,235 @@
+# team_list.py
+"""
+Virtualized team list for the Team Manager window.
+
+Only the rows that fit in the viewport (+2) exist as `CTkButton`s. Scrolling,
+filtering and keyboard navigation rebind those buttons to a slice of `rows`
+instead of creating, packing or recoloring one widget per team, so opening
+the window and filtering cost the same with 50 teams or 10 000.
+
+Benchmark (needs a display):
+    python -m src.ui.team_list --teams 10000 [--legacy]
+"""
+from typing import Callable, List, Optional, Tuple
+
+import customtkinter as ctk
+
+from .virtual_list import VirtualViewport
+
+TeamRow = Tuple[str, str]  # (name, abbreviation)
+
+ROW_HEIGHT = 49  # 45px button + 2px padding above and below
+_BUTTON_HEIGHT = 45
+_ROW_COLORS = {"fg_color": ("gray90", "gray30"), "border_color": ("gray80", "gray40")}
+_SELECTED_COLORS = {"fg_color": ("gray80", "gray40"), "border_color": ("blue", "lightblue")}
+
+
+class VirtualTeamList(ctk.CTkFrame):
+    def __init__(
+        self,
+        master,
+        on_activate: Callable[[str, str], None],
+        row_height: int = ROW_HEIGHT,
+        **kwargs,
+    ):
+        super().__init__(master, **kwargs)
+        self.on_activate = on_activate
+        self.rows: List[TeamRow] = []
+        self.selected_index = -1
+        self._view = VirtualViewport(row_height, 8)  # Real row count comes from <Configure>
+        self._pool: List[ctk.CTkButton] = []
+        self._slot_items: List[Optional[int]] = []  # pool slot -> row index
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 4), pady=8)
+        self.body = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self.body.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=8)
+
+        self.body.bind("<Configure>", self._on_resize)
+        self.body.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.scrollbar.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.bind("<MouseWheel>", self._on_mouse_wheel)
+        self._ensure_pool()
+
+    # ---------------- Data ----------------
+    def set_rows(self, rows: List[TeamRow]) -> None:
+        """Show `rows` (display order); selection goes to the first row."""
+        self.rows = rows
+        self._view.set_count(len(rows))
+        self.selected_index = 0 if rows else -1
+        self._render()
+
+    def selected_row(self) -> Optional[TeamRow]:
+        if 0 <= self.selected_index < len(self.rows):
+            return self.rows[self.selected_index]
+        return None
+
+    # ---------------- Selection ----------------
+    def select(self, index: int) -> None:
+        if not self.rows:
+            self.selected_index = -1
+            return
+        self.selected_index = max(0, min(index, len(self.rows) - 1))
+        self._view.ensure_visible(self.selected_index)
+        self._render()
+
+    def move_selection(self, delta: int, wrap: bool = True) -> None:
+        """Move by `delta` rows; single steps wrap around, page jumps clamp."""
+        if not self.rows:
+            return
+        target = self.selected_index + delta
+        if wrap:
+            target %= len(self.rows)
+        self.select(target)
+
+    def page_size(self) -> int:
+        return max(1, self._view.visible - 1)
+
+    # ---------------- Pool / rendering ----------------
+    def _ensure_pool(self) -> None:
+        while len(self._pool) < self._view.pool_size:
+            slot = len(self._pool)
+            btn = ctk.CTkButton(
+                self.body,
+                text="",
+                anchor="w",
+                font=("Segoe UI", 13),
+                height=_BUTTON_HEIGHT,
+                corner_radius=10,
+                hover_color=("gray85", "gray35"),
+                border_width=1,
+                command=lambda s=slot: self._activate_slot(s),
+                **_ROW_COLORS,
+            )
+            btn.bind("<MouseWheel>", self._on_mouse_wheel)
+            self._pool.append(btn)
+            self._slot_items.append(None)
+
+    def _render(self) -> None:
+        for slot, index, y in self._view.slots():
+            btn = self._pool[slot]
+            previous = self._slot_items[slot]
+            self._slot_items[slot] = index
+            if index is None:
+                if previous is not None:
+                    btn.place_forget()
+                continue
+            name, abrev = self.rows[index]
+            colors = _SELECTED_COLORS if index == self.selected_index else _ROW_COLORS
+            btn.configure(text=f"{name} — {abrev}", **colors)
+            btn.place(x=0, y=y + 2, relwidth=1.0, width=-5, height=_BUTTON_HEIGHT)
+        # Rows left over after the viewport shrank
+        for slot in range(self._view.pool_size, len(self._pool)):
+            if self._slot_items[slot] is not None:
+                self._slot_items[slot] = None
+                self._pool[slot].place_forget()
+        try:
+            self.scrollbar.set(*self._view.fractions())
+        except Exception:
+            pass
+
+    def _activate_slot(self, slot: int) -> None:
+        index = self._slot_items[slot]
+        if index is None or index >= len(self.rows):
+            return
+        self.selected_index = index
+        self._render()
+        self.on_activate(*self.rows[index])
+
+    # ---------------- Events ----------------
+    def _on_resize(self, event) -> None:
+        visible = max(1, event.height // self._view.row_height)
+        if visible == self._view.visible:
+            return
+        self._view.visible = visible
+        self._view.set_count(len(self.rows), keep_offset=True)
+        self._ensure_pool()
+        if self.selected_index >= 0:
+            self._view.ensure_visible(self.selected_index)
+        self._render()
+
+    def _on_scrollbar(self, *args) -> None:
+        if not args:
+            return
+        changed = False
+        if args[0] == "moveto":
+            changed = self._view.moveto(float(args[1]))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            changed = self._view.scroll_pages(amount) if args[2] == "pages" else self._view.scroll_rows(amount)
+        if changed:
+            self._render()
+
+    def _on_mouse_wheel(self, event):
+        rows = -int(event.delta / 120) if abs(event.delta) >= 120 else (-1 if event.delta > 0 else 1)
+        if self._view.scroll_rows(rows):
+            self._render()
+        return "break"
+
+
+# ---------------- Benchmark ----------------
+def _count_widgets(widget) -> int:
+    return sum(1 + _count_widgets(child) for child in widget.winfo_children())
+
+
+def run_benchmark(count: int = 10_000, legacy: bool = False) -> dict:
+    """Open a 500x600 window with `count` teams; time first paint and filtering."""
+    import time
+
+    from src.core.team_search import FuzzyTeamSearch, random_teams
+
+    teams = random_teams(count)
+    root = ctk.CTk()
+    root.geometry("500x600")
+    root.update()
+    try:
+        t0 = time.perf_counter()
+        engine = FuzzyTeamSearch()
+        engine.build(teams)
+        if legacy:
+            # Previous layout: one packed CTkButton per team in a CTkScrollableFrame
+            frame = ctk.CTkScrollableFrame(root)
+            frame.pack(fill="both", expand=True)
+            for name, abrev in teams.items():
+                ctk.CTkButton(frame, text=f"{name} — {abrev}", anchor="w", height=_BUTTON_HEIGHT).pack(
+                    fill="x", pady=2, padx=5
+                )
+        else:
+            team_list = VirtualTeamList(root, on_activate=lambda name, abrev: None)
+            team_list.pack(fill="both", expand=True)
+            team_list.set_rows(list(teams.items()))
+        root.update()
+        open_ms = (time.perf_counter() - t0) * 1000
+
+        filter_ms: List[float] = []
+        if not legacy:
+            typed = next(iter(teams))[:6]
+            for i in range(1, len(typed) + 1):
+                t = time.perf_counter()
+                team_list.set_rows([(name, teams[name]) for name in engine.search(typed[:i])])
+                root.update_idletasks()
+                filter_ms.append((time.perf_counter() - t) * 1000)
+        return {
+            "teams": count,
+            "layout": "legacy" if legacy else "virtual",
+            "open_ms": round(open_ms, 1),
+            "widgets": _count_widgets(root),
+            "max_filter_ms": round(max(filter_ms), 2) if filter_ms else None,
+        }
+    finally:
+        root.destroy()
+
+
+def main() -> None:
+    import argparse
+    import json
+
+    ap = argparse.ArgumentParser(description="Team Manager list opening-time benchmark")
+    ap.add_argument("--teams", type=int, default=10_000)
+    ap.add_argument("--legacy", action="store_true", help="measure the one-button-per-team layout instead")
+    args = ap.parse_args()
+    print(json.dumps(run_benchmark(args.teams, args.legacy), indent=2))
+
+
+if __name__ == "__main__":
+    main()
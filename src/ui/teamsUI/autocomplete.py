@@ -1,6 +1,13 @@
 import customtkinter as ctk
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from ...utils import create_popup_dialog
+from ..virtual_list import VirtualViewport
+
+ROW_HEIGHT = 28
+ROW_COLOR = "#333333"
+ROW_HOVER_COLOR = "#444444"
+ROW_SELECTED_COLOR = "#555555"
+
 
 class Autocomplete(ctk.CTkFrame):
     def __init__(
@@ -11,9 +18,12 @@ class Autocomplete(ctk.CTkFrame):
         placeholder: str = "",
         max_visible: int = 6,
         debounce_ms: int = 120,
+        search: Optional[Callable[[str], Optional[Sequence[Tuple[str, Any]]]]] = None,
     ):
         super().__init__(parent, fg_color="transparent")
         self.fetch_suggestions = fetch_suggestions
+        # Indexed lookup (label, value) pairs; None result -> fall back to scanning fetch_suggestions()
+        self.search = search
         self.selection_callback = selection_callback
         self.max_visible = max_visible
         self.debounce_ms = debounce_ms
@@ -21,34 +31,48 @@ class Autocomplete(ctk.CTkFrame):
         self.entry = ctk.CTkEntry(self, placeholder_text=placeholder)
         self.entry.pack(fill="x")
 
-        # Popup + state
+        # Popup + state. The popup and its rows are built once and recycled:
+        # `max_visible + 2` labels are rebound to whatever slice of `matches`
+        # is scrolled into view, however many teams match.
         self.popup: Optional[ctk.CTkToplevel] = None
-        self.container: Optional[ctk.CTkScrollableFrame] = None
-        self.items: List[ctk.CTkLabel] = []
+        self.viewport: Optional[ctk.CTkFrame] = None
+        self.scrollbar: Optional[ctk.CTkScrollbar] = None
+        self.rows: List[ctk.CTkLabel] = []
+        self._row_items: List[Optional[int]] = []  # pool slot -> match index
+        self._view = VirtualViewport(ROW_HEIGHT, max_visible)
+        self._hover_slot: Optional[int] = None
+        self._popup_visible = False
+        self._pointer_in_popup = False
         self.matches: List[str] = []
+        self._match_values: Dict[str, Any] = {}
         self._debounce_job: Optional[str] = None
+        self._close_job: Optional[str] = None
         self._selected_index: int = -1
         self._last_text: str = ""  # for restore when empty
         self._binding_tag = f"autocomplete_{id(self)}"  # Unique binding tag
-        self._monitoring = False  # Track if we're monitoring the popup
-        self._click_binding_id: Optional[str] = None  # track root click binding id
+        self._toplevel_binding: Optional[Tuple[Any, str]] = None  # (toplevel, funcid) for <Configure>
 
         # Bindings
         self.entry.bind("<KeyRelease>", self._on_key)
         self.entry.bind("<Down>", self._nav_down)
         self.entry.bind("<Up>", self._nav_up)
+        self.entry.bind("<Prior>", lambda e: self._nav_page(-1))
+        self.entry.bind("<Next>", lambda e: self._nav_page(1))
         self.entry.bind("<Return>", self._nav_enter)
         self.entry.bind("<Escape>", self._restore_last_immediately)
         self.entry.bind("<FocusIn>", self._on_focus_in)
+        # Popup lifetime is event driven: focus leaving the entry, the window moving, teardown
+        self.entry.bind("<FocusOut>", self._on_entry_focus_out, add=True)
+        self.bind("<Destroy>", self._on_destroy, add=True)
         # Ensure popup opens on mouse click inside the entry (even without key press)
         self.entry.bind("<Button-1>", self._on_entry_click, add=True)
 
     # ---------------- Events / Debounce ----------------
     def _on_key(self, event: Any):
         # Ignore nav keys here (handled separately)
-        if event.keysym in ("Up", "Down", "Return", "Escape"):
+        if event.keysym in ("Up", "Down", "Prior", "Next", "Return", "Escape"):
             return
-        
+
         # Clear matches if text is completely cleared
         current_text = (self.entry.get() or "").strip()
         if not current_text:
@@ -56,7 +80,7 @@ class Autocomplete(ctk.CTkFrame):
             self._selected_index = -1
             self._hide_popup()
             return
-            
+
         if self._debounce_job:
             self.after_cancel(self._debounce_job)
         self._debounce_job = self.after(self.debounce_ms, self._query_and_show)
@@ -68,25 +92,33 @@ class Autocomplete(ctk.CTkFrame):
             self._hide_popup()
             return
 
-        # Always fetch fresh data to ensure consistency
         try:
-            data = self.fetch_suggestions() or {}
+            pairs = self.search(q) if self.search is not None else None
+            if pairs is None:
+                # No index: scan the whole mapping
+                data = self.fetch_suggestions() or {}
+                qcf = q.casefold()
+                pairs = [(lbl, val) for lbl, val in data.items() if qcf in lbl.casefold()]
         except Exception:
             return
 
-        qcf = q.casefold()
-        labels = list(data.keys())
-        self.matches = [lbl for lbl in labels if qcf in lbl.casefold()]
+        self.matches = [lbl for lbl, _ in pairs]
+        self._match_values = dict(pairs)
 
         if not self.matches:
             self._hide_popup()
             return
 
         self._selected_index = -1
+        self._view.set_count(len(self.matches))
         try:
             popup = self._ensure_popup()
             self._position_popup(popup)
-            self._populate_popup(data)
+            self._render_rows()
+            if not self._popup_visible:
+                popup.deiconify()
+                popup.lift()
+                self._popup_visible = True
         except Exception:
             pass
 
@@ -99,85 +131,74 @@ class Autocomplete(ctk.CTkFrame):
                     return popup
             except Exception:
                 pass
-        
+
         # Create popup with custom configuration to allow proper focus handling
-        try:
-            parent_win = self.winfo_toplevel()
-            # At runtime this is a CTk/CTkToplevel; cast to satisfy type checker
-            from typing import cast
-            import customtkinter as _ctk
-            # Prefer CTkToplevel parent when possible; fall back to root cast
-            parent_ctk = parent_win if isinstance(parent_win, (_ctk.CTk, _ctk.CTkToplevel)) else _ctk.CTk()
-            popup = create_popup_dialog(
-                cast(_ctk.CTk, parent_ctk),
-                "Autocomplete", 
-                200, 
-                150,
-                config={
-                    "grab_set": False,
-                    "transient": True,
-                    "overrideredirect": True,
-                    "topmost": True
-                }
+        parent_win = self.winfo_toplevel()
+        # At runtime this is a CTk/CTkToplevel; cast to satisfy type checker
+        from typing import cast
+        import customtkinter as _ctk
+        # Prefer CTkToplevel parent when possible; fall back to root cast
+        parent_ctk = parent_win if isinstance(parent_win, (_ctk.CTk, _ctk.CTkToplevel)) else _ctk.CTk()
+        popup = create_popup_dialog(
+            cast(_ctk.CTk, parent_ctk),
+            "Autocomplete",
+            200,
+            150,
+            config={
+                "grab_set": False,
+                "transient": True,
+                "overrideredirect": True,
+                "topmost": True
+            }
+        )
+        popup.withdraw()
+        self.popup = popup
+        self._popup_visible = False
+
+        frame = ctk.CTkFrame(popup, corner_radius=6)
+        frame.pack(fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(frame, command=self._on_scrollbar, width=12)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 2), pady=2)
+        viewport = ctk.CTkFrame(frame, fg_color="transparent", corner_radius=0, height=self._view.view_height)
+        viewport.pack(side="left", fill="both", expand=True)
+        self.viewport = viewport
+
+        # Fixed row pool, bound once; handlers resolve the slot to a match at event time
+        self.rows = []
+        self._row_items = [None] * self._view.pool_size
+        for slot in range(self._view.pool_size):
+            row = ctk.CTkLabel(
+                viewport,
+                text="",
+                anchor="w",
+                justify="left",
+                fg_color=ROW_COLOR,
+                corner_radius=0,
+                height=ROW_HEIGHT - 2,
             )
-            self.popup = popup
-
-            self.container = ctk.CTkScrollableFrame(popup, corner_radius=6)
-            self.container.pack(fill="both", expand=True)
-
-            # Bind popup-specific events for better click outside detection
-            # NOTE: Do not bind <FocusOut> on popup; it fires immediately because
-            # the toplevel never gains focus when created via click, causing the
-            # suggestions window to close instantaneously. Entry focus tracking
-            # is sufficient for auto-closing behaviour.
-            popup.bind("<Button-1>", self._on_popup_click)
-            
-            # Bind to the main window for click outside detection
-            try:
-                # No root-level click binding anymore; nothing to clean
-                pass
-            except Exception:
-                pass
-            
-            # Background monitor disabled – focus-out logic already handles closure
-            
-            return popup
-        except Exception as e:
-            raise
-
-    def _start_popup_monitor(self) -> None:
-        """Start monitoring the popup to detect when it should be closed"""
-        if self._monitoring:
-            return  # Already monitoring
-        
-        self._monitoring = True
-        
-        def check_popup():
-            if not self._monitoring:
-                return  # Stop monitoring
-            
-            try:
-                if self.popup and hasattr(self.popup, 'winfo_exists') and self.popup.winfo_exists():
-                    # Check if the entry still has focus
-                    if hasattr(self.entry, 'focus_get') and self.entry.focus_get() != self.entry:
-                        # Entry lost focus, close popup
-                        self._hide_popup()
-                    else:
-                        # Continue monitoring
-                        self.after(100, check_popup)
-                else:
-                    # Popup closed, stop monitoring
-                    self._monitoring = False
-            except Exception:
-                # If there's any error, stop monitoring and clean up
-                self._monitoring = False
-                try:
-                    self._hide_popup()
-                except Exception:
-                    pass
-        
-        # Start the monitoring
-        self.after(100, check_popup)
+            row.bind("<ButtonRelease-1>", lambda e, s=slot: self._on_row_clicked(s))
+            row.bind("<Enter>", lambda e, s=slot: self._on_row_hover(s))
+            row.bind("<Leave>", lambda e, s=slot: self._on_row_hover(None))
+            row.bind("<MouseWheel>", self._on_mouse_wheel)
+            self.rows.append(row)
+
+        # NOTE: Do not bind <FocusOut> on popup; it fires immediately because
+        # the toplevel never gains focus when created via click, causing the
+        # suggestions window to close instantaneously. Entry focus tracking
+        # (plus the pointer-in-popup flag) is sufficient for auto-closing.
+        popup.bind("<Button-1>", self._on_popup_click)
+        popup.bind("<Enter>", lambda e: self._set_pointer_in_popup(True))
+        popup.bind("<Leave>", lambda e: self._set_pointer_in_popup(False))
+        viewport.bind("<MouseWheel>", self._on_mouse_wheel)
+
+        # Follow the owning window when it moves/resizes
+        try:
+            top = self.winfo_toplevel()
+            funcid = top.bind("<Configure>", self._on_toplevel_configure, add="+")
+            self._toplevel_binding = (top, funcid)
+        except Exception:
+            self._toplevel_binding = None
+        return popup
 
     def _position_popup(self, popup: ctk.CTkToplevel) -> None:
         try:
@@ -185,82 +206,138 @@ class Autocomplete(ctk.CTkFrame):
             x = self.entry.winfo_rootx()
             y = self.entry.winfo_rooty() + self.entry.winfo_height()
             width = self.entry.winfo_width()
-            item_h = 30
             visible = min(len(self.matches), self.max_visible) or 1
-            height = max(1, visible) * item_h
+            height = visible * ROW_HEIGHT + 4
             popup.geometry(f"{width}x{height}+{x}+{y}")
         except Exception:
             pass
 
-    def _populate_popup(self, data: Dict[str, Any]) -> None:
-        container = self.container
-        if container is None:
+    def _render_rows(self) -> None:
+        """Rebind the pooled rows to the visible slice of matches."""
+        if not self.rows:
             return
-        # Clear previous
-        for it in self.items:
+        for slot, index, y in self._view.slots():
+            row = self.rows[slot]
+            self._row_items[slot] = index
+            if index is None:
+                row.place_forget()
+                continue
+            if index == self._selected_index:
+                color = ROW_SELECTED_COLOR
+            elif slot == self._hover_slot:
+                color = ROW_HOVER_COLOR
+            else:
+                color = ROW_COLOR
             try:
-                it.destroy()
+                row.configure(text=self.matches[index], fg_color=color)
+                row.place(x=8, y=y + 1, relwidth=1.0, width=-10, height=ROW_HEIGHT - 2)
             except Exception:
                 pass
-        self.items.clear()
-
-        # 🚀 Build ALL items (scroll shows the rest)
-        for label in self.matches:
+        if self.scrollbar is not None:
             try:
-                value = data[label]
-                item = ctk.CTkLabel(
-                    container,
-                    text=label,
-                    anchor="w",
-                    justify="left",
-                    fg_color="#333333",
-                    corner_radius=0,
-                    height=26,
-                )
-                item.pack(fill="x", padx=(8, 2), pady=1)
-                item.bind("<ButtonRelease-1>", lambda e, lbl=label, val=value: self._on_item_clicked(lbl, val))
-                item.bind("<Enter>",    lambda e, w=item: w.configure(fg_color="#444444"))
-                item.bind("<Leave>",    lambda e, w=item: w.configure(fg_color="#333333"))
-                self.items.append(item)
+                if self._view.max_offset:
+                    self.scrollbar.set(*self._view.fractions())
+                    self.scrollbar.pack(side="right", fill="y", padx=(0, 2), pady=2)
+                else:
+                    self.scrollbar.pack_forget()
             except Exception:
                 pass
 
-        self._highlight_selected()  # reset highlight
+    def _on_scrollbar(self, *args: Any) -> None:
+        if not args:
+            return
+        changed = False
+        if args[0] == "moveto":
+            changed = self._view.moveto(float(args[1]))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            changed = self._view.scroll_pages(amount) if args[2] == "pages" else self._view.scroll_rows(amount)
+        if changed:
+            self._render_rows()
+
+    def _on_mouse_wheel(self, event: Any):
+        step = -1 if getattr(event, "delta", 0) > 0 else 1
+        if self._view.scroll_rows(step):
+            self._render_rows()
+        return "break"
+
+    def _on_row_hover(self, slot: Optional[int]) -> None:
+        self._hover_slot = slot
+        self._render_rows()
+
+    def _on_row_clicked(self, slot: int):
+        """Handle click on a suggestion row and prevent event propagation."""
+        index = self._row_items[slot] if 0 <= slot < len(self._row_items) else None
+        if index is None or index >= len(self.matches):
+            return "break"
+        label = self.matches[index]
+        self._select(label, self._match_values.get(label))
+        return "break"
 
     def _hide_popup(self) -> None:
+        """Hide (not destroy) the popup; rows and bindings are reused next time."""
         popup = self.popup
-        if popup is not None:
+        if popup is not None and self._popup_visible:
             try:
-                # Check if the popup still exists and the application is still running
-                if hasattr(popup, 'winfo_exists') and popup.winfo_exists():
-                    # Unbind from main window
-                    try:
-                        # No root-level click binding anymore; nothing to clean
-                        pass
-                    except Exception:
-                        pass
-                    popup.destroy()
+                if popup.winfo_exists():
+                    popup.withdraw()
             except Exception:
-                # If there's any error, just clear the reference
-                pass
-        
-        self.popup = None
-        self.container = None
-        self.items.clear()
+                # If there's any error, just drop the reference
+                self.popup = None
+        self._popup_visible = False
+        self._pointer_in_popup = False
+        self._hover_slot = None
         # Clear matches when closing to prevent stale data
         self.matches.clear()
+        self._match_values = {}
+        self._view.set_count(0)
         self._selected_index = -1
-        self._monitoring = False  # ensure monitor stops when popup closed
 
-    def _on_popup_focus_out(self, event: Any):
-        """Handle when popup loses focus"""
-        # Small delay to allow click events to process first
-        self.after(100, self._check_if_should_close)
+    def _destroy_popup(self) -> None:
+        self._hide_popup()
+        binding = self._toplevel_binding
+        self._toplevel_binding = None
+        if binding is not None:
+            try:
+                binding[0].unbind("<Configure>", binding[1])
+            except Exception:
+                pass
+        popup = self.popup
+        self.popup = None
+        self.viewport = None
+        self.scrollbar = None
+        self.rows = []
+        self._row_items = []
+        if popup is not None:
+            try:
+                popup.destroy()
+            except Exception:
+                pass
+
+    def _set_pointer_in_popup(self, inside: bool) -> None:
+        self._pointer_in_popup = inside
+
+    def _on_toplevel_configure(self, _event: Any) -> None:
+        if self._popup_visible and self.popup is not None:
+            self._position_popup(self.popup)
+
+    def _on_destroy(self, event: Any) -> None:
+        if event.widget is self:
+            self._destroy_popup()
+
+    def _on_entry_focus_out(self, _event: Any) -> None:
+        """Close once the focus change settles, unless the pointer is over the popup."""
+        if self._close_job:
+            self.after_cancel(self._close_job)
+        self._close_job = self.after(100, self._check_if_should_close)
 
     def _on_focus_in(self, event: Any):
         """Handle when entry gains focus - show suggestions for existing text"""
+        if self._close_job:
+            self.after_cancel(self._close_job)
+            self._close_job = None
         current_text = (self.entry.get() or "").strip()
-        if current_text and not self.popup:
+        if current_text and not self._popup_visible:
             # There's text and no popup, show suggestions
             self.after(50, self._query_and_show)
 
@@ -269,7 +346,7 @@ class Autocomplete(ctk.CTkFrame):
         current_text = (self.entry.get() or "").strip()
         if current_text:
             # If popup already open, leave as is; otherwise trigger suggestions fast
-            if not self.popup:
+            if not self._popup_visible:
                 self.after(10, self._query_and_show)
         # allow normal click processing to continue
         return None
@@ -280,25 +357,18 @@ class Autocomplete(ctk.CTkFrame):
             if self._debounce_job:
                 self.after_cancel(self._debounce_job)
                 self._debounce_job = None
-            
-            # Stop monitoring
-            self._monitoring = False
-            
-            # Only try to hide popup if we're still in a valid state
-            if hasattr(self, 'popup') and self.popup is not None:
-                self._hide_popup()
-            
-            self.matches.clear()
-            self._selected_index = -1
+            if self._close_job:
+                self.after_cancel(self._close_job)
+                self._close_job = None
+            self._hide_popup()
             self._last_text = ""
         except Exception:
             # If cleanup fails, just clear the basic state
-            self._monitoring = False
             self._debounce_job = None
-            self.popup = None
-            self.container = None
-            self.items = []
+            self._close_job = None
+            self._popup_visible = False
             self.matches = []
+            self._match_values = {}
             self._selected_index = -1
             self._last_text = ""
 
@@ -307,11 +377,6 @@ class Autocomplete(ctk.CTkFrame):
         # Prevent the popup from closing when clicking inside it
         return "break"
 
-    def _on_main_window_click(self, event: Any):
-        """Handle clicks on the main window"""
-        # Deprecated: root click binding removed to avoid focus/grab conflicts.
-        pass
-
     def reset(self) -> None:
         """Reset the autocomplete to a clean state - useful when it breaks"""
         self._cleanup_state()
@@ -320,15 +385,17 @@ class Autocomplete(ctk.CTkFrame):
 
     def _check_if_should_close(self) -> None:
         """Check if popup should be closed based on focus"""
+        self._close_job = None
+        if not self._popup_visible or self._pointer_in_popup:
+            return
         try:
-            if self.popup and hasattr(self.popup, 'winfo_exists') and self.popup.winfo_exists():
-                # Check if the popup or any of its children still have focus
-                if hasattr(self.popup, 'focus_get'):
-                    focused_widget = self.popup.focus_get()
-                    if focused_widget is None or not self._is_descendant(focused_widget, self.popup):
-                        # Focus left the popup; if it's also not on the entry, close
-                        if hasattr(self.entry, 'focus_get') and self.entry.focus_get() != self.entry:
-                            self._hide_popup()
+            focused_widget = self.focus_get()
+            if focused_widget is None or not (
+                focused_widget == self.entry
+                or self._is_descendant(focused_widget, self.entry)
+                or self._is_descendant(focused_widget, self.popup)
+            ):
+                self._hide_popup()
         except Exception:
             # If there's any error, just close the popup to be safe
             try:
@@ -348,41 +415,10 @@ class Autocomplete(ctk.CTkFrame):
 
     # ---------------- Selection / Navigation ----------------
     def _scroll_selected_into_view(self) -> None:
-        """Ensure the highlighted item is visible inside the scrollable frame."""
-        cont = self.container
-        if cont is None or not self.items or self._selected_index < 0:
-            return
-        # item geometry (relative to the inner frame)
-        item = self.items[self._selected_index]
-        try:
-            canvas = cont._parent_canvas  # customtkinter internal canvas
-        except Exception:
-            return
-
-        canvas.update_idletasks()
-
-        item_y = item.winfo_y()
-        item_h = item.winfo_height()
-
-        top = canvas.canvasy(0)                  # current top of visible area (in inner-frame coords)
-        view_h = canvas.winfo_height()
-        bottom = top + view_h
-
-        # compute the target top we want after scroll
-        if item_y < top:
-            target_top = item_y
-        elif item_y + item_h > bottom:
-            target_top = item_y + item_h - view_h
-        else:
-            return  # already fully visible
-
-        # clamp fraction to [0,1] based on scrollregion height
-        bbox = canvas.bbox("all")
-        if not bbox:
-            return
-        total_h = max(1, bbox[3] - bbox[1])
-        frac = max(0.0, min(1.0, target_top / total_h))
-        canvas.yview_moveto(frac)
+        """Ensure the highlighted match is inside the viewport, then repaint the rows."""
+        if self._selected_index >= 0:
+            self._view.ensure_visible(self._selected_index)
+        self._render_rows()
 
     def _select(self, label: str, value: Any) -> None:
         self.entry.delete(0, "end")
@@ -410,37 +446,42 @@ class Autocomplete(ctk.CTkFrame):
         return "break"
 
     def _nav_down(self, _e: Any):
-        if not self.items:
+        if not self.matches:
             return "break"
-        self._selected_index = (self._selected_index + 1) % len(self.items)
+        self._selected_index = (self._selected_index + 1) % len(self.matches)
         self._highlight_selected()
-        self._scroll_selected_into_view()
         return "break"
 
     def _nav_up(self, _e: Any):
-        if not self.items:
+        if not self.matches:
             return "break"
-        self._selected_index = (self._selected_index - 1) % len(self.items)
+        self._selected_index = (self._selected_index - 1) % len(self.matches)
+        self._highlight_selected()
+        return "break"
+
+    def _nav_page(self, direction: int):
+        if not self.matches:
+            return "break"
+        step = max(1, self.max_visible - 1) * direction
+        current = self._selected_index if self._selected_index >= 0 else 0
+        self._selected_index = max(0, min(len(self.matches) - 1, current + step))
         self._highlight_selected()
-        self._scroll_selected_into_view()
         return "break"
 
     def _nav_enter(self, _e: Any):
-        if not self.items:
+        if not self.matches:
             return "break"
         idx = self._selected_index if self._selected_index >= 0 else 0
-        label = self.items[idx].cget("text")
-        data = self.fetch_suggestions() or {}
-        self._select(label, data.get(label))
+        label = self.matches[idx]
+        if label in self._match_values:
+            self._select(label, self._match_values[label])
+        else:
+            data = self.fetch_suggestions() or {}
+            self._select(label, data.get(label))
         return "break"
 
     def _highlight_selected(self):
-        for i, item in enumerate(self.items):
-            try:
-                item.configure(fg_color="#555555" if i == self._selected_index else "#333333")
-            except Exception:
-                pass
-        # keep the highlighted one visible
+        # keep the highlighted one visible (re-renders the pooled rows)
         self._scroll_selected_into_view()
 
     # ---------------- API ----------------
@@ -451,24 +492,19 @@ class Autocomplete(ctk.CTkFrame):
         self.entry.delete(0, "end")
         self.entry.insert(0, text or "")
         self._last_text = text or ""
-        
+
     def show_suggestions(self):
         """Manually trigger showing suggestions for current text"""
         if self.entry.get().strip():
             self._query_and_show()
-            
+
     def force_refresh(self):
         """Force refresh suggestions - useful when autocomplete seems broken"""
         self._cleanup_state()
         current_text = self.entry.get().strip()
         if current_text:
             self.after(100, self._query_and_show)
-            
+
     def clear_state(self):
         """Clear the current autocomplete state"""
         self._cleanup_state()
-
-    def _on_item_clicked(self, label: str, value: Any):
-        """Handle click on a suggestion item and prevent event propagation."""
-        self._select(label, value)
-        return "break"
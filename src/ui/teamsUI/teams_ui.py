@@ -1,7 +1,8 @@
 import customtkinter as ctk
 from typing import Dict, Any, Callable
 from src.notification import show_message_notification
-from src.core import load_teams_from_json, save_teams_to_json, GameInfoStore, MongoTeamManager, DEFAULT_FIELD_STATE
+from src.core import load_teams_from_json, GameInfoStore, DEFAULT_FIELD_STATE, get_team_manager
+from src.core.team_async import async_team_manager, deliver
 from .autocomplete import Autocomplete
 # Removed TeamManagerWindow import after Edit button deletion
 from src.config.settings import AppConfig
@@ -15,56 +16,86 @@ BUTTON_PAD = dict(padx=5, pady=5)
 
 log = get_logger(__name__)
 
-def append_team_to_mongo(name: str, abrev: str, instance: int):
-    """Helper function to append team to MongoDB with validation"""
+def append_team_to_mongo(name: str, abrev: str, instance: int, mongo=None, widget=None):
+    """Helper function to append team to MongoDB with validation.
+
+    With a Tk `widget`, the lookups and the write run on the team pool and the
+    dialogs/notifications come back on the Tk thread; without one it blocks (scripts).
+    """
     name = name.strip().upper()
     abrev = abrev.strip().upper()
     
     if not name or not abrev:
         return  # Skip empty entries
     
-    mongo = MongoTeamManager()
-    
-    current_abrev = mongo.get_abbreviation(name)
-    
-    if current_abrev:
-        if current_abrev != abrev:
-            # Same name, different abbrev — Ask to update
-            root = ctk.CTk()
-            root.withdraw()
-            result = messagebox.askyesno(
-                title=f"Campo {instance} - Equipa já existe",
-                message=(
-                    f"A equipa '{name}' já existe com a sigla '{current_abrev}'.\n\n"
-                    f"Deseja atualizar para '{abrev}'?"
-                )
-            )
-            root.destroy()
-            if result:
-                try:
-                    mongo.save_team(name, abrev)
-                    show_message_notification(f"✅Campo {instance} - Atualizado", f"Equipa '{name}' atualizada para '{abrev}'.", bg_color=AppConfig.COLOR_SUCCESS)
-                except Exception as e:
-                    messagebox.showerror("Erro", f"Erro ao atualizar equipa: {e}")
-            else:
-                show_message_notification(f"❌ Campo {instance} - Cancelado", f"A sigla de '{name}' não foi alterada.", bg_color=AppConfig.COLOR_WARNING)
-            return
+    if mongo is None:
+        mongo = get_team_manager()
+
+    def lookup():
+        return mongo.get_abbreviation(name), mongo.load_teams()
+
+    def save(title: str, message: str, duration: int = 5000):
+        def ok(similar=None):
+            show_message_notification(title, message, duration=duration, bg_color=AppConfig.COLOR_SUCCESS)
+            if similar:
+                show_message_notification(f"⚠️ Campo {instance} - Possível duplicado", f"'{name}' é semelhante a: {', '.join(similar[:3])}", bg_color=AppConfig.COLOR_WARNING)
+
+        def failed(e):
+            messagebox.showerror("Erro", f"Erro ao guardar equipa na base de dados: {e}")
+
+        if widget is None:
+            try:
+                similar = mongo.save_team(name, abrev)
+            except Exception as e:
+                failed(e)
+                return
+            ok(similar)
         else:
+            deliver(async_team_manager(mongo).save_team(name, abrev), widget, ok, failed)
+
+    def resolve(found):
+        current_abrev, all_teams = found
+        if current_abrev:
+            if current_abrev != abrev:
+                # Same name, different abbrev — Ask to update
+                root = None
+                if widget is None:
+                    root = ctk.CTk()
+                    root.withdraw()
+                result = messagebox.askyesno(
+                    title=f"Campo {instance} - Equipa já existe",
+                    message=(
+                        f"A equipa '{name}' já existe com a sigla '{current_abrev}'.\n\n"
+                        f"Deseja atualizar para '{abrev}'?"
+                    ),
+                    parent=widget or root,
+                )
+                if root is not None:
+                    root.destroy()
+                if result:
+                    save(f"✅Campo {instance} - Atualizado", f"Equipa '{name}' atualizada para '{abrev}'.")
+                else:
+                    show_message_notification(f"❌ Campo {instance} - Cancelado", f"A sigla de '{name}' não foi alterada.", bg_color=AppConfig.COLOR_WARNING)
             return
 
-    # Check if abbreviation is already used by another team (informative, not blocking)
-    all_teams = mongo.load_teams()
-    for other_name, other_abrev in all_teams.items():
-        if other_name != name and other_abrev == abrev:
-            show_message_notification(f"⚠️ Campo {instance} - Reutilização", f"A abreviação '{abrev}' já está em uso por '{other_name}', mas será reutilizada.", bg_color=AppConfig.COLOR_WARNING)
-            break  # Just log, don't stop
+        # Check if abbreviation is already used by another team (informative, not blocking)
+        for other_name, other_abrev in all_teams.items():
+            if other_name != name and other_abrev == abrev:
+                show_message_notification(f"⚠️ Campo {instance} - Reutilização", f"A abreviação '{abrev}' já está em uso por '{other_name}', mas será reutilizada.", bg_color=AppConfig.COLOR_WARNING)
+                break  # Just log, don't stop
+
+        # Save new team
+        save(f"✅ Campo {instance} - Gravado", f"Equipa '{name}' gravada com sucesso.", duration=1500)
+
+    if widget is None:
+        resolve(lookup())
+        return
+
+    def lookup_failed(e):
+        log.warning("team_lookup_failed", extra={"team": name}, exc_info=(type(e), e, e.__traceback__))
+        show_message_notification(f"❌ Campo {instance} - Erro", f"Não foi possível verificar a equipa '{name}'.", bg_color=AppConfig.COLOR_STOP)
 
-    # Save new team
-    try:
-        mongo.save_team(name, abrev)
-        show_message_notification(f"✅ Campo {instance} - Gravado", f"Equipa '{name}' gravada com sucesso.", duration=1500, bg_color=AppConfig.COLOR_SUCCESS)
-    except Exception as e:
-        messagebox.showerror("Erro", f"Erro ao guardar equipa na base de dados: {e}")
+    deliver(async_team_manager(mongo).submit(lookup), widget, resolve, lookup_failed)
 
 
 class TeamInputManager(ctk.CTkFrame):
@@ -142,10 +173,10 @@ class TeamInputManager(ctk.CTkFrame):
         # Fallback to JSON file
         teams = load_teams_from_json()
         if teams is False or not teams:
-            # Last resort: load from Mongo and backup to JSON
+            # Last resort: load from Mongo and back up to JSON (in the background)
             teams = self.mongo.load_teams()
             try:
-                save_teams_to_json(teams)
+                self.mongo.schedule_backup()
             except Exception:
                 pass
         
@@ -153,6 +184,17 @@ class TeamInputManager(ctk.CTkFrame):
         self._teams_cache = {str(k).upper(): str(v).upper() for k, v in (teams or {}).items()}
         return self._teams_cache
 
+    def _search_teams(self, query: str):
+        """Indexed suggestions for every keystroke; never waits on the broker or Mongo."""
+        suggest = getattr(self.mongo, "suggest_teams", None)
+        pairs = suggest(query, AppConfig.AUTOCOMPLETE_MAX_RESULTS) if suggest is not None else None
+        if pairs is not None:
+            return pairs
+        # Index still loading: answer from the teams.json preload (possibly empty for now)
+        q = query.casefold()
+        teams = self._teams_cache
+        return [(n, a) for n, a in teams.items() if q in n.casefold()][:AppConfig.AUTOCOMPLETE_MAX_RESULTS]
+
     def _preload_teams_json(self):
         """Preload teams JSON in background for faster autocomplete"""
         import threading
@@ -190,6 +232,7 @@ class TeamInputManager(ctk.CTkFrame):
         self.home_name_entry = Autocomplete(
             container,
             fetch_suggestions=self._fetch_teams_cached,
+            search=self._search_teams,
             selection_callback=self._on_home_selected,
             placeholder="ex: SPORTING",
         )
@@ -204,6 +247,7 @@ class TeamInputManager(ctk.CTkFrame):
         self.away_name_entry = Autocomplete(
             container,
             fetch_suggestions=self._fetch_teams_cached,
+            search=self._search_teams,
             selection_callback=self._on_away_selected,
             placeholder="ex: PORTO",
         )
@@ -240,8 +284,8 @@ class TeamInputManager(ctk.CTkFrame):
         away_abrev = (self.away_abbrev_entry.get() or "").strip().upper()
 
         # Save into Mongo registry (idempotent)
-        append_team_to_mongo(home_name, home_abrev, self.instance_number)
-        append_team_to_mongo(away_name, away_abrev, self.instance_number)
+        append_team_to_mongo(home_name, home_abrev, self.instance_number, self.mongo, self)
+        append_team_to_mongo(away_name, away_abrev, self.instance_number, self.mongo, self)
 
         if not all([home_name, home_abrev, away_name, away_abrev]):
             show_message_notification(
@@ -270,19 +314,6 @@ class TeamInputManager(ctk.CTkFrame):
         if away_name and away_abrev:
             self._teams_cache[away_name] = away_abrev
 
-        # Also persist to local JSON backup (teams.json) so the file reflects latest entries
-        try:
-            existing = load_teams_from_json()
-            mapping: Dict[str, str] = existing if isinstance(existing, dict) else {}
-            if home_name and home_abrev:
-                mapping[home_name] = home_abrev
-            if away_name and away_abrev:
-                mapping[away_name] = away_abrev
-            if mapping:
-                save_teams_to_json(mapping)
-        except Exception:
-            pass
-
         # Let the caller refresh overlay labels, etc. (immediate)
         try:
             self.refresh_labels()
@@ -297,5 +328,6 @@ class TeamInputManager(ctk.CTkFrame):
             f"✅ Campo {self.instance_number} - Gravado",
             "Informações da equipa foram guardadas",
             icon="✅",
-            bg_color=AppConfig.COLOR_SUCCESS
+            bg_color=AppConfig.COLOR_SUCCESS,
+            group=f"campo{self.instance_number}:teams",
         )
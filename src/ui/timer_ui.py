@@ -181,6 +181,7 @@ class TimerComponent(ctk.CTkFrame):
             f"Metade definida: {part}",
             icon="✅",
             bg_color=AppConfig.COLOR_SUCCESS,
+            group=f"campo{self.instance_number}:timer",
         )
 
     # ---------- UI ----------
@@ -421,6 +422,7 @@ class TimerComponent(ctk.CTkFrame):
             "Tempos guardados.",
             icon="💾",
             bg_color=AppConfig.COLOR_SUCCESS,
+            group=f"campo{self.instance_number}:timer",
         )
 
     # ---------- Run loop ----------
@@ -452,6 +454,7 @@ class TimerComponent(ctk.CTkFrame):
             "Cronómetro iniciado.",
             icon="⏳",
             bg_color=AppConfig.COLOR_INFO,
+            group=f"campo{self.instance_number}:timer",
         )
 
     def _tick(self):
@@ -513,6 +516,7 @@ class TimerComponent(ctk.CTkFrame):
             "Cronómetro pausado.",
             icon="⏸",
             bg_color=AppConfig.COLOR_PAUSE,
+            group=f"campo{self.instance_number}:timer",
         )
 
     def reset_timer(self):
@@ -534,6 +538,7 @@ class TimerComponent(ctk.CTkFrame):
             "Cronómetro parado.",
             icon="🛑",
             bg_color=AppConfig.COLOR_STOP,
+            group=f"campo{self.instance_number}:timer",
         )
         
     def _cleanup_timer(self):
@@ -1,14 +1,14 @@
 import customtkinter as ctk
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Union
 from customtkinter import CTkFrame, CTkButton, CTkLabel, CTkToplevel
 
 from src.ui import get_icon
 from src.core import GameInfoStore
-from src.core import MongoTeamManager
+from src.core import MongoTeamManager, RemoteTeamManager
 from src.core.logger import get_logger
 
 class TopWidget:
-    def __init__(self, parent, instance_number: int, mongo: MongoTeamManager, json: GameInfoStore):
+    def __init__(self, parent, instance_number: int, mongo: Union[MongoTeamManager, RemoteTeamManager], json: GameInfoStore):
         """
         Widget launcher for opening a borderless, draggable TimerComponent window.
 
@@ -0,0 +1,101 @@
+# virtual_list.py
+"""
+Viewport math for virtualized (recycled-row) lists.
+
+A list of `count` fixed-height rows is shown through a window of
+`view_height` pixels using a constant pool of `visible + 2` row widgets: one
+extra row for the partially visible row at the top and one at the bottom
+while scrolling by pixels. Widgets stay the same; only their text and their
+`y` position change. This module holds the Tk-free part (scroll clamping, which
+item each pooled row shows, keeping a selection in view) so it can be tested
+without a display.
+"""
+from typing import List, Optional, Tuple
+
+
+class VirtualViewport:
+    def __init__(self, row_height: int, visible: int):
+        self.row_height = max(1, int(row_height))
+        self.visible = max(1, int(visible))
+        self.count = 0
+        self.offset = 0  # Scroll position in pixels
+
+    # ---------------- Geometry ----------------
+    @property
+    def pool_size(self) -> int:
+        return self.visible + 2
+
+    @property
+    def view_height(self) -> int:
+        return self.visible * self.row_height
+
+    @property
+    def content_height(self) -> int:
+        return self.count * self.row_height
+
+    @property
+    def max_offset(self) -> int:
+        return max(0, self.content_height - self.view_height)
+
+    def set_count(self, count: int, keep_offset: bool = False) -> None:
+        self.count = max(0, int(count))
+        self.offset = self._clamp(self.offset if keep_offset else 0)
+
+    def _clamp(self, offset: int) -> int:
+        return max(0, min(int(offset), self.max_offset))
+
+    # ---------------- Scrolling ----------------
+    def scroll_to(self, offset: int) -> bool:
+        """Move to `offset` px; returns True if the view changed."""
+        new = self._clamp(offset)
+        changed = new != self.offset
+        self.offset = new
+        return changed
+
+    def scroll_by(self, pixels: int) -> bool:
+        return self.scroll_to(self.offset + pixels)
+
+    def scroll_rows(self, rows: int) -> bool:
+        return self.scroll_by(rows * self.row_height)
+
+    def scroll_pages(self, pages: int) -> bool:
+        return self.scroll_by(pages * max(1, self.visible - 1) * self.row_height)
+
+    def moveto(self, fraction: float) -> bool:
+        """Scrollbar 'moveto' (fraction of the content height)."""
+        return self.scroll_to(int(round(float(fraction) * self.content_height)))
+
+    def ensure_visible(self, index: int) -> bool:
+        """Scroll the minimum needed so row `index` is fully visible."""
+        if not 0 <= index < self.count:
+            return False
+        top = index * self.row_height
+        bottom = top + self.row_height
+        if top < self.offset:
+            return self.scroll_to(top)
+        if bottom > self.offset + self.view_height:
+            return self.scroll_to(bottom - self.view_height)
+        return False
+
+    def fractions(self) -> Tuple[float, float]:
+        """(first, last) visible fractions for `scrollbar.set()`."""
+        total = self.content_height
+        if total <= self.view_height:
+            return 0.0, 1.0
+        return self.offset / total, (self.offset + self.view_height) / total
+
+    # ---------------- Row binding ----------------
+    def slots(self) -> List[Tuple[int, Optional[int], int]]:
+        """(pool slot, item index or None, y) for every pooled row widget."""
+        first, shift = divmod(self.offset, self.row_height)
+        out: List[Tuple[int, Optional[int], int]] = []
+        for slot in range(self.pool_size):
+            index = first + slot
+            y = slot * self.row_height - shift
+            out.append((slot, index if index < self.count and y < self.view_height else None, y))
+        return out
+
+    def index_at(self, y: int) -> Optional[int]:
+        """Item under viewport pixel `y` (for clicks)."""
+        index = (self.offset + int(y)) // self.row_height
+        return index if 0 <= index < self.count else None
@@ -17,3 +17,27 @@ def test_config_manager_forbids_admin_pin_and_allows_aliases():
         assert cm.config.get("ui_update_debounce") == 75
 
 
+
+
+def test_config_file_overrides_apply_and_merge_nested_sections():
+    import json
+
+    with tempfile.TemporaryDirectory() as td:
+        cfg_path = Path(td) / "perf.json"
+        cfg_path.write_text(json.dumps({
+            "ui_update_debounce": 75,
+            "teams_cache": {"stale_ttl": 120, "bogus": 1},
+            "admin_pin": "1234",
+            "not_a_setting": True,
+        }), encoding="utf-8")
+        cm = ConfigManager(config_file=str(cfg_path))
+
+        # Allowed file overrides apply
+        assert cm.get("ui_update_debounce") == 75
+        # A partial section only overrides the keys it names
+        tc = cm.get("teams_cache")
+        assert tc["stale_ttl"] == 120
+        assert tc["base_ttl"] == 300 and tc["max_ttl"] == 1800
+        assert "bogus" not in tc
+        # Forbidden and unknown keys in the file are dropped
+        assert "admin_pin" not in cm.config and "not_a_setting" not in cm.config
@@ -0,0 +1,84 @@
+import threading
+import time
+
+from src.core.state_bus import StateBusClient, StateBusHub
+from src.licensing.license_status import BUS_ACTIVATED_KEY, BUS_FIELD, LicenseStatusService
+
+
+class _SlowManager:
+    """evaluate_license stand-in: counts calls, online checks take a while."""
+
+    def __init__(self):
+        self.calls = {"local": 0, "online": 0}
+        self.status = ("active", True)
+        self.gate = threading.Event()
+
+    def evaluate_license(self, online=True):
+        self.calls["online" if online else "local"] += 1
+        if online:
+            self.gate.wait(2)
+        return self.status[0], self.status[1], {"code": "X"}
+
+
+def test_reads_are_cached_and_refreshes_single_flight():
+    manager = _SlowManager()
+    service = LicenseStatusService(manager, refresh_interval_s=3600)
+    service.request_refresh = lambda: None  # No background thread in this test
+
+    assert service.get_license_status() == ("active", True)
+    for _ in range(100):
+        service.get_license_status()
+    assert manager.calls == {"local": 1, "online": 0}
+
+    manager.status = ("blocked", False)
+    threads = [threading.Thread(target=service.refresh) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    manager.gate.set()
+    for t in threads:
+        t.join(2)
+    assert manager.calls["online"] == 1 and service.revalidations == 1
+    snap = service.snapshot()
+    assert (snap.status, snap.is_valid, snap.online) == ("blocked", False, True)
+
+
+def test_listeners_only_hear_status_changes():
+    manager = _SlowManager()
+    manager.gate.set()
+    service = LicenseStatusService(manager, refresh_interval_s=3600)
+    service.request_refresh = lambda: None
+    seen = []
+    service.add_listener(lambda snap: seen.append(snap.status))
+
+    service.reload()
+    service.refresh()  # Same status: no callback
+    manager.status = ("expired", False)
+    service.refresh()
+    assert seen == ["active", "expired"]
+
+
+def test_activation_announced_over_the_state_bus():
+    hub = StateBusHub().start()
+    activating = StateBusClient(hub.address, hub.authkey)
+    blocked = StateBusClient(hub.address, hub.authkey)
+    try:
+        manager = _SlowManager()
+        manager.gate.set()
+        manager.status = ("not_found", False)
+        service = LicenseStatusService(manager, refresh_interval_s=3600)
+        service.request_refresh = lambda: None
+        assert service.attach_bus(blocked) and not service.snapshot().is_valid
+        unblocked = threading.Event()
+        service.add_listener(lambda snap: snap.is_valid and unblocked.set())
+
+        manager.status = ("active", True)  # license.enc saved by the other process
+        started = time.perf_counter()
+        activating.publish(BUS_FIELD, BUS_ACTIVATED_KEY, 1234)
+        assert unblocked.wait(2)
+        assert time.perf_counter() - started < 0.5
+        assert manager.calls == {"local": 2, "online": 0}  # One re-read, no polling or revalidation
+    finally:
+        activating.close()
+        blocked.close()
+        hub.close()
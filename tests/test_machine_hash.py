@@ -0,0 +1,54 @@
+import src.licensing.machine_hash as mh
+from src.licensing.machine_hash import MachineHashCache, get_machine_hash
+
+
+def test_cache_is_valid_only_for_this_boot_and_host(tmp_path):
+    cache = MachineHashCache(tmp_path / "machine_hash.bin")
+    assert cache.load(1000.0, "PC-1") is None
+    cache.store(1000.0, "PC-1", ["Intel64", "C:\\"])
+    assert cache.load(1001.5, "PC-1") == ["Intel64", "C:\\"]  # Derived boot time jitter
+    assert cache.load(5000.0, "PC-1") is None  # Rebooted
+    assert cache.load(1000.0, "PC-2") is None  # Renamed / copied profile
+
+    raw = bytearray(cache.path.read_bytes())
+    raw[-3] ^= 0x01
+    cache.path.write_bytes(bytes(raw))
+    assert cache.load(1000.0, "PC-1") is None  # Edited file
+
+
+def test_hardware_is_probed_once_per_boot(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(mh, "probe_hardware", lambda: calls.append(1) or ["Intel64", "C:\\"])
+    monkeypatch.setattr(mh, "live_identity", lambda: ["PC-1", "AMD64", "1234"])
+    monkeypatch.setattr(mh, "current_boot_key", lambda: (1000.0, "PC-1"))
+    monkeypatch.setattr(mh, "_memo", None)
+    cache = MachineHashCache(tmp_path / "machine_hash.bin")
+    expected = mh.compute_machine_hash(["Intel64", "C:\\"])
+
+    assert get_machine_hash(cache, use_memo=False) == expected
+    assert mh.last_lookup["source"] == "computed"
+    # Another process (no memo) reads the file
+    assert get_machine_hash(cache, use_memo=False) == expected
+    assert mh.last_lookup["source"] == "file"
+    assert get_machine_hash(cache) == expected and get_machine_hash(cache) == expected
+    assert mh.last_lookup["source"] == "memo"
+    assert len(calls) == 1
+
+    monkeypatch.setattr(mh, "current_boot_key", lambda: (9000.0, "PC-1"))
+    assert get_machine_hash(cache, use_memo=False) == expected
+    assert mh.last_lookup["source"] == "computed" and len(calls) == 2
+
+
+def test_forged_cache_cannot_stand_in_for_another_machine(tmp_path, monkeypatch):
+    """The file only carries CPU/disk; computer name and MAC are always read live."""
+    monkeypatch.setattr(mh, "current_boot_key", lambda: (1000.0, "PC-1"))
+    monkeypatch.setattr(mh, "probe_hardware", lambda: ["Intel64", "C:\\"])
+    monkeypatch.setattr(mh, "live_identity", lambda: ["PC-1", "AMD64", "1234"])
+    licensed = mh.compute_machine_hash(["Intel64", "C:\\"])
+
+    # The app's own tag key re-signs a file claiming the licensed machine's hardware
+    cache = MachineHashCache(tmp_path / "machine_hash.bin")
+    cache.store(1000.0, "PC-1", ["Intel64", "C:\\"])
+    monkeypatch.setattr(mh, "live_identity", lambda: ["PC-1", "AMD64", "9999"])  # Other MAC
+    assert get_machine_hash(cache, use_memo=False) != licensed
+    assert mh.last_lookup["source"] == "file"
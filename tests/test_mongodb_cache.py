@@ -14,3 +14,79 @@ def test_smart_team_cache_basic_behavior():
     assert ttl >= 60
 
 
+
+def test_smart_team_cache_serves_stale_and_refreshes_once():
+    import threading
+
+    c = SmartTeamCache(base_ttl=60, min_ttl=0, stale_ttl=60)
+    calls = []
+    gate = threading.Event()
+
+    def loader():
+        calls.append(1)
+        gate.wait(2)
+        return {"a": "aa", "b": "bb"}
+
+    c.set_teams({"A": "OLD"})
+    c.mark_stale()
+    # Stale snapshot comes back immediately; only one refresh starts
+    assert c.get_or_load(loader) == {"A": "OLD"}
+    assert c.get_or_load(loader) == {"A": "OLD"}
+    gate.set()
+    deadline = time.time() + 2
+    while c.stats()["refreshing"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(calls) == 1
+    assert c.get_or_load(loader) == {"A": "AA", "B": "BB"}
+    stats = c.stats()
+    assert (stats["stale_hits"], stats["hits"], stats["refreshes"]) == (2, 1, 1)
+
+
+def test_search_never_loads_on_the_calling_thread():
+    import threading
+
+    c = SmartTeamCache(base_ttl=60, min_ttl=0, stale_ttl=60)
+    threads = []
+    gate = threading.Event()
+
+    def loader():
+        threads.append(threading.get_ident())
+        gate.wait(2)
+        return {"benfica": "slb"}
+
+    # Cold cache: empty result right away, the load runs in the background
+    assert c.search("ben", loader=loader) == []
+    gate.set()
+    deadline = time.time() + 2
+    while not c.has_data() and time.time() < deadline:
+        time.sleep(0.01)
+    assert threads and threading.get_ident() not in threads
+    assert c.search("ben", loader=loader) == [("BENFICA", "SLB")]
+
+
+def test_local_suggest_teams_never_loads_on_the_calling_thread(monkeypatch):
+    import threading
+    import src.core.mongodb as mongodb
+
+    cache = SmartTeamCache(base_ttl=60, min_ttl=0, stale_ttl=60)
+    monkeypatch.setattr(mongodb, "_teams_cache", cache)
+    threads = []
+    gate = threading.Event()
+
+    def loader():
+        threads.append(threading.get_ident())
+        gate.wait(2)
+        return {"benfica": "slb"}
+
+    # Local fallback manager (broker disabled); skip __init__'s Mongo/catalog wiring
+    manager = object.__new__(mongodb.MongoTeamManager)
+    manager._load_from_catalog = loader
+
+    assert manager.suggest_teams("ben") is None  # Cold: the UI uses its teams.json preload
+    assert manager.suggest_teams("ben") is None  # Still loading; no second refresh
+    gate.set()
+    deadline = time.time() + 2
+    while not cache.has_data() and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(threads) == 1 and threads[0] != threading.get_ident()
+    assert manager.suggest_teams("ben") == [("BENFICA", "SLB")]
@@ -0,0 +1,32 @@
+import json
+import queue
+import time
+
+from src.notification.headless import HeadlessToastSink, run_headless
+from src.notification.toast import ToastPayload
+
+
+def test_headless_sink_records_layout_decisions(tmp_path):
+    q = queue.Queue()
+    now = time.time()
+    for i in range(15):
+        q.put(ToastPayload(title=f"t{i}", message="hello", duration=60000, created_at=now))
+    q.put(ToastPayload(title="score 1", message="", group="campo1:score"))
+    q.put(ToastPayload(title="score 2", message="", group="campo1:score"))
+    q.put(("Legacy", "tuple payload", {"duration": 1000}))
+    q.put(None)
+
+    out = tmp_path / "report.json"
+    report = run_headless(q, HeadlessToastSink(), str(out))
+
+    decisions = [e["decision"] for e in report["events"]]
+    shown = [e for e in report["events"] if e["decision"] == "shown"]
+    # Toasts stack bottom-up on the single headless screen until it is full
+    assert 0 < len(shown) <= 15
+    ys = [e["geometry"][1] for e in shown]
+    assert ys == sorted(ys, reverse=True)
+    assert "queued" in decisions
+    assert decisions.count("coalesced") == 1
+    assert report["summary"]["payloads"] == 18
+    assert report["summary"]["latency"]["count"] == 15
+    assert json.loads(out.read_text(encoding="utf-8"))["summary"]["payloads"] == 18
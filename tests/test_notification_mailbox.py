@@ -0,0 +1,40 @@
+import threading
+from multiprocessing import Queue
+
+from src.notification.notification_server import NotificationMailbox, _reader_loop
+from src.notification.toast import ToastPayload
+
+
+class _FakeRoot:
+    def __init__(self):
+        self.wakes = 0
+
+    def event_generate(self, *_a, **_k):
+        self.wakes += 1
+
+
+def test_mailbox_single_wake_and_uncapped_drain():
+    root = _FakeRoot()
+    mb = NotificationMailbox(root)
+    for i in range(200):
+        mb.put(ToastPayload(title=str(i), message=""))
+    # Only the first payload fires a wake-up; the rest piggyback on it
+    assert root.wakes == 1
+    drained = mb.drain()
+    assert len(drained) == 200
+    mb.put(ToastPayload(title="next", message=""))
+    assert root.wakes == 2
+
+
+def test_reader_loop_converts_legacy_tuples_and_stops_on_sentinel():
+    root = _FakeRoot()
+    mb = NotificationMailbox(root)
+    q = Queue()
+    q.put(("Title", "Body", {"duration": 1000}))
+    q.put(None)
+    t = threading.Thread(target=_reader_loop, args=(q, mb), daemon=True)
+    t.start()
+    t.join(timeout=5)
+    items = mb.drain()
+    assert isinstance(items[0], ToastPayload) and items[0].duration == 1000
+    assert items[-1] is None
@@ -0,0 +1,76 @@
+import queue
+import threading
+
+from src.notification.sender import NotificationSender
+from src.notification.toast import ToastPayload
+
+
+class _StalledQueue:
+    """Queue whose consumer is 'stalled' until released."""
+
+    def __init__(self):
+        self.items = []
+        self.release = threading.Event()
+
+    def put(self, item):
+        self.items.append(item)
+
+    def qsize(self):
+        return 0 if self.release.is_set() else 10**6
+
+
+def _stall(sender):
+    """First payload gets picked up by the feeder, which then waits for room."""
+    sender.submit(ToastPayload(title="first", message=""))
+    for _ in range(200):
+        if not sender._buf:
+            break
+        threading.Event().wait(0.005)
+
+
+def test_sender_forwards_in_order():
+    q = queue.Queue()
+    sender = NotificationSender(q, capacity=16)
+    for i in range(10):
+        sender.submit(ToastPayload(title=str(i), message=""))
+    assert sender.flush(2.0)
+    assert [q.get_nowait().title for _ in range(10)] == [str(i) for i in range(10)]
+    assert sender.stats()["dropped"] == 0
+    sender.close()
+
+
+def test_stalled_server_bounds_buffer_and_merges_groups():
+    q = _StalledQueue()
+    sender = NotificationSender(q, capacity=8, backoff_s=0.005)
+    _stall(sender)
+    for i in range(50):
+        sender.submit(ToastPayload(title=f"score {i}", message="", group="campo1:score"))
+    sender.submit(ToastPayload(title="other", message=""))
+    assert len(sender._buf) <= 8
+    q.release.set()
+    assert sender.flush(2.0)
+    titles = [p.title for p in q.items]
+    # Only the newest same-group payload is sent; overflow folded the group instead of dropping
+    assert titles == ["first", "score 49", "other"]
+    stats = sender.stats()
+    assert stats["dropped"] == 0
+    assert stats["merged"] == 49
+    sender.close()
+
+
+def test_mixed_group_overflow_keeps_ungrouped_toasts():
+    q = _StalledQueue()
+    sender = NotificationSender(q, capacity=4, backoff_s=0.005)
+    _stall(sender)
+    sender.submit(ToastPayload(title="saved", message=""))
+    sender.submit(ToastPayload(title="timer 0", message="", group="campo1:timer"))
+    for i in range(30):
+        sender.submit(ToastPayload(title=f"score {i}", message="", group="campo1:score"))
+        sender.submit(ToastPayload(title=f"timer {i + 1}", message="", group="campo1:timer"))
+    sender.submit(ToastPayload(title="error", message=""))
+    sender.submit(ToastPayload(title="late", message=""))  # Nothing left to fold: oldest goes
+    q.release.set()
+    assert sender.flush(2.0)
+    assert [p.title for p in q.items] == ["first", "score 29", "timer 30", "error", "late"]
+    assert sender.stats()["dropped"] == 1  # "saved"
+    sender.close()
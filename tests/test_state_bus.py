@@ -0,0 +1,59 @@
+import time
+
+from src.core.state_bus import StateBusClient, StateBusHub
+
+
+def test_state_bus_relays_deltas_to_other_clients():
+    hub = StateBusHub().start()
+    a = StateBusClient(hub.address, hub.authkey)
+    b = StateBusClient(hub.address, hub.authkey)
+    got_a, got_b = [], []
+    a.subscribe(got_a.append)
+    b.subscribe(got_b.append)
+    try:
+        # Wait for both connections to be registered by the hub
+        for _ in range(100):
+            if hub.client_count() == 2:
+                break
+            time.sleep(0.01)
+        a.publish("field_1", "home_score", 3)
+        for _ in range(100):
+            if got_b:
+                break
+            time.sleep(0.01)
+        assert [(d.field, d.key, d.value) for d in got_b] == [("field_1", "home_score", 3)]
+        # Publisher does not receive its own delta back
+        assert got_a == []
+        assert b.latency_stats()["count"] == 1
+    finally:
+        a.close()
+        b.close()
+        hub.close()
+
+
+def test_hub_relays_concurrent_publishers_intact():
+    hub = StateBusHub().start()
+    pubs = [StateBusClient(hub.address, hub.authkey) for _ in range(3)]
+    sink = StateBusClient(hub.address, hub.authkey)
+    got = []
+    sink.subscribe(got.append)
+    try:
+        for _ in range(100):
+            if hub.client_count() == 4:
+                break
+            time.sleep(0.01)
+        for i in range(200):
+            for n, p in enumerate(pubs):
+                p.publish(f"field_{n + 1}", "home_score", i)
+        for _ in range(300):
+            if len(got) == 600:
+                break
+            time.sleep(0.01)
+        # Every delta arrives unpickled and in per-publisher order
+        assert len(got) == 600
+        for n in range(3):
+            assert [d.value for d in got if d.field == f"field_{n + 1}"] == list(range(200))
+    finally:
+        for c in pubs + [sink]:
+            c.close()
+        hub.close()
@@ -0,0 +1,66 @@
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from src.core.team_async import AsyncTeamManager, TeamTaskRejected, _Pool, deliver, get_team_pool
+
+
+class _Manager:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def load_teams(self):
+        self.release.wait(2)
+        return {"A": "AA"}
+
+    def get_abbreviation(self, name):
+        return name[:3]
+
+
+class _FakeWidget:
+    def __init__(self):
+        self.calls = []
+
+    def winfo_exists(self):
+        return True
+
+    def after(self, ms, fn):
+        self.calls.append(fn)
+
+
+def test_async_manager_timeout_cancel_and_tk_delivery(monkeypatch):
+    import src.core.team_async as team_async
+
+    monkeypatch.setattr(team_async, "_pool", _Pool(workers=1, max_pending=2))
+    mgr = _Manager()
+    api = AsyncTeamManager(mgr, timeout_s=0.05)
+
+    slow = api.load_teams()             # occupies the only worker
+    queued = api.get_abbreviation("BENFICA")
+    assert queued.cancel()              # still queued -> cancellable
+    with pytest.raises(TeamTaskRejected):
+        api.get_abbreviation("PORTO").result(timeout=1)
+    with pytest.raises(TimeoutError):
+        slow.result(timeout=1)          # watchdog fails it; the worker is still blocked
+    with pytest.raises(CancelledError):
+        queued.result(timeout=0)
+
+    mgr.release.set()
+    deadline = time.time() + 1
+    while get_team_pool().stats()["pending"] and time.time() < deadline:
+        time.sleep(0.01)
+    widget = _FakeWidget()
+    got = []
+    ok = AsyncTeamManager(mgr).get_abbreviation("SPORTING")
+    deliver(ok, widget, got.append)
+    ok.result(timeout=1)
+    deadline = time.time() + 1
+    while not widget.calls and time.time() < deadline:
+        time.sleep(0.01)
+    # Nothing runs until the Tk loop drains after() callbacks
+    assert got == []
+    widget.calls.pop()()
+    assert got == ["SPO"]
+    assert get_team_pool().stats()["timed_out"] >= 1
@@ -0,0 +1,72 @@
+import gzip
+import json
+import os
+import threading
+import time
+
+import src.core.mongodb as mongodb
+from src.core.team_backup import TeamBackup, teams_content_hash
+from src.core.team_catalog import TeamCatalog
+from src.core.team_outbox import OutboxFlusher, TeamOutbox
+
+
+def test_backup_skips_unchanged_sets_and_rotates_snapshots(tmp_path):
+    catalog = TeamCatalog(tmp_path / "catalog.sqlite3")
+    catalog.replace_all({"BENFICA": "SLB", "PORTO": "FCP"})
+    catalog.upsert("braga", "scb")
+    catalog.upsert("BENFICA", "BEN")
+    catalog.remove("PORTO")
+    # Running hash equals the full hash, whatever order the edits came in
+    assert catalog.content_hash() == teams_content_hash({"BRAGA": "SCB", "BENFICA": "BEN"})
+    assert TeamCatalog(tmp_path / "catalog.sqlite3").content_hash() == catalog.content_hash()
+
+    live = tmp_path / "teams.json"
+    backup = TeamBackup(live_path=live, retention_days=7, snapshots_enabled=True)
+    first = backup.save(catalog.all(), catalog.content_hash())
+    assert first is not None and first.name.startswith("teams_backup_") and first.name.endswith(".json.gz")
+    assert json.loads(live.read_text(encoding="utf-8")) == {"BENFICA": "BEN", "BRAGA": "SCB"}
+    assert json.loads(gzip.decompress(first.read_bytes())) == {"BENFICA": "BEN", "BRAGA": "SCB"}
+
+    # Same content (also after a restart): nothing written
+    assert TeamBackup(live_path=live).is_current(catalog.content_hash())
+    assert backup.save(catalog.all(), catalog.content_hash()) is None
+    assert backup.snapshots() == [first]
+
+    catalog.upsert("SPORTING", "SCP")
+    second = backup.save(catalog.all(), catalog.content_hash())
+    assert second is not None and backup.snapshots()[0] == second
+    assert backup.load(first.name) == {"BENFICA": "BEN", "BRAGA": "SCB"}
+
+    # Snapshots past the retention window go, but the newest always stays
+    old = backup.folder / "teams_backup_20000101-000000.json.gz"
+    old.write_bytes(first.read_bytes())
+    assert backup.prune() == 1 and not old.exists()
+    assert backup.prune(now=time.time() + 30 * 86400) == 1
+    assert backup.snapshots() == [second]
+
+
+def test_restore_replays_snapshot_through_the_outbox(tmp_path, monkeypatch):
+    backup = TeamBackup(live_path=tmp_path / "teams.json", snapshots_enabled=True)
+    monkeypatch.setattr(mongodb, "get_team_backup", lambda: backup)
+
+    manager = mongodb.MongoTeamManager.__new__(mongodb.MongoTeamManager)
+    manager.catalog = TeamCatalog(tmp_path / "catalog.sqlite3")
+    manager.outbox = TeamOutbox(tmp_path / "outbox.sqlite3")
+    manager.flusher = OutboxFlusher(manager.outbox, lambda: None)
+    manager._json_sync_pending = True  # No debounce thread in the test
+    manager._json_sync_lock = threading.Lock()
+
+    manager.catalog.replace_all({"BENFICA": "SLB", "PORTO": "FCP"})
+    manager.backup_to_json()
+    snapshot = backup.snapshots()[0]
+    manager.catalog.apply_changes([("BENFICA", "BEN"), ("PORTO", None), ("BRAGA", "SCB")])
+    manager.backup_to_json()
+    assert len(backup.snapshots()) == 2
+
+    assert manager.restore_backup(os.fspath(snapshot)) == 3
+    assert manager.catalog.all() == {"BENFICA": "SLB", "PORTO": "FCP"}
+    assert manager.outbox.pending_changes() == {"BENFICA": "SLB", "PORTO": "FCP", "BRAGA": None}
+    assert backup.is_current(manager.catalog.content_hash()) is False
+    manager.backup_to_json()
+    assert backup.is_current(manager.catalog.content_hash())
+    assert manager.restore_backup(snapshot.name) == 0
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from src.core.team_broker import RemoteTeamManager, TeamBroker, TeamBrokerError, start_team_broker
+
+
+class _FakeManager:
+    def __init__(self):
+        self.teams = {"BENFICA": "SLB"}
+        self.lookups = 0
+
+    def load_teams(self):
+        return dict(self.teams)
+
+    def get_abbreviation(self, name):
+        self.lookups += 1
+        return self.teams.get(name, "")
+
+    def save_team(self, name, abbreviation):
+        if not name:
+            raise ValueError("name required")
+        self.teams[name] = abbreviation
+        return []
+
+    def import_teams(self, path, progress=None):
+        for done in (1, 2):
+            progress(done, 2)
+        return 2
+
+
+def _wait_for(predicate, timeout=2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_team_broker_serves_clients_and_pushes_invalidations():
+    managers = []
+
+    def factory():
+        managers.append(_FakeManager())
+        return managers[-1]
+
+    broker = TeamBroker(factory).start()
+    a = RemoteTeamManager(broker.address, broker.authkey, timeout_s=5)
+    b = RemoteTeamManager(broker.address, broker.authkey, timeout_s=5)
+    try:
+        assert b.get_abbreviation("benfica") == "SLB"
+        assert b.get_abbreviation("BENFICA") == "SLB"  # Memoized
+        assert managers[0].lookups == 1
+
+        a.save_team("BENFICA", "BEN")
+        assert _wait_for(lambda: b.version == 1)
+        assert b.get_abbreviation("BENFICA") == "BEN"  # Memo cleared by the push
+        assert b.load_teams() == {"BENFICA": "BEN"}
+
+        seen = []
+        assert a.import_teams("teams.csv", lambda done, total: seen.append((done, total))) == 2
+        assert seen == [(1, 2), (2, 2)]
+
+        with pytest.raises(TeamBrokerError) as exc:
+            a.save_team("", "X")
+        assert exc.value.remote_type == "ValueError"
+        with pytest.raises(TeamBrokerError):
+            a._call("__init__")
+
+        # One manager (one Mongo client/catalog) no matter how many clients
+        assert len(managers) == 1 and broker.client_count() == 2
+    finally:
+        a.close()
+        b.close()
+        broker.close()
+
+
+def test_suggestions_come_from_a_field_local_index():
+    broker = TeamBroker(_FakeManager).start()
+    typing_field = RemoteTeamManager(broker.address, broker.authkey, timeout_s=5)
+    editor = RemoteTeamManager(broker.address, broker.authkey, timeout_s=5)
+    try:
+        assert typing_field.suggest_teams("ben") is None  # Index loads in the background
+        assert _wait_for(lambda: typing_field.suggest_teams("ben") == [("BENFICA", "SLB")])
+        calls = broker.calls
+        for prefix in ("b", "be", "ben", "benf"):
+            typing_field.suggest_teams(prefix)
+        assert broker.calls == calls  # Keystrokes never reach the broker
+
+        editor.save_team("BENFIM", "BFM")  # Pushed "changed" rebuilds the index
+        assert _wait_for(lambda: len(typing_field.suggest_teams("benf") or []) == 2)
+    finally:
+        typing_field.close()
+        editor.close()
+        broker.close()
+
+
+def test_remote_team_manager_falls_back_to_local_when_broker_process_dies():
+    handle = start_team_broker()
+    assert handle is not None
+    local = _FakeManager()
+    client = RemoteTeamManager(handle.address, handle.authkey, timeout_s=5, fallback=lambda: local)
+    try:
+        handle.process.terminate()
+        handle.process.join(5)
+        assert _wait_for(lambda: not client.is_connected())
+        client.save_team("PORTO", "FCP")
+        assert local.teams["PORTO"] == "FCP"
+    finally:
+        client.close()
+        if handle.process.is_alive():
+            handle.process.kill()
@@ -0,0 +1,49 @@
+import io
+import json
+
+from src.config.settings import AppConfig
+from src.core.team_bulk import bulk_upsert_teams, export_teams, parse_team_csv, read_team_file
+
+
+class _Result:
+    def __init__(self, n):
+        self.upserted_count = n
+        self.modified_count = 0
+
+
+class _FakeCollection:
+    def __init__(self):
+        self.calls = []
+
+    def bulk_write(self, ops, ordered=True):
+        self.calls.append(len(ops))
+        return _Result(len(ops))
+
+
+def test_bulk_import_batches_and_validates():
+    long_name = "X" * (AppConfig.MAX_TEAM_NAME_LENGTH + 1)
+    rows = ["name;sigla", f"{long_name};LNG", "benfica;slb", "Porto;"]
+    rows += [f"team {i};T{i}" for i in range(1200)]
+    rows += ["Benfica;SLB2"]
+    coll = _FakeCollection()
+    seen = []
+    report = bulk_upsert_teams(
+        coll, parse_team_csv(io.StringIO("\n".join(rows) + "\n")),
+        batch_size=500, progress=lambda done, total: seen.append((done, total)),
+    )
+    assert coll.calls == [500, 500, 201]
+    assert report.valid == 1201 and report.duplicates == 1
+    assert [reason for _, reason in report.invalid] == [
+        f"name longer than {AppConfig.MAX_TEAM_NAME_LENGTH}", "missing abbreviation",
+    ]
+    assert ("BENFICA", "SLB2") in report.applied
+    assert seen[0] == (0, 1201) and seen[-1] == (1201, 1201)
+
+
+def test_export_roundtrip_csv_and_json(tmp_path):
+    teams = [("BENFICA", "SLB"), ("PORTO", "FCP")]
+    for ext in ("csv", "json"):
+        path = str(tmp_path / f"teams.{ext}")
+        assert export_teams(iter(teams), path) == 2
+        assert [(n, a) for _, n, a in read_team_file(path)] == teams
+    assert json.loads((tmp_path / "teams.json").read_text(encoding="utf-8")) == dict(teams)
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+from src.core.team_catalog import TeamCatalog, TeamCatalogSync
+
+
+class _FakeCollection:
+    """Tiny subset of a pymongo collection: find with an updated_at $gte filter."""
+
+    def __init__(self):
+        self.docs = {}
+        self.clock = datetime(2025, 1, 1)
+        self.scanned = 0
+
+    def write(self, name, abbr=None, deleted=False):
+        self.clock += timedelta(seconds=1)
+        self.docs[name] = {"name": name, "abbreviation": abbr or "", "deleted": deleted, "updated_at": self.clock}
+
+    def create_index(self, *_a, **_k):
+        pass
+
+    def delete_many(self, *_a, **_k):
+        pass
+
+    def find(self, query, projection=None):
+        since = (query.get("updated_at") or {}).get("$gte")
+        for doc in self.docs.values():
+            if since is not None and doc["updated_at"].timestamp() < since.replace(tzinfo=None).timestamp():
+                continue
+            self.scanned += 1
+            yield dict(doc)
+
+
+def test_incremental_sync_scales_with_changes(tmp_path):
+    coll = _FakeCollection()
+    for i in range(500):
+        coll.write(f"TEAM {i}", f"T{i}")
+    catalog = TeamCatalog(tmp_path / "catalog.sqlite3")
+    sync = TeamCatalogSync(catalog, lambda: coll, retention_days=30)
+
+    assert sync.sync_once() == 500
+    assert catalog.get("team 7") == "T7"
+
+    coll.scanned = 0
+    coll.write("TEAM 7", "X7")
+    coll.write("TEAM 9", deleted=True)
+    assert sync.sync_once() == 2
+    # Only the changed docs (plus the inclusive watermark boundary) were read
+    assert coll.scanned <= 3
+    assert catalog.get("TEAM 7") == "X7"
+    assert catalog.get("TEAM 9") is None
+
+    # Re-running with nothing new applies nothing
+    assert sync.sync_once() == 0
+
+    # Persisted: a fresh process sees the same catalog and watermark without syncing
+    reopened = TeamCatalog(tmp_path / "catalog.sqlite3")
+    assert len(reopened) == 499 and reopened.get("TEAM 7") == "X7"
+    assert reopened.has_synced()
+
+
+def test_catalog_keys_are_accent_insensitive_and_flag_near_duplicates(tmp_path):
+    import sqlite3
+
+    from src.core.team_catalog import TeamCatalog
+    from src.core.team_search import TeamSearchIndex
+
+    # Catalog created before name_key existed: migrated + backfilled on open
+    path = tmp_path / "old.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE teams (name TEXT PRIMARY KEY, abbreviation TEXT NOT NULL, updated_at REAL NOT NULL)")
+    conn.execute("INSERT INTO teams VALUES ('SPORTING CLUBE DE BRAGANÇA', 'SCB', 0)")
+    conn.commit()
+    conn.close()
+
+    cat = TeamCatalog(path)
+    assert cat.key_of("Sporting Clube de Bragança") == "sporting clube de braganca"
+    assert cat.find_by_key("sporting-clube de  BRAGANCA") == ["SPORTING CLUBE DE BRAGANÇA"]
+    cat.upsert("F.C. PORTO", "FCP")
+    assert cat.find_similar("FC PORTO") == ["F.C. PORTO"]
+    assert cat.find_similar("SPORTING CLUBE DE BRAGANCA") == ["SPORTING CLUBE DE BRAGANÇA"]
+    assert cat.find_similar("SPORTING CLUBE DE BRAGA") == []
+
+    index = TeamSearchIndex(cat.all(), key_fn=cat.key_of)
+    assert index.search("braganca") == [("SPORTING CLUBE DE BRAGANÇA", "SCB")]
+    assert index.search("fc porto")[0][0] == "F.C. PORTO"
+    cat.close()
+
+
+def test_processes_sharing_a_catalog_file_keep_their_own_watermark(tmp_path):
+    coll = _FakeCollection()
+    coll.write("BENFICA", "SLB")
+    path = tmp_path / "catalog.sqlite3"
+    first, second = TeamCatalog(path), TeamCatalog(path)  # Two field processes
+    sync_a = TeamCatalogSync(first, lambda: coll, retention_days=30)
+    sync_b = TeamCatalogSync(second, lambda: coll, retention_days=30)
+    assert sync_a.sync_once() == 1 and sync_b.sync_once() == 1
+
+    coll.write("PORTO", "FCP")
+    coll.write("SPORTING", "SCP")
+    assert sync_a.sync_once() == 2
+    # The other process still pulls both changes, not just the shared watermark's boundary doc
+    assert sync_b.sync_once() == 2
+    assert second.all() == first.all() == {"BENFICA": "SLB", "PORTO": "FCP", "SPORTING": "SCP"}
+    assert second.watermark() == first.watermark()
+
+    # A lagging process never moves the stored (seed) watermark backwards
+    first.mark_synced(0.0, 0.0)
+    assert TeamCatalog(path).watermark() == second.watermark()
+    for cat in (first, second):
+        cat.close()
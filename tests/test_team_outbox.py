@@ -0,0 +1,94 @@
+from src.core.team_catalog import TeamCatalog, TeamCatalogSync
+from src.core.team_outbox import OP_DELETE, OP_UPSERT, OutboxFlusher, TeamOutbox
+
+
+class _FakeCollection:
+    """find by name/$in (no updated_at filtering) and bulk_write of UpdateOne ops."""
+
+    def __init__(self):
+        self.docs = {}
+        self.offline = False
+        self.writes = 0
+
+    def create_index(self, *_a, **_k):
+        pass
+
+    def delete_many(self, *_a, **_k):
+        pass
+
+    def find(self, query, projection=None):
+        names = (query.get("name") or {}).get("$in")
+        for doc in list(self.docs.values()):
+            if names is None or doc["name"] in names:
+                yield dict(doc)
+
+    def bulk_write(self, ops, ordered=True):
+        if self.offline:
+            raise ConnectionError("server selection timeout")
+        for op in ops:
+            name = op._filter["name"]
+            doc = self.docs.get(name)
+            if doc is None:
+                if not op._upsert:
+                    continue
+                doc = self.docs[name] = {"name": name, "abbreviation": "", "deleted": False}
+            doc.update(op._doc["$set"])
+            self.writes += 1
+
+
+def test_outbox_survives_offline_flushes_and_reports_conflicts(tmp_path):
+    coll = _FakeCollection()
+    coll.docs["PORTO"] = {"name": "PORTO", "abbreviation": "FCP", "deleted": False}
+    path = tmp_path / "outbox.sqlite3"
+    outbox = TeamOutbox(path)
+    flusher = OutboxFlusher(outbox, lambda: coll, batch_size=1, base_delay_s=2, max_delay_s=10)
+
+    outbox.record(OP_UPSERT, "benfica", "slb", None)
+    outbox.record(OP_UPSERT, "BENFICA", "BEN", None)  # Coalesced into one entry
+    outbox.record(OP_DELETE, "Porto", None, "FCP")
+    assert outbox.pending_changes() == {"BENFICA": "BEN", "PORTO": None}
+
+    coll.offline = True
+    try:
+        flusher.flush_once()
+        raise AssertionError("flush should fail while offline")
+    except ConnectionError:
+        pass
+    flusher.failures = 3
+    assert 4.0 <= flusher.retry_delay() <= 8.0
+    flusher.failures = 10
+    assert flusher.retry_delay() <= 10.0
+
+    # Durable across restarts; meanwhile another machine changed PORTO
+    outbox = TeamOutbox(path)
+    assert outbox.pending_count() == 2
+    assert "ConnectionError" in (outbox.last_error() or "")
+    coll.docs["PORTO"]["abbreviation"] = "FCPX"
+    coll.offline = False
+    flusher = OutboxFlusher(outbox, lambda: coll, batch_size=1)
+    assert flusher.flush_once() == 2
+    assert outbox.pending_count() == 0
+    assert coll.docs["BENFICA"]["abbreviation"] == "BEN" and coll.docs["PORTO"]["deleted"] is True
+
+    conflicts = outbox.take_conflicts()
+    assert [(c["name"], c["local"], c["remote"]) for c in conflicts] == [("PORTO", None, "FCPX")]
+    assert outbox.take_conflicts() == []
+
+    # Replaying is idempotent: nothing pending, nothing written
+    assert flusher.flush_once() == 0
+
+
+def test_catalog_sync_keeps_pending_edits_on_top(tmp_path):
+    coll = _FakeCollection()
+    coll.docs["BENFICA"] = {"name": "BENFICA", "abbreviation": "SLB", "deleted": False}
+    coll.docs["PORTO"] = {"name": "PORTO", "abbreviation": "FCP", "deleted": False}
+    outbox = TeamOutbox(tmp_path / "outbox.sqlite3")
+    outbox.record(OP_UPSERT, "BENFICA", "BEN", "SLB")
+    outbox.record(OP_DELETE, "PORTO", None, "FCP")
+    catalog = TeamCatalog(tmp_path / "catalog.sqlite3")
+    sync = TeamCatalogSync(catalog, lambda: coll, pending_fn=outbox.pending_changes)
+
+    sync.sync_once()  # Full resync
+    assert catalog.all() == {"BENFICA": "BEN"}
+    sync.sync_once()  # Incremental
+    assert catalog.all() == {"BENFICA": "BEN"}
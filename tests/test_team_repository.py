@@ -0,0 +1,58 @@
+import time
+
+from src.core.team_bench import run_benchmark, run_bulk_path, run_workload
+from src.core.team_repository import (
+    InjectedFailure,
+    InMemoryTeamCollection,
+    InMemoryTeamRepository,
+    JsonTeamRepository,
+)
+
+
+def test_repositories_share_the_manager_contract(tmp_path):
+    path = tmp_path / "teams.json"
+    for repo in (InMemoryTeamRepository({"benfica": "slb"}), JsonTeamRepository(path)):
+        repo.save_many({"benfica": "slb", "Porto ": "fcp"})
+        assert repo.save_team("benfíca", "ben") == ["BENFICA"]  # Near duplicate reported
+        assert repo.get_abbreviation(" porto") == "FCP"
+        assert repo.delete_team("PORTO") is True and repo.delete_team("PORTO") is False
+        assert sorted(repo.get_all_names()) == ["BENFICA", "BENFÍCA"]
+        assert repo.load_teams() == {"BENFICA": "SLB", "BENFÍCA": "BEN"}
+    assert JsonTeamRepository(path).load_teams() == {"BENFICA": "SLB", "BENFÍCA": "BEN"}
+
+
+def test_in_memory_latency_failures_and_workload():
+    repo = InMemoryTeamRepository(latency_s=0.02, fail_on={"delete_team"})
+    t = time.perf_counter()
+    repo.save_team("BENFICA", "SLB")
+    assert time.perf_counter() - t >= 0.02
+    try:
+        repo.delete_team("BENFICA")
+        raise AssertionError("delete_team should fail")
+    except InjectedFailure:
+        pass
+    assert repo.get_abbreviation("BENFICA") == "SLB"
+    assert repo.calls == {"save_team": 1, "delete_team": 1, "get_abbreviation": 1} and repo.failures == 1
+
+    # Every backend load fails: reads degrade to misses, the workload still completes
+    flaky = InMemoryTeamRepository(fail_on={"load_teams"})
+    teams = {f"TEAM {i}": f"T{i}" for i in range(200)}
+    result = run_workload(flaky, teams, writes=20, reads=200, remote_change_every=50, queries=10)
+    assert result["save_team"]["failed"] == 0 and result["bulk"]["teams_per_s"] > 0
+    assert result["cache"]["refresh_failures"] == result["cache"]["backend_loads"] >= 1
+    assert result["search"]["keystrokes"] > 0
+
+
+def test_app_bulk_path_runs_offline_and_survives_flaky_backends():
+    repo = InMemoryTeamRepository()
+    teams = {f"TEAM {i}": f"T{i}" for i in range(120)}
+    result = run_bulk_path(InMemoryTeamCollection(repo), teams, edits=30, batch_size=50)
+    assert result["import"]["completed"] and result["export"]["teams"] == 120
+    assert (result["outbox_flush"]["flushed"], result["outbox_flush"]["pending"]) == (30, 0)
+    assert repo.calls["bulk_write"] == 3 + 1  # ceil(120 / 50) import batches + one outbox batch
+    assert sum(1 for abbr in repo.load_teams().values() if abbr.startswith("E")) == 30
+
+    # Half of all calls fail: bulk steps are retried and counted instead of aborting the run
+    flaky = run_benchmark("memory", 200, failure_rate=0.5, writes=10, reads=100, queries=5, edits=20)
+    assert flaky["bulk"]["failed_attempts"] + flaky["bulk_path"]["import"]["failed_attempts"] > 0
+    assert "outbox_flush" in flaky["bulk_path"]
@@ -0,0 +1,74 @@
+import random
+
+from src.core.team_search import TeamSearchIndex, normalize_key, random_teams
+
+
+def _naive(keys, query):
+    q = normalize_key(query)
+    if not q:
+        return set()
+    return {name for name, key in keys.items() if q in key}
+
+
+def test_team_search_matches_naive_scan_under_updates():
+    teams = random_teams(1500, seed=3)
+    index = TeamSearchIndex(teams)
+    keys = {name: normalize_key(name) for name in teams}
+    rng = random.Random(5)
+    names = list(teams)
+    for step in range(150):
+        if step % 3 == 0:
+            victim = rng.choice(names)
+            index.remove(victim)
+            teams.pop(victim, None)
+            keys.pop(victim, None)
+        elif step % 3 == 1:
+            name = f"NEW TEAM {step}"
+            index.upsert(name, "NEW")
+            teams[name] = "NEW"
+            keys[name] = normalize_key(name)
+        target = rng.choice(list(teams))
+        start = rng.randrange(len(target))
+        typed = target[start:start + 8]
+        # Growing queries exercise the narrowing path
+        for i in range(1, len(typed) + 1):
+            got = index.search(typed[:i])
+            assert {label for label, _ in got} == _naive(keys, typed[:i])
+            assert all(teams[label] == value for label, value in got)
+
+
+def test_team_search_prefix_first_and_limit():
+    index = TeamSearchIndex({"SPORTING": "SCP", "BENFICA": "SLB", "SPORTING BRAGA": "SCB", "ALVERCA SPORT": "FCA"})
+    assert [n for n, _ in index.search("sport")] == ["SPORTING", "SPORTING BRAGA", "ALVERCA SPORT"]
+    assert index.search("sport", limit=1) == [("SPORTING", "SCP")]
+    index.upsert("SPORT CLUBE", "SC")
+    assert [n for n, _ in index.search("sport", limit=2)] == ["SPORT CLUBE", "SPORTING"]
+    assert index.search("") == []
+
+
+def _letters_match(query, text):
+    # Previous TeamManagerWindow semantics: every query letter present (with multiplicity)
+    text_chars = [c for c in text if c.isalnum()]
+    for ch in (c for c in query if c.isalnum()):
+        if ch not in text_chars:
+            return False
+        text_chars.remove(ch)
+    return True
+
+
+def test_fuzzy_search_same_matches_ranked_best_first():
+    from src.core.team_search import FuzzyTeamSearch
+
+    teams = {"SPORTING": "SCP", "SPORTING BRAGA": "SCB", "PORTO": "FCP", "BOAVISTA": "BFC",
+             "ESTORIL PRAIA": "EST", "RIO AVE": "RAFC", "GIL VICENTE": "GVFC"}
+    engine = FuzzyTeamSearch(teams)
+    for q in ["s", "sp", "spo", "port", "ro", "gv", "fcp", "vista", "zz", "ot"]:
+        got = engine.search(q)
+        expected = {n for n, a in teams.items() if _letters_match(q, f"{n.lower()} {a.lower()}")}
+        assert set(got) == expected, q
+    assert engine.search("porto")[0] == "PORTO"          # exact beats substring
+    assert engine.search("sporting")[:2] == ["SPORTING", "SPORTING BRAGA"]
+    assert engine.search("scp")[0] == "SPORTING"         # abbreviation exact
+    assert engine.search("gv")[0] == "GIL VICENTE"       # word starts
+    engine.remove("PORTO")
+    assert "PORTO" not in engine.search("port")
@@ -0,0 +1,59 @@
+from src.notification.animation import AnimationTicker, Tween, linear
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.pending = []
+
+    def __call__(self):
+        return self.now
+
+    def after(self, ms, fn):
+        self.pending.append((ms, fn))
+        return len(self.pending)
+
+    def run_frames(self, n):
+        for _ in range(n):
+            if not self.pending:
+                return
+            ms, fn = self.pending.pop(0)
+            self.now += ms / 1000.0
+            fn()
+
+
+def test_single_timer_drives_all_animations():
+    clock = _FakeClock()
+    ticker = AnimationTicker(clock.after, 16, clock=clock)
+    values = {i: [] for i in range(10)}
+    done = []
+    for i in range(10):
+        ticker.start(i, "fade", Tween(160, values[i].append, lambda i=i: done.append(i), easing=linear))
+    # Only one frame callback is ever pending, regardless of how many toasts animate
+    assert len(clock.pending) == 1
+    clock.run_frames(20)
+    assert sorted(done) == list(range(10))
+    assert all(v[0] == 0.0 and v[-1] == 1.0 for v in values.values())
+    assert len(ticker) == 0 and not clock.pending
+    stats = ticker.stats()
+    assert stats["frames"] >= 10 and stats["peak_active"] == 10
+
+
+def test_skipped_tween_jumps_to_end_without_scheduling():
+    clock = _FakeClock()
+    ticker = AnimationTicker(clock.after, 16, clock=clock)
+    frames, done = [], []
+    ticker.start("toast", "fade", Tween(500, frames.append, lambda: done.append(1), skip=lambda: True))
+    assert frames == [1.0] and done == [1]
+    assert not clock.pending
+    assert ticker.stats()["skipped"] == 1
+
+
+def test_cancel_owner_stops_its_channels():
+    clock = _FakeClock()
+    ticker = AnimationTicker(clock.after, 16, clock=clock)
+    ticker.start("a", "fade", lambda now: True)
+    ticker.start("a", "progress", lambda now: True)
+    ticker.start("b", "fade", lambda now: True)
+    ticker.cancel("a")
+    assert len(ticker) == 1 and ticker.is_running("b", "fade")
@@ -0,0 +1,27 @@
+from src.notification.notification_server import GroupRateLimiter
+
+
+def test_group_rate_limiter_sliding_window():
+    rl = GroupRateLimiter({"*": (2, 1000), "campo1:timer": (1, 500)})
+    assert rl.allow("campo2:lock", now=0.0)
+    assert rl.allow("campo2:lock", now=0.1)
+    assert not rl.allow("campo2:lock", now=0.2)
+    # Window slides: first hit expires after 1s
+    assert rl.allow("campo2:lock", now=1.05)
+    # Group-specific limit overrides the default
+    assert rl.allow("campo1:timer", now=0.0)
+    assert not rl.allow("campo1:timer", now=0.4)
+    assert rl.allow("campo1:timer", now=0.6)
+
+
+def test_group_rate_limiter_unlimited_without_default():
+    rl = GroupRateLimiter({})
+    assert all(rl.allow("g", now=0.0) for _ in range(50))
+
+
+def test_group_rate_limiter_kind_wildcard_leaves_other_groups_alone():
+    rl = GroupRateLimiter({"*:score": (1, 1000)})
+    assert rl.allow("campo1:score", now=0.0)
+    assert not rl.allow("campo1:score", now=0.1)
+    assert rl.allow("campo2:score", now=0.1)  # Counted per field
+    assert all(rl.allow("campo1:teams", now=0.2) for _ in range(10))
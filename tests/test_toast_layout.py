@@ -0,0 +1,87 @@
+import random
+
+from src.notification.toast_layout import (
+    GAP, MARGIN, PendingBacklog, ToastStackLayout,
+)
+
+WORKAREA = (0, 0, 1920, 1040)
+
+
+class _Toast:
+    pass
+
+
+def _recomputed_used(layout):
+    return sum(s.height + GAP for s in layout.slots)
+
+
+def test_push_is_constant_work_and_stacks_bottom_up():
+    layout = ToastStackLayout(WORKAREA, 320)
+    a, b = _Toast(), _Toast()
+    _, x, y_a, w, h = layout.push(a, 60)
+    _, _, y_b, _, _ = layout.push(b, 40)
+    assert x == 1920 - MARGIN - 320 and w == 320
+    assert y_a == 1040 - MARGIN - 60
+    assert y_b == y_a - GAP - 40
+    assert layout.work == 2
+
+
+def test_remove_only_moves_toasts_above():
+    layout = ToastStackLayout(WORKAREA, 320)
+    items = [_Toast() for _ in range(5)]
+    for t in items:
+        layout.push(t, 50)
+    assert layout.remove(items[-1]) == []
+    moved = layout.remove(items[1])
+    assert [m[0] for m in moved] == items[2:4]
+    assert layout.used == _recomputed_used(layout)
+
+
+def test_synthetic_stream_amortized_constant_placement():
+    rng = random.Random(7)
+    layout = ToastStackLayout(WORKAREA, 320)
+    backlog = PendingBacklog()
+    visible = []
+    n = 5000
+    placements = 0
+    removal_work = 0
+    for i in range(n):
+        h = rng.randint(30, 160)
+        if backlog.peek(WORKAREA) is None and layout.can_fit(h):
+            layout.push(_Toast(), h)
+            visible.append(layout.slots[-1].win)
+            placements += 1
+        else:
+            backlog.append(h, WORKAREA, group=f"g{i % 7}")
+        # Dismiss a random visible toast roughly as often as toasts arrive
+        if visible and rng.random() < 0.9:
+            victim = visible.pop(rng.randrange(len(visible)))
+            before = layout.work
+            layout.remove(victim)
+            removal_work += layout.work - before
+            while True:
+                entry = backlog.peek(WORKAREA)
+                if entry is None or not layout.can_fit(entry.payload):
+                    break
+                backlog.popleft(WORKAREA)
+                layout.push(_Toast(), entry.payload)
+                visible.append(layout.slots[-1].win)
+                placements += 1
+        assert layout.floor - layout.used >= layout.ceiling - GAP
+    assert layout.used == _recomputed_used(layout)
+    # Every placement touched exactly one slot; removals touch at most the
+    # visible stack (bounded by TARGET_MAX_VISIBLE-ish), never the backlog.
+    assert layout.work - removal_work == placements
+    assert removal_work / max(1, n) < len(layout.slots) + 10
+
+
+def test_backlog_group_index_tracks_latest_entry():
+    backlog = PendingBacklog()
+    backlog.append("a", WORKAREA, group="g")
+    e2 = backlog.append("b", WORKAREA, group="g")
+    assert backlog.for_group("g") is e2
+    backlog.popleft(WORKAREA)
+    assert backlog.for_group("g") is e2
+    backlog.popleft(WORKAREA)
+    assert backlog.for_group("g") is None
+    assert len(backlog) == 0
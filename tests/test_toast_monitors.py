@@ -0,0 +1,53 @@
+from src.notification.monitors import Monitor, MonitorTopology
+
+
+class _FakeRoot:
+    def __init__(self):
+        self.screen_reads = 0
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_screenwidth(self):
+        self.screen_reads += 1
+        return 1280
+
+    def winfo_screenheight(self):
+        return 720
+
+
+def test_lookup_is_cached_and_picks_containing_monitor():
+    calls = []
+    left = Monitor((0, 0, 1920, 1080), (0, 0, 1920, 1040))
+    right = Monitor((1920, 0, 3840, 1080), (1920, 0, 3840, 1080))
+
+    def enumerate_fn():
+        calls.append(1)
+        return [left, right]
+
+    topo = MonitorTopology(enumerate_fn=enumerate_fn, miss_refresh_s=3600)
+    for _ in range(1000):
+        assert topo.work_area_at(100, 100) == left.work_area
+        assert topo.work_area_at(2500, 500) == right.work_area
+    # Outside every monitor -> nearest, without re-enumerating inside the window
+    assert topo.work_area_at(5000, 500) == right.work_area
+    assert len(calls) == 1
+
+
+def test_fallback_uses_existing_root_once():
+    root = _FakeRoot()
+
+    def failing():
+        raise OSError("no win32")
+
+    topo = MonitorTopology(root, enumerate_fn=failing, miss_refresh_s=3600)
+    for _ in range(100):
+        assert topo.work_area_at(10, 10) == (0, 0, 1280, 720)
+    assert root.screen_reads == 1
+
+
+def test_is_visible_overlap():
+    topo = MonitorTopology(enumerate_fn=lambda: [Monitor((0, 0, 1920, 1080), (0, 0, 1920, 1040))])
+    topo.refresh()
+    assert topo.is_visible(1800, 900, 300, 100)
+    assert not topo.is_visible(2000, 900, 300, 100)
@@ -0,0 +1,33 @@
+from src.ui.virtual_list import VirtualViewport
+
+
+def test_pool_size_is_constant_and_slots_follow_offset():
+    view = VirtualViewport(row_height=28, visible=6)
+    for count in (0, 3, 6, 10_000):
+        view.set_count(count)
+        assert len(view.slots()) == view.pool_size == 8
+
+    view.set_count(10_000)
+    assert [i for _, i, _ in view.slots()] == [0, 1, 2, 3, 4, 5, None, None]
+    view.scroll_by(14)  # half a row: top row partially hidden, one extra shown
+    shown = [(i, y) for _, i, y in view.slots() if i is not None]
+    assert shown[0] == (0, -14)
+    assert [i for i, _ in shown] == [0, 1, 2, 3, 4, 5, 6]
+    assert view.index_at(0) == 0 and view.index_at(20) == 1
+
+
+def test_ensure_visible_and_clamping():
+    view = VirtualViewport(row_height=10, visible=5)
+    view.set_count(100)
+    assert view.ensure_visible(7)
+    assert view.offset == 30  # row 7 sits on the bottom edge
+    assert not view.ensure_visible(5)
+    assert view.ensure_visible(2) and view.offset == 20
+
+    assert view.moveto(2.0) and view.offset == view.max_offset == 950
+    assert view.fractions() == (0.95, 1.0)
+    assert view.moveto(-1.0) and view.offset == 0
+    view.scroll_to(500)
+    view.set_count(20, keep_offset=True)
+    assert view.offset == 150
+    assert not view.ensure_visible(20)